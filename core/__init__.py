@@ -2,7 +2,18 @@
 from .config_manager import ConfigManager
 from .scheduler import ScheduleManager
 from .build_operations import BuildOperations
-from .worker_thread import WorkerThread, ScheduleWorkerThread
 
-__all__ = ['ConfigManager', 'ScheduleManager', 'BuildOperations', 'WorkerThread', 'ScheduleWorkerThread']
 
+def __getattr__(name):
+    # 작업 스레드는 PyQt5가 필요하므로 처음 사용할 때 import
+    # (헤드리스 데몬 / python -m core.copy 등은 PyQt5 없이, PyQt5를 로드하지 않고 시작)
+    if name in ('WorkerThread', 'ScheduleWorkerThread'):
+        try:
+            from . import worker_thread
+        except ImportError:
+            return None
+        return getattr(worker_thread, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['ConfigManager', 'ScheduleManager', 'BuildOperations', 'WorkerThread', 'ScheduleWorkerThread']
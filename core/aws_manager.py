@@ -10,13 +10,14 @@ from selenium.common.exceptions import StaleElementReferenceException, TimeoutEx
 import subprocess
 import time
 import requests
-import re
 import os
 import sys
 import zipfile
 import shutil
 import psutil
 from exporter import export_upload_result
+from .build_name import parse_build_name
+from .build_token_index import BuildTokenIndex, split_keywords
 
 
 class AWSManager:
@@ -1472,7 +1473,7 @@ ChromeDriver 버전: {chromedriver_version}
                 print(f"[서버최신강제패치] branch 기본값 설정: {branch}")
 
             # build_prefix 파싱
-            prefixes = [p.strip() for p in build_prefix.split(';') if p.strip()]
+            prefixes = split_keywords(build_prefix)
             if not prefixes:
                 raise Exception("Build Prefix가 비어있습니다. 세미콜론(;)으로 구분하여 키워드를 입력하세요.")
             print(f"[서버최신강제패치] 필터 키워드: {prefixes}")
@@ -1608,13 +1609,11 @@ ChromeDriver 버전: {chromedriver_version}
             try:
                 print(f"[서버최신강제패치] [단계 7/11] 필터링 중... (키워드: {prefixes})")
                 matching_tags = []
-                for label in all_tags:
-                    if all(p in label for p in prefixes):
-                        rev_match = re.search(r'_r(\d+)', label)
-                        if rev_match:
-                            revision = int(rev_match.group(1))
-                            matching_tags.append((revision, label))
-                            print(f"  [매칭] {label} (revision: {revision})")
+                for label in BuildTokenIndex(all_tags).search(prefixes):
+                    revision = parse_build_name(label).revision
+                    if revision:
+                        matching_tags.append((revision, label))
+                        print(f"  [매칭] {label} (revision: {revision})")
 
                 if not matching_tags:
                     raise Exception(
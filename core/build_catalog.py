@@ -0,0 +1,318 @@
+"""로컬 SQLite 빌드 카탈로그 모듈
+
+소스 루트 아래 빌드 폴더 정보(이름, 브랜치, 빌드 타입, CL, 리비전, mtime, 크기, 파일 수,
+version.txt 유무)를 로컬 DB에 저장합니다. BuildCatalogScanner가 백그라운드에서
+변경된 빌드만 다시 훑어 갱신하며, 조회는 SMB 접근 없이 DB에서 처리합니다.
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .build_index import get_build_index
+from .build_name import parse_build_name
+
+
+# 카탈로그 DB 파일 (settings.json과 같은 위치)
+DEFAULT_CATALOG_PATH = 'build_catalog.db'
+
+# 기본 스캔 주기 (초, 빌드 목록 캐시 TTL과 비슷하게 유지)
+DEFAULT_SCAN_INTERVAL = 30.0
+
+# 이 시간(초) 안에 수정된 빌드는 매 스캔마다 다시 측정 (복사 중인 빌드 대비)
+RECENT_BUILD_SECONDS = 600.0
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    root TEXT NOT NULL,
+    name TEXT NOT NULL,
+    build_type TEXT,
+    branch TEXT,
+    changelist INTEGER,
+    revision INTEGER,
+    mtime REAL,
+    total_bytes INTEGER,
+    file_count INTEGER,
+    has_version INTEGER,
+    scanned_at REAL,
+    PRIMARY KEY (root, name)
+);
+CREATE INDEX IF NOT EXISTS idx_builds_revision ON builds (root, revision DESC, mtime DESC);
+CREATE TABLE IF NOT EXISTS roots (
+    root TEXT PRIMARY KEY,
+    scanned_at REAL
+);
+"""
+
+_COLUMNS = ('root', 'name', 'build_type', 'branch', 'changelist', 'revision', 'mtime',
+            'total_bytes', 'file_count', 'has_version', 'scanned_at')
+
+
+def parse_build_fields(name: str) -> Tuple[str, str, int, int]:
+    """빌드명에서 (빌드 타입, 브랜치, CL, 리비전) 추출"""
+    parsed = parse_build_name(name)
+    return parsed.build_type, parsed.branch, parsed.changelist, parsed.revision
+
+
+def measure_tree(path: str) -> Tuple[int, int]:
+    """폴더 전체 (크기, 파일 수) - scandir 기반"""
+    total_bytes, file_count = 0, 0
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        else:
+                            total_bytes += entry.stat(follow_symlinks=False).st_size
+                            file_count += 1
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total_bytes, file_count
+
+
+def _normalize_root(root: str) -> str:
+    return os.path.normcase(os.path.abspath(root))
+
+
+class BuildCatalog:
+    """빌드 카탈로그 DB (스레드 안전, 단일 연결)"""
+
+    def __init__(self, db_path: str = DEFAULT_CATALOG_PATH, max_lag: float = DEFAULT_SCAN_INTERVAL * 1.5):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            max_lag: 이 시간(초) 안에 스캔된 루트만 조회에 사용 (is_fresh 기준)
+        """
+        self.db_path = db_path
+        self.max_lag = max_lag
+        self._lock = threading.Lock()
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # 갱신
+    def upsert(self, records: Iterable[Dict[str, Any]]) -> None:
+        rows = [tuple(r.get(c) for c in _COLUMNS) for r in records]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO builds ({', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in _COLUMNS)})", rows)
+            self._conn.commit()
+
+    def remove_missing(self, root: str, present: Iterable[str]) -> int:
+        """목록에 없는 빌드 삭제 (삭제된 행 수 반환)"""
+        root = _normalize_root(root)
+        present = set(present)
+        with self._lock:
+            names = [r[0] for r in self._conn.execute('SELECT name FROM builds WHERE root = ?', (root,))]
+            gone = [(root, n) for n in names if n not in present]
+            if gone:
+                self._conn.executemany('DELETE FROM builds WHERE root = ? AND name = ?', gone)
+                self._conn.commit()
+        return len(gone)
+
+    def mark_scanned(self, root: str, scanned_at: Optional[float] = None) -> None:
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO roots (root, scanned_at) VALUES (?, ?)',
+                               (_normalize_root(root), scanned_at or time.time()))
+            self._conn.commit()
+
+    # 조회
+    def last_scanned(self, root: str) -> float:
+        """루트 마지막 스캔 완료 시각 (없으면 0)"""
+        with self._lock:
+            row = self._conn.execute('SELECT scanned_at FROM roots WHERE root = ?',
+                                     (_normalize_root(root),)).fetchone()
+        return row[0] if row else 0.0
+
+    def is_fresh(self, root: str, max_lag: Optional[float] = None) -> bool:
+        """max_lag 초 이내에 스캔된 루트인지 (기본: self.max_lag)"""
+        lag = self.max_lag if max_lag is None else max_lag
+        return time.time() - self.last_scanned(root) <= lag
+
+    def mtimes(self, root: str) -> Dict[str, float]:
+        with self._lock:
+            return {r[0]: r[1] for r in self._conn.execute(
+                'SELECT name, mtime FROM builds WHERE root = ?', (_normalize_root(root),))}
+
+    def query(self, root: str, keywords: Optional[List[str]] = None, limit: int = 0,
+              require_version: bool = False) -> List[Dict[str, Any]]:
+        """
+        빌드 검색 (리비전, mtime 내림차순)
+
+        Args:
+            root: 소스 루트
+            keywords: 이름에 모두 포함되어야 하는 문자열 목록
+            limit: 최대 개수 (0이면 제한 없음)
+            require_version: version.txt 있는 빌드만
+        """
+        sql = 'SELECT * FROM builds WHERE root = ?'
+        params: List[Any] = [_normalize_root(root)]
+        for keyword in keywords or []:
+            if keyword:
+                sql += " AND instr(name, ?) > 0"
+                params.append(keyword)
+        if require_version:
+            sql += ' AND has_version = 1'
+        sql += ' ORDER BY revision DESC, mtime DESC'
+        if limit > 0:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        with self._lock:
+            return [dict(r) for r in self._conn.execute(sql, params)]
+
+    def find_latest(self, root: str, keyword: str) -> Optional[str]:
+        rows = self.query(root, [keyword], limit=1)
+        return rows[0]['name'] if rows else None
+
+    def get_build(self, folder_path: str) -> Optional[Dict[str, Any]]:
+        """빌드 폴더 전체 경로로 조회"""
+        root, name = os.path.split(os.path.normpath(folder_path))
+        with self._lock:
+            row = self._conn.execute('SELECT * FROM builds WHERE root = ? AND name = ?',
+                                     (_normalize_root(root), name)).fetchone()
+        return dict(row) if row else None
+
+    # 스캔
+    def scan_root(self, root: str, cancel_check=None) -> int:
+        """
+        루트 한 번 스캔 (mtime이 바뀐 빌드만 다시 측정)
+
+        Returns:
+            갱신된 빌드 수
+        """
+        if not os.path.isdir(root):
+            return 0
+        index = get_build_index()
+        # 목록을 읽기 시작한 시각으로 스캔 완료를 기록 - 목록을 읽은 뒤 생긴 빌드를 최신이라 보지 않도록
+        listed_at = time.time()
+        names = index.get_builds(root, force=True)
+        known = self.mtimes(root)
+        norm_root = _normalize_root(root)
+
+        # 최근에 바뀐 빌드는 하위 폴더에 아직 쓰는 중일 수 있으므로 mtime이 같아도 다시 측정
+        now = time.time()
+        changed = [n for n in names
+                   if known.get(n) != index.get_mtime(root, n)
+                   or now - index.get_mtime(root, n) < RECENT_BUILD_SECONDS]
+        # 최신 리비전부터 채워 넣어 스캔 도중에도 바로 쓸 수 있게 함
+        changed.sort(key=lambda n: parse_build_fields(n)[3], reverse=True)
+
+        updated = 0
+        batch: List[Dict[str, Any]] = []
+        for name in changed:
+            if cancel_check and cancel_check():
+                break
+            path = os.path.join(root, name)
+            build_type, branch, changelist, revision = parse_build_fields(name)
+            total_bytes, file_count = measure_tree(path)
+            batch.append({
+                'root': norm_root,
+                'name': name,
+                'build_type': build_type,
+                'branch': branch,
+                'changelist': changelist,
+                'revision': revision,
+                'mtime': index.get_mtime(root, name),
+                'total_bytes': total_bytes,
+                'file_count': file_count,
+                'has_version': 1 if os.path.isfile(os.path.join(path, 'version.txt')) else 0,
+                'scanned_at': time.time(),
+            })
+            if len(batch) >= 20:
+                self.upsert(batch)
+                updated += len(batch)
+                batch = []
+        self.upsert(batch)
+        updated += len(batch)
+
+        removed = self.remove_missing(root, names)
+        if not (cancel_check and cancel_check()):
+            self.mark_scanned(root, listed_at)
+        if updated or removed:
+            print(f"[BuildCatalog] {root}: {updated}개 갱신, {removed}개 삭제")
+        return updated
+
+
+class BuildCatalogScanner(threading.Thread):
+    """카탈로그 백그라운드 스캐너 (interval 초마다 루트 목록 스캔)"""
+
+    def __init__(self, catalog: BuildCatalog, roots: List[str],
+                 interval: float = DEFAULT_SCAN_INTERVAL):
+        super().__init__(name='build-catalog-scanner', daemon=True)
+        self.catalog = catalog
+        self.interval = interval
+        self._roots = list(dict.fromkeys(r for r in roots if r))
+        self._roots_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+
+    def set_roots(self, roots: List[str]) -> None:
+        """스캔 대상 변경 (바뀐 경우에만 바로 스캔)"""
+        roots = list(dict.fromkeys(r for r in roots if r))
+        with self._roots_lock:
+            changed = roots != self._roots
+            self._roots = roots
+        if changed:
+            self._wake_event.set()
+
+    def scan_now(self) -> None:
+        """다음 주기를 기다리지 않고 바로 스캔"""
+        self._wake_event.set()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._wake_event.set()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            with self._roots_lock:
+                roots = list(self._roots)
+            for root in roots:
+                if self._stop_event.is_set():
+                    break
+                try:
+                    self.catalog.scan_root(root, cancel_check=self._stop_event.is_set)
+                except Exception as e:
+                    print(f"[BuildCatalog] 스캔 오류 ({root}): {e}")
+            self._wake_event.wait(self.interval)
+            self._wake_event.clear()
+
+
+_shared_catalog: Optional[BuildCatalog] = None
+_shared_lock = threading.Lock()
+
+
+def get_build_catalog(db_path: str = DEFAULT_CATALOG_PATH) -> BuildCatalog:
+    """프로세스 전역 공유 BuildCatalog"""
+    global _shared_catalog
+    with _shared_lock:
+        if _shared_catalog is None:
+            _shared_catalog = BuildCatalog(db_path)
+        return _shared_catalog
+
+
+def peek_build_catalog() -> Optional[BuildCatalog]:
+    """공유 카탈로그가 열려 있으면 반환 (없으면 새로 만들지 않음)"""
+    return _shared_catalog
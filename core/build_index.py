@@ -0,0 +1,219 @@
+"""빌드 목록 공유 캐시 모듈
+
+find_latest_build, get_latest_builds, 스케줄 다이얼로그의 빌드 목록 새로고침이
+소스 루트 목록을 각자 조회하지 않고 같은 캐시를 사용합니다.
+
+- TTL 이내: 디스크/네트워크 접근 없이 캐시 반환
+- TTL 경과: 루트 폴더 mtime만 확인해 변경이 없으면 캐시 연장, 바뀌었으면 다시 조회
+- 같은 루트를 여러 스레드가 동시에 요청하면 한 번만 조회 (09:00 동시 실행 스케줄 대비)
+"""
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .build_token_index import BuildTokenIndex
+from .copy_sources import CopySource, PathCopySource
+from .stat_prober import get_stat_prober
+
+
+# 캐시 유지 시간 (초)
+DEFAULT_TTL = 30.0
+
+# mtime이 그대로여도 이 시간이 지나면 다시 조회 (SMB mtime 갱신 누락 대비)
+DEFAULT_MAX_AGE = 600.0
+
+# get_builds(on_names=...)로 조회 중 전달하는 폴더명 묶음 크기
+STREAM_BATCH_SIZE = 100
+
+
+class _Listing:
+    """루트 하나의 목록 캐시"""
+
+    __slots__ = ('names', 'mtimes', 'root_mtime', 'checked_at', 'listed_at', 'lock',
+                 'tokens', 'tokens_at')
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.mtimes: Dict[str, float] = {}
+        self.root_mtime: Optional[float] = None
+        self.checked_at = 0.0
+        self.listed_at = 0.0
+        self.lock = threading.Lock()
+        self.tokens = BuildTokenIndex()  # 검색용 토큰 역색인 (search 시 목록 변경분만 반영)
+        self.tokens_at = 0.0
+
+
+class BuildIndex:
+    """소스 루트별 빌드 폴더 목록 캐시 (스레드 안전)"""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_age: float = DEFAULT_MAX_AGE):
+        self.ttl = ttl
+        self.max_age = max_age
+        self._listings: Dict[str, _Listing] = {}
+        self._lock = threading.Lock()
+        self.list_count = 0  # 실제 목록 조회 횟수 (확인용)
+
+    @staticmethod
+    def _key(root: str, source: Optional[CopySource]) -> str:
+        if source is not None and not isinstance(source, PathCopySource):
+            return source.describe()
+        return os.path.normcase(os.path.abspath(root))
+
+    def _listing(self, key: str) -> _Listing:
+        with self._lock:
+            listing = self._listings.get(key)
+            if listing is None:
+                listing = self._listings[key] = _Listing()
+            return listing
+
+    def get_builds(self, root: str, source: Optional[CopySource] = None,
+                   force: bool = False,
+                   on_names: Optional[Callable[[List[str]], None]] = None) -> List[str]:
+        """
+        빌드 폴더명 목록
+
+        Args:
+            root: 소스 루트 경로 (경로 소스)
+            source: 경로 소스가 아니면 source.list_builds() 결과를 캐시
+            force: True면 캐시 무시하고 다시 조회
+            on_names: 조회 중 찾은 폴더명을 묶음 단위로 전달 (캐시 사용 시 전체 한 번)
+
+        Returns:
+            폴더명 목록 (캐시 사본)
+        """
+        key = self._key(root, source)
+        listing = self._listing(key)
+        is_path = source is None or isinstance(source, PathCopySource)
+
+        with listing.lock:
+            now = time.time()
+            if not force and listing.listed_at:
+                cached = now - listing.checked_at < self.ttl
+                if not cached and is_path and now - listing.listed_at < self.max_age:
+                    root_mtime = self._root_mtime(root)
+                    cached = root_mtime is not None and root_mtime == listing.root_mtime
+                    if cached:
+                        listing.checked_at = now
+                if cached:
+                    if on_names:
+                        on_names(list(listing.names))
+                    return list(listing.names)
+
+            if is_path:
+                self._list_path(root, listing, on_names)
+            else:
+                listing.names = source.list_builds()
+                listing.mtimes = {}
+                if on_names:
+                    on_names(list(listing.names))
+            listing.checked_at = listing.listed_at = time.time()
+            self.list_count += 1
+            return list(listing.names)
+
+    def peek_builds(self, root: str, source: Optional[CopySource] = None) -> Optional[List[str]]:
+        """
+        캐시된 목록만 반환 (디스크/네트워크 접근 없음, TTL 무시)
+
+        Returns:
+            폴더명 목록 사본, 한 번도 조회하지 않았으면 None
+        """
+        with self._lock:
+            listing = self._listings.get(self._key(root, source))
+        if listing is None or not listing.listed_at:
+            return None
+        return list(listing.names)
+
+    def search(self, root: str, keywords: Iterable[str], source: Optional[CopySource] = None,
+               cached_only: bool = False) -> Optional[List[str]]:
+        """
+        모든 키워드를 포함하는 빌드명 (리비전 내림차순, 토큰 역색인 사용)
+
+        Args:
+            root: 소스 루트 경로
+            keywords: 이름에 모두 포함되어야 하는 문자열 목록
+            source: 경로 소스가 아니면 source.list_builds() 기준
+            cached_only: True면 목록 조회 없이 캐시만 사용 (한 번도 조회하지 않았으면 None)
+        """
+        if cached_only:
+            if self.peek_builds(root, source) is None:
+                return None
+        else:
+            self.get_builds(root, source)
+        listing = self._listing(self._key(root, source))
+        with listing.lock:
+            if listing.tokens_at != listing.listed_at:
+                listing.tokens.sync(listing.names)
+                listing.tokens_at = listing.listed_at
+        return listing.tokens.search(keywords)
+
+    def get_mtime(self, root: str, name: str) -> float:
+        """빌드 폴더 수정 시간 (목록 조회 시 함께 얻은 값, 없으면 0)"""
+        listing = self._listings.get(self._key(root, None))
+        if listing is None:
+            return 0.0
+        return listing.mtimes.get(name, 0.0)
+
+    def invalidate(self, root: Optional[str] = None, source: Optional[CopySource] = None) -> None:
+        """캐시 무효화 (root 미지정 시 전체)"""
+        with self._lock:
+            if root is None and source is None:
+                self._listings.clear()
+            else:
+                self._listings.pop(self._key(root or '', source), None)
+
+    @staticmethod
+    def _root_mtime(root: str) -> Optional[float]:
+        try:
+            return os.stat(root).st_mtime
+        except OSError:
+            return None
+
+    def _list_path(self, root: str, listing: _Listing,
+                   on_names: Optional[Callable[[List[str]], None]] = None) -> None:
+        """
+        scandir 한 번으로 폴더명과 mtime 수집
+
+        Windows는 DirEntry에 stat 정보가 포함되어 추가 호출이 없고,
+        그 외 플랫폼은 남은 stat 호출을 스레드 풀로 병렬 처리합니다.
+        """
+        root_mtime = self._root_mtime(root)
+        entries: List[os.DirEntry] = []
+        if root_mtime is not None:
+            with os.scandir(root) as it:
+                batch: List[str] = []
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            entries.append(entry)
+                            batch.append(entry.name)
+                    except OSError:
+                        continue
+                    if on_names and len(batch) >= STREAM_BATCH_SIZE:
+                        on_names(batch)
+                        batch = []
+                if on_names and batch:
+                    on_names(batch)
+        names: List[str] = []
+        mtimes: Dict[str, float] = {}
+        for entry, mtime in zip(entries, get_stat_prober().entry_mtimes(entries)):
+            if mtime is None:
+                continue
+            names.append(entry.name)
+            mtimes[entry.name] = mtime
+        listing.names = names
+        listing.mtimes = mtimes
+        listing.root_mtime = root_mtime
+
+
+_shared_index: Optional[BuildIndex] = None
+_shared_lock = threading.Lock()
+
+
+def get_build_index() -> BuildIndex:
+    """프로세스 전역 공유 BuildIndex"""
+    global _shared_index
+    with _shared_lock:
+        if _shared_index is None:
+            _shared_index = BuildIndex()
+        return _shared_index
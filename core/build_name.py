@@ -0,0 +1,102 @@
+"""빌드명 파서 모듈
+
+예: CompileBuild_DEV_game_SEL_271167_r306671
+    → kind='CompileBuild', build_type='DEV', branch_tokens=('game', 'SEL'),
+      changelist=271167, revision=306671
+
+리비전 추출, 빌드 타입(buildType) 추출 등 빌드명 해석은 모두 parse_build_name을 사용합니다.
+같은 이름은 캐시된 레코드를 돌려주므로 수만 개 정렬도 한 번씩만 파싱합니다.
+"""
+import re
+from functools import lru_cache
+from typing import Tuple
+
+
+_REVISION_TOKEN_RE = re.compile(r'r(\d+)')
+_REVISION_ANY_RE = re.compile(r'_r(\d+)')
+
+
+class BuildName:
+    """파싱된 빌드명 (불변)"""
+
+    __slots__ = ('name', 'kind', 'build_type', 'branch_tokens', 'changelist', 'revision')
+
+    def __init__(self, name: str, kind: str, build_type: str, branch_tokens: Tuple[str, ...],
+                 changelist: int, revision: int):
+        set_ = object.__setattr__
+        set_(self, 'name', name)
+        set_(self, 'kind', kind)
+        set_(self, 'build_type', build_type)
+        set_(self, 'branch_tokens', branch_tokens)
+        set_(self, 'changelist', changelist)
+        set_(self, 'revision', revision)
+
+    def __setattr__(self, key, value):
+        raise AttributeError('BuildName은 변경할 수 없습니다')
+
+    def __delattr__(self, key):
+        raise AttributeError('BuildName은 변경할 수 없습니다')
+
+    @property
+    def branch(self) -> str:
+        """브랜치 (예: game_SEL)"""
+        return '_'.join(self.branch_tokens)
+
+    @property
+    def sort_key(self) -> Tuple[int, int]:
+        """최신순 정렬 키 (리비전, CL)"""
+        return self.revision, self.changelist
+
+    def __repr__(self) -> str:
+        return (f"BuildName(kind={self.kind!r}, build_type={self.build_type!r}, "
+                f"branch={self.branch!r}, changelist={self.changelist}, revision={self.revision})")
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, BuildName) and self.name == other.name
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+    def __reduce__(self):
+        return parse_build_name, (self.name,)
+
+
+@lru_cache(maxsize=65536)
+def parse_build_name(name: str) -> BuildName:
+    """
+    빌드명 파싱 (결과 캐시)
+
+    - 리비전: 'r<숫자>' 토큰 중 마지막 것, 없으면 '_r<숫자>' 위치, 없으면 0
+    - CL: 리비전 토큰 바로 앞의 숫자 토큰, 없으면 0
+    - 빌드 타입: 두 번째 토큰 (없으면 '')
+    - 브랜치: 빌드 타입 다음부터 CL(또는 리비전) 앞까지의 토큰
+    """
+    tokens = name.split('_')
+
+    rev_index = -1
+    revision = 0
+    for i in range(len(tokens) - 1, 0, -1):
+        m = _REVISION_TOKEN_RE.fullmatch(tokens[i])
+        if m:
+            rev_index = i
+            revision = int(m.group(1))
+            break
+    if rev_index < 0:
+        m = _REVISION_ANY_RE.search(name)
+        revision = int(m.group(1)) if m else 0
+
+    end = rev_index if rev_index > 0 else len(tokens)
+    changelist = 0
+    if end - 1 >= 2 and tokens[end - 1].isdigit():
+        changelist = int(tokens[end - 1])
+        end -= 1
+
+    kind = tokens[0]
+    build_type = tokens[1] if len(tokens) > 1 else ''
+    branch_tokens = tuple(tokens[2:end]) if len(tokens) > 2 else ()
+    return BuildName(name, kind, build_type, branch_tokens, changelist, revision)
+
+
+def revision_of(name: str) -> int:
+    """빌드명의 리비전 번호 (정렬 key 용)"""
+    return parse_build_name(name).revision
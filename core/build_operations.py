@@ -1,9 +1,24 @@
 """빌드 복사/압축 관련 작업 모듈"""
+import heapq
 import os
 import shutil
 import zipfile
 from typing import Callable, Optional
-import re
+
+from .build_catalog import peek_build_catalog
+from .build_index import get_build_index
+from .build_name import parse_build_name
+from .build_readiness import get_readiness_checker
+from .build_token_index import split_keywords
+from .copy_sources import PathCopySource
+from .stat_prober import get_stat_prober
+
+
+# find_latest_build에서 준비 완료 여부를 확인할 최신 후보 수
+READY_CANDIDATE_LIMIT = 10
+
+# get_latest_builds에서 version.txt를 한 번에 확인할 최소 후보 수
+VERSION_CHECK_BATCH = 8
 
 
 class BuildOperations:
@@ -12,12 +27,16 @@ class BuildOperations:
     @staticmethod
     def extract_revision_number(folder_name: str) -> int:
         """폴더명에서 리비전 번호 추출 (_r 뒤의 숫자)"""
-        match = re.search(r'_r(\d+)', folder_name)
-        return int(match.group(1)) if match else 0
+        return parse_build_name(folder_name).revision
     
     @staticmethod
     def get_file_count(folder_path: str) -> int:
-        """폴더 내 파일 개수 계산"""
+        """폴더 내 파일 개수 계산 (카탈로그에 있는 빌드 폴더면 DB 값 사용)"""
+        catalog = peek_build_catalog()
+        if catalog is not None:
+            record = catalog.get_build(folder_path)
+            if record and record.get('file_count') is not None:
+                return record['file_count']
         return sum(len(files) for _, _, files in os.walk(folder_path))
     
     @staticmethod
@@ -103,33 +122,114 @@ class BuildOperations:
         Returns:
             빌드 폴더명 목록
         """
-        if not os.path.isdir(source_path):
+        # 공유 목록 캐시 사용 (find_latest_build/스케줄 다이얼로그와 같은 조회 결과)
+        folders = get_build_index().get_builds(source_path)
+        if not folders:
             return []
         
-        folders = [f for f in os.listdir(source_path) 
-                  if os.path.isdir(os.path.join(source_path, f))]
+        # 필터 적용 후 리비전 기준 힙 (같은 리비전은 목록 순서 유지)
+        heap = [(-parse_build_name(folder).revision, i, folder)
+                for i, folder in enumerate(folders)
+                if not filter_texts or any(ft in folder for ft in filter_texts)]
+        if not heap or max_count <= 0:
+            return []
+        heapq.heapify(heap)
         
-        # 리비전 번호로 정렬
-        folders.sort(key=BuildOperations.extract_revision_number, reverse=True)
+        # 첫 번째는 version.txt 확인 없이 포함
+        result = [heapq.heappop(heap)[2]]
         
-        result = []
-        for folder in folders:
-            if len(result) >= max_count:
-                break
-            
-            folder_path = os.path.join(source_path, folder)
-            version_file = os.path.join(folder_path, "version.txt")
-            
-            # version.txt 존재 확인 (첫 번째 제외)
-            if len(result) >= 1 and not os.path.isfile(version_file):
-                continue
-            
-            # 필터 적용
-            if not filter_texts or any(ft in folder for ft in filter_texts):
-                result.append(folder)
+        # 나머지는 필요한 만큼만 꺼내 version.txt를 묶음 단위로 병렬 확인 (k개 확정되면 중단)
+        prober = get_stat_prober()
+        while heap and len(result) < max_count:
+            batch_size = max(max_count - len(result), VERSION_CHECK_BATCH)
+            batch = [heapq.heappop(heap)[2] for _ in range(min(batch_size, len(heap)))]
+            exists = prober.isfiles(os.path.join(source_path, folder, "version.txt") for folder in batch)
+            for folder, has_version in zip(batch, exists):
+                if has_version:
+                    result.append(folder)
+                    if len(result) >= max_count:
+                        break
         
         return result
     
+    @staticmethod
+    def find_latest_build(src_folder: str, buildname: str, source=None) -> str:
+        """
+        빌드명으로 최신 빌드 폴더 찾기
+        
+        Args:
+            src_folder: 빌드 소스 경로
+            buildname: 빌드명 (짧은 이름, 예: game_SEL, game_progression)
+                       ';'로 구분하면 모든 키워드를 포함하는 빌드 (예: game_SEL;DEV)
+            source: 복사 소스 (경로 소스가 아니면 소스의 빌드 목록에서 탐색)
+        
+        Returns:
+            전체 빌드 폴더명 (예: CompileBuild_DEV_game_SEL_271167_r306671)
+        """
+        index = get_build_index()
+        checker = get_readiness_checker()
+        keywords = split_keywords(buildname) or [buildname]
+        if source is not None and not isinstance(source, PathCopySource):
+            # HTTP/캐시 소스: 소스 목록 기준 (폴더 수정 시간 정보 없음)
+            try:
+                matching_folders = index.search(src_folder, keywords, source)
+            except Exception as e:
+                raise Exception(f'Failed to list builds in {source.describe()}: {e}')
+            if not matching_folders:
+                raise Exception(f'No build folders found matching: {buildname}')
+            latest_folder = matching_folders[0]
+            print(f"[find_latest_build] Found {len(matching_folders)} matching builds, latest: {latest_folder}")
+            return latest_folder
+        
+        # 카탈로그가 최근 스캔한 루트면 DB에서 조회 (SMB 접근 없음, 못 찾으면 목록 조회로 진행)
+        catalog = peek_build_catalog()
+        if catalog is not None and catalog.is_fresh(src_folder):
+            candidates = [row['name'] for row in catalog.query(src_folder, keywords,
+                                                                limit=READY_CANDIDATE_LIMIT)]
+            latest_folder = BuildOperations._first_ready(checker, src_folder, candidates)
+            if latest_folder:
+                print(f"[find_latest_build] Found in catalog, latest: {latest_folder}")
+                return latest_folder
+        
+        # src_folder에서 buildname이 포함된 폴더 찾기 (공유 목록 캐시 + 토큰 역색인)
+        try:
+            matching_folders = index.search(src_folder, keywords)
+        except Exception as e:
+            raise Exception(f'Failed to list folders in {src_folder}: {e}')
+        if not matching_folders and not os.path.isdir(src_folder):
+            raise Exception(f'Source folder does not exist: {src_folder}')
+        
+        if not matching_folders:
+            raise Exception(f'No build folders found matching: {buildname}')
+        
+        # 최신 폴더 찾기 (리비전 r 값 기준)
+        matching_folders.sort(
+            key=lambda x: (
+                parse_build_name(x).revision,
+                index.get_mtime(src_folder, x)
+            ),
+            reverse=True
+        )
+        
+        # 빌드 시스템이 아직 쓰고 있는 빌드는 건너뜀
+        latest_folder = BuildOperations._first_ready(checker, src_folder,
+                                                     matching_folders[:READY_CANDIDATE_LIMIT])
+        if not latest_folder:
+            raise Exception(f'No ready build folders found matching: {buildname}')
+        
+        print(f"[find_latest_build] Found {len(matching_folders)} matching folders, latest: {latest_folder}")
+        return latest_folder
+    
+    @staticmethod
+    def _first_ready(checker, src_folder: str, candidates: list) -> Optional[str]:
+        """최신순 후보 중 준비 완료된 첫 빌드 (마커 확인은 후보 전체를 한 번에 병렬 처리)"""
+        checker.prefetch(src_folder, candidates)
+        for name in candidates:
+            if checker.is_ready(src_folder, name, wait=True):
+                return name
+            print(f"[find_latest_build] 준비 안 된 빌드 건너뜀: {name}")
+        return None
+    
     @staticmethod
     def generate_backend_bat_files(output_dir: str, server_list: list) -> None:
         """백엔드 접속용 BAT 파일 생성"""
@@ -0,0 +1,155 @@
+"""빌드 준비 완료(게시 완료) 판정 모듈
+
+빌드 시스템이 아직 쓰고 있는 빌드를 복사/패치하지 않도록 다음 중 하나를 만족해야 준비 완료로 봅니다.
+1. 마커 파일 존재 (기본: version.txt)
+2. 매니페스트 존재 (manifest.json)
+3. 전체 크기/파일 수가 probe_interval 이상 떨어진 두 번의 측정에서 같음
+"""
+import os
+import threading
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+from .build_catalog import measure_tree
+from .copy_sources import CopySource, PathCopySource
+from .stat_prober import get_stat_prober
+
+
+DEFAULT_MARKERS = ('version.txt',)
+DEFAULT_MANIFESTS = ('manifest.json',)
+
+# 크기 안정 판정 측정 간격 (초)
+DEFAULT_PROBE_INTERVAL = 5.0
+
+
+class BuildReadinessChecker:
+    """빌드 준비 완료 판정 (판정 결과/이전 측정값 캐시, 스레드 안전)"""
+
+    def __init__(self, markers: Sequence[str] = DEFAULT_MARKERS,
+                 manifests: Sequence[str] = DEFAULT_MANIFESTS,
+                 probe_interval: float = DEFAULT_PROBE_INTERVAL):
+        self.markers = tuple(markers)
+        self.manifests = tuple(manifests)
+        self.probe_interval = probe_interval
+        self.enabled = True
+        self._ready: Dict[str, str] = {}                            # 경로 → 판정 사유
+        self._probes: Dict[str, Tuple[int, int, float]] = {}       # 경로 → (크기, 파일 수, 측정 시각)
+        self._lock = threading.Lock()
+
+    def is_ready(self, root: str, build_name: str, wait: bool = False,
+                 source: Optional[CopySource] = None) -> bool:
+        """
+        준비 완료 여부
+
+        Args:
+            root: 소스 루트
+            build_name: 빌드 폴더명
+            wait: 마커/매니페스트가 없고 이전 측정값도 없으면 probe_interval 만큼 기다려 두 번 측정
+                  (False면 이번 측정값만 기록하고 다음 호출에서 비교 - 감시 스레드용)
+            source: 경로 소스가 아니면 목록에 올라온 시점을 게시 완료로 간주 (HTTP 매니페스트 기준)
+        """
+        if not self.enabled:
+            return True
+        if source is not None and not isinstance(source, PathCopySource):
+            return True
+
+        path = os.path.join(root, build_name)
+        with self._lock:
+            if path in self._ready:
+                return True
+
+        reason = self._marker_reason(path)
+        if reason is None:
+            reason = self._stable_reason(path, wait)
+        if reason is None:
+            return False
+
+        with self._lock:
+            self._ready[path] = reason
+            self._probes.pop(path, None)
+        print(f"[readiness] 준비 완료: {build_name} ({reason})")
+        return True
+
+    def prefetch(self, root: str, build_names: Sequence[str]) -> int:
+        """
+        여러 빌드의 마커/매니페스트를 병렬로 확인해 판정 캐시에 기록
+
+        크기 안정 판정은 하지 않으므로 마커가 없는 빌드는 이후 is_ready에서 따로 판정합니다.
+
+        Returns:
+            새로 준비 완료로 기록된 빌드 수
+        """
+        if not self.enabled:
+            return 0
+        with self._lock:
+            names = [n for n in build_names if os.path.join(root, n) not in self._ready]
+        if not names:
+            return 0
+        reasons = get_stat_prober().map(lambda n: self._marker_reason(os.path.join(root, n)), names)
+        found = 0
+        with self._lock:
+            for name, reason in zip(names, reasons):
+                if reason:
+                    path = os.path.join(root, name)
+                    self._ready[path] = reason
+                    self._probes.pop(path, None)
+                    found += 1
+        return found
+
+    def reason(self, root: str, build_name: str) -> Optional[str]:
+        """준비 완료로 판정된 사유 (판정 전이면 None)"""
+        with self._lock:
+            return self._ready.get(os.path.join(root, build_name))
+
+    def forget(self, root: str, build_name: str) -> None:
+        path = os.path.join(root, build_name)
+        with self._lock:
+            self._ready.pop(path, None)
+            self._probes.pop(path, None)
+
+    def _marker_reason(self, path: str) -> Optional[str]:
+        for marker in self.markers:
+            if os.path.isfile(os.path.join(path, marker)):
+                return f"marker:{marker}"
+        for manifest in self.manifests:
+            if os.path.isfile(os.path.join(path, manifest)):
+                return f"manifest:{manifest}"
+        return None
+
+    def _stable_reason(self, path: str, wait: bool) -> Optional[str]:
+        if not os.path.isdir(path):
+            return None
+        with self._lock:
+            previous = self._probes.get(path)
+
+        if previous is None and wait:
+            first = measure_tree(path)
+            previous = (first[0], first[1], time.time())
+            time.sleep(self.probe_interval)
+        elif previous is not None and time.time() - previous[2] < self.probe_interval:
+            # 측정 간격이 너무 짧으면 판정 보류 (wait면 남은 시간만큼 대기)
+            if not wait:
+                return None
+            time.sleep(self.probe_interval - (time.time() - previous[2]))
+
+        total_bytes, file_count = measure_tree(path)
+        now = time.time()
+        if previous is not None and file_count > 0 and (total_bytes, file_count) == previous[:2]:
+            return f"stable:{file_count} files"
+
+        with self._lock:
+            self._probes[path] = (total_bytes, file_count, now)
+        return None
+
+
+_shared_checker: Optional[BuildReadinessChecker] = None
+_shared_lock = threading.Lock()
+
+
+def get_readiness_checker() -> BuildReadinessChecker:
+    """프로세스 전역 공유 BuildReadinessChecker"""
+    global _shared_checker
+    with _shared_lock:
+        if _shared_checker is None:
+            _shared_checker = BuildReadinessChecker()
+        return _shared_checker
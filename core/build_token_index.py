@@ -0,0 +1,230 @@
+"""빌드명 토큰 역색인 모듈
+
+빌드명을 '_' 기준 토큰으로 나눠 토큰 → 빌드명 집합 색인을 메모리에 유지합니다.
+키워드 검색은 색인으로 후보를 좁힌 뒤 부분 문자열 검사로 확인하므로
+기존 `keyword in name` 검색과 결과가 같고, 수만 개 빌드에서도 전체를 훑지 않습니다.
+
+- 키워드 여러 개는 AND (build_prefix처럼 ';'로 구분된 입력은 split_keywords 사용)
+- 목록이 바뀌면 sync()로 추가/삭제된 빌드만 반영
+- CL/리비전 같은 숫자 토큰은 빌드마다 달라 색인하지 않음 (해당 조각은 확인 단계에서만 검사)
+- 최신 빌드 조회는 리비전 순 목록을 위에서부터 확인하다 처음 맞는 빌드에서 멈춤
+"""
+import bisect
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .build_name import parse_build_name
+
+
+_NUMERIC_TOKEN_RE = re.compile(r'r?\d*')
+
+# 후보가 이 개수 이하면 후보만 정렬, 넘으면 리비전 순 목록을 위에서부터 확인
+LATEST_SCAN_THRESHOLD = 256
+
+
+def split_keywords(text: str) -> List[str]:
+    """';'로 구분된 검색어를 키워드 목록으로 (빈 항목 제외)"""
+    return [k.strip() for k in (text or '').split(';') if k.strip()]
+
+
+def _is_numeric_token(token: str) -> bool:
+    return _NUMERIC_TOKEN_RE.fullmatch(token) is not None
+
+
+class BuildTokenIndex:
+    """빌드명 토큰 역색인 (스레드 안전)"""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._names: Dict[str, int] = {}     # 빌드명 → 리비전
+        self._order: List[Tuple[int, str]] = []  # (리비전, 빌드명) 오름차순
+        self._postings: Dict[str, Set[str]] = {}
+        self._vocab: List[str] = []          # 정렬된 토큰 (앞부분 일치 검색)
+        self._vocab_rev: List[str] = []      # 뒤집은 토큰 정렬 (뒷부분 일치 검색)
+        self._vocab_dirty = False
+        self._piece_cache: Dict[tuple, Set[str]] = {}
+        self._keyword_cache: Dict[str, Optional[Set[str]]] = {}
+        self._lock = threading.Lock()
+        self.update(names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    # 갱신
+    def update(self, added: Iterable[str] = (), removed: Iterable[str] = ()) -> None:
+        """빌드 추가/삭제 반영"""
+        with self._lock:
+            for name in removed:
+                revision = self._names.pop(name, None)
+                if revision is None:
+                    continue
+                pos = bisect.bisect_left(self._order, (revision, name))
+                if pos < len(self._order) and self._order[pos] == (revision, name):
+                    del self._order[pos]
+                for token in self._tokens(name):
+                    posting = self._postings.get(token)
+                    if posting is None:
+                        continue
+                    posting.discard(name)
+                    if not posting:
+                        del self._postings[token]
+                        self._vocab_dirty = True
+            for name in added:
+                if name in self._names:
+                    continue
+                revision = parse_build_name(name).revision
+                self._names[name] = revision
+                bisect.insort(self._order, (revision, name))
+                for token in self._tokens(name):
+                    posting = self._postings.get(token)
+                    if posting is None:
+                        posting = self._postings[token] = set()
+                        self._vocab_dirty = True
+                    posting.add(name)
+            # 후보 캐시는 빌드 집합이 바뀌면 무효
+            self._piece_cache.clear()
+            self._keyword_cache.clear()
+
+    def sync(self, names: Iterable[str]) -> None:
+        """현재 목록과 비교해 바뀐 빌드만 반영"""
+        names = set(names)
+        with self._lock:
+            added = names.difference(self._names)
+            removed = set(self._names).difference(names)
+        if added or removed:
+            self.update(added, removed)
+
+    # 조회
+    def search(self, keywords: Iterable[str], limit: int = 0) -> List[str]:
+        """
+        모든 키워드를 포함하는 빌드명 (리비전 내림차순)
+
+        Args:
+            keywords: 이름에 모두 포함되어야 하는 문자열 목록 (비어 있으면 전체)
+            limit: 최대 개수 (0이면 제한 없음)
+        """
+        keywords = [k for k in keywords if k]
+        with self._lock:
+            constraints = self._constraints(keywords)
+            if constraints is None:
+                return []
+            if constraints and len(constraints[0]) <= LATEST_SCAN_THRESHOLD:
+                # 후보가 적으면 후보만 정렬
+                ordered = sorted(((self._names[n], n) for n in constraints[0]
+                                  if all(n in c for c in constraints[1:])), reverse=True)
+            else:
+                # 후보가 많으면 리비전 순 목록을 위에서부터 확인 (limit에 닿으면 중단)
+                ordered = (item for item in reversed(self._order)
+                           if all(item[1] in c for c in constraints))
+            result = []
+            for _, name in ordered:
+                if all(k in name for k in keywords):
+                    result.append(name)
+                    if 0 < limit <= len(result):
+                        break
+            return result
+
+    def latest(self, keywords: Iterable[str]) -> Optional[str]:
+        """모든 키워드를 포함하는 빌드 중 리비전이 가장 높은 빌드명"""
+        keywords = [k for k in keywords if k]
+        with self._lock:
+            constraints = self._constraints(keywords)
+            if constraints is None:
+                return None
+            if constraints and len(constraints[0]) <= LATEST_SCAN_THRESHOLD:
+                candidates = [(self._names[n], n) for n in constraints[0]
+                              if all(n in c for c in constraints[1:]) and all(k in n for k in keywords)]
+                return max(candidates)[1] if candidates else None
+            # 후보가 많으면 최신 빌드부터 확인 (대부분 몇 개 안에서 끝남)
+            for _, name in reversed(self._order):
+                if all(name in c for c in constraints) and all(k in name for k in keywords):
+                    return name
+            return None
+
+    def _constraints(self, keywords: List[str]) -> Optional[List[Set[str]]]:
+        """
+        키워드별 후보 집합 (작은 것부터, 좁힐 수 없는 키워드는 제외)
+
+        Returns:
+            후보 집합 목록, 맞는 빌드가 없는 게 확실하면 None
+        """
+        if self._vocab_dirty:
+            self._vocab = sorted(self._postings)
+            self._vocab_rev = sorted(t[::-1] for t in self._postings)
+            self._vocab_dirty = False
+        constraints = []
+        for keyword in keywords:
+            found = self._candidates(keyword)
+            if found is None:
+                continue
+            if not found:
+                return None
+            constraints.append(found)
+        constraints.sort(key=len)
+        return constraints
+
+    def _candidates(self, keyword: str) -> Optional[Set[str]]:
+        """
+        키워드를 포함할 수 있는 빌드 후보 (좁힐 수 없으면 None)
+
+        키워드를 '_'로 나눈 조각 중 가운데 조각은 토큰 전체와, 첫 조각은 토큰 뒷부분과,
+        마지막 조각은 토큰 앞부분과 일치해야 합니다 (조각이 하나면 토큰 안 어디든).
+        """
+        if keyword in self._keyword_cache:
+            return self._keyword_cache[keyword]
+        pieces = keyword.split('_')
+        result: Optional[Set[str]] = None
+        for i, piece in enumerate(pieces):
+            if _is_numeric_token(piece):
+                continue
+            if len(pieces) == 1:
+                mode = 'contains'
+            elif i == 0:
+                mode = 'suffix'
+            elif i == len(pieces) - 1:
+                mode = 'prefix'
+            else:
+                mode = 'exact'
+            found = self._piece_candidates(piece, mode)
+            result = found if result is None else result & found
+            if not result:
+                result = set()
+                break
+        self._keyword_cache[keyword] = result
+        return result
+
+    def _piece_candidates(self, piece: str, mode: str) -> Set[str]:
+        key = (piece, mode)
+        cached = self._piece_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if mode == 'exact':
+            tokens = [piece] if piece in self._postings else []
+        elif mode == 'prefix':
+            tokens = self._range(self._vocab, piece)
+        elif mode == 'suffix':
+            tokens = [t[::-1] for t in self._range(self._vocab_rev, piece[::-1])]
+        else:
+            tokens = [t for t in self._vocab if piece in t]
+
+        found: Set[str] = set()
+        for token in tokens:
+            found |= self._postings[token]
+        self._piece_cache[key] = found
+        return found
+
+    @staticmethod
+    def _range(sorted_tokens: List[str], prefix: str) -> List[str]:
+        start = bisect.bisect_left(sorted_tokens, prefix)
+        end = start
+        while end < len(sorted_tokens) and sorted_tokens[end].startswith(prefix):
+            end += 1
+        return sorted_tokens[start:end]
+
+    @staticmethod
+    def _tokens(name: str) -> Set[str]:
+        return {t for t in name.split('_') if t and not _is_numeric_token(t)}
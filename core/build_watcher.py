@@ -0,0 +1,184 @@
+"""새 빌드 감지 모듈 ("새 빌드가 올라오면 실행" 트리거)
+
+소스 루트 목록을 주기적으로 비교해 새로 생긴 빌드 폴더를 찾습니다.
+- 루트 폴더 mtime이 그대로면 목록을 다시 조회하지 않음
+- 변화가 없으면 조회 간격을 min_interval → max_interval까지 점점 늘리고, 변화가 생기면 다시 줄임
+- 새 빌드는 준비 완료(ready_check)될 때까지 대기 목록에 두었다가 콜백 호출
+"""
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+from .build_index import get_build_index
+
+
+# 스케줄 반복 유형 값
+REPEAT_TYPE_NEW_BUILD = 'new_build'
+
+# 조회 간격 (초)
+DEFAULT_MIN_INTERVAL = 5.0
+DEFAULT_MAX_INTERVAL = 60.0
+BACKOFF_FACTOR = 1.5
+
+
+def matches_prefix(build_name: str, prefix: str) -> bool:
+    """스케줄 Prefix와 빌드명 매칭 (find_latest_build와 같은 포함 검사)"""
+    return bool(prefix) and prefix in build_name
+
+
+class _WatchedRoot:
+    __slots__ = ('root', 'prefixes', 'known', 'root_mtime', 'pending', 'pending_mtimes',
+                 'interval', 'next_poll', 'last_listed')
+
+    def __init__(self, root: str, prefixes: Set[str], min_interval: float):
+        self.root = root
+        self.prefixes = prefixes
+        self.known: Optional[Set[str]] = None   # None이면 아직 기준 목록 없음
+        self.root_mtime: Optional[float] = None
+        self.pending: Dict[str, float] = {}     # 준비 대기 중인 새 빌드 → 처음 본 시각
+        self.pending_mtimes: Dict[str, float] = {}
+        self.interval = min_interval
+        self.next_poll = 0.0
+        self.last_listed = 0.0
+
+
+class NewBuildWatcher(threading.Thread):
+    """소스 루트별 새 빌드 감지 스레드"""
+
+    def __init__(self, on_new_build: Callable[[str, str], None],
+                 ready_check: Optional[Callable[[str, str], bool]] = None,
+                 min_interval: float = DEFAULT_MIN_INTERVAL,
+                 max_interval: float = DEFAULT_MAX_INTERVAL):
+        """
+        Args:
+            on_new_build: (루트, 빌드명) 콜백 - 감시 스레드에서 호출됨
+            ready_check: (루트, 빌드명) → 준비 완료 여부 (기본: 폴더 mtime이 한 주기 동안 변하지 않음)
+            min_interval: 최소 조회 간격 (초)
+            max_interval: 최대 조회 간격 (초, 백오프 상한)
+        """
+        super().__init__(name='new-build-watcher', daemon=True)
+        self.on_new_build = on_new_build
+        self.ready_check = ready_check
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._roots: Dict[str, _WatchedRoot] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+
+    def set_watches(self, watches: Dict[str, List[str]]) -> None:
+        """
+        감시 대상 설정
+
+        Args:
+            watches: {소스 루트: [Prefix, ...]} - 빠진 루트는 감시 중단, 기존 루트는 기준 목록 유지
+        """
+        with self._lock:
+            for root in list(self._roots):
+                if root not in watches:
+                    del self._roots[root]
+            for root, prefixes in watches.items():
+                prefixes = {p for p in prefixes if p}
+                if not root or not prefixes:
+                    self._roots.pop(root, None)
+                    continue
+                watched = self._roots.get(root)
+                if watched is None:
+                    self._roots[root] = _WatchedRoot(root, prefixes, self.min_interval)
+                else:
+                    watched.prefixes = prefixes
+        self._wake_event.set()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._wake_event.set()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            now = time.time()
+            with self._lock:
+                due = [w for w in self._roots.values() if w.next_poll <= now]
+            for watched in due:
+                if self._stop_event.is_set():
+                    break
+                try:
+                    self.poll(watched)
+                except Exception as e:
+                    print(f"[NewBuildWatcher] 조회 오류 ({watched.root}): {e}")
+                    watched.interval = self.max_interval
+                watched.next_poll = time.time() + watched.interval
+
+            # 가장 가까운 다음 조회 시각까지 대기 (감시 대상 변경 시 즉시 깨어남)
+            with self._lock:
+                next_poll = min((w.next_poll for w in self._roots.values()),
+                                default=time.time() + self.max_interval)
+            self._wake_event.wait(max(0.1, next_poll - time.time()))
+            self._wake_event.clear()
+
+    def poll(self, watched: _WatchedRoot) -> List[str]:
+        """
+        루트 한 번 조회 (새로 준비된 빌드명 목록 반환, 콜백도 호출)
+        """
+        root = watched.root
+        changed = False
+
+        # 루트 mtime이 그대로면 목록 조회 생략 (SMB mtime 누락 대비 max_interval마다는 다시 조회)
+        try:
+            root_mtime = os.stat(root).st_mtime
+        except OSError:
+            root_mtime = None
+        must_list = (watched.known is None or root_mtime != watched.root_mtime
+                     or time.time() - watched.last_listed >= self.max_interval)
+
+        if must_list and root_mtime is not None:
+            names = set(get_build_index().get_builds(root, force=True))
+            watched.last_listed = time.time()
+            if watched.known is None:
+                # 첫 조회는 기준 목록만 기록 (기존 빌드로는 실행하지 않음)
+                watched.known = names
+            else:
+                for name in names - watched.known:
+                    if any(matches_prefix(name, p) for p in watched.prefixes):
+                        print(f"[NewBuildWatcher] 새 빌드 발견: {name}")
+                        watched.pending[name] = time.time()
+                        changed = True
+                for name in list(watched.pending):
+                    if name not in names:
+                        watched.pending.pop(name, None)
+                        watched.pending_mtimes.pop(name, None)
+                changed = changed or names != watched.known
+                watched.known = names
+            watched.root_mtime = root_mtime
+
+        ready = []
+        for name in list(watched.pending):
+            if self._is_ready(watched, name):
+                watched.pending.pop(name, None)
+                watched.pending_mtimes.pop(name, None)
+                ready.append(name)
+
+        # 변화/대기 중인 빌드가 있으면 빠르게, 없으면 점점 느리게 조회
+        if changed or watched.pending:
+            watched.interval = self.min_interval
+        else:
+            watched.interval = min(self.max_interval, watched.interval * BACKOFF_FACTOR)
+
+        for name in ready:
+            try:
+                self.on_new_build(root, name)
+            except Exception as e:
+                print(f"[NewBuildWatcher] 콜백 오류 ({name}): {e}")
+        return ready
+
+    def _is_ready(self, watched: _WatchedRoot, name: str) -> bool:
+        if self.ready_check is not None:
+            return self.ready_check(watched.root, name)
+        # 기본: 빌드 폴더 mtime이 한 주기 동안 그대로면 준비 완료로 간주
+        try:
+            mtime = os.stat(os.path.join(watched.root, name)).st_mtime
+        except OSError:
+            return False
+        previous = watched.pending_mtimes.get(name)
+        watched.pending_mtimes[name] = mtime
+        return previous is not None and previous == mtime
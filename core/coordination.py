@@ -0,0 +1,558 @@
+"""여러 PC 스케줄 분산 실행 모듈 (임대(lease) 기반 잠금)
+
+같은 NAS를 보는 여러 QA PC가 겹치는 스케줄을 가지고 있을 때, 실행 시각 하나(또는 감지된 빌드 하나)를
+공유 저장소의 임대로 잡은 PC만 실행합니다. 설정 (settings.json):
+    coordination_enabled     true면 사용 (기본 false)
+    coordination_store       공유 잠금 폴더 (예: \\\\pubg-pds\\PBB\\GetBuildLocks) 또는 .db/.sqlite 파일
+    coordination_lease_ttl   임대 유지 시간 (초, 실행 중에는 주기적으로 연장)
+    coordination_claim_grace 담당 PC가 아닐 때 잡기 전에 기다리는 시간 (초)
+
+- 실행마다 살아 있는 PC 중 해시로 담당 PC를 정해(rendezvous hashing) 작업을 나눕니다.
+  담당 PC는 바로, 나머지는 claim_grace초 뒤에 임대를 시도하므로 담당 PC가 꺼져 있어도 실행됩니다.
+- 실행 중인 PC가 죽어 임대가 연장되지 않으면 만료 후 다른 PC가 넘겨받아 다시 실행합니다.
+- 끝난 실행(성공/실패)은 done으로 남겨 늦게 확인한 PC가 다시 실행하지 않게 합니다.
+- 만료 판정은 각 PC의 시계를 쓰므로 lease_ttl은 PC 간 시계 오차보다 충분히 길게 둡니다.
+- 실행 중 임대를 잃으면(공유 저장소 접근이 lease_ttl 넘게 끊겨 다른 PC가 넘겨받음) on_lost로 알립니다.
+  다단계 스케줄은 남은 단계를 취소하지만, 이미 실행 중인 작업(복사/업로드 한 단계)은 강제로
+  멈출 수 없어 끝까지 실행되므로 그동안 두 PC에서 같은 실행이 겹칠 수 있습니다.
+"""
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# 임대 상태
+LEASE_RUNNING = 'running'
+LEASE_DONE = 'done'
+
+# 임대 기본 유지 시간 (초, 실행 중에는 DEFAULT_LEASE_TTL / 4마다 연장)
+DEFAULT_LEASE_TTL = 120.0
+
+# 담당 PC가 아닐 때 임대를 시도하기 전 대기 (초)
+DEFAULT_CLAIM_GRACE = 15.0
+
+# 끝난 실행 기록 보관 시간 (초, 이 안에 같은 실행을 다른 PC가 잡지 않음)
+DEFAULT_DONE_KEEP = 24 * 3600.0
+
+# 못 잡은 실행을 다시 시도하는 최대 기간 (초, 담당 PC가 실행 도중 죽은 경우 넘겨받기)
+PENDING_MAX_AGE = 6 * 3600.0
+
+# 이 시간(초)마다 한 번 만료된 기록 정리
+PURGE_INTERVAL = 600.0
+
+# 만료된 임대를 덮어쓴 뒤 다시 읽어 확인하기 전 대기 (초, 동시에 덮어쓴 다른 PC의 쓰기가 끝나도록)
+TAKEOVER_SETTLE = 0.5
+
+
+class Lease:
+    """임대 하나"""
+
+    __slots__ = ('key', 'holder', 'expires_at', 'state')
+
+    def __init__(self, key: str, holder: str, expires_at: float, state: str = LEASE_RUNNING):
+        self.key = key
+        self.holder = holder
+        self.expires_at = expires_at
+        self.state = state
+
+    def __repr__(self) -> str:
+        return f"Lease({self.key!r}, {self.holder!r}, {self.state})"
+
+    def expired(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) >= self.expires_at
+
+    def to_dict(self) -> Dict[str, object]:
+        return {'key': self.key, 'holder': self.holder, 'expires_at': self.expires_at, 'state': self.state}
+
+
+class LeaseStore:
+    """임대 저장소 인터페이스"""
+
+    def try_acquire(self, key: str, holder: str, ttl: float) -> bool:
+        """임대가 없거나 만료된 running이면 잡기 (done은 만료 전까지 잡지 않음)"""
+        raise NotImplementedError
+
+    def renew(self, key: str, holder: str, ttl: float) -> bool:
+        """holder가 가진 running 임대 연장 (넘겨받혔으면 False)"""
+        raise NotImplementedError
+
+    def complete(self, key: str, holder: str, keep: float) -> None:
+        """holder가 가진 임대를 done으로 바꾸고 keep초 동안 보관"""
+        raise NotImplementedError
+
+    def get(self, key: str) -> Optional[Lease]:
+        raise NotImplementedError
+
+    def heartbeat(self, host: str, ttl: float) -> None:
+        """PC 생존 신호 (live_hosts 기준)"""
+        raise NotImplementedError
+
+    def live_hosts(self) -> List[str]:
+        raise NotImplementedError
+
+    def purge(self) -> int:
+        """만료된 임대/PC 기록 삭제 (삭제 수 반환)"""
+        raise NotImplementedError
+
+
+def _key_file(key: str) -> str:
+    return hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json'
+
+
+class DirectoryLeaseStore(LeaseStore):
+    """
+    공유 폴더 임대 저장소 (임대 하나 = 파일 하나)
+
+    생성은 O_CREAT|O_EXCL로 한 PC만 성공합니다. 만료된 임대는 PC별 임시 파일을 os.replace로
+    덮어쓴 뒤 잠시 기다렸다 다시 읽어 내 임대가 남아 있을 때만 넘겨받습니다. 임대 파일이 없어지는
+    순간이 없으므로 넘겨받는 도중 다른 PC가 O_EXCL 생성으로 끼어들 수 없습니다.
+    """
+
+    def __init__(self, root: str, settle: float = TAKEOVER_SETTLE):
+        self.root = root
+        self.lease_dir = os.path.join(root, 'leases')
+        self.host_dir = os.path.join(root, 'hosts')
+        self.settle = settle
+        os.makedirs(self.lease_dir, exist_ok=True)
+        os.makedirs(self.host_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.lease_dir, _key_file(key))
+
+    @staticmethod
+    def _read(path: str) -> Optional[Lease]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return Lease(data['key'], data['holder'], float(data['expires_at']), data.get('state', LEASE_RUNNING))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _write(path: str, lease: Lease) -> None:
+        """임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)"""
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(lease.to_dict(), f)
+        os.replace(tmp, path)
+
+    def _create(self, path: str, lease: Lease) -> bool:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(lease.to_dict(), f)
+        return True
+
+    def try_acquire(self, key: str, holder: str, ttl: float) -> bool:
+        path = self._path(key)
+        lease = Lease(key, holder, time.time() + ttl)
+        if self._create(path, lease):
+            return True
+        current = self._read(path)
+        if current is None:
+            # 다른 PC가 막 만든 파일을 읽는 중이거나 깨진 파일 - 이번에는 양보
+            return False
+        if current.holder == holder and current.state == LEASE_RUNNING:
+            return self.renew(key, holder, ttl)
+        if not current.expired():
+            return False
+        # 만료된 임대: 내 임대로 덮어쓴 뒤 확인 (동시에 덮어쓴 PC 중 마지막으로 쓴 PC만 남음)
+        claim = f"{path}.{holder.replace(os.sep, '_')}.{os.getpid()}.{threading.get_ident()}.claim"
+        try:
+            with open(claim, 'w', encoding='utf-8') as f:
+                json.dump(lease.to_dict(), f)
+            latest = self._read(path)
+            if latest is None or not latest.expired():
+                # 그 사이 다른 PC가 먼저 넘겨받음
+                return False
+            os.replace(claim, path)
+        except OSError:
+            return False
+        finally:
+            if os.path.exists(claim):
+                try:
+                    os.remove(claim)
+                except OSError:
+                    pass
+        time.sleep(self.settle)
+        check = self._read(path)
+        return (check is not None and check.holder == holder and check.state == LEASE_RUNNING
+                and check.expires_at == lease.expires_at)
+
+    def renew(self, key: str, holder: str, ttl: float) -> bool:
+        path = self._path(key)
+        current = self._read(path)
+        if current is None or current.holder != holder or current.state != LEASE_RUNNING:
+            return False
+        current.expires_at = time.time() + ttl
+        self._write(path, current)
+        return True
+
+    def complete(self, key: str, holder: str, keep: float) -> None:
+        path = self._path(key)
+        current = self._read(path)
+        if current is None or current.holder != holder:
+            return
+        current.state = LEASE_DONE
+        current.expires_at = time.time() + keep
+        self._write(path, current)
+
+    def get(self, key: str) -> Optional[Lease]:
+        return self._read(self._path(key))
+
+    def heartbeat(self, host: str, ttl: float) -> None:
+        path = os.path.join(self.host_dir, _key_file(host))
+        self._write(path, Lease(host, host, time.time() + ttl))
+
+    def live_hosts(self) -> List[str]:
+        hosts = []
+        now = time.time()
+        try:
+            names = os.listdir(self.host_dir)
+        except OSError:
+            return hosts
+        for name in names:
+            if not name.endswith('.json'):
+                continue
+            lease = self._read(os.path.join(self.host_dir, name))
+            if lease is not None and not lease.expired(now):
+                hosts.append(lease.holder)
+        return sorted(hosts)
+
+    def purge(self) -> int:
+        removed = 0
+        now = time.time()
+        for folder in (self.lease_dir, self.host_dir):
+            try:
+                names = os.listdir(folder)
+            except OSError:
+                continue
+            for name in names:
+                if not name.endswith('.json'):
+                    continue
+                path = os.path.join(folder, name)
+                lease = self._read(path)
+                if lease is not None and lease.expired(now):
+                    try:
+                        os.remove(path)
+                        removed += 1
+                    except OSError:
+                        pass
+        return removed
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    key TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    state TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS hosts (
+    host TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+class SQLiteLeaseStore(LeaseStore):
+    """
+    SQLite 파일 임대 저장소 (BEGIN IMMEDIATE로 잡기/넘겨받기를 한 트랜잭션에서 처리)
+
+    네트워크 드라이브에서는 WAL을 쓸 수 없어 기본 롤백 저널을 사용합니다.
+    """
+
+    def __init__(self, db_path: str, timeout: float = 10.0):
+        self.db_path = db_path
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=timeout, check_same_thread=False,
+                                     isolation_level=None)
+        with self._lock:
+            self._conn.executescript(_SQLITE_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _transaction(self, func):
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = func(self._conn)
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+            return result
+
+    def try_acquire(self, key: str, holder: str, ttl: float) -> bool:
+        def acquire(conn):
+            now = time.time()
+            row = conn.execute('SELECT holder, expires_at, state FROM leases WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                current_holder, expires_at, state = row
+                mine = current_holder == holder and state == LEASE_RUNNING
+                if not mine and now < expires_at:
+                    return False
+            conn.execute('INSERT OR REPLACE INTO leases (key, holder, expires_at, state) VALUES (?, ?, ?, ?)',
+                         (key, holder, now + ttl, LEASE_RUNNING))
+            return True
+        return self._transaction(acquire)
+
+    def renew(self, key: str, holder: str, ttl: float) -> bool:
+        def renew(conn):
+            cursor = conn.execute('UPDATE leases SET expires_at = ? WHERE key = ? AND holder = ? AND state = ?',
+                                  (time.time() + ttl, key, holder, LEASE_RUNNING))
+            return cursor.rowcount > 0
+        return self._transaction(renew)
+
+    def complete(self, key: str, holder: str, keep: float) -> None:
+        self._transaction(lambda conn: conn.execute(
+            'UPDATE leases SET state = ?, expires_at = ? WHERE key = ? AND holder = ?',
+            (LEASE_DONE, time.time() + keep, key, holder)))
+
+    def get(self, key: str) -> Optional[Lease]:
+        with self._lock:
+            row = self._conn.execute('SELECT key, holder, expires_at, state FROM leases WHERE key = ?',
+                                     (key,)).fetchone()
+        return Lease(*row) if row else None
+
+    def heartbeat(self, host: str, ttl: float) -> None:
+        self._transaction(lambda conn: conn.execute(
+            'INSERT OR REPLACE INTO hosts (host, expires_at) VALUES (?, ?)', (host, time.time() + ttl)))
+
+    def live_hosts(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute('SELECT host FROM hosts WHERE expires_at > ? ORDER BY host',
+                                      (time.time(),)).fetchall()
+        return [r[0] for r in rows]
+
+    def purge(self) -> int:
+        def purge(conn):
+            now = time.time()
+            removed = conn.execute('DELETE FROM leases WHERE expires_at <= ?', (now,)).rowcount
+            removed += conn.execute('DELETE FROM hosts WHERE expires_at <= ?', (now,)).rowcount
+            return removed
+        return self._transaction(purge)
+
+
+def create_lease_store(location: str) -> LeaseStore:
+    """경로가 .db/.sqlite/.sqlite3로 끝나면 SQLite, 아니면 잠금 폴더 저장소"""
+    if os.path.splitext(location)[1].lower() in ('.db', '.sqlite', '.sqlite3'):
+        return SQLiteLeaseStore(location)
+    return DirectoryLeaseStore(location)
+
+
+def default_host_id() -> str:
+    """PC 식별자 (호스트명, 같은 PC에서 UI와 데몬을 같이 띄우면 settings의 coordination_host_id로 구분)"""
+    return socket.gethostname().lower()
+
+
+def run_key(schedule_id: str, fire_at=None, build_name: str = '') -> str:
+    """실행 하나의 임대 키 (시각 실행은 예정 시각, 새 빌드 실행은 빌드명 기준)"""
+    if build_name:
+        return f"{schedule_id}@build:{build_name}"
+    if fire_at is not None:
+        return f"{schedule_id}@{fire_at.strftime('%Y-%m-%dT%H:%M:%S')}"
+    return f"{schedule_id}@manual:{time.time():.3f}"
+
+
+class ScheduleCoordinator:
+    """
+    실행 임대 관리 (스레드 안전)
+
+    submit()으로 실행을 넘기면 임대를 잡았을 때만 실행 함수를 호출하고,
+    못 잡은 실행은 poll()에서 다시 시도합니다. 실행이 끝나면 finish(schedule_id)를 호출합니다.
+    실행 중 임대를 잃으면 on_lost(임대 키, 스케줄 ID)를 생존 신호 스레드에서 호출합니다.
+    """
+
+    def __init__(self, store: LeaseStore, host_id: Optional[str] = None,
+                 lease_ttl: float = DEFAULT_LEASE_TTL, claim_grace: float = DEFAULT_CLAIM_GRACE,
+                 done_keep: float = DEFAULT_DONE_KEEP, log: Callable[[str], None] = print,
+                 on_lost: Optional[Callable[[str, str], None]] = None):
+        self.store = store
+        self.host_id = host_id or default_host_id()
+        self.lease_ttl = max(10.0, float(lease_ttl))
+        self.claim_grace = max(0.0, float(claim_grace))
+        self.done_keep = done_keep
+        self.log = log
+        self.on_lost = on_lost
+        self._held: Dict[str, str] = {}      # 임대 키 → 스케줄 ID (실행 중)
+        self._pending: Dict[str, Tuple[float, str, Callable[[], bool]]] = {}  # 임대 키 → (처음 본 시각, 스케줄 ID, 실행 함수)
+        self._hosts: List[str] = [self.host_id]
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_purge = 0.0
+
+    # 생존 신호 / 임대 연장 스레드
+    def start(self) -> None:
+        self._beat()
+        self._thread = threading.Thread(target=self._run, daemon=True, name='lease-heartbeat')
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.lease_ttl / 4):
+            self._beat()
+
+    def _beat(self) -> None:
+        try:
+            self.store.heartbeat(self.host_id, self.lease_ttl)
+            hosts = self.store.live_hosts()
+            with self._lock:
+                self._hosts = hosts if self.host_id in hosts else sorted(hosts + [self.host_id])
+                held = list(self._held.items())
+            for key, schedule_id in held:
+                if not self.store.renew(key, self.host_id, self.lease_ttl):
+                    self.log(f"[Coordinator] 임대를 잃었습니다 (다른 PC가 넘겨받음): {key}")
+                    with self._lock:
+                        self._held.pop(key, None)
+                    if self.on_lost is not None:
+                        try:
+                            self.on_lost(key, schedule_id)
+                        except Exception as e:
+                            self.log(f"[Coordinator] 임대 상실 처리 실패: {key} - {e}")
+            now = time.time()
+            if now - self._last_purge >= PURGE_INTERVAL:
+                self._last_purge = now
+                self.store.purge()
+        except (OSError, sqlite3.Error) as e:
+            self.log(f"[Coordinator] 공유 저장소 접근 실패: {e}")
+
+    # 실행
+    def preferred_host(self, key: str) -> str:
+        """살아 있는 PC 중 이 실행을 맡을 PC (rendezvous hashing)"""
+        with self._lock:
+            hosts = list(self._hosts)
+        return max(hosts, key=lambda host: hashlib.sha1(f"{host}|{key}".encode('utf-8')).digest())
+
+    def submit(self, key: str, schedule_id: str, run: Callable[[], bool]) -> bool:
+        """
+        임대를 잡으면 run() 호출 (run이 False를 반환하면 실행하지 않은 것으로 보고 임대를 끝냄)
+
+        Returns:
+            지금 실행했으면 True, 보류했으면 False (poll()에서 다시 시도)
+        """
+        with self._lock:
+            if key in self._held or key in self._pending:
+                return False
+            self._pending[key] = (time.monotonic(), schedule_id, run)
+        return self._try_claim(key)
+
+    def poll(self) -> int:
+        """보류한 실행 다시 시도 (실행한 수 반환)"""
+        with self._lock:
+            keys = list(self._pending)
+        return sum(1 for key in keys if self._try_claim(key))
+
+    def finish(self, schedule_id: str) -> None:
+        """스케줄 실행 종료 (성공/실패 모두 done으로 남겨 다른 PC가 다시 실행하지 않음)"""
+        with self._lock:
+            keys = [key for key, sid in self._held.items() if sid == schedule_id]
+        self._complete(keys)
+
+    def _complete(self, keys: List[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._held.pop(key, None)
+        for key in keys:
+            try:
+                self.store.complete(key, self.host_id, self.done_keep)
+            except (OSError, sqlite3.Error) as e:
+                self.log(f"[Coordinator] 임대 종료 기록 실패: {key} - {e}")
+
+    def held_keys(self) -> List[str]:
+        with self._lock:
+            return list(self._held)
+
+    def pending_keys(self) -> List[str]:
+        with self._lock:
+            return list(self._pending)
+
+    def has_pending(self, schedule_id: str) -> bool:
+        """이 스케줄의 실행 중 아직 임대를 기다리는 것이 있는지 (다른 PC가 실행하는지 확인 중)"""
+        with self._lock:
+            return any(entry[1] == schedule_id for entry in self._pending.values())
+
+    def _try_claim(self, key: str) -> bool:
+        with self._lock:
+            entry = self._pending.get(key)
+        if entry is None:
+            return False
+        first_seen, schedule_id, run = entry
+        waited = time.monotonic() - first_seen
+
+        try:
+            current = self.store.get(key)
+            if current is not None and current.state == LEASE_DONE and not current.expired():
+                # 이미 실행한 실행 (다른 PC 또는 이 PC)
+                self._drop(key)
+                return False
+            if waited > PENDING_MAX_AGE:
+                self._drop(key)
+                return False
+            if self.preferred_host(key) != self.host_id and waited < self.claim_grace:
+                return False
+            if not self.store.try_acquire(key, self.host_id, self.lease_ttl):
+                return False
+        except (OSError, sqlite3.Error) as e:
+            self.log(f"[Coordinator] 임대 확인 실패 (다음에 다시 시도): {key} - {e}")
+            return False
+
+        with self._lock:
+            if self._pending.pop(key, None) is None:
+                return False
+            self._held[key] = schedule_id
+        takeover = ' (넘겨받음)' if current is not None else ''
+        self.log(f"[Coordinator] 실행 임대 획득{takeover}: {key}")
+        started = False
+        try:
+            started = run()
+        finally:
+            if not started:
+                # 이 실행의 임대만 끝냄 (같은 스케줄의 다른 실행 임대는 유지)
+                self._complete([key])
+        return bool(started)
+
+    def _drop(self, key: str) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+
+
+def create_coordinator(config_mgr, log: Callable[[str], None] = print,
+                       on_lost: Optional[Callable[[str, str], None]] = None) -> Optional[ScheduleCoordinator]:
+    """settings.json 분산 실행 설정으로 코디네이터 생성 (사용 안 하거나 저장소를 못 열면 None)"""
+    if not config_mgr.get_setting('coordination_enabled', False):
+        return None
+    location = config_mgr.get_setting('coordination_store', '')
+    if not location:
+        log("[Coordinator] coordination_store가 설정되지 않아 분산 실행을 사용하지 않습니다")
+        return None
+    try:
+        store = create_lease_store(location)
+    except (OSError, sqlite3.Error) as e:
+        log(f"[Coordinator] 공유 저장소를 열 수 없어 단독 실행합니다: {location} - {e}")
+        return None
+    coordinator = ScheduleCoordinator(
+        store,
+        host_id=config_mgr.get_setting('coordination_host_id', '') or None,
+        lease_ttl=config_mgr.get_setting('coordination_lease_ttl', DEFAULT_LEASE_TTL),
+        claim_grace=config_mgr.get_setting('coordination_claim_grace', DEFAULT_CLAIM_GRACE),
+        log=log,
+        on_lost=on_lost)
+    coordinator.start()
+    log(f"[Coordinator] 분산 실행 사용: {location} (PC: {coordinator.host_id})")
+    return coordinator
@@ -0,0 +1,147 @@
+"""헤드리스 빌드 복사 CLI (PyQt 없이 실행, JSON 출력)
+
+사용 예:
+    python -m core.copy --build game_SEL --profile client
+    python -m core.copy --src \\\\pubg-pds\\PBB\\Builds --build CompileBuild_DEV_game_SEL_271167_r306671 \\
+        --dest C:/mybuild --profile all --workers 8
+
+stdout에는 한 줄에 하나씩 JSON 이벤트만 출력합니다 (start → progress... → summary 또는 error).
+라이브러리 로그(print)는 stderr로 보냅니다.
+
+종료 코드: 0 성공, 1 오류, 2 일부 파일 실패 (복사 실패면 게시하지 않음, 게시 중 사용 중인 파일은 건너뜀)
+"""
+import argparse
+import contextlib
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from .build_operations import BuildOperations
+from .config_manager import ConfigManager
+from .copy_engine import copy_build
+from .copy_sources import SOURCE_TYPES, create_copy_source, detect_source_type
+from .mirror_selector import MIRROR_MODE_FASTEST, MIRROR_MODE_STRIPE, parse_mirror_roots
+
+
+# 복사 프로필 → 빌드 하위 폴더 (execute_option의 클라복사/서버복사/전체복사와 동일)
+PROFILE_TARGETS = {
+    'client': 'WindowsClient',
+    'server': 'WindowsServer',
+    'all': '',
+}
+
+DEFAULT_SRC = r'\\pubg-pds\PBB\Builds'
+DEFAULT_DEST = 'C:/mybuild'
+
+
+class JsonEventWriter:
+    """JSON Lines 이벤트 출력 (progress는 interval 초 간격으로 제한)"""
+
+    def __init__(self, stream, progress_interval: float = 1.0):
+        self.stream = stream
+        self.progress_interval = progress_interval
+        self.started = time.perf_counter()
+        self._last_progress = 0.0
+
+    def emit(self, event: str, **fields) -> None:
+        record: Dict[str, Any] = {'event': event, 'time': round(time.time(), 3)}
+        record.update(fields)
+        self.stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.stream.flush()
+
+    def progress(self, files_done: int, files_total: int, bytes_done: int, bytes_total: int) -> None:
+        now = time.perf_counter()
+        if files_done == 0:
+            # 파일 복사 시작 - 빌드 탐색 / 미러 측정 시간은 elapsed / throughput에서 제외
+            self.started = now
+        elif files_done < files_total and now - self._last_progress < self.progress_interval:
+            return
+        self._last_progress = now
+        elapsed = now - self.started
+        self.emit('progress',
+                  files_done=files_done, files_total=files_total,
+                  bytes_done=bytes_done, bytes_total=bytes_total,
+                  elapsed=round(elapsed, 3),
+                  throughput=round(bytes_done / elapsed, 1) if elapsed > 0 else 0.0)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m core.copy',
+        description='QuickBuild 헤드리스 빌드 복사 (JSON Lines 출력)')
+    parser.add_argument('--src', default='', help='빌드 소스 경로 또는 URL (기본: settings.json input_box1)')
+    parser.add_argument('--build', required=True, help='빌드 Prefix 또는 전체 빌드명')
+    parser.add_argument('--dest', default='', help='로컬 저장 경로 (기본: settings.json input_box2)')
+    parser.add_argument('--profile', choices=sorted(PROFILE_TARGETS), default='client',
+                        help='복사 대상 (client=WindowsClient, server=WindowsServer, all=빌드 전체)')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='동시 파일 복사 수 (기본: settings.json copy_workers 또는 4)')
+    parser.add_argument('--source-type', choices=SOURCE_TYPES, default='',
+                        help='소스 유형 (기본: --src 값으로 자동 판별)')
+    parser.add_argument('--cache-path', default='', help='cache 소스의 로컬 캐시 경로')
+    parser.add_argument('--mirror', action='append', default=[],
+                        help='추가 미러 경로 (여러 번 지정 또는 ; 구분)')
+    parser.add_argument('--mirror-mode', choices=[MIRROR_MODE_FASTEST, MIRROR_MODE_STRIPE],
+                        default=MIRROR_MODE_FASTEST, help='미러 선택 모드')
+    parser.add_argument('--progress-interval', type=float, default=1.0,
+                        help='progress 이벤트 최소 간격 (초, 0이면 파일마다)')
+    parser.add_argument('--settings', default='settings.json', help='settings.json 경로')
+    return parser
+
+
+def run(args: argparse.Namespace, events: JsonEventWriter) -> int:
+    """복사 실행 (종료 코드 반환)"""
+    settings = ConfigManager(settings_path=args.settings).load_settings()
+    src_folder = args.src or settings.get('input_box1', DEFAULT_SRC)
+    dest_folder = args.dest or settings.get('input_box2', DEFAULT_DEST)
+    workers = args.workers or settings.get('copy_workers', 4)
+    source_type = args.source_type or detect_source_type(src_folder)
+    mirror_roots: List[str] = []
+    for value in args.mirror:
+        mirror_roots.extend(parse_mirror_roots(value))
+    target_name = PROFILE_TARGETS[args.profile]
+
+    source = create_copy_source(source_type, src_folder, args.cache_path)
+    try:
+        # 전체 빌드명이 아니면 Prefix 기준 최신 빌드 탐색
+        build_name: Optional[str] = args.build if source.exists(args.build) else None
+        if build_name is None:
+            build_name = BuildOperations.find_latest_build(src_folder, args.build, source)
+
+        events.emit('start', src=src_folder, source_type=source_type, build=build_name,
+                    dest=dest_folder, profile=args.profile, workers=workers,
+                    mirrors=mirror_roots, mirror_mode=args.mirror_mode)
+
+        result = copy_build(source, dest_folder, build_name, target_name,
+                            max_workers=workers, mirror_roots=mirror_roots,
+                            mirror_mode=args.mirror_mode, context={'schedule': 'cli'},
+                            progress_callback=events.progress)
+    finally:
+        source.close()
+
+    summary = result.to_dict()
+    summary.update(build=build_name, dest=dest_folder, profile=args.profile,
+                   status='failed' if not result.published else 'partial' if result.failed_files else 'ok')
+    events.emit('summary', **summary)
+    return 2 if result.failed_files else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    events = JsonEventWriter(sys.stdout, args.progress_interval)
+
+    # stdout은 JSON 전용으로 유지
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            return run(args, events)
+        except KeyboardInterrupt:
+            events.emit('error', status='cancelled', message='복사 취소됨')
+            return 1
+        except Exception as e:
+            events.emit('error', status='error', message=f"{type(e).__name__}: {e}")
+            return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
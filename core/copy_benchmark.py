@@ -0,0 +1,290 @@
+"""복사 경로 벤치마크 (합성 빌드 트리 + 선택적 지연 주입)
+
+사용 예:
+    python -m core.copy_benchmark
+    python -m core.copy_benchmark --workers 1 4 8 --latency-ms 0 5 --repeat 3
+    python -m core.copy_benchmark --output log/bench_new.json --compare log/bench_old.json
+
+임시 폴더에 실제 빌드 구조(작은 파일 다수, 대용량 pak 몇 개, 깊은 폴더)를 흉내 낸 트리를 만들고
+copy_build(CopyEngine) / BuildOperations.copy_folder를 워커 수·지연 조건별로 실행해
+결과를 JSON으로 저장합니다. 커밋 간 비교는 --compare로 합니다.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .build_operations import BuildOperations
+from .copy_engine import copy_build
+from .copy_sources import PathCopySource
+
+
+BENCH_BUILD_NAME = 'CompileBuild_DEV_game_BENCH_100000_r100000'
+BENCH_TARGET = 'WindowsClient'
+
+# 벤치마크 대상 복사 경로
+PATH_ENGINE = 'engine'   # copy_build (CopyEngine + 스테이징)
+PATH_LEGACY = 'legacy'   # BuildOperations.copy_folder (순차)
+BENCH_PATHS = (PATH_ENGINE, PATH_LEGACY)
+
+# 합성 트리 기본 구성 (scale=1.0 기준, 약 300MB)
+DEFAULT_SHAPE = {
+    'tiny_files': 3000,              # 설정/셰이더 캐시 등 작은 파일
+    'tiny_size': 2 * 1024,
+    'medium_files': 200,             # dll/exe 등
+    'medium_size': 512 * 1024,
+    'huge_files': 4,                 # pak
+    'huge_size': 48 * 1024 * 1024,
+    'depth': 8,                      # 최대 폴더 깊이
+    'fanout': 4,                     # 폴더당 하위 폴더 수
+}
+
+
+def generate_build_tree(root: str, shape: Optional[Dict[str, int]] = None,
+                        scale: float = 1.0) -> Dict[str, int]:
+    """
+    root/BENCH_BUILD_NAME/WindowsClient 아래에 합성 빌드 트리 생성
+
+    Returns:
+        {'files': 파일 수, 'dirs': 폴더 수, 'bytes': 전체 크기}
+    """
+    shape = dict(DEFAULT_SHAPE, **(shape or {}))
+    base = os.path.join(root, BENCH_BUILD_NAME, BENCH_TARGET)
+
+    # 깊이 우선으로 폴더 생성 (Content/Paks, Binaries/Win64 같은 깊은 경로 흉내)
+    dirs = ['']
+    frontier = ['']
+    for _ in range(shape['depth']):
+        next_frontier = []
+        for parent in frontier[:shape['fanout']]:
+            for i in range(shape['fanout']):
+                rel = os.path.join(parent, f"Dir{i}") if parent else f"Dir{i}"
+                next_frontier.append(rel)
+        dirs.extend(next_frontier)
+        frontier = next_frontier
+    for rel in dirs:
+        os.makedirs(os.path.join(base, rel), exist_ok=True)
+
+    block = os.urandom(1024 * 1024)
+    stats = {'files': 0, 'dirs': len(dirs), 'bytes': 0}
+
+    def write_file(path: str, size: int) -> None:
+        with open(path, 'wb') as f:
+            remaining = size
+            while remaining > 0:
+                chunk = block[:min(remaining, len(block))]
+                f.write(chunk)
+                remaining -= len(chunk)
+        stats['files'] += 1
+        stats['bytes'] += size
+
+    groups = [('tiny', 'ini'), ('medium', 'dll'), ('huge', 'pak')]
+    for kind, ext in groups:
+        count = max(1 if shape[f'{kind}_files'] else 0, int(shape[f'{kind}_files'] * scale))
+        size = shape[f'{kind}_size']
+        if kind == 'huge':
+            size = max(1, int(size * scale))
+        for i in range(count):
+            rel_dir = 'Paks' if kind == 'huge' else dirs[i % len(dirs)]
+            target_dir = os.path.join(base, rel_dir)
+            os.makedirs(target_dir, exist_ok=True)
+            write_file(os.path.join(target_dir, f"{kind}_{i}.{ext}"), size)
+
+    return stats
+
+
+@contextlib.contextmanager
+def inject_latency(latency_ms: float):
+    """
+    파일 복사마다 지연 추가 (SMB 왕복 지연 흉내)
+
+    두 복사 경로 모두 파일 단위로 shutil.copy/copy2를 호출하므로 이를 감쌉니다.
+    """
+    if latency_ms <= 0:
+        yield
+        return
+
+    delay = latency_ms / 1000.0
+    original_copy, original_copy2 = shutil.copy, shutil.copy2
+
+    def slow_copy(*args, **kwargs):
+        time.sleep(delay)
+        return original_copy(*args, **kwargs)
+
+    def slow_copy2(*args, **kwargs):
+        time.sleep(delay)
+        return original_copy2(*args, **kwargs)
+
+    shutil.copy, shutil.copy2 = slow_copy, slow_copy2
+    try:
+        yield
+    finally:
+        shutil.copy, shutil.copy2 = original_copy, original_copy2
+
+
+def run_once(path: str, src_root: str, dest_root: str, workers: int) -> float:
+    """복사 1회 실행 (경과 초 반환)"""
+    if os.path.exists(dest_root):
+        shutil.rmtree(dest_root)
+    os.makedirs(dest_root)
+
+    started = time.perf_counter()
+    if path == PATH_ENGINE:
+        source = PathCopySource(src_root)
+        result = copy_build(source, dest_root, BENCH_BUILD_NAME, BENCH_TARGET, max_workers=workers)
+        if result.failed_files:
+            raise RuntimeError(f"복사 실패 파일: {result.failed_files[:5]}")
+    elif path == PATH_LEGACY:
+        BuildOperations.copy_folder(os.path.join(src_root, BENCH_BUILD_NAME, BENCH_TARGET),
+                                    os.path.join(dest_root, BENCH_BUILD_NAME, BENCH_TARGET))
+    else:
+        raise ValueError(f"알 수 없는 복사 경로: {path}")
+    return time.perf_counter() - started
+
+
+def run_benchmark(paths: List[str], workers_list: List[int], latencies: List[float],
+                  repeat: int = 3, scale: float = 1.0, work_dir: str = '') -> Dict[str, Any]:
+    """전체 벤치마크 실행 (결과 dict 반환)"""
+    temp_root = tempfile.mkdtemp(prefix='quickbuild_bench_', dir=work_dir or None)
+    src_root = os.path.join(temp_root, 'src')
+    dest_root = os.path.join(temp_root, 'dest')
+    results = []
+    try:
+        print(f"[bench] 합성 트리 생성 중: {src_root}")
+        tree = generate_build_tree(src_root, scale=scale)
+        print(f"[bench] {tree['files']} files, {tree['dirs']} dirs, {tree['bytes'] / (1024 * 1024):.1f} MB")
+
+        for latency_ms in latencies:
+            for path in paths:
+                # 순차 경로는 워커 수와 무관
+                path_workers = [1] if path == PATH_LEGACY else workers_list
+                for workers in path_workers:
+                    runs = []
+                    with inject_latency(latency_ms):
+                        for _ in range(repeat):
+                            runs.append(run_once(path, src_root, dest_root, workers))
+                    median = statistics.median(runs)
+                    entry = {
+                        'path': path,
+                        'workers': workers,
+                        'latency_ms': latency_ms,
+                        'runs': [round(r, 4) for r in runs],
+                        'median_s': round(median, 4),
+                        'min_s': round(min(runs), 4),
+                        'throughput_mb_s': round(tree['bytes'] / median / (1024 * 1024), 2) if median > 0 else 0.0,
+                        'files_per_s': round(tree['files'] / median, 1) if median > 0 else 0.0,
+                    }
+                    results.append(entry)
+                    print(f"[bench] {path:<6} workers={workers:<2} latency={latency_ms}ms "
+                          f"median={entry['median_s']:.3f}s ({entry['throughput_mb_s']} MB/s)")
+    finally:
+        shutil.rmtree(temp_root, ignore_errors=True)
+
+    return {
+        'meta': {
+            'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'repeat': repeat,
+            'scale': scale,
+            'tree': tree,
+        },
+        'results': results,
+    }
+
+
+def _git_commit() -> str:
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                             text=True, timeout=5)
+        return out.stdout.strip() if out.returncode == 0 else ''
+    except Exception:
+        return ''
+
+
+def _result_key(entry: Dict[str, Any]) -> tuple:
+    return entry['path'], entry['workers'], entry['latency_ms']
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    두 결과 파일 비교 (중앙값 기준)
+
+    Returns:
+        [{'path', 'workers', 'latency_ms', 'baseline_s', 'current_s', 'change_pct'}]
+        change_pct < 0 이면 빨라짐
+    """
+    base_map = {_result_key(e): e for e in baseline.get('results', [])}
+    rows = []
+    for entry in current.get('results', []):
+        base = base_map.get(_result_key(entry))
+        if not base or not base['median_s']:
+            continue
+        rows.append({
+            'path': entry['path'],
+            'workers': entry['workers'],
+            'latency_ms': entry['latency_ms'],
+            'baseline_s': base['median_s'],
+            'current_s': entry['median_s'],
+            'change_pct': round((entry['median_s'] - base['median_s']) / base['median_s'] * 100, 1),
+        })
+    return rows
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m core.copy_benchmark',
+                                     description='QuickBuild 복사 경로 벤치마크')
+    parser.add_argument('--paths', nargs='+', choices=BENCH_PATHS, default=list(BENCH_PATHS),
+                        help='측정할 복사 경로')
+    parser.add_argument('--workers', nargs='+', type=int, default=[1, 2, 4, 8],
+                        help='engine 경로의 워커 수 목록')
+    parser.add_argument('--latency-ms', nargs='+', type=float, default=[0.0],
+                        help='파일당 주입 지연 (ms) 목록, 예: 0 5 20')
+    parser.add_argument('--repeat', type=int, default=3, help='조건별 반복 횟수')
+    parser.add_argument('--scale', type=float, default=1.0, help='트리 크기 배율 (0.1 = 빠른 측정)')
+    parser.add_argument('--work-dir', default='', help='임시 트리 위치 (기본: 시스템 임시 폴더)')
+    parser.add_argument('--output', default='', help='결과 JSON 경로 (기본: log/copy_benchmark_<commit>.json)')
+    parser.add_argument('--compare', default='', help='비교할 이전 결과 JSON')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    # 복사 모듈 로그는 stderr로 (결과 요약만 stdout)
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run_benchmark(args.paths, args.workers, args.latency_ms,
+                               repeat=max(1, args.repeat), scale=args.scale, work_dir=args.work_dir)
+
+    output = args.output or os.path.join(
+        'log', f"copy_benchmark_{report['meta']['commit'] or datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    output_dir = os.path.dirname(output)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"비교 기준: {args.compare} ({baseline.get('meta', {}).get('commit', '')})")
+        for row in compare_results(baseline, report):
+            print(f"  {row['path']:<6} workers={row['workers']:<2} latency={row['latency_ms']}ms "
+                  f"{row['baseline_s']:.3f}s → {row['current_s']:.3f}s ({row['change_pct']:+.1f}%)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
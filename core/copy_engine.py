@@ -0,0 +1,214 @@
+"""빌드 복사 엔진 모듈 (복사 소스 백엔드 + 병렬 파일 복사)"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+from .copy_sources import CopySource
+from .mirror_selector import select_mirror_source
+from .staging import StagedBuild
+
+
+class CopyResult:
+    """복사 결과 요약"""
+
+    def __init__(self, source: str = ''):
+        self.source = source
+        self.file_count = 0
+        self.dir_count = 0
+        self.bytes_copied = 0
+        self.failed_files: List[str] = []
+        self.elapsed = 0.0
+        self.published = False  # 최종 위치에 게시되었는지 (복사 실패 파일이 있으면 게시하지 않음)
+
+    @property
+    def throughput(self) -> float:
+        """초당 복사 바이트 수"""
+        return self.bytes_copied / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """UI/슬랙 표시용 결과 메시지"""
+        result = f"{self.file_count} files copied, {self.dir_count} dirs created"
+        if not self.published:
+            result += f" ❌ {len(self.failed_files)} files failed, not published"
+            if len(self.failed_files) <= 5:
+                result += f": {', '.join(self.failed_files)}"
+        elif self.failed_files:
+            result += f" ⚠️ {len(self.failed_files)} files skipped (in use)"
+            if len(self.failed_files) <= 5:
+                result += f": {', '.join(self.failed_files)}"
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'source': self.source,
+            'files': self.file_count,
+            'dirs': self.dir_count,
+            'bytes': self.bytes_copied,
+            'elapsed': round(self.elapsed, 3),
+            'throughput': round(self.throughput, 1),
+            'failures': list(self.failed_files),
+            'published': self.published,
+        }
+
+
+class CopyEngine:
+    """복사 소스에서 로컬 경로로 빌드 트리를 병렬 복사"""
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Args:
+            max_workers: 동시 파일 복사 수 (SMB/HTTP 지연을 감추기 위한 병렬도)
+        """
+        self.max_workers = max(1, max_workers)
+
+    def copy(self, source: CopySource, rel_path: str, dest_path: str,
+             progress_callback: Optional[Callable[[int, int, int, int], None]] = None,
+             cancel_check: Optional[Callable[[], bool]] = None) -> CopyResult:
+        """
+        트리 복사
+
+        Args:
+            source: 복사 소스
+            rel_path: 소스 루트 기준 복사할 폴더 (예: 'CompileBuild_..._r306671/WindowsClient')
+            dest_path: 로컬 대상 폴더
+            progress_callback: (완료 파일 수, 전체 파일 수, 완료 바이트, 전체 바이트) 콜백
+                (파일 복사를 시작할 때 완료 0으로 한 번 호출)
+            cancel_check: 취소 체크 콜백 (True 반환시 중단)
+
+        Returns:
+            CopyResult
+        """
+        result = CopyResult(source.describe())
+        started = time.perf_counter()
+
+        dirs, files = source.list_tree(rel_path)
+
+        # 디렉터리(빈 폴더 포함) 먼저 생성
+        if not os.path.exists(dest_path):
+            os.makedirs(dest_path)
+            result.dir_count += 1
+        for rel_dir in sorted(dirs):
+            dest_dir = os.path.join(dest_path, *rel_dir.split('/'))
+            if not os.path.exists(dest_dir):
+                os.makedirs(dest_dir)
+                result.dir_count += 1
+
+        # 큰 파일부터 시작해 마지막 워커만 대용량 파일을 붙잡고 있는 상황을 줄임
+        files = sorted(files, key=lambda f: f[1], reverse=True)
+        total_files = len(files)
+        total_bytes = sum(size for _, size in files)
+        base = rel_path.replace('\\', '/').strip('/')
+        lock = threading.Lock()
+        done = [0]
+        # 파일 복사 시작 알림 (미러 측정 / 목록 조회가 끝난 시점 - 소요 시간/속도 기준)
+        if progress_callback:
+            progress_callback(0, total_files, 0, total_bytes)
+
+        def copy_one(rel_file: str):
+            if cancel_check and cancel_check():
+                raise InterruptedError("복사 취소됨")
+            src_rel = f"{base}/{rel_file}" if base else rel_file
+            dest_file = os.path.join(dest_path, *rel_file.split('/'))
+            file_name = rel_file.rsplit('/', 1)[-1]
+            try:
+                copied = source.copy_file(src_rel, dest_file)
+            except PermissionError:
+                print(f"[경고] {file_name}: 복사 실패 (파일 사용 중)")
+                copied = None
+            except Exception as e:
+                print(f"[오류] {file_name}: {type(e).__name__}: {e}")
+                copied = None
+
+            with lock:
+                done[0] += 1
+                if copied is None:
+                    result.failed_files.append(file_name)
+                else:
+                    result.file_count += 1
+                    result.bytes_copied += copied
+                if progress_callback:
+                    progress_callback(done[0], total_files, result.bytes_copied, total_bytes)
+
+        try:
+            if self.max_workers == 1:
+                for rel_file, _ in files:
+                    copy_one(rel_file)
+            else:
+                with ThreadPoolExecutor(max_workers=self.max_workers,
+                                        thread_name_prefix='copy') as pool:
+                    futures = [pool.submit(copy_one, rel_file) for rel_file, _ in files]
+                    try:
+                        for future in as_completed(futures):
+                            future.result()
+                    except InterruptedError:
+                        for future in futures:
+                            future.cancel()
+                        raise
+        finally:
+            result.elapsed = time.perf_counter() - started
+
+        return result
+
+
+def copy_build(source: CopySource, dest_folder: str, build_name: str, target_name: str = '',
+               max_workers: int = 4, mirror_roots: Optional[List[str]] = None,
+               mirror_mode: str = 'fastest', context: Optional[Dict[str, Any]] = None,
+               progress_callback: Optional[Callable[[int, int, int, int], None]] = None,
+               cancel_check: Optional[Callable[[], bool]] = None) -> CopyResult:
+    """
+    빌드(또는 하위 폴더) 하나를 스테이징 폴더에 복사한 뒤 dest_folder에 게시
+
+    Args:
+        source: 주 복사 소스
+        dest_folder: 로컬 저장 경로 (예: C:/mybuild)
+        build_name: 빌드 전체명
+        target_name: 복사할 하위 폴더 (예: WindowsClient, '' 이면 빌드 전체)
+        max_workers: 동시 파일 복사 수
+        mirror_roots: 추가 미러 경로 목록 (측정 후 최속 미러 선택 또는 분산 복사)
+        mirror_mode: 'fastest' 또는 'stripe'
+        context: 미러 선택 기록에 함께 남길 정보
+        progress_callback: CopyEngine.copy와 동일
+        cancel_check: CopyEngine.copy와 동일
+
+    Returns:
+        CopyResult (게시 중 건너뛴 파일 포함). 복사에 실패한 파일이 있으면 스테이징 폴더를 버리고
+        게시하지 않습니다 (published=False, 기존 폴더는 그대로 유지)
+    """
+    rel_path = f"{build_name}/{target_name}" if target_name else build_name
+
+    if not source.is_available():
+        raise Exception(f'Source path is not valid: {source.root}')
+    if not os.path.isdir(dest_folder):
+        raise Exception(f'Destination path is not valid: {dest_folder}')
+    if not source.exists(rel_path):
+        raise Exception(f'Folder to copy does not exist: {rel_path}')
+
+    # 숨김 스테이징 폴더에 복사 후 완료 시 rename으로 게시 (반쯤 복사된 빌드 노출 방지)
+    staged = StagedBuild(dest_folder, build_name, target_name)
+
+    # 미러가 있으면 측정 후 복사 소스 결정
+    selected = source
+    if mirror_roots:
+        ctx = {'build': build_name}
+        ctx.update(context or {})
+        selected = select_mirror_source(source, mirror_roots, rel_path, mirror_mode, ctx)
+
+    engine = CopyEngine(max_workers=max_workers)
+    try:
+        result = engine.copy(selected, rel_path, staged.path, progress_callback, cancel_check)
+        if result.failed_files:
+            print(f"[copy_build] {len(result.failed_files)}개 파일 복사 실패 - 게시하지 않음: {rel_path}")
+            staged.discard()
+            return result
+        staged.publish()
+        result.published = True
+        result.failed_files.extend(staged.skipped_files)
+    except BaseException:
+        staged.discard()
+        raise
+    finally:
+        if selected is not source:
+            selected.close()
+    return result
@@ -0,0 +1,498 @@
+"""빌드 복사 소스 백엔드 모듈 (경로 / HTTP 아티팩트 / 로컬 캐시)"""
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+
+# 소스 유형 (스케줄의 'source_type' 값)
+SOURCE_TYPE_PATH = 'path'
+SOURCE_TYPE_HTTP = 'http'
+SOURCE_TYPE_CACHE = 'cache'
+
+SOURCE_TYPES = [SOURCE_TYPE_PATH, SOURCE_TYPE_HTTP, SOURCE_TYPE_CACHE]
+
+# HTTP 다운로드 재시도 횟수 / 재시도 간격 (초, 시도마다 배수로 증가)
+HTTP_RETRIES = 3
+HTTP_RETRY_DELAY = 1.0
+
+# HTTP 응답을 파일에 쓰는 단위 (연결이 끊기면 마지막으로 다 받은 단위 다음부터 이어받음)
+HTTP_READ_SIZE = 256 * 1024
+
+
+class CopySource:
+    """
+    복사 소스 백엔드 기본 클래스
+
+    모든 경로 인자는 소스 루트 기준 상대 경로이며 구분자는 '/' 를 사용합니다.
+    (예: 'CompileBuild_DEV_game_SEL_271167_r306671/WindowsClient')
+    """
+
+    source_type = ''
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def describe(self) -> str:
+        """로그 표시용 소스 설명"""
+        return f"{self.source_type}:{self.root}"
+
+    def is_available(self) -> bool:
+        """소스 루트 접근 가능 여부"""
+        raise NotImplementedError
+
+    def list_builds(self) -> List[str]:
+        """소스 루트 아래 빌드 폴더명 목록"""
+        raise NotImplementedError
+
+    def exists(self, rel_path: str) -> bool:
+        """상대 경로(빌드 폴더 또는 하위 폴더) 존재 여부"""
+        raise NotImplementedError
+
+    def list_tree(self, rel_path: str) -> Tuple[List[str], List[Tuple[str, int]]]:
+        """
+        하위 트리 조회
+
+        Returns:
+            (디렉터리 목록, [(파일 경로, 크기), ...]) - 모두 rel_path 기준 상대 경로
+        """
+        raise NotImplementedError
+
+    def copy_file(self, rel_file: str, dest_file: str) -> int:
+        """
+        파일 하나를 dest_file 로 복사
+
+        Returns:
+            복사한 바이트 수
+        """
+        raise NotImplementedError
+
+    def read_sample(self, rel_file: str, length: int) -> int:
+        """
+        파일 앞부분을 length 바이트까지 읽고 버림 (미러 처리량 측정용)
+
+        Returns:
+            읽은 바이트 수
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """리소스 정리 (세션, 스레드 풀 등)"""
+        pass
+
+
+class PathCopySource(CopySource):
+    """파일시스템 경로 소스 (SMB 공유 폴더, 로컬 폴더)"""
+
+    source_type = SOURCE_TYPE_PATH
+
+    def _abs(self, rel_path: str) -> str:
+        parts = [p for p in rel_path.replace('\\', '/').split('/') if p]
+        return os.path.join(self.root, *parts)
+
+    def is_available(self) -> bool:
+        return os.path.isdir(self.root)
+
+    def list_builds(self) -> List[str]:
+        if not os.path.isdir(self.root):
+            return []
+        with os.scandir(self.root) as it:
+            return [entry.name for entry in it if entry.is_dir()]
+
+    def exists(self, rel_path: str) -> bool:
+        return os.path.isdir(self._abs(rel_path))
+
+    def list_tree(self, rel_path: str) -> Tuple[List[str], List[Tuple[str, int]]]:
+        base = self._abs(rel_path)
+        dirs = []
+        files = []
+        pending = ['']
+        while pending:
+            rel_dir = pending.pop()
+            with os.scandir(os.path.join(base, rel_dir) if rel_dir else base) as it:
+                for entry in it:
+                    rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    if entry.is_dir():
+                        dirs.append(rel)
+                        pending.append(rel)
+                    else:
+                        # Windows에서는 DirEntry.stat()이 추가 요청 없이 캐시값을 반환
+                        files.append((rel, entry.stat().st_size))
+        return dirs, files
+
+    def copy_file(self, rel_file: str, dest_file: str) -> int:
+        src_file = self._abs(rel_file)
+        # 목적지 파일이 이미 존재하고 읽기 전용이면 속성 제거
+        if os.path.exists(dest_file):
+            try:
+                os.chmod(dest_file, 0o777)
+            except OSError:
+                pass
+        shutil.copy2(src_file, dest_file)
+        return os.path.getsize(dest_file)
+
+    def read_sample(self, rel_file: str, length: int) -> int:
+        read = 0
+        with open(self._abs(rel_file), 'rb') as f:
+            while read < length:
+                chunk = f.read(min(1024 * 1024, length - read))
+                if not chunk:
+                    break
+                read += len(chunk)
+        return read
+
+
+class HttpCopySource(CopySource):
+    """
+    HTTP 아티팩트 소스
+
+    서버 규약:
+        GET {base}/index.json                 → ["빌드명", ...] 또는 {"builds": [...]}
+        GET {base}/{빌드명}/manifest.json      → {"dirs": [...], "files": [{"path": ..., "size": ...}]}
+        GET {base}/{빌드명}/{파일 경로}          → 파일 내용 (Range 요청 지원 시 분할 다운로드)
+
+    연결이 끊기거나 5xx 응답이면 받은 위치부터 Range 요청으로 이어받습니다 (최대 retries회).
+    """
+
+    source_type = SOURCE_TYPE_HTTP
+
+    def __init__(self, root: str, session=None, chunk_size: int = 8 * 1024 * 1024,
+                 range_workers: int = 4, timeout: float = 30.0, retries: int = HTTP_RETRIES,
+                 retry_delay: float = HTTP_RETRY_DELAY):
+        """
+        Args:
+            root: 아티팩트 기본 URL (예: http://artifacts.local/builds)
+            session: requests.Session (None이면 커넥션 풀 세션 생성)
+            chunk_size: Range 요청 한 개당 바이트 수 (이보다 큰 파일은 분할 다운로드)
+            range_workers: 파일 하나당 동시 Range 요청 수
+            timeout: 요청 타임아웃 (초)
+            retries: 파일/Range 하나당 재시도 횟수
+            retry_delay: 첫 재시도 전 대기 (초)
+        """
+        super().__init__(root.rstrip('/'))
+        self.chunk_size = chunk_size
+        self.range_workers = max(1, range_workers)
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.retry_delay = retry_delay
+        self._session = session or self._create_session()
+        self._range_pool = ThreadPoolExecutor(max_workers=self.range_workers,
+                                              thread_name_prefix='http-range')
+        self._manifests: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _create_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        # 복사 워커 + Range 워커가 동시에 연결을 재사용할 수 있도록 풀 크기 확보
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=2)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _url(self, rel_path: str) -> str:
+        parts = [quote(p) for p in rel_path.replace('\\', '/').split('/') if p]
+        return '/'.join([self.root] + parts)
+
+    def _get_json(self, rel_path: str):
+        response = self._session.get(self._url(rel_path), timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _get_manifest(self, build: str) -> Optional[dict]:
+        with self._lock:
+            if build in self._manifests:
+                return self._manifests[build]
+        try:
+            manifest = self._get_json(f"{build}/manifest.json")
+            # 파일별 크기 조회용 색인
+            manifest['_sizes'] = {f.get('path', ''): int(f.get('size', 0))
+                                  for f in manifest.get('files', [])}
+        except Exception:
+            manifest = None
+        with self._lock:
+            self._manifests[build] = manifest
+        return manifest
+
+    @staticmethod
+    def _split(rel_path: str) -> Tuple[str, str]:
+        """'빌드명/하위경로' → (빌드명, 하위경로)"""
+        parts = [p for p in rel_path.replace('\\', '/').split('/') if p]
+        if not parts:
+            return '', ''
+        return parts[0], '/'.join(parts[1:])
+
+    def is_available(self) -> bool:
+        try:
+            self._get_json('index.json')
+            return True
+        except Exception:
+            return False
+
+    def list_builds(self) -> List[str]:
+        data = self._get_json('index.json')
+        if isinstance(data, dict):
+            data = data.get('builds', [])
+        return [str(name) for name in data] if isinstance(data, list) else []
+
+    def exists(self, rel_path: str) -> bool:
+        build, sub = self._split(rel_path)
+        manifest = self._get_manifest(build) if build else None
+        if not manifest:
+            return False
+        if not sub:
+            return True
+        prefix = sub + '/'
+        return (sub in manifest.get('dirs', [])
+                or any(f.get('path', '').startswith(prefix) for f in manifest.get('files', [])))
+
+    def list_tree(self, rel_path: str) -> Tuple[List[str], List[Tuple[str, int]]]:
+        build, sub = self._split(rel_path)
+        manifest = self._get_manifest(build)
+        if not manifest:
+            raise FileNotFoundError(f"manifest.json not found: {self._url(build)}")
+
+        prefix = f"{sub}/" if sub else ''
+        dirs = set()
+        files = []
+        for d in manifest.get('dirs', []):
+            if d.startswith(prefix) and d != sub:
+                dirs.add(d[len(prefix):])
+        for f in manifest.get('files', []):
+            path = f.get('path', '')
+            if not path.startswith(prefix):
+                continue
+            rel = path[len(prefix):]
+            files.append((rel, int(f.get('size', 0))))
+            # 매니페스트에 디렉터리 목록이 없어도 상위 폴더 생성
+            parent = rel.rsplit('/', 1)[0] if '/' in rel else ''
+            while parent and parent not in dirs:
+                dirs.add(parent)
+                parent = parent.rsplit('/', 1)[0] if '/' in parent else ''
+        return sorted(dirs), files
+
+    def copy_file(self, rel_file: str, dest_file: str) -> int:
+        url = self._url(rel_file)
+        size = self._remote_size(rel_file)
+
+        if size is not None and size > self.chunk_size and self._supports_ranges(url):
+            return self._download_ranges(url, dest_file, size)
+        return self._download_whole(url, dest_file, size)
+
+    def read_sample(self, rel_file: str, length: int) -> int:
+        headers = {'Range': f'bytes=0-{max(0, length - 1)}'}
+        read = 0
+        with self._session.get(self._url(rel_file), headers=headers, stream=True,
+                               timeout=self.timeout) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=256 * 1024):
+                read += len(chunk)
+                if read >= length:
+                    break
+        return min(read, length)
+
+    def _remote_size(self, rel_file: str) -> Optional[int]:
+        build, sub = self._split(rel_file)
+        manifest = self._get_manifest(build)
+        return manifest['_sizes'].get(sub) if manifest else None
+
+    def _supports_ranges(self, url: str) -> bool:
+        try:
+            response = self._session.head(url, timeout=self.timeout, allow_redirects=True)
+            return response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+        except Exception:
+            return False
+
+    def _retry_wait(self, attempt: int, url: str, error: Exception) -> None:
+        """재시도 가능한 오류면 대기, 아니면 다시 발생 (4xx / 재시도 소진)"""
+        response = getattr(error, 'response', None)
+        status = getattr(response, 'status_code', 0) or 0
+        if attempt >= self.retries or 400 <= status < 500:
+            raise error
+        print(f"[HttpCopySource] 재시도 {attempt + 1}/{self.retries}: {url} ({type(error).__name__}: {error})")
+        time.sleep(self.retry_delay * (attempt + 1))
+
+    def _download_whole(self, url: str, dest_file: str, size: Optional[int] = None) -> int:
+        """파일 전체 다운로드 (끊기면 받은 위치부터 이어받기, 서버가 Range를 거부하면 처음부터)"""
+        written = 0
+        with open(dest_file, 'wb'):
+            pass
+        for attempt in range(self.retries + 1):
+            try:
+                headers = {'Range': f'bytes={written}-'} if written else {}
+                with self._session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+                    response.raise_for_status()
+                    if written and response.status_code != 206:
+                        written = 0
+                    with open(dest_file, 'r+b') as f:
+                        f.seek(written)
+                        f.truncate()
+                        for chunk in response.iter_content(chunk_size=HTTP_READ_SIZE):
+                            if chunk:
+                                f.write(chunk)
+                                written += len(chunk)
+                if size is not None and written != size:
+                    raise IOError(f"크기 불일치 ({written}/{size}): {url}")
+                return written
+            except Exception as e:
+                self._retry_wait(attempt, url, e)
+        return written
+
+    def _download_ranges(self, url: str, dest_file: str, size: int) -> int:
+        # 전체 크기로 미리 할당 후 각 Range를 제 위치에 기록
+        with open(dest_file, 'wb') as f:
+            f.truncate(size)
+
+        ranges = [(start, min(start + self.chunk_size, size) - 1)
+                  for start in range(0, size, self.chunk_size)]
+        futures = [self._range_pool.submit(self._fetch_range, url, dest_file, start, end)
+                   for start, end in ranges]
+        return sum(future.result() for future in futures)
+
+    def _fetch_range(self, url: str, dest_file: str, start: int, end: int) -> int:
+        """Range 하나 다운로드 (끊기면 받은 위치부터 남은 구간만 다시 요청)"""
+        position = start
+        for attempt in range(self.retries + 1):
+            try:
+                headers = {'Range': f'bytes={position}-{end}'}
+                with self._session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        raise ValueError(f"Range 요청이 거부됨 ({response.status_code}): {url}")
+                    with open(dest_file, 'r+b') as f:
+                        f.seek(position)
+                        for chunk in response.iter_content(chunk_size=HTTP_READ_SIZE):
+                            if chunk:
+                                f.write(chunk)
+                                position += len(chunk)
+                if position != end + 1:
+                    raise IOError(f"Range 크기 불일치 ({position - start}/{end - start + 1}): {url}")
+                return end - start + 1
+            except ValueError:
+                raise
+            except Exception as e:
+                self._retry_wait(attempt, url, e)
+        return position - start
+
+    def close(self) -> None:
+        self._range_pool.shutdown(wait=False)
+        self._session.close()
+
+
+class CacheCopySource(CopySource):
+    """
+    로컬 캐시 소스
+
+    cache_dir 에 있는 파일은 로컬에서 바로 복사하고, 없거나 크기가 다르면
+    upstream 소스에서 캐시로 먼저 받아온 뒤 복사합니다. upstream이 없으면
+    캐시 폴더를 일반 경로 소스처럼 사용합니다.
+    """
+
+    source_type = SOURCE_TYPE_CACHE
+
+    def __init__(self, cache_dir: str, upstream: Optional[CopySource] = None):
+        super().__init__(cache_dir)
+        self.upstream = upstream
+        self._local = PathCopySource(cache_dir)
+        self._expected_sizes: Dict[str, int] = {}
+
+    def describe(self) -> str:
+        if self.upstream:
+            return f"{self.source_type}:{self.root} ← {self.upstream.describe()}"
+        return super().describe()
+
+    def is_available(self) -> bool:
+        if self.upstream:
+            return self.upstream.is_available()
+        return self._local.is_available()
+
+    def list_builds(self) -> List[str]:
+        names = set(self._local.list_builds())
+        if self.upstream:
+            try:
+                names.update(self.upstream.list_builds())
+            except Exception as e:
+                print(f"[CacheCopySource] upstream 목록 조회 실패: {e}")
+        return sorted(names)
+
+    def exists(self, rel_path: str) -> bool:
+        if self.upstream and self.upstream.exists(rel_path):
+            return True
+        return self._local.exists(rel_path)
+
+    def list_tree(self, rel_path: str) -> Tuple[List[str], List[Tuple[str, int]]]:
+        # upstream이 정본 - 캐시에만 남은 오래된 파일이 섞이지 않도록 upstream 트리 사용
+        if not self.upstream:
+            return self._local.list_tree(rel_path)
+
+        dirs, files = self.upstream.list_tree(rel_path)
+        base = rel_path.replace('\\', '/').strip('/')
+        for rel, size in files:
+            self._expected_sizes[f"{base}/{rel}" if base else rel] = size
+        return dirs, files
+
+    def copy_file(self, rel_file: str, dest_file: str) -> int:
+        cache_file = self._local._abs(rel_file)
+        if self.upstream and not self._is_cached(rel_file, cache_file):
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            tmp_file = f"{cache_file}.part{threading.get_ident()}"
+            try:
+                self.upstream.copy_file(rel_file, tmp_file)
+                os.replace(tmp_file, cache_file)
+            finally:
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+        return self._local.copy_file(rel_file, dest_file)
+
+    def read_sample(self, rel_file: str, length: int) -> int:
+        if self.upstream:
+            return self.upstream.read_sample(rel_file, length)
+        return self._local.read_sample(rel_file, length)
+
+    def _is_cached(self, rel_file: str, cache_file: str) -> bool:
+        if not os.path.isfile(cache_file):
+            return False
+        expected = self._expected_sizes.get(rel_file.replace('\\', '/').strip('/'))
+        return expected is None or os.path.getsize(cache_file) == expected
+
+    def close(self) -> None:
+        if self.upstream:
+            self.upstream.close()
+
+
+def detect_source_type(src_path: str) -> str:
+    """경로 형태로 소스 유형 추정 (URL이면 http, 그 외 path)"""
+    return SOURCE_TYPE_HTTP if src_path.startswith(('http://', 'https://')) else SOURCE_TYPE_PATH
+
+
+def create_copy_source(source_type: str, src_path: str, cache_path: str = '') -> CopySource:
+    """
+    스케줄 설정값으로 복사 소스 생성
+
+    Args:
+        source_type: 'path', 'http', 'cache'
+        src_path: 경로 또는 아티팩트 URL
+        cache_path: 로컬 캐시 폴더 (cache 유형 전용, src_path는 upstream으로 사용)
+    """
+    source_type = source_type or SOURCE_TYPE_PATH
+
+    if source_type == SOURCE_TYPE_HTTP:
+        return HttpCopySource(src_path)
+
+    if source_type == SOURCE_TYPE_CACHE:
+        if not cache_path:
+            raise ValueError("로컬 캐시 경로가 설정되지 않았습니다.")
+        upstream = None
+        if src_path:
+            upstream = create_copy_source(detect_source_type(src_path), src_path)
+        return CacheCopySource(cache_path, upstream)
+
+    if source_type == SOURCE_TYPE_PATH:
+        return PathCopySource(src_path)
+
+    raise ValueError(f"알 수 없는 소스 유형: {source_type}")
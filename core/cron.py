@@ -0,0 +1,178 @@
+"""크론 표현식 모듈 (repeat_type 'cron' 스케줄)
+
+필드 5개(분 시 일 월 요일) 또는 6개(초 분 시 일 월 요일)를 지원합니다.
+- '*', 목록(1,15), 범위(10-17), 간격(*/20, 10-40/10)
+- 월/요일 이름 (JAN-DEC, SUN-SAT), 요일 0과 7은 일요일
+- 일과 요일이 모두 지정되면 둘 중 하나만 맞아도 실행 (표준 cron 규칙, '*'로 시작하는 필드('*/2' 포함)는 미지정)
+
+예:
+    0 */20 10-17 * * MON-FRI   평일 10:00~17:40 20분마다 (초 포함 6필드)
+    15 30 * * * *              매시 30분 15초
+    0 9 * * 1                  매주 월요일 09:00
+
+표현식은 compile_cron()으로 한 번만 해석하고, next_after()는 필드별 정렬 목록에서
+다음 값으로 바로 건너뛰므로 1초씩 훑지 않습니다.
+"""
+import bisect
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+
+REPEAT_TYPE_CRON = 'cron'
+
+_MONTH_NAMES = {name: i + 1 for i, name in enumerate(
+    ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'])}
+_DOW_NAMES = {name: i for i, name in enumerate(['SUN', 'MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT'])}
+
+# 다음 실행 시각을 찾을 최대 범위 (존재하지 않는 날짜만 지정한 표현식 대비)
+_SEARCH_YEARS = 5
+
+
+class CronError(ValueError):
+    """잘못된 크론 표현식"""
+
+
+def _parse_value(text: str, names: dict, field: str) -> int:
+    upper = text.upper()
+    if upper in names:
+        return names[upper]
+    try:
+        return int(text)
+    except ValueError:
+        raise CronError(f"{field} 필드 값이 올바르지 않습니다: {text}")
+
+
+def _parse_field(text: str, low: int, high: int, field: str, names: dict = None) -> Tuple[List[int], bool]:
+    """
+    필드 하나 해석
+
+    Returns:
+        (허용 값 정렬 목록, '*'로 시작하는지 - '*/N' 포함, Vixie cron의 일/요일 OR 규칙 판정용)
+    """
+    names = names or {}
+    values = set()
+    wildcard = text.startswith('*')
+    for part in text.split(','):
+        if not part:
+            raise CronError(f"{field} 필드가 비어 있습니다: {text}")
+        step = 1
+        if '/' in part:
+            part, step_text = part.split('/', 1)
+            try:
+                step = int(step_text)
+            except ValueError:
+                raise CronError(f"{field} 필드 간격이 올바르지 않습니다: {step_text}")
+            if step <= 0:
+                raise CronError(f"{field} 필드 간격은 1 이상이어야 합니다: {step}")
+        if part == '*':
+            start, end = low, high
+        elif '-' in part:
+            start_text, end_text = part.split('-', 1)
+            start = _parse_value(start_text, names, field)
+            end = _parse_value(end_text, names, field)
+        else:
+            start = _parse_value(part, names, field)
+            end = high if step > 1 else start
+        if not (low <= start <= high and low <= end <= high) or start > end:
+            raise CronError(f"{field} 필드 범위({low}-{high})를 벗어났습니다: {part}")
+        values.update(range(start, end + 1, step))
+    return sorted(values), wildcard
+
+
+class CronExpression:
+    """해석된 크론 표현식 (불변, 스레드 안전)"""
+
+    __slots__ = ('expr', 'seconds', 'minutes', 'hours', 'days', 'months', 'weekdays',
+                 'day_wildcard', 'weekday_wildcard')
+
+    def __init__(self, expr: str):
+        fields = expr.split()
+        if len(fields) == 5:
+            fields.insert(0, '0')
+        if len(fields) != 6:
+            raise CronError(f"크론 표현식은 필드 5개 또는 6개여야 합니다: {expr}")
+        self.expr = expr.strip()
+        self.seconds, _ = _parse_field(fields[0], 0, 59, '초')
+        self.minutes, _ = _parse_field(fields[1], 0, 59, '분')
+        self.hours, _ = _parse_field(fields[2], 0, 23, '시')
+        self.days, self.day_wildcard = _parse_field(fields[3], 1, 31, '일')
+        self.months, _ = _parse_field(fields[4], 1, 12, '월', _MONTH_NAMES)
+        cron_dows, self.weekday_wildcard = _parse_field(fields[5], 0, 7, '요일', _DOW_NAMES)
+        # cron 요일(0/7=일) → Python weekday (0=월)
+        self.weekdays = frozenset((d - 1) % 7 for d in cron_dows)
+
+    def __repr__(self) -> str:
+        return f"CronExpression({self.expr!r})"
+
+    def _day_matches(self, dt: datetime) -> bool:
+        day_ok = dt.day in self.days
+        dow_ok = dt.weekday() in self.weekdays
+        if self.day_wildcard or self.weekday_wildcard:
+            return day_ok and dow_ok
+        return day_ok or dow_ok
+
+    @staticmethod
+    def _next_value(values: List[int], current: int) -> Optional[int]:
+        i = bisect.bisect_left(values, current)
+        return values[i] if i < len(values) else None
+
+    def next_after(self, after: datetime) -> Optional[datetime]:
+        """after 이후(after 제외) 첫 실행 시각 (없으면 None)"""
+        dt = after.replace(microsecond=0) + timedelta(seconds=1)
+        limit = after.year + _SEARCH_YEARS
+
+        while dt.year <= limit:
+            # 월
+            month = self._next_value(self.months, dt.month)
+            if month is None:
+                dt = datetime(dt.year + 1, self.months[0], 1)
+                continue
+            if month != dt.month:
+                dt = datetime(dt.year, month, 1)
+
+            # 일/요일
+            if not self._day_matches(dt):
+                dt = datetime(dt.year, dt.month, dt.day) + timedelta(days=1)
+                continue
+
+            # 시
+            hour = self._next_value(self.hours, dt.hour)
+            if hour is None:
+                dt = datetime(dt.year, dt.month, dt.day) + timedelta(days=1)
+                continue
+            if hour != dt.hour:
+                dt = dt.replace(hour=hour, minute=0, second=0)
+
+            # 분
+            minute = self._next_value(self.minutes, dt.minute)
+            if minute is None:
+                dt = dt.replace(minute=0, second=0) + timedelta(hours=1)
+                continue
+            if minute != dt.minute:
+                dt = dt.replace(minute=minute, second=0)
+
+            # 초
+            second = self._next_value(self.seconds, dt.second)
+            if second is None:
+                dt = dt.replace(second=0) + timedelta(minutes=1)
+                continue
+            return dt.replace(second=second)
+        return None
+
+    def next_times(self, after: datetime, count: int) -> List[datetime]:
+        """after 이후 실행 시각 count개 (미리보기용)"""
+        result = []
+        current = after
+        for _ in range(count):
+            current = self.next_after(current)
+            if current is None:
+                break
+            result.append(current)
+        return result
+
+
+@lru_cache(maxsize=1024)
+def compile_cron(expr: str) -> CronExpression:
+    """크론 표현식 해석 (결과 캐시, 잘못된 표현식이면 CronError)"""
+    return CronExpression(expr)
@@ -0,0 +1,502 @@
+"""헤드리스 스케줄러 데몬 (PyQt 없이 실행)
+
+사용 예:
+    python -m core.daemon
+    python -m core.daemon --base-dir C:/QuickBuild --port 8765
+
+schedule.json / settings.json을 읽어 UI와 같은 JobRunner(execute_option / 다단계 파이프라인)로
+스케줄을 실행합니다. 데스크톱 세션 없이 서비스로 돌릴 수 있도록 다음만 사용합니다.
+- 로그: log/daemon_YYYYMMDD.txt (작업 중 print 출력 포함)
+- 상태: http://127.0.0.1:<port>/status (JSON), /history (최근 실행 통계), /health
+- selenium / slack_sdk는 해당 작업을 실행할 때 로드하므로 시작은 1초 이내
+
+UI와 같은 PC에서 같은 schedule.json으로 동시에 실행하면 스케줄이 두 번 실행되므로 둘 중 하나만 사용하세요.
+"""
+import argparse
+import collections
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from .build_catalog import BuildCatalogScanner, get_build_catalog
+from .build_index import DEFAULT_TTL, get_build_index
+from .build_readiness import DEFAULT_MARKERS, DEFAULT_PROBE_INTERVAL, get_readiness_checker
+from .build_watcher import DEFAULT_MAX_INTERVAL, DEFAULT_MIN_INTERVAL, NewBuildWatcher
+from .config_manager import ConfigManager
+from .coordination import create_coordinator, run_key
+from .error_messages import simplify_error_message
+from .job_runner import DEFAULT_SRC_FOLDER, JobRunner
+from .job_store import open_job_store
+from .pipeline import PipelineError
+from .resource_executor import (RESOURCE_DEST_DISK, RESOURCE_NAS_READ, ResourceExecutor,
+                                describe_resources)
+from .run_history import open_run_history
+from .schedule_queue import SCHEDULE_MAX_SLEEP, CatchupQueue, ScheduleQueue, is_run_all
+from .scheduler import ScheduleManager
+
+
+# 상태 HTTP 기본 포트 (settings.json daemon_status_port, 0이면 사용 안 함)
+DEFAULT_STATUS_PORT = 8765
+
+# /status에 보여줄 최근 실행 결과 수
+RECENT_RESULTS = 50
+
+# /history 집계 기간 (일)
+HISTORY_SUMMARY_DAYS = 7
+
+# 같은 스케줄 연속 실행 요청 무시 간격 (초, UI의 중복 실행 방지와 동일)
+DUPLICATE_RUN_WINDOW = 1.5
+
+
+class DaemonLog:
+    """날짜별 로그 파일 (log/daemon_YYYYMMDD.txt, 스레드 안전)"""
+
+    def __init__(self, log_dir: str = 'log', echo=None):
+        self.log_dir = log_dir
+        self.echo = echo  # 원래 stdout (서비스 관리자가 수집하는 경우)
+        self._lock = threading.Lock()
+
+    def write_line(self, line: str) -> None:
+        now = datetime.now()
+        line = f"[{now.strftime('%H:%M:%S')}] {line}"
+        with self._lock:
+            try:
+                os.makedirs(self.log_dir, exist_ok=True)
+                path = os.path.join(self.log_dir, f"daemon_{now.strftime('%Y%m%d')}.txt")
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+            except OSError:
+                pass
+            if self.echo is not None:
+                try:
+                    self.echo.write(line + '\n')
+                    self.echo.flush()
+                except (OSError, ValueError):
+                    pass
+
+    def __call__(self, message: str) -> None:
+        self.write_line(message)
+
+
+class _LogStream:
+    """print 출력을 줄 단위로 DaemonLog에 기록하는 stdout 대체 (스레드별 버퍼)"""
+
+    def __init__(self, log: DaemonLog):
+        self.log = log
+        self._local = threading.local()
+
+    def write(self, data: str) -> int:
+        buffer = getattr(self._local, 'buffer', '') + data
+        *lines, self._local.buffer = buffer.split('\n')
+        for line in lines:
+            if line.strip():
+                self.log.write_line(line)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+class ScheduleDaemon:
+    """스케줄 실행 루프 + 새 빌드 감지 + 상태 조회"""
+
+    def __init__(self, log: DaemonLog, schedule_file: str = 'schedule.json',
+                 settings_file: str = 'settings.json', config_file: str = 'config.json'):
+        self.log = log
+        self.config_mgr = ConfigManager(config_file, settings_file)
+        self.schedule_mgr = ScheduleManager(schedule_file)
+        get_build_index().ttl = self.config_mgr.get_setting('build_index_ttl', DEFAULT_TTL)
+
+        # 데몬 프로세스 전용 자원 실행기 (UI와 같은 설정 키 사용)
+        self.executor = ResourceExecutor({
+            RESOURCE_NAS_READ: self.config_mgr.get_setting('resource_nas_read_slots', 2),
+            RESOURCE_DEST_DISK: self.config_mgr.get_setting('resource_disk_slots', 1),
+        })
+        self.runner = JobRunner(self.config_mgr, executor=self.executor, log=log,
+                                job_store=open_job_store(self.config_mgr),
+                                history=open_run_history(self.config_mgr))
+        # 여러 PC 분산 실행 (사용 안 하면 None)
+        self.coordinator = create_coordinator(self.config_mgr, log=log, on_lost=self.on_lease_lost)
+
+        self.queue = ScheduleQueue()
+        self.queue_version = None
+        self.catchup = CatchupQueue()  # run_all 정책으로 밀린 실행 (앞 실행이 끝나면 하나씩)
+        self.started_at = datetime.now()
+        self.running: Dict[str, Dict[str, Any]] = {}  # {schedule_id: 실행 정보}
+        self.recent = collections.deque(maxlen=RECENT_RESULTS)
+        self._last_run: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self.watcher: Optional[NewBuildWatcher] = None
+        self.catalog_scanner: Optional[BuildCatalogScanner] = None
+
+    # 시작/종료
+    def start_background(self) -> None:
+        """새 빌드 감지 / 빌드 카탈로그 스캐너 시작"""
+        readiness = get_readiness_checker()
+        readiness.enabled = self.config_mgr.get_setting('readiness_enabled', True)
+        readiness.markers = tuple(self.config_mgr.get_setting('readiness_markers', list(DEFAULT_MARKERS)))
+        readiness.probe_interval = self.config_mgr.get_setting('readiness_probe_interval', DEFAULT_PROBE_INTERVAL)
+
+        self.watcher = NewBuildWatcher(
+            on_new_build=self.on_new_build_detected,
+            ready_check=lambda root, name: readiness.is_ready(root, name, wait=False),
+            min_interval=self.config_mgr.get_setting('build_watch_min_interval', DEFAULT_MIN_INTERVAL),
+            max_interval=self.config_mgr.get_setting('build_watch_max_interval', DEFAULT_MAX_INTERVAL))
+        self.watcher.set_watches(self.runner.build_watch_targets(self.schedule_mgr.load_schedules()))
+        self.watcher.start()
+
+        if self.config_mgr.get_setting('catalog_enabled', True):
+            try:
+                self.catalog_scanner = BuildCatalogScanner(
+                    get_build_catalog(), self.catalog_roots(),
+                    interval=self.config_mgr.get_setting('catalog_scan_interval', 30))
+                self.catalog_scanner.start()
+            except Exception as e:
+                self.catalog_scanner = None
+                self.log(f"[BuildCatalog] 스캐너 시작 실패: {e}")
+
+    def catalog_roots(self) -> List[str]:
+        """카탈로그 스캔 대상 루트 (기본 소스 경로 + 스케줄의 경로 소스)"""
+        roots = [self.config_mgr.load_settings().get('input_box1', DEFAULT_SRC_FOLDER)]
+        for schedule in self.schedule_mgr.load_schedules():
+            if schedule.get('source_type', 'path') == 'path' and schedule.get('src_path'):
+                roots.append(schedule['src_path'])
+        return roots
+
+    def request_stop(self) -> None:
+        """run_forever 종료 요청 (신호 처리기에서 호출, 잠금을 잡지 않음)"""
+        self._stop.set()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self.watcher is not None:
+            self.watcher.stop()
+        if self.catalog_scanner is not None:
+            self.catalog_scanner.stop()
+        if self.coordinator is not None:
+            self.coordinator.stop()
+        if self.runner.history is not None:
+            self.runner.history.flush(2.0)
+
+    def run_forever(self) -> None:
+        """중단된 작업 재개 후 실행 시각이 된 스케줄 실행 → 다음 실행 시각까지 대기 (stop() 전까지)"""
+        for schedule, resume in self.runner.recover_jobs():
+            self.execute_schedule(schedule, resume=resume)
+        while not self._stop.is_set():
+            delay = self.check_schedules()
+            self._stop.wait(delay)
+
+    # 스케줄 실행
+    def check_schedules(self) -> float:
+        """실행 시각이 된 스케줄 실행 (다음 확인까지 대기할 초 반환)"""
+        version = self.schedule_mgr.get_version()
+        if version != self.queue_version:
+            schedules = self.schedule_mgr.load_schedules()
+            self.queue.rebuild(schedules)
+            self.catchup.retain(schedules)
+            self.queue_version = version
+            if self.watcher is not None:
+                self.watcher.set_watches(self.runner.build_watch_targets(schedules))
+
+        now = datetime.now()
+        due = self.queue.pop_due(now)
+        for fire_at, schedule in self.queue.skipped:
+            self.log(f"[누락 건너뜀] {schedule.get('name', 'Unknown')} - {fire_at.strftime('%m-%d %H:%M:%S')}")
+        for fire_at, schedule in due:
+            if is_run_all(schedule) and self.defer_catchup(fire_at, schedule):
+                continue
+            late = (now - fire_at).total_seconds()
+            if late > 60:
+                self.log(f"[지연 실행] {schedule.get('name', 'Unknown')} - {fire_at.strftime('%m-%d %H:%M:%S')} "
+                         f"({int(late // 60)}분 늦음)")
+            else:
+                self.log(f"[자동 실행] {schedule.get('name', 'Unknown')} - {fire_at.strftime('%H:%M:%S')}")
+            self.execute_coordinated(schedule, run_key(schedule.get('id', ''), fire_at=fire_at))
+
+        # 담당 PC가 잡지 않았거나 실행 중 끊긴 실행 넘겨받기
+        if self.coordinator is not None:
+            self.coordinator.poll()
+        self.run_catchups()
+
+        delay = self.queue.next_delay()
+        if delay is None or delay > SCHEDULE_MAX_SLEEP:
+            delay = SCHEDULE_MAX_SLEEP
+        return delay + 0.001
+
+    def on_new_build_detected(self, root: str, build_name: str) -> None:
+        """새 빌드 감지 → 해당 Prefix의 'new_build' 스케줄 실행 (감지 스레드에서 호출)"""
+        for schedule in self.runner.new_build_schedules(self.schedule_mgr.load_schedules(), root, build_name):
+            self.log(f"[새 빌드 감지] {schedule.get('name', 'Unknown')} - {build_name}")
+            self.execute_coordinated(schedule, run_key(schedule.get('id', ''), build_name=build_name),
+                                     build_name)
+
+    def on_lease_lost(self, key: str, schedule_id: str) -> None:
+        """실행 중 분산 실행 임대를 잃음 (생존 신호 스레드) → 다단계 스케줄이면 남은 단계 취소"""
+        with self._lock:
+            name = self.running.get(schedule_id, {}).get('name', schedule_id)
+        self.log(f"[분산 실행] {name} - 다른 PC가 넘겨받아 남은 단계를 취소합니다 (실행 중인 단계는 끝까지 실행)")
+        self.runner.cancel_pipeline(schedule_id)
+
+    def is_busy(self, schedule_id: str) -> bool:
+        """실행 중 / 자원 대기 중이거나 다른 PC가 실행하는지 확인 중인 스케줄"""
+        with self._lock:
+            return (schedule_id in self.running or self.executor.is_waiting(schedule_id)
+                    or self.executor.is_running(schedule_id)
+                    or (self.coordinator is not None and self.coordinator.has_pending(schedule_id)))
+
+    def defer_catchup(self, fire_at: datetime, schedule: Dict[str, Any]) -> bool:
+        """run_all 스케줄이 아직 실행 중이면 밀린 실행으로 보관 (보관했으면 True)"""
+        schedule_id = schedule.get('id', '')
+        with self._lock:
+            if not self.is_busy(schedule_id) and not self.catchup.has(schedule_id):
+                return False
+            self.catchup.add(fire_at, schedule)
+        self.log(f"[누락 실행 대기] {schedule.get('name', 'Unknown')} - {fire_at.strftime('%m-%d %H:%M:%S')} "
+                 f"(앞 실행이 끝나면 실행)")
+        return True
+
+    def run_catchups(self) -> None:
+        """앞 실행이 끝난 스케줄의 다음 밀린 실행 시작"""
+        for schedule_id in self.catchup.schedule_ids():
+            with self._lock:
+                if self.is_busy(schedule_id):
+                    continue
+                entry = self.catchup.pop(schedule_id)
+                if entry is None:
+                    continue
+                fire_at, schedule = entry
+                self.log(f"[누락 실행] {schedule.get('name', 'Unknown')} - {fire_at.strftime('%m-%d %H:%M:%S')}")
+                self.execute_coordinated(schedule, run_key(schedule_id, fire_at=fire_at), catchup=True)
+
+    def execute_coordinated(self, schedule: Dict[str, Any], key: str, detected_build: str = '',
+                            catchup: bool = False) -> None:
+        """자동 실행 (분산 실행을 쓰면 임대를 잡은 경우에만 실행)"""
+        if self.coordinator is None:
+            self.execute_schedule(schedule, detected_build, catchup=catchup)
+            return
+        if not self.coordinator.submit(key, schedule.get('id', ''),
+                                       lambda: self.execute_schedule(schedule, detected_build, catchup=catchup)):
+            self.log(f"[분산 실행] {schedule.get('name', 'Unknown')} - 다른 PC가 실행하거나 담당 PC를 기다립니다")
+
+    def execute_schedule(self, schedule: Dict[str, Any], detected_build: str = '',
+                         resume: Optional[Dict[str, Any]] = None, catchup: bool = False) -> bool:
+        """스케줄 실행 요청 (자원이 겹치면 대기열에 넣고 자원이 반환될 때 시작, catchup은 중복 실행 방지 생략)"""
+        schedule_id = schedule.get('id', '')
+        name = schedule.get('name', 'Unknown')
+        with self._lock:
+            if (schedule_id in self.running or self.executor.is_waiting(schedule_id)
+                    or self.executor.is_running(schedule_id)):
+                self.log(f"[실행 중] {name} - 이미 실행 중이거나 대기 중입니다.")
+                return False
+            now = time.monotonic()
+            last = self._last_run.get(schedule_id)
+            if not catchup and last is not None and now - last < DUPLICATE_RUN_WINDOW:
+                self.log(f"[실행 스킵] {name} - 중복 실행 방지")
+                return False
+            self._last_run[schedule_id] = now
+
+            try:
+                task_func, resources = self.runner.prepare_run(schedule, detected_build, resume)
+            except PipelineError as e:
+                self.log(f"[실행 오류] {name} - 단계 정의 오류: {e}")
+                return False
+            self.runner.begin_job(schedule, detected_build, resume)
+
+            position = self.executor.submit(
+                schedule_id, resources, lambda: self._start_job(schedule, task_func))
+            if position:
+                self.log(f"[실행 대기] {name} - {position}번째 (사용 중인 자원: {describe_resources(resources)})")
+        return True
+
+    def _start_job(self, schedule: Dict[str, Any], task_func) -> None:
+        schedule_id = schedule.get('id', '')
+        with self._lock:
+            self.running[schedule_id] = {
+                'name': schedule.get('name', 'Unknown'),
+                'option': schedule.get('option', ''),
+                'started_at': datetime.now().isoformat(timespec='seconds'),
+            }
+        self.runner.job_started(schedule_id)
+        threading.Thread(target=self._run_job, args=(schedule, task_func), daemon=True,
+                         name=f"job-{schedule_id[:8]}").start()
+
+    def _run_job(self, schedule: Dict[str, Any], task_func) -> None:
+        schedule_id = schedule.get('id', '')
+        name = schedule.get('name', 'Unknown')
+        self.log(f"[스케줄 시작] {name} ({schedule.get('option', '')})")
+        started = time.monotonic()
+        try:
+            result = task_func()
+            success, message = True, str(result) if result else "완료"
+        except Exception as e:
+            success, message = False, simplify_error_message(f"{type(e).__name__}: {e}")
+        elapsed = time.monotonic() - started
+
+        # 작업 기록, 분산 실행 임대 종료 (끝날 때까지 실행 중으로 보임)
+        self.runner.job_finished(schedule_id, success, message)
+        if self.coordinator is not None:
+            self.coordinator.finish(schedule_id)
+        # 자원 반환 (기다리던 스케줄 시작)과 실행 중 목록 제거를 한 번에 - 그 사이 같은 스케줄이 제출되지 않도록
+        with self._lock:
+            self.executor.release(schedule_id)
+            info = self.running.pop(schedule_id, {})
+            info.update(id=schedule_id, success=success, message=message,
+                        finished_at=datetime.now().isoformat(timespec='seconds'),
+                        elapsed=round(elapsed, 1))
+            self.recent.appendleft(info)
+
+        self.log(f"{'✅ 완료' if success else '❌ 실패'}: {name} - {message}")
+        self.runner.send_slack_notification_if_enabled(schedule, '완료' if success else '실패', message)
+        # run_all 정책으로 밀린 다음 실행
+        self.run_catchups()
+
+    # 상태
+    def status(self) -> Dict[str, Any]:
+        """상태 요약 (/status 응답)"""
+        with self._lock:
+            running = [dict(info, id=sid) for sid, info in self.running.items()]
+            recent = list(self.recent)
+        names = {s.get('id'): s.get('name', '') for s in self.schedule_mgr.load_schedules()}
+        waiting = [{'id': sid, 'name': names.get(sid, sid), 'position': position,
+                    'waiting_for': describe_resources(blocking)}
+                   for sid, position, blocking in self.executor.waiting()]
+        next_at = self.queue.peek()
+        return {
+            'pid': os.getpid(),
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'schedules': len(names),
+            'next_fire_at': next_at.isoformat(timespec='seconds') if next_at else None,
+            'running': running,
+            'waiting': waiting,
+            'catchup_runs': len(self.catchup),
+            'recent': recent,
+            'coordination': self.coordination_status(),
+        }
+
+    def history_summary(self) -> Dict[str, Any]:
+        """최근 HISTORY_SUMMARY_DAYS일 스케줄별 실행 수 / 실패율 / 평균 소요 시간 (/history 응답)"""
+        history = self.runner.history
+        if history is None:
+            return {'enabled': False}
+        since = time.time() - HISTORY_SUMMARY_DAYS * 86400
+        return {
+            'enabled': True,
+            'days': HISTORY_SUMMARY_DAYS,
+            'schedules': history.summary_by_schedule(since),
+            'failure_reasons': history.failure_reasons(since=since),
+        }
+
+    def coordination_status(self) -> Optional[Dict[str, Any]]:
+        """분산 실행 상태 (사용 안 하면 None)"""
+        if self.coordinator is None:
+            return None
+        return {
+            'host': self.coordinator.host_id,
+            'held': self.coordinator.held_keys(),
+            'pending': self.coordinator.pending_keys(),
+        }
+
+
+class StatusServer(ThreadingHTTPServer):
+    """로컬 상태 조회 HTTP 서버 (127.0.0.1 전용)"""
+
+    daemon_threads = True
+
+    def __init__(self, daemon: ScheduleDaemon, port: int):
+        self.schedule_daemon = daemon
+        super().__init__(('127.0.0.1', port), _StatusHandler)
+
+
+class _StatusHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path in ('/', '/status'):
+            self._reply(200, self.server.schedule_daemon.status())
+        elif self.path == '/history':
+            self._reply(200, self.server.schedule_daemon.history_summary())
+        elif self.path == '/health':
+            self._reply(200, {'ok': True})
+        else:
+            self._reply(404, {'error': 'not found'})
+
+    def _reply(self, code: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # 상태 조회는 로그에 남기지 않음
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m core.daemon', description='헤드리스 스케줄러 데몬')
+    parser.add_argument('--base-dir', default='', help='schedule.json / settings.json이 있는 폴더 (기본: 현재 폴더)')
+    parser.add_argument('--port', type=int, default=None,
+                        help=f'상태 HTTP 포트 (기본: settings.json daemon_status_port 또는 {DEFAULT_STATUS_PORT}, 0이면 사용 안 함)')
+    parser.add_argument('--quiet', action='store_true', help='콘솔 출력 없이 로그 파일에만 기록')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.base_dir:
+        os.chdir(args.base_dir)
+
+    log = DaemonLog(echo=None if args.quiet else sys.stdout)
+    sys.stdout = _LogStream(log)  # 작업 중 print 출력도 로그 파일로
+
+    daemon = ScheduleDaemon(log)
+    port = args.port
+    if port is None:
+        port = daemon.config_mgr.get_setting('daemon_status_port', DEFAULT_STATUS_PORT)
+
+    server = None
+    if port:
+        try:
+            server = StatusServer(daemon, port)
+            threading.Thread(target=server.serve_forever, daemon=True, name='status-http').start()
+        except OSError as e:
+            log(f"[daemon] 상태 포트 {port} 사용 불가: {e}")
+            server = None
+
+    received = []
+
+    def handle_signal(signum, frame):
+        # 신호 처리기는 메인 스레드가 로그 잠금을 잡은 채 끼어들 수 있어 종료 요청만 함
+        received.append(signum)
+        daemon.request_stop()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, handle_signal)
+
+    daemon.start_background()
+    status_url = f"http://127.0.0.1:{server.server_address[1]}/status" if server else '사용 안 함'
+    log(f"[daemon] 시작 (pid {os.getpid()}, 상태: {status_url})")
+    try:
+        daemon.run_forever()
+    finally:
+        if received:
+            log(f"[daemon] 종료 신호 수신 ({received[0]})")
+        daemon.stop()
+        if server is not None:
+            server.shutdown()
+        log("[daemon] 종료")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
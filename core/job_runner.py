@@ -0,0 +1,880 @@
+"""스케줄 작업 실행 모듈 (Qt 없이 사용 가능)
+
+execute_option / 다단계 파이프라인 / 슬랙 알림 등 스케줄 실행에 필요한 작업을 모아 둔 모듈입니다.
+UI(QuickBuildApp)는 QThread에서, 헤드리스 데몬(core.daemon)은 작업 스레드에서 같은 JobRunner를 호출합니다.
+작업 상태는 JobStore에 기록해 비정상 종료 후 다시 시작하면 중단된 다단계 작업을 이어서 실행하고,
+단계별 소요 시간 / 복사량 / 실패 사유는 RunHistory에 남깁니다.
+selenium / slack_sdk는 import가 무거워 실제로 쓰는 시점에 로드합니다.
+"""
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from makelog import log_execution
+
+from .build_name import parse_build_name
+from .build_operations import BuildOperations
+from .build_watcher import REPEAT_TYPE_NEW_BUILD, matches_prefix
+from .copy_engine import copy_build
+from .copy_sources import PathCopySource, create_copy_source
+from .error_messages import simplify_error_message
+from .job_store import (DEFAULT_KEEP_DAYS, DEFAULT_RESUME_MAX_AGE, JOB_CANCELLED, JOB_DONE, JOB_FAILED, JOB_INTERRUPTED,
+                        JOB_QUEUED, JOB_RUNNING, JobStore)
+from .mirror_selector import parse_mirror_roots
+from .pipeline import (BUILD_STAGE_OPTIONS, STAGE_DONE, STAGE_FAILED, STAGE_OPTION, STAGE_RUNNING, STAGE_SLACK,
+                       PipelineError, PipelineRun, schedule_stages)
+from .resource_executor import (BROWSER_OPTIONS, CHROMEDRIVER_OPTIONS, ResourceExecutor,
+                                get_resource_executor, resources_for_option)
+from .run_history import (RUN_CANCELLED, RUN_DONE, RUN_FAILED, RunHistory, RunRecorder, note_build,
+                          note_copy)
+from .staging import is_staging_entry
+
+
+# 경로 기본값 (settings.json input_box1 / input_box2가 없을 때)
+DEFAULT_SRC_FOLDER = r'\\pubg-pds\PBB\Builds'
+DEFAULT_DEST_FOLDER = 'C:/mybuild'
+
+
+class JobRunner:
+    """스케줄 작업 실행 (UI / 데몬 공용, 여러 작업 스레드에서 동시에 호출 가능)"""
+    
+    def __init__(self, config_mgr, build_ops: Optional[BuildOperations] = None,
+                 executor: Optional[ResourceExecutor] = None, log: Callable[[str], None] = print,
+                 job_store: Optional[JobStore] = None, history: Optional[RunHistory] = None):
+        """
+        Args:
+            config_mgr: ConfigManager
+            build_ops: BuildOperations (None이면 새로 생성)
+            executor: 자원 실행기 (None이면 프로세스 공유 실행기)
+            log: 로그 함수 (UI는 화면+파일 로그, 데몬은 파일 로그)
+            job_store: 작업 상태 기록 (None이면 기록/재개 안 함)
+            history: 실행 기록 (None이면 기록 안 함)
+        """
+        self.config_mgr = config_mgr
+        self.build_ops = build_ops or BuildOperations()
+        self.executor = executor or get_resource_executor()
+        self.log = log
+        self.jobs = job_store
+        self.history = history
+        self.running_pipelines: Dict[str, PipelineRun] = {}  # {schedule_id: PipelineRun} (다단계 스케줄 중지용)
+        self.active_jobs: Dict[str, str] = {}  # {schedule_id: 작업 ID} (JobStore 기록용)
+        self.active_runs: Dict[str, RunRecorder] = {}  # {schedule_id: 실행 기록}
+    
+    def prepare_run(self, schedule: dict, detected_build: str = '',
+                    resume: Optional[Dict[str, Any]] = None) -> Tuple[Callable[[], str], list]:
+        """
+        스케줄 실행 준비
+        
+        Args:
+            schedule: 스케줄
+            detected_build: 새 빌드 감지 트리거로 실행된 경우 감지된 빌드명 (최신 빌드 탐색 생략)
+            resume: recover_jobs가 돌려준 재개 정보 (완료된 단계를 건너뛰고 같은 빌드로 실행)
+        
+        Returns:
+            (작업 스레드에서 호출할 함수, 스케줄 단위로 확보할 자원)
+        
+        Raises:
+            PipelineError: 단계 정의 오류
+        """
+        buildname = schedule.get('buildname', '')
+        
+        # 빌드 모드 확인: 'latest' 또는 'fixed'
+        build_mode = schedule.get('build_mode', 'latest')
+        prefix = schedule.get('prefix', '')
+        
+        # 새 빌드 감지로 실행되면 감지된 빌드 사용
+        if detected_build:
+            buildname = detected_build
+        
+        # 최신 모드일 경우 prefix로 최신 빌드 찾기
+        # (준비 완료 확인에 시간이 걸릴 수 있어 작업 스레드의 execute_option에서 탐색)
+        elif build_mode == 'latest' and prefix:
+            buildname = prefix
+            self.log(f"[최신 빌드 탐색] Prefix '{prefix}' → 실행 시 준비 완료된 최신 빌드 사용")
+        
+        # 다단계 스케줄 (stages 또는 서버업로드및패치)은 단계마다 자원을 확보
+        stages = schedule_stages(schedule)
+        if stages and resume:
+            return (lambda: self.execute_pipeline(schedule, stages, resume.get('build', ''),
+                                                  completed=resume.get('completed', ()))), []
+        if stages:
+            return (lambda: self.execute_pipeline(schedule, stages, buildname)), []
+        return (lambda: self.run_recorded_option(schedule, buildname)), self.get_schedule_resources(schedule)
+    
+    # 작업 상태 기록 (JobStore / RunHistory)
+    def begin_job(self, schedule: dict, detected_build: str = '',
+                  resume: Optional[Dict[str, Any]] = None) -> None:
+        """실행 요청된 작업 등록 (queued)"""
+        schedule_id = schedule.get('id', '')
+        build = resume.get('build', '') if resume else detected_build
+        job_id = ''
+        if self.jobs is not None:
+            resumed_from = resume.get('job_id', '') if resume else ''
+            job_id = self.active_jobs[schedule_id] = self.jobs.create(schedule, build, resumed_from)
+            # 이전 작업에서 완료한 단계도 새 작업에 기록 - 재개한 작업이 다시 중단돼도 그 단계를 건너뜀
+            for stage_id in (resume.get('completed', ()) if resume else ()):
+                self.jobs.set_stage(job_id, stage_id, STAGE_DONE, '이전 작업에서 완료')
+        if self.history is not None:
+            self.active_runs[schedule_id] = RunRecorder(self.history, schedule, build, run_id=job_id)
+    
+    def job_started(self, schedule_id: str) -> None:
+        """자원을 확보해 작업 시작 (running)"""
+        job_id = self.active_jobs.get(schedule_id)
+        if job_id:
+            self.jobs.set_state(job_id, JOB_RUNNING)
+        recorder = self.active_runs.get(schedule_id)
+        if recorder is not None:
+            recorder.start()
+    
+    def job_finished(self, schedule_id: str, success: bool, message: str = '', cancelled: bool = False) -> None:
+        """작업 종료 기록 (done/failed/cancelled)"""
+        job_id = self.active_jobs.pop(schedule_id, None)
+        if job_id:
+            state = JOB_CANCELLED if cancelled else JOB_DONE if success else JOB_FAILED
+            self.jobs.set_state(job_id, state, message)
+        recorder = self.active_runs.pop(schedule_id, None)
+        if recorder is not None:
+            status = RUN_CANCELLED if cancelled else RUN_DONE if success else RUN_FAILED
+            recorder.finish(status, '' if success else message)
+    
+    def recover_jobs(self) -> List[Tuple[dict, Dict[str, Any]]]:
+        """
+        이전 실행에서 끝나지 않은 작업 처리 (앱 시작 시 한 번 호출)
+        
+        완료된 단계가 있는 다단계 작업은 재개 대상으로 돌려주고, 나머지는 실패로 기록합니다.
+        settings.json job_resume_enabled(기본 true) / job_resume_max_age(초)로 조정합니다.
+        
+        Returns:
+            [(작업 당시 스케줄, 재개 정보), ...] (prepare_run / begin_job의 resume 인자로 사용)
+        """
+        if self.jobs is None:
+            return []
+        resume_enabled = self.config_mgr.get_setting('job_resume_enabled', True)
+        max_age = self.config_mgr.get_setting('job_resume_max_age', DEFAULT_RESUME_MAX_AGE)
+        resumable = []
+        for job in self.jobs.find_interrupted():
+            job_id = job['job_id']
+            name = job.get('schedule_name') or job.get('schedule_id')
+            try:
+                schedule = json.loads(job.get('schedule_json') or '{}')
+                stages = schedule_stages(schedule)
+            except (ValueError, PipelineError):
+                schedule, stages = {}, None
+            status = self.jobs.stages(job_id)
+            completed = [s.id for s in stages or [] if status.get(s.id) == STAGE_DONE]
+            age = time.time() - (job.get('updated_at') or 0)
+            
+            if job['state'] == JOB_QUEUED:
+                reason = "시작 전에 앱이 종료되어 실행되지 않았습니다"
+            elif not stages:
+                reason = "실행 중 앱이 종료되었습니다 (단일 작업은 재개하지 않음)"
+            elif len(completed) == len(stages):
+                self.jobs.set_state(job_id, JOB_DONE, "모든 단계 완료 (종료 기록 누락)")
+                self.finish_interrupted_run(job, '', RUN_DONE)
+                continue
+            elif not completed:
+                reason = "실행 중 앱이 종료되었습니다 (완료된 단계 없음)"
+            elif not resume_enabled:
+                reason = "실행 중 앱이 종료되었습니다 (재개 사용 안 함)"
+            elif age > max_age:
+                reason = f"실행 중 앱이 종료되었습니다 ({int(age // 60)}분 경과로 재개하지 않음)"
+            else:
+                self.jobs.set_state(job_id, JOB_INTERRUPTED, f"재개: 완료 단계 {', '.join(completed)}")
+                self.log(f"[작업 재개] {name} - 완료된 단계({', '.join(completed)}) 다음부터 실행")
+                resumable.append((schedule, {'job_id': job_id, 'build': job.get('build') or '',
+                                             'completed': completed}))
+                # 재개는 새 작업 ID(새 실행 기록)로 실행하므로 중단된 실행은 실패로 마감
+                self.finish_interrupted_run(job, "실행 중 앱이 종료되었습니다 (다음 실행에서 재개)")
+                continue
+            self.jobs.set_state(job_id, JOB_FAILED, reason)
+            self.finish_interrupted_run(job, reason)
+            self.log(f"[작업 중단] {name} - {reason}")
+        self.jobs.purge(self.config_mgr.get_setting('job_keep_days', DEFAULT_KEEP_DAYS))
+        return resumable
+    
+    def finish_interrupted_run(self, job: Dict[str, Any], reason: str, status: str = RUN_FAILED) -> None:
+        """중단된 작업의 실행 기록 (run_id = 작업 ID)을 마지막 기록 시각으로 마감"""
+        if self.history is not None:
+            self.history.mark_interrupted(job['job_id'], reason, job.get('updated_at'), status)
+    
+    def cancel_pipeline(self, schedule_id: str) -> None:
+        """다단계 스케줄이면 남은 단계 취소 (실행 중인 단계는 끝나면 자원 반환)"""
+        pipeline = self.running_pipelines.pop(schedule_id, None)
+        if pipeline is not None:
+            pipeline.cancel()
+    
+    def build_watch_targets(self, schedules: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """새 빌드 감지 대상 {소스 루트: [Prefix, ...]} (활성화된 'new_build' 스케줄 기준)"""
+        default_src = self.config_mgr.load_settings().get('input_box1', DEFAULT_SRC_FOLDER)
+        watches = {}
+        for schedule in schedules:
+            if schedule.get('repeat_type') != REPEAT_TYPE_NEW_BUILD or not schedule.get('enabled', True):
+                continue
+            if schedule.get('source_type', 'path') != 'path':
+                continue
+            prefix = schedule.get('prefix', '') or schedule.get('buildname', '')
+            if prefix:
+                watches.setdefault(schedule.get('src_path') or default_src, []).append(prefix)
+        return watches
+    
+    def new_build_schedules(self, schedules: List[Dict[str, Any]], root: str,
+                            build_name: str) -> List[Dict[str, Any]]:
+        """감지된 새 빌드로 실행할 'new_build' 스케줄"""
+        default_src = self.config_mgr.load_settings().get('input_box1', DEFAULT_SRC_FOLDER)
+        matched = []
+        for schedule in schedules:
+            if schedule.get('repeat_type') != REPEAT_TYPE_NEW_BUILD or not schedule.get('enabled', True):
+                continue
+            if (schedule.get('src_path') or default_src) != root:
+                continue
+            prefix = schedule.get('prefix', '') or schedule.get('buildname', '')
+            if matches_prefix(build_name, prefix):
+                matched.append(schedule)
+        return matched
+    
+    def get_schedule_resources(self, schedule: dict) -> list:
+        """스케줄 옵션이 사용하는 자원 (경로는 execute_option과 같은 기본값 사용)"""
+        src_folder = schedule.get('src_path', '')
+        dest_folder = schedule.get('dest_path', '')
+        if not src_folder or not dest_folder:
+            settings = self.config_mgr.load_settings()
+            src_folder = src_folder or settings.get('input_box1', DEFAULT_SRC_FOLDER)
+            dest_folder = dest_folder or settings.get('input_box2', DEFAULT_DEST_FOLDER)
+        return resources_for_option(schedule.get('option', ''), src_folder, dest_folder)
+    
+    def execute_pipeline(self, schedule: dict, stages: list, buildname: str, completed=()) -> str:
+        """
+        다단계 스케줄 실행 (작업 스레드에서 실행, 단계는 의존 단계가 끝나는 즉시 시작)
+        
+        Args:
+            schedule: 스케줄
+            stages: schedule_stages 결과
+            buildname: 빌드명 (Prefix면 시작 시 한 번만 최신 빌드를 찾아 모든 단계에서 같은 빌드 사용)
+            completed: 중단된 작업 재개 시 이미 끝난 단계 id (buildname은 당시 확정된 빌드명)
+        """
+        schedule_id = schedule.get('id', '')
+        schedule_name = schedule.get('name', 'Unknown')
+        job_id = self.active_jobs.get(schedule_id)
+        needs_build = any(s.type == STAGE_OPTION and s.option in BUILD_STAGE_OPTIONS for s in stages)
+        if needs_build and not completed:
+            full_buildname = self.resolve_schedule_build(schedule, buildname)
+        else:
+            full_buildname = buildname
+        if job_id and full_buildname:
+            self.jobs.set_build(job_id, full_buildname)
+        recorder = self.active_runs.get(schedule_id)
+        if recorder is not None and full_buildname:
+            recorder.set_build(full_buildname)
+        
+        def on_stage(stage, status: str, message: str) -> None:
+            if job_id:
+                self.jobs.set_stage(job_id, stage.id, status, message)
+            if recorder is not None:
+                if status == STAGE_RUNNING:
+                    recorder.stage_started(stage.id, stage.option or stage.type)
+                else:
+                    recorder.stage_finished(stage.id, status, message if status == STAGE_FAILED else '')
+        
+        def stage_schedule(stage) -> dict:
+            return dict(schedule, **stage.overrides, option=stage.option)
+        
+        def run_stage(stage) -> str:
+            if stage.type == STAGE_SLACK:
+                message = stage.message
+                if full_buildname:
+                    message += f"\n• 빌드: `{full_buildname}`"
+                self.send_slack_notification_if_enabled(schedule, '알림', message)
+                return ''
+            if recorder is None:
+                return self.run_schedule_option(stage_schedule(stage), full_buildname)
+            with recorder.stage(stage.id):
+                return self.run_schedule_option(stage_schedule(stage), full_buildname)
+        
+        pipeline = PipelineRun(
+            stages, run_stage, self.executor,
+            resources_for=lambda stage: self.get_schedule_resources(stage_schedule(stage)),
+            name=schedule_name,
+            completed=completed,
+            on_stage=on_stage,
+        )
+        self.running_pipelines[schedule_id] = pipeline
+        try:
+            print(f"[execute_pipeline] {schedule_name}: {' → '.join(s.label() for s in stages)}")
+            pipeline.run()
+        except PipelineError as e:
+            raise Exception(f"단계 실패 - {e}")
+        finally:
+            if self.running_pipelines.get(schedule_id) is pipeline:
+                del self.running_pipelines[schedule_id]
+        return pipeline.summary() or f"{len(stages)}단계 완료"
+    
+    def run_recorded_option(self, schedule: dict, buildname: str) -> str:
+        """단일 옵션 스케줄 실행 (실행 기록에는 옵션 이름을 단계 하나로 남김)"""
+        recorder = self.active_runs.get(schedule.get('id', ''))
+        if recorder is None:
+            return self.run_schedule_option(schedule, buildname)
+        option = schedule.get('option', '')
+        recorder.stage_started(option, option)
+        try:
+            with recorder.stage(option):
+                result = self.run_schedule_option(schedule, buildname)
+        except Exception as e:
+            recorder.stage_finished(option, RUN_FAILED, simplify_error_message(str(e)))
+            raise
+        recorder.stage_finished(option, RUN_DONE)
+        return result
+    
+    def run_schedule_option(self, schedule: dict, buildname: str) -> str:
+        """스케줄 값으로 execute_option 실행 (파이프라인 option 단계)"""
+        return self.execute_option(
+            schedule.get('option', ''), buildname, schedule.get('awsurl', ''), schedule.get('branch', ''),
+            schedule.get('src_path', ''), schedule.get('dest_path', ''), schedule.get('max_local_copies', 0),
+            schedule.get('patch_delay', 30), schedule, schedule.get('build_prefix', ''),
+            schedule.get('teamcity_url', ''), schedule.get('teamcity_branch', ''))
+    
+    def resolve_schedule_build(self, schedule: dict, buildname: str) -> str:
+        """Prefix면 최신 빌드명, 전체 빌드명이거나 비어 있으면 그대로"""
+        if not buildname:
+            return buildname
+        src_folder = schedule.get('src_path', '') or self.config_mgr.load_settings().get(
+            'input_box1', DEFAULT_SRC_FOLDER)
+        copy_source = self.create_copy_source_for(schedule, src_folder)
+        try:
+            if copy_source.exists(buildname):
+                return buildname
+            print(f"[execute_pipeline] Prefix로 최신 빌드 탐색: {buildname}")
+            return self.find_latest_build(src_folder, buildname, copy_source)
+        finally:
+            copy_source.close()
+        
+        # 슬랙 알림 전송 (시작)
+        # self.send_slack_notification_if_enabled(schedule, '시작', 
+        #                                        f"옵션: {option}\n빌드: {buildname}")
+    
+    def find_latest_build(self, src_folder: str, buildname: str, source=None) -> str:
+        """
+        빌드명으로 최신 빌드 폴더 찾기 (BuildOperations.find_latest_build 위임)
+        
+        Returns:
+            전체 빌드 폴더명 (예: CompileBuild_DEV_game_SEL_271167_r306671)
+        """
+        return self.build_ops.find_latest_build(src_folder, buildname, source)
+    
+    def force_remove_readonly(self, func, path, exc_info):
+        """
+        읽기 전용 파일 강제 삭제를 위한 오류 핸들러
+        
+        Args:
+            func: 실패한 함수
+            path: 파일/폴더 경로
+            exc_info: 예외 정보
+        """
+        import stat
+        
+        # 읽기 전용 속성 제거
+        try:
+            os.chmod(path, stat.S_IWRITE)
+            func(path)
+        except Exception as e:
+            print(f"[force_remove_readonly] 강제 삭제 실패: {path} - {e}")
+    
+    def cleanup_old_builds(self, dest_folder: str, max_copies: int):
+        """
+        로컬 경로에서 오래된 빌드 폴더 정리 (강제 삭제 포함)
+        
+        Args:
+            dest_folder: 로컬 저장 경로 (예: C:/mybuild)
+            max_copies: 최대 보관 개수 (0이면 정리 안 함)
+        """
+        if max_copies <= 0:
+            return
+        
+        if not os.path.isdir(dest_folder):
+            return
+        
+        try:
+            # dest_folder 내의 모든 폴더 목록 가져오기
+            folders = []
+            for item in os.listdir(dest_folder):
+                # 복사 중인 스테이징 폴더는 정리 대상에서 제외
+                if is_staging_entry(item):
+                    continue
+                item_path = os.path.join(dest_folder, item)
+                if os.path.isdir(item_path):
+                    # 폴더의 수정 시간 가져오기
+                    mtime = os.path.getmtime(item_path)
+                    folders.append((item, item_path, mtime))
+            
+            # 수정 시간 기준 정렬 (오래된 것부터)
+            folders.sort(key=lambda x: x[2])
+            
+            # 현재 개수가 max_copies 이상이면 오래된 것부터 삭제
+            if len(folders) >= max_copies:
+                # 삭제할 개수 계산 (새로 추가될 1개를 위해 공간 확보)
+                to_delete_count = len(folders) - max_copies + 1
+                
+                for i in range(to_delete_count):
+                    folder_name, folder_path, _ = folders[i]
+                    print(f"[cleanup_old_builds] 오래된 빌드 삭제: {folder_name}")
+                    
+                    try:
+                        # 1차 시도: 일반 삭제
+                        shutil.rmtree(folder_path)
+                        print(f"[cleanup_old_builds] 삭제 완료: {folder_name}")
+                    except PermissionError as e:
+                        # 2차 시도: 읽기 전용 속성 제거 후 강제 삭제
+                        print(f"[cleanup_old_builds] 권한 오류 발생, 강제 삭제 시도: {folder_name}")
+                        try:
+                            shutil.rmtree(folder_path, onerror=self.force_remove_readonly)
+                            print(f"[cleanup_old_builds] 강제 삭제 완료: {folder_name}")
+                        except Exception as e2:
+                            print(f"[cleanup_old_builds] 강제 삭제 실패: {folder_name} - {e2}")
+                            # 3차 시도: Windows attrib 명령어 사용
+                            try:
+                                print(f"[cleanup_old_builds] attrib 명령어로 재시도: {folder_name}")
+                                # 읽기 전용 속성 제거 (재귀적으로)
+                                os.system(f'attrib -R "{folder_path}\\*.*" /S /D')
+                                time.sleep(0.5)
+                                shutil.rmtree(folder_path)
+                                print(f"[cleanup_old_builds] attrib 명령어로 삭제 완료: {folder_name}")
+                            except Exception as e3:
+                                print(f"[cleanup_old_builds] 최종 삭제 실패: {folder_name} - {e3}")
+                                print(f"[cleanup_old_builds] 수동 삭제 필요: {folder_path}")
+                    except Exception as e:
+                        print(f"[cleanup_old_builds] 삭제 실패: {folder_name} - {e}")
+        
+        except Exception as e:
+            print(f"[cleanup_old_builds] 오류: {e}")
+    
+    def create_copy_source_for(self, schedule: dict, src_folder: str):
+        """스케줄의 소스 유형(source_type)에 맞는 복사 소스 생성"""
+        schedule = schedule or {}
+        return create_copy_source(
+            schedule.get('source_type', 'path'),
+            src_folder,
+            schedule.get('cache_path', '')
+        )
+    
+    def copy_folder_direct(self, src_folder: str, dest_folder: str, target_folder: str, target_name: str,
+                           source=None, mirror_roots: list = None, mirror_mode: str = 'fastest',
+                           schedule_name: str = '') -> str:
+        """
+        폴더 복사 (스레드 안전 버전)
+        
+        Args:
+            src_folder: 빌드 소스 경로 (예: \\\\pubg-pds\\PBB\\Builds)
+            dest_folder: 로컬 저장 경로 (예: C:/mybuild)
+            target_folder: 빌드 전체명 (예: game_SEL_232323)
+            target_name: 복사할 폴더명 (예: WindowsClient, WindowsServer, '' for all)
+            source: 복사 소스 (None이면 src_folder 경로 소스)
+            mirror_roots: 추가 미러 경로 목록 (측정 후 최속 미러 선택 또는 분산 복사)
+            mirror_mode: 'fastest' 또는 'stripe'
+            schedule_name: 미러 선택 기록용 스케줄 이름
+        """
+        if source is None:
+            source = PathCopySource(src_folder)
+        
+        rel_path = f"{target_folder}/{target_name}" if target_name else target_folder
+        
+        print(f"[copy_folder_direct] src: {source.describe()} / {rel_path}")
+        print(f"[copy_folder_direct] dest: {os.path.join(dest_folder, target_folder, target_name)}")
+        
+        # 스테이징 복사 → 게시 (미러가 있으면 측정 후 복사 소스 결정)
+        result = copy_build(source, dest_folder, target_folder, target_name,
+                            max_workers=self.config_mgr.get_setting('copy_workers', 4),
+                            mirror_roots=mirror_roots, mirror_mode=mirror_mode,
+                            context={'schedule': schedule_name})
+        print(f"[copy_folder_direct] {result.bytes_copied / (1024 * 1024):.1f} MB, "
+              f"{result.elapsed:.1f}s ({result.throughput / (1024 * 1024):.1f} MB/s)")
+        note_copy(result.bytes_copied, result.file_count)
+        if not result.published:
+            raise Exception(f"복사 실패로 게시하지 않았습니다: {result.summary()}")
+        
+        return result.summary()
+    
+    def execute_option(self, option: str, buildname: str, awsurl: str, branch: str,
+                      src_path: str = '', dest_path: str = '', max_local_copies: int = 0,
+                      patch_delay: int = 30, schedule: dict = None, build_prefix: str = '',
+                      teamcity_url: str = '', teamcity_branch: str = '') -> str:
+        """
+        실행 옵션 처리 (실제 작업)
+        이 함수는 작업 스레드(QThread 또는 데몬 작업 스레드)에서 실행됩니다.
+
+        Args:
+            buildname: 빌드명 (Prefix 또는 전체 빌드명)
+                - 짧은 이름(예: game_SEL): find_latest_build로 최신 빌드 찾음
+                - 전체 빌드명(예: CompileBuild_DEV_game_SEL_...): 그대로 사용
+            max_local_copies: 로컬 경로에 저장할 최대 빌드 개수 (0이면 제한 없음)
+            patch_delay: 사용 안 함 (서버업로드및패치는 prepare_run에서 업로드 → 대기 → 패치 파이프라인으로 실행)
+        """
+        log_execution()  # 실행 로그
+        copy_source = None
+        # selenium import가 무거워 브라우저를 쓰는 옵션에서만 로드 (데몬 시작 시간, 복사 전용 PC)
+        if option in BROWSER_OPTIONS:
+            from .aws_manager import AWSManager
+        
+        try:
+            # 경로 정보: 스케줄에 지정된 경로 우선, 없으면 settings에서 가져오기
+            if not src_path or not dest_path:
+                settings = self.config_mgr.load_settings()
+                src_folder = src_path or settings.get('input_box1', DEFAULT_SRC_FOLDER)
+                dest_folder = dest_path or settings.get('input_box2', DEFAULT_DEST_FOLDER)
+            else:
+                src_folder = src_path
+                dest_folder = dest_path
+            
+            print(f"[execute_option] option: {option}, buildname: {buildname}")
+            print(f"[execute_option] src_folder: {src_folder}, dest_folder: {dest_folder}")
+            
+            # ChromeDriver 사용 옵션: 기존 세션 재사용 문제 방지 위해 맨앞에 강제 종료
+            # (브라우저 자원은 한 번에 한 작업만 확보하므로 다른 스케줄의 세션을 끊지 않음)
+            if option in CHROMEDRIVER_OPTIONS:
+                print(f"[execute_option] ChromeDriver 강제 종료 (기존 세션 재사용 방지)")
+                AWSManager.kill_all_chromedrivers()
+                AWSManager.kill_chrome_on_debug_port(port=AWSManager.CHROME_DEBUGGING_PORT)
+                time.sleep(2)
+            
+            # 복사 소스 (스케줄의 소스 유형: 경로 / HTTP 아티팩트 / 로컬 캐시)
+            copy_source = self.create_copy_source_for(schedule, src_folder)
+            mirror_roots = parse_mirror_roots((schedule or {}).get('src_paths', []))
+            mirror_mode = (schedule or {}).get('mirror_mode', 'fastest')
+            schedule_name = (schedule or {}).get('name', '')
+            
+            # buildname이 실제 폴더인지 확인 (전체 빌드명인지 Prefix인지 판단)
+            def is_full_buildname(name: str) -> bool:
+                """전체 빌드명인지 확인 (실제 폴더 존재 여부로 판단)"""
+                if not name:
+                    return False
+                return copy_source.exists(name)
+            
+            # 전체 빌드명 결정
+            def get_full_buildname(name: str) -> str:
+                """buildname이 Prefix면 최신 빌드 찾기, 전체 빌드명이면 그대로 사용"""
+                if is_full_buildname(name):
+                    print(f"[get_full_buildname] 전체 빌드명 사용: {name}")
+                    full_name = name
+                else:
+                    print(f"[get_full_buildname] Prefix로 최신 빌드 탐색: {name}")
+                    full_name = self.find_latest_build(src_folder, name, copy_source)
+                note_build(full_name)
+                return full_name
+            
+            if option == "테스트(로그)":
+                # 테스트 로그만 출력
+                test_log = f"""
+[테스트 로그 출력]
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+실행 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+실행 옵션: {option}
+빌드명: {buildname}
+AWS URL: {awsurl}
+Branch: {branch}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+                print(test_log)
+                return ""
+            
+            elif option == "클라복사":
+                full_buildname = get_full_buildname(buildname)
+                print(f"[execute_option] 클라복사 - full_buildname: {full_buildname}")
+                
+                # 오래된 빌드 정리 (max_local_copies가 설정되어 있으면)
+                if max_local_copies > 0:
+                    print(f"[execute_option] 최대 경로 개수 제한: {max_local_copies}개")
+                    self.cleanup_old_builds(dest_folder, max_local_copies)
+                
+                # 실제 클라이언트 복사 로직
+                result = self.copy_folder_direct(src_folder, dest_folder, full_buildname, 'WindowsClient', copy_source,
+                                                 mirror_roots, mirror_mode, schedule_name)
+                return f"클라복사 완료: {full_buildname} ({result})"
+            
+            elif option == "서버복사":
+                full_buildname = get_full_buildname(buildname)
+                print(f"[execute_option] 서버복사 - full_buildname: {full_buildname}")
+                
+                # 오래된 빌드 정리 (max_local_copies가 설정되어 있으면)
+                if max_local_copies > 0:
+                    print(f"[execute_option] 최대 경로 개수 제한: {max_local_copies}개")
+                    self.cleanup_old_builds(dest_folder, max_local_copies)
+                
+                # 실제 서버 복사 로직
+                result = self.copy_folder_direct(src_folder, dest_folder, full_buildname, 'WindowsServer', copy_source,
+                                                 mirror_roots, mirror_mode, schedule_name)
+                return f"서버복사 완료: {full_buildname} ({result})"
+            
+            elif option == "전체복사":
+                full_buildname = get_full_buildname(buildname)
+                print(f"[execute_option] 전체복사 - full_buildname: {full_buildname}")
+                
+                # 오래된 빌드 정리 (max_local_copies가 설정되어 있으면)
+                if max_local_copies > 0:
+                    print(f"[execute_option] 최대 경로 개수 제한: {max_local_copies}개")
+                    self.cleanup_old_builds(dest_folder, max_local_copies)
+                
+                # 실제 전체 복사 로직
+                result = self.copy_folder_direct(src_folder, dest_folder, full_buildname, '', copy_source,
+                                                 mirror_roots, mirror_mode, schedule_name)
+                return f"전체복사 완료: {full_buildname} ({result})"
+            
+            elif option == "서버패치":
+                # AWS 패치 실행
+                if not awsurl:
+                    raise Exception("AWS URL이 설정되지 않았습니다.")
+                
+                # buildname이 이미 full_buildname이면 그대로 사용 (폴더 검색 없이)
+                # 그렇지 않으면 get_full_buildname으로 폴더 검색
+                if buildname and ('CompileBuild' in buildname or 'Compilebuild' in buildname):
+                    # 이미 전체 빌드 이름임 (예: CompileBuild_DEV_game_SEL_25000_r300001)
+                    full_buildname = buildname
+                    print(f"[서버패치] 지정된 full_buildname 사용: {full_buildname}")
+                else:
+                    # 폴더에서 검색
+                    full_buildname = get_full_buildname(buildname)
+                    print(f"[서버패치] 검색된 full_buildname: {full_buildname}")
+                
+                # 리비전/타입 추출
+                parsed = parse_build_name(full_buildname)
+                revision = parsed.revision
+                buildType = parsed.build_type or 'DEV'
+                
+                print(f"[서버패치] revision: {revision}, buildType: {buildType}, branch: {branch}")
+                print(f"[서버패치] AWS URL: {awsurl}")
+                
+                # Chrome 프로세스 종료 후 재시작 (디버깅 포트 재활용 안정화)
+                # print("[서버패치] Chrome 프로세스 종료 중...")
+                # os.system('taskkill /F /IM chrome.exe /T 2>nul')
+                # os.system('taskkill /F /IM chromedriver.exe /T 2>nul')
+                # time.sleep(3)
+                
+                print("[서버패치] AWS Manager 실행 중...")
+                AWSManager.update_server_container(
+                    driver=None,
+                    revision=revision,
+                    aws_link=awsurl,
+                    branch=branch,
+                    build_type=buildType,
+                    is_debug=False,
+                    full_build_name=full_buildname
+                )
+                print("[서버패치] AWS Manager 완료")
+                return (
+                    f"• AWS: {awsurl}\n"
+                    f"• 빌드: `{full_buildname}`"
+                )
+
+            elif option == "서버최신강제패치":
+                # AWS 최신 TAG 자동 선택 패치
+                if not awsurl:
+                    raise Exception("AWS URL이 설정되지 않았습니다.")
+                if not build_prefix:
+                    raise Exception("Build Prefix가 설정되지 않았습니다. (예: DailyQLOC;game_dev_AMS)")
+
+                print(f"[서버최신강제패치] AWS URL: {awsurl}")
+                print(f"[서버최신강제패치] Branch: {branch}")
+                print(f"[서버최신강제패치] Build Prefix: {build_prefix}")
+
+                print("[서버최신강제패치] AWS Manager 실행 중...")
+                selected_tag = AWSManager.update_latest_server_container(
+                    driver=None,
+                    aws_link=awsurl,
+                    branch=branch,
+                    build_prefix=build_prefix,
+                    is_debug=False
+                )
+                print("[서버최신강제패치] AWS Manager 완료")
+                return (
+                    f"• AWS: {awsurl}\n"
+                    f"• Build: `{selected_tag}`\n"
+                    f"• Prefix: `{build_prefix}`"
+                )
+
+            elif option == "서버삭제":
+                # AWS 서버 컨테이너 삭제
+                if not awsurl:
+                    raise Exception("AWS URL이 설정되지 않았습니다.")
+                
+                print(f"[서버삭제] AWS URL: {awsurl}")
+                
+                print("[서버삭제] AWS Manager 실행 중...")
+                AWSManager.delete_server_container(
+                    driver=None,
+                    aws_link=awsurl
+                )
+                print("[서버삭제] AWS Manager 완료")
+                return f"서버삭제 완료: {awsurl}"
+            
+            elif option == "서버업로드":
+                # if not awsurl:
+                #     raise Exception("AWS URL이 설정되지 않았습니다.")
+                
+                # Chrome 프로세스 종료 후 재시작 (디버깅 포트 재활용 안정화)
+                # print("[서버패치] Chrome 프로세스 종료 중...")
+                # os.system('taskkill /F /IM chrome.exe /T 2>nul')
+                # os.system('taskkill /F /IM chromedriver.exe /T 2>nul')
+                # time.sleep(3)
+                
+                
+                full_buildname = get_full_buildname(buildname)
+                
+                # 빌드 존재 확인 (선택한 복사 소스 기준: 경로 / HTTP 아티팩트 / 캐시)
+                if not copy_source.exists(full_buildname):
+                    raise Exception(f"빌드 폴더가 없습니다: {copy_source.describe()} / {full_buildname}")
+                
+                # 리비전/타입 추출
+                parsed = parse_build_name(full_buildname)
+                revision = parsed.revision
+                buildType = parsed.build_type or 'DEV'
+                
+                # Teamcity 로그인 정보 가져오기
+                teamcity_id, teamcity_pw = self.config_mgr.get_teamcity_credentials()
+                
+                # TeamCity를 통한 서버 배포 실행
+                tc_url = teamcity_url or 'https://pbbseoul6-w.bluehole.net/buildConfiguration/BlackBudget_Deployment_DeployBuild?mode=branches#all-projects'
+                AWSManager.upload_server_build(
+                    driver=None,
+                    revision=revision,
+                    zip_path="",  # TeamCity 방식에서는 사용하지 않음
+                    aws_link=awsurl,
+                    branch=branch,
+                    build_type=buildType,
+                    full_build_name=full_buildname,
+                    teamcity_id=teamcity_id,
+                    teamcity_pw=teamcity_pw,
+                    teamcity_url=teamcity_url
+                )
+                # 서버업로드 완료 슬랙 알림
+                if schedule:
+                    upload_body = (
+                        f"• TeamCity: {tc_url}\n"
+                        f"• 빌드: `{full_buildname}`"
+                    )
+                    if awsurl:
+                        upload_body += f"\n• AWS: {awsurl}"
+                    self.send_slack_notification_if_enabled(
+                        schedule, '업로드완료', upload_body
+                    )
+                return f"서버업로드 완료: {full_buildname}"
+            
+            elif option == "빌드굽기":
+                # Teamcity 로그인 정보 가져오기
+                teamcity_id, teamcity_pw = self.config_mgr.get_teamcity_credentials()
+                
+                # Teamcity URL (미지정 시 기본값 사용)
+                url_link = teamcity_url or 'https://pbbseoul6-w.bluehole.net/buildConfiguration/BlackBudget_CompileBuild?mode=builds#all-projects'
+                # Teamcity Branch (팀시티 설정에서 지정, 미지정 시 branch 또는 game)
+                tc_branch = teamcity_branch or branch or 'game'
+                
+                # TeamCity 빌드 실행
+                AWSManager.run_teamcity_build(
+                    driver=None,
+                    url_link=url_link,
+                    branch=tc_branch,
+                    teamcity_id=teamcity_id,
+                    teamcity_pw=teamcity_pw
+                )
+                return f"빌드굽기 완료: {tc_branch}"
+            
+            elif option == "Chrome프로세스정리":
+                # Chrome 및 ChromeDriver 프로세스 정리
+                print("[Chrome프로세스정리] 시작")
+                
+                # ChromeDriver 프로세스 종료
+                chromedriver_killed = AWSManager.kill_all_chromedrivers()
+                print(f"[Chrome프로세스정리] ChromeDriver 프로세스 {chromedriver_killed}개 종료")
+                
+                # Chrome 프로세스 종료
+                chrome_result = os.system('taskkill /F /IM chrome.exe /T 2>nul')
+                chrome_killed = "성공" if chrome_result == 0 else "없음"
+                print(f"[Chrome프로세스정리] Chrome 프로세스 종료: {chrome_killed}")
+                
+                # ChromeTEMP 캐시 정리 (선택적)
+                try:
+                    cache_dir = AWSManager.CHROME_USER_DATA_DIR
+                    if os.path.exists(cache_dir):
+                        import shutil
+                        shutil.rmtree(cache_dir)
+                        print(f"[Chrome프로세스정리] 캐시 디렉터리 삭제: {cache_dir}")
+                        cache_cleaned = "✅ 캐시 정리 완료"
+                    else:
+                        cache_cleaned = "캐시 없음"
+                except Exception as e:
+                    cache_cleaned = f"⚠️ 캐시 정리 실패: {e}"
+                    print(f"[Chrome프로세스정리] {cache_cleaned}")
+                
+                # 결과 요약
+                summary = f"ChromeDriver: {chromedriver_killed}개 종료, Chrome: {chrome_killed}, {cache_cleaned}"
+                print(f"[Chrome프로세스정리] 완료 - {summary}")
+                return f"Chrome프로세스정리 완료 - {summary}"
+            
+            else:
+                return f"{option} 실행 완료 (미구현)"
+        
+        except Exception as e:
+            # 에러 메시지를 간결하게 만들어서 재발생
+            simplified_msg = simplify_error_message(str(e))
+            raise Exception(f"{option} 실행 오류: {simplified_msg}")
+        finally:
+            if copy_source is not None:
+                copy_source.close()
+    
+    def send_slack_notification_if_enabled(self, schedule: dict, status: str, details: str = None):
+        """
+        스케줄에 슬랙 알림이 활성화되어 있으면 알림 전송
+        
+        Args:
+            schedule: 스케줄 정보
+            status: 상태 (시작, 완료, 실패)
+            details: 추가 상세 정보
+        """
+        try:
+            # 슬랙 알림이 활성화되어 있는지 확인
+            slack_enabled = schedule.get('slack_enabled', False)
+            bot_token = schedule.get('bot_token', '').strip()
+            channel_id = schedule.get('channel_id', '').strip()
+            
+            if not slack_enabled or not bot_token or not channel_id:
+                return
+            
+            # 스케줄 이름
+            schedule_name = schedule.get('name', 'Unknown')
+            
+            # 알림 타입 및 추가 정보
+            notification_type = schedule.get('notification_type', 'standalone')
+            thread_keyword = schedule.get('thread_keyword', '').strip()
+            first_message = schedule.get('first_message', '').strip()
+            
+            # 테스트(로그) 옵션 처리
+            option = schedule.get('option', '')
+            if option == '테스트(로그)':
+                # first_message가 있으면 그것만 전송, 없으면 알림 안 보냄
+                if first_message:
+                    details = None  # 상태값(완료/실패) 제거
+                else:
+                    return  # 알림 전송 안 함
+            
+            # 알림 전송
+            if notification_type in ('thread', 'thread_broadcast') and thread_keyword:
+                mode_label = "스레드 댓글(채널에도 전송)" if notification_type == 'thread_broadcast' else "스레드 댓글"
+                self.log(f"[슬랙 알림] {mode_label} 모드: '{thread_keyword}' 검색 중...")
+
+            from slack import send_schedule_notification  # slack_sdk import가 무거워 전송 시에만 로드
+            send_schedule_notification(
+                webhook_url='',  # 더 이상 사용 안 함 (호환성용)
+                schedule_name=schedule_name,
+                status=status,
+                details=details,
+                notification_type=notification_type,
+                bot_token=bot_token,
+                channel_id=channel_id,
+                thread_keyword=thread_keyword if notification_type in ('thread', 'thread_broadcast') else None,
+                first_message=first_message if first_message else None,
+                schedule_option=schedule.get('option') or None,
+                plain_message_only=(option == '테스트(로그)'),
+            )
+            
+        except Exception as e:
+            # 슬랙 알림 실패는 로그만 남기고 계속 진행
+            self.log(f"[슬랙 알림 오류] {e}")
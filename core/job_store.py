@@ -0,0 +1,250 @@
+"""SQLite 작업 대기열 기록 모듈 (비정상 종료 후 재개)
+
+실행 요청된 스케줄 작업마다 상태 변화(queued → running → done/failed/cancelled)와
+파이프라인 단계별 상태를 로컬 DB에 기록합니다. 앱이 비정상 종료되거나 자동 업데이트로
+재시작되면, 다음 시작 시 끝나지 않은 작업을 찾아 완료된 단계 다음부터 재개하거나 실패로 기록합니다.
+
+작업을 기록한 프로세스가 아직 살아 있으면(UI와 데몬을 같이 띄운 경우) 중단된 작업으로 보지 않습니다.
+"""
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+# 작업 기록 DB 파일 (settings.json과 같은 위치)
+DEFAULT_JOB_DB_PATH = 'job_queue.db'
+
+# 작업 상태
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+JOB_INTERRUPTED = 'interrupted'  # 비정상 종료 후 새 작업으로 재개됨
+
+ACTIVE_STATES = (JOB_QUEUED, JOB_RUNNING)
+
+# 이 시간(초)보다 오래된 중단 작업은 재개하지 않고 실패로 기록 (상황이 바뀌었을 가능성)
+DEFAULT_RESUME_MAX_AGE = 6 * 3600.0
+
+# 끝난 작업 기록 보관 기간 (일)
+DEFAULT_KEEP_DAYS = 30
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    schedule_id TEXT NOT NULL,
+    schedule_name TEXT,
+    option TEXT,
+    build TEXT,
+    state TEXT NOT NULL,
+    stage TEXT,
+    message TEXT,
+    schedule_json TEXT,
+    resumed_from TEXT,
+    host TEXT,
+    pid INTEGER,
+    pid_started REAL,
+    created_at REAL,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs (state);
+CREATE TABLE IF NOT EXISTS job_stages (
+    job_id TEXT NOT NULL,
+    stage_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    message TEXT,
+    updated_at REAL,
+    PRIMARY KEY (job_id, stage_id)
+);
+CREATE TABLE IF NOT EXISTS job_events (
+    job_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    stage TEXT,
+    message TEXT,
+    at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_job_events_job ON job_events (job_id);
+"""
+
+
+def _process_started(pid: int) -> Optional[float]:
+    """프로세스 시작 시각 (PID 재사용 구분용, psutil이 없거나 프로세스가 없으면 None)"""
+    if psutil is None:
+        return None
+    try:
+        return psutil.Process(pid).create_time()
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+
+class JobStore:
+    """작업 상태 기록 (스레드 안전, 기록 실패는 로그만 남기고 실행을 막지 않음)"""
+
+    def __init__(self, db_path: str = DEFAULT_JOB_DB_PATH):
+        self.db_path = db_path
+        self.host = socket.gethostname().lower()
+        self.pid = os.getpid()
+        self.pid_started = _process_started(self.pid)
+        self._lock = threading.Lock()
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _write(self, statements: List[tuple]) -> bool:
+        """여러 문장을 한 트랜잭션으로 기록"""
+        with self._lock:
+            try:
+                for sql, params in statements:
+                    self._conn.execute(sql, params)
+                self._conn.commit()
+                return True
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                print(f"[JobStore] 기록 실패: {e}")
+                return False
+
+    # 기록
+    def create(self, schedule: Dict[str, Any], build: str = '', resumed_from: str = '') -> str:
+        """작업 등록 (queued) 후 작업 ID 반환"""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._write([
+            ('INSERT INTO jobs (job_id, schedule_id, schedule_name, option, build, state, stage, message, '
+             'schedule_json, resumed_from, host, pid, pid_started, created_at, updated_at) '
+             'VALUES (?, ?, ?, ?, ?, ?, NULL, NULL, ?, ?, ?, ?, ?, ?, ?)',
+             (job_id, schedule.get('id', ''), schedule.get('name', ''), schedule.get('option', ''), build,
+              JOB_QUEUED, json.dumps(schedule, ensure_ascii=False), resumed_from or None,
+              self.host, self.pid, self.pid_started, now, now)),
+            ('INSERT INTO job_events (job_id, state, stage, message, at) VALUES (?, ?, NULL, NULL, ?)',
+             (job_id, JOB_QUEUED, now)),
+        ])
+        return job_id
+
+    def set_state(self, job_id: str, state: str, message: str = '') -> None:
+        now = time.time()
+        self._write([
+            ('UPDATE jobs SET state = ?, message = ?, updated_at = ? WHERE job_id = ?',
+             (state, message or None, now, job_id)),
+            ('INSERT INTO job_events (job_id, state, stage, message, at) VALUES (?, ?, NULL, ?, ?)',
+             (job_id, state, message or None, now)),
+        ])
+
+    def set_build(self, job_id: str, build: str) -> None:
+        """실행 중 확정된 빌드명 기록 (재개 시 같은 빌드 사용)"""
+        self._write([('UPDATE jobs SET build = ?, updated_at = ? WHERE job_id = ?', (build, time.time(), job_id))])
+
+    def set_stage(self, job_id: str, stage_id: str, status: str, message: str = '') -> None:
+        """파이프라인 단계 상태 기록 (작업의 현재 단계도 갱신)"""
+        now = time.time()
+        self._write([
+            ('INSERT OR REPLACE INTO job_stages (job_id, stage_id, status, message, updated_at) '
+             'VALUES (?, ?, ?, ?, ?)', (job_id, stage_id, status, message or None, now)),
+            ('UPDATE jobs SET stage = ?, updated_at = ? WHERE job_id = ?', (stage_id, now, job_id)),
+            ('INSERT INTO job_events (job_id, state, stage, message, at) VALUES (?, ?, ?, ?, ?)',
+             (job_id, status, stage_id, message or None, now)),
+        ])
+
+    def purge(self, keep_days: float = DEFAULT_KEEP_DAYS) -> int:
+        """보관 기간이 지난 끝난 작업 삭제 (삭제 수 반환)"""
+        cutoff = time.time() - keep_days * 86400
+        with self._lock:
+            try:
+                old = [r[0] for r in self._conn.execute(
+                    f"SELECT job_id FROM jobs WHERE updated_at < ? AND state NOT IN "
+                    f"({', '.join('?' * len(ACTIVE_STATES))})", (cutoff, *ACTIVE_STATES))]
+                for table in ('job_events', 'job_stages', 'jobs'):
+                    self._conn.executemany(f'DELETE FROM {table} WHERE job_id = ?', [(j,) for j in old])
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                print(f"[JobStore] 정리 실패: {e}")
+                return 0
+        return len(old)
+
+    # 조회
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute('SELECT * FROM jobs WHERE job_id = ?', (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def stages(self, job_id: str) -> Dict[str, str]:
+        """{단계 id: 상태}"""
+        with self._lock:
+            return {r[0]: r[1] for r in self._conn.execute(
+                'SELECT stage_id, status FROM job_stages WHERE job_id = ?', (job_id,))}
+
+    def events(self, job_id: str) -> List[Dict[str, Any]]:
+        """상태 변화 기록 (시간순)"""
+        with self._lock:
+            return [dict(r) for r in self._conn.execute(
+                'SELECT state, stage, message, at FROM job_events WHERE job_id = ? ORDER BY rowid', (job_id,))]
+
+    def active(self) -> List[Dict[str, Any]]:
+        """끝나지 않은 작업 (queued/running)"""
+        with self._lock:
+            return [dict(r) for r in self._conn.execute(
+                f"SELECT * FROM jobs WHERE state IN ({', '.join('?' * len(ACTIVE_STATES))}) ORDER BY created_at",
+                ACTIVE_STATES)]
+
+    def find_interrupted(self) -> List[Dict[str, Any]]:
+        """기록한 프로세스가 종료된 채 끝나지 않은 작업 (이 PC 기록만)"""
+        return [job for job in self.active()
+                if job.get('host') == self.host and not self._owner_alive(job)]
+
+    def _owner_alive(self, job: Dict[str, Any]) -> bool:
+        pid = job.get('pid')
+        if pid == self.pid:
+            return job.get('pid_started') == self.pid_started
+        if psutil is None:
+            # 프로세스 확인 불가 - 다른 프로세스 작업은 종료된 것으로 간주
+            return False
+        started = _process_started(pid)
+        return started is not None and (job.get('pid_started') is None or
+                                        abs(started - job['pid_started']) < 1.0)
+
+
+_shared_store: Optional[JobStore] = None
+_shared_lock = threading.Lock()
+
+
+def get_job_store(db_path: str = DEFAULT_JOB_DB_PATH) -> JobStore:
+    """프로세스 전역 공유 JobStore"""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = JobStore(db_path)
+        return _shared_store
+
+
+def open_job_store(config_mgr) -> Optional[JobStore]:
+    """settings.json job_store_enabled(기본 true)면 공유 JobStore (DB를 열 수 없으면 None)"""
+    if not config_mgr.get_setting('job_store_enabled', True):
+        return None
+    try:
+        return get_job_store()
+    except (OSError, sqlite3.Error) as e:
+        print(f"[JobStore] 작업 기록 DB를 열 수 없어 기록하지 않습니다: {e}")
+        return None
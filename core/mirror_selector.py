@@ -0,0 +1,320 @@
+"""멀티 미러 소스 선택 모듈 (지연/처리량 측정 → 최속 미러 선택 또는 분산 복사)"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .copy_sources import (CacheCopySource, CopySource, PathCopySource,
+                           create_copy_source, detect_source_type)
+
+
+# 미러 선택 모드 (스케줄의 'mirror_mode' 값)
+MIRROR_MODE_FASTEST = 'fastest'
+MIRROR_MODE_STRIPE = 'stripe'
+
+# 측정용 읽기 크기
+DEFAULT_SAMPLE_BYTES = 4 * 1024 * 1024
+
+# 미러 선택 기록 파일 (JSON Lines)
+MIRROR_LOG_PATH = os.path.join('log', 'mirror_selection.jsonl')
+
+
+class MirrorProbe:
+    """미러 하나의 측정 결과"""
+
+    def __init__(self, source: CopySource):
+        self.source = source
+        self.listing_latency: Optional[float] = None  # 초
+        self.read_throughput: Optional[float] = None  # bytes/s
+        self.sample_bytes = 0
+        self.error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.read_throughput is not None
+
+    def estimate_seconds(self, total_bytes: int, file_count: int) -> float:
+        """예상 복사 시간 (파일당 왕복 지연 + 전송 시간)"""
+        if not self.ok:
+            return float('inf')
+        transfer = total_bytes / self.read_throughput if self.read_throughput > 0 else float('inf')
+        return self.listing_latency * max(1, file_count) + transfer
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'source': self.source.describe(),
+            'listing_latency': None if self.listing_latency is None else round(self.listing_latency, 4),
+            'read_throughput': None if self.read_throughput is None else round(self.read_throughput, 1),
+            'sample_bytes': self.sample_bytes,
+            'error': self.error,
+        }
+
+
+def find_sample_file(source: CopySource, rel_path: str,
+                     max_entries: int = 500) -> Tuple[Optional[str], int, int]:
+    """
+    측정에 쓸 샘플 파일 선택 (가장 큰 파일)
+
+    경로 소스는 전체 트리를 훑지 않도록 max_entries 개까지만 확인합니다.
+
+    Returns:
+        (rel_path 기준 파일 경로, 확인한 전체 바이트, 확인한 파일 수)
+    """
+    if isinstance(source, PathCopySource):
+        base = source._abs(rel_path)
+        best, best_size, total, count = None, -1, 0, 0
+        pending = ['']
+        seen = 0
+        while pending and seen < max_entries:
+            rel_dir = pending.pop(0)
+            try:
+                with os.scandir(os.path.join(base, rel_dir) if rel_dir else base) as it:
+                    for entry in it:
+                        seen += 1
+                        rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                        if entry.is_dir():
+                            pending.append(rel)
+                        else:
+                            size = entry.stat().st_size
+                            total += size
+                            count += 1
+                            if size > best_size:
+                                best, best_size = rel, size
+            except OSError:
+                break
+        return best, total, count
+
+    _, files = source.list_tree(rel_path)
+    if not files:
+        return None, 0, 0
+    best = max(files, key=lambda f: f[1])
+    return best[0], sum(size for _, size in files), len(files)
+
+
+def probe_source(source: CopySource, rel_path: str, sample_file: Optional[str],
+                 sample_bytes: int = DEFAULT_SAMPLE_BYTES) -> MirrorProbe:
+    """미러 하나 측정 (목록 조회 지연 + 짧은 읽기 처리량)"""
+    probe = MirrorProbe(source)
+    try:
+        started = time.perf_counter()
+        if not source.exists(rel_path):
+            raise FileNotFoundError(f"빌드 없음: {rel_path}")
+        probe.listing_latency = time.perf_counter() - started
+
+        if sample_file:
+            base = rel_path.replace('\\', '/').strip('/')
+            started = time.perf_counter()
+            probe.sample_bytes = source.read_sample(f"{base}/{sample_file}", sample_bytes)
+            elapsed = max(time.perf_counter() - started, 1e-6)
+            probe.read_throughput = probe.sample_bytes / elapsed
+        else:
+            # 빈 폴더: 처리량 대신 지연만 비교
+            probe.read_throughput = 1.0 / max(probe.listing_latency, 1e-6)
+    except Exception as e:
+        probe.error = f"{type(e).__name__}: {e}"
+    return probe
+
+
+def probe_sources(sources: List[CopySource], rel_path: str,
+                  sample_bytes: int = DEFAULT_SAMPLE_BYTES) -> Tuple[List[MirrorProbe], int, int]:
+    """
+    모든 미러를 동시에 측정
+
+    Returns:
+        (측정 결과 목록, 샘플 기준 전체 바이트, 샘플 기준 파일 수)
+    """
+    sample_file, total_bytes, file_count = None, 0, 0
+    for source in sources:
+        try:
+            sample_file, total_bytes, file_count = find_sample_file(source, rel_path)
+            break
+        except Exception:
+            continue
+
+    with ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix='mirror-probe') as pool:
+        futures = [pool.submit(probe_source, source, rel_path, sample_file, sample_bytes)
+                   for source in sources]
+        probes = [future.result() for future in futures]
+    return probes, total_bytes, file_count
+
+
+class StripedCopySource(CopySource):
+    """
+    여러 미러에 파일을 나눠 동시에 받는 소스
+
+    파일마다 '진행 중 바이트 / 처리량' 으로 예상 완료 시간이 가장 이른 미러를 고르며,
+    실패하면 다른 미러로 재시도합니다.
+    """
+
+    source_type = 'stripe'
+
+    def __init__(self, sources: List[CopySource], throughputs: List[float],
+                 borrowed: Sequence[CopySource] = ()):
+        """
+        Args:
+            sources: 미러 소스 (처리량 순)
+            throughputs: 소스별 측정 처리량 (bytes/s)
+            borrowed: 호출한 쪽 소유 소스 (close에서 닫지 않음)
+        """
+        super().__init__(sources[0].root)
+        self.sources = sources
+        self.borrowed = list(borrowed)
+        self.throughputs = [max(t, 1.0) for t in throughputs]
+        self._pending = [0] * len(sources)
+        self._sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.bytes_per_source = [0] * len(sources)
+
+    def describe(self) -> str:
+        return 'stripe[' + ', '.join(s.describe() for s in self.sources) + ']'
+
+    def is_available(self) -> bool:
+        return any(s.is_available() for s in self.sources)
+
+    def list_builds(self) -> List[str]:
+        return self.sources[0].list_builds()
+
+    def exists(self, rel_path: str) -> bool:
+        return self.sources[0].exists(rel_path)
+
+    def list_tree(self, rel_path: str):
+        dirs, files = self.sources[0].list_tree(rel_path)
+        base = rel_path.replace('\\', '/').strip('/')
+        self._sizes = {f"{base}/{rel}" if base else rel: size for rel, size in files}
+        return dirs, files
+
+    def _pick(self, size: int, exclude: set) -> Optional[int]:
+        with self._lock:
+            candidates = [i for i in range(len(self.sources)) if i not in exclude]
+            if not candidates:
+                return None
+            index = min(candidates,
+                        key=lambda i: (self._pending[i] + size) / self.throughputs[i])
+            self._pending[index] += size
+            return index
+
+    def copy_file(self, rel_file: str, dest_file: str) -> int:
+        size = self._sizes.get(rel_file.replace('\\', '/').strip('/'), 0)
+        tried = set()
+        last_error = None
+        while True:
+            index = self._pick(size, tried)
+            if index is None:
+                raise last_error or IOError(f"모든 미러에서 복사 실패: {rel_file}")
+            try:
+                copied = self.sources[index].copy_file(rel_file, dest_file)
+                with self._lock:
+                    self.bytes_per_source[index] += copied
+                return copied
+            except PermissionError:
+                raise
+            except Exception as e:
+                print(f"[StripedCopySource] {self.sources[index].describe()} 실패, 다른 미러로 재시도: {e}")
+                last_error = e
+                tried.add(index)
+            finally:
+                with self._lock:
+                    self._pending[index] -= size
+
+    def read_sample(self, rel_file: str, length: int) -> int:
+        return self.sources[0].read_sample(rel_file, length)
+
+    def close(self) -> None:
+        for source in self.sources:
+            if source not in self.borrowed:
+                source.close()
+
+
+def log_mirror_selection(record: Dict[str, Any], log_path: str = MIRROR_LOG_PATH) -> None:
+    """미러 선택 결과를 JSON Lines로 기록 (이후 분석용)"""
+    try:
+        log_dir = os.path.dirname(log_path)
+        if log_dir and not os.path.exists(log_dir):
+            os.makedirs(log_dir)
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    except Exception as e:
+        print(f"미러 선택 기록 오류: {e}")
+
+
+def parse_mirror_roots(value) -> List[str]:
+    """스케줄의 src_paths 값(list 또는 ';' 구분 문자열)을 목록으로 변환"""
+    if isinstance(value, str):
+        value = value.split(';')
+    if not isinstance(value, list):
+        return []
+    return [str(v).strip() for v in value if str(v).strip()]
+
+
+def select_mirror_source(primary: CopySource, mirror_roots: List[str], rel_path: str,
+                         mode: str = MIRROR_MODE_FASTEST,
+                         context: Optional[Dict[str, Any]] = None) -> CopySource:
+    """
+    주 소스와 미러 중 복사에 사용할 소스 결정
+
+    Args:
+        primary: 스케줄의 주 소스 (캐시 소스면 upstream을 미러 대상으로 사용, primary는 변경하지 않음)
+        mirror_roots: 추가 미러 루트 (경로 또는 URL)
+        rel_path: 복사할 상대 경로
+        mode: 'fastest' (최속 미러 하나) 또는 'stripe' (여러 미러 분산)
+        context: 기록에 함께 남길 정보 (스케줄 이름, 빌드명 등)
+
+    Returns:
+        복사에 사용할 소스 (미러가 없으면 primary 그대로)
+    """
+    cache = primary if isinstance(primary, CacheCopySource) and primary.upstream else None
+    base = cache.upstream if cache else primary
+
+    roots = [r for r in mirror_roots if r and r != base.root]
+    if not roots:
+        return primary
+
+    sources = [base] + [create_copy_source(detect_source_type(r), r) for r in roots]
+    probes, total_bytes, file_count = probe_sources(sources, rel_path)
+    ranked = sorted([p for p in probes if p.ok],
+                    key=lambda p: p.estimate_seconds(total_bytes, file_count))
+
+    record = {
+        'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'rel_path': rel_path,
+        'mode': mode,
+        'sample_total_bytes': total_bytes,
+        'sample_file_count': file_count,
+        'probes': [p.to_dict() for p in probes],
+    }
+    record.update(context or {})
+
+    if not ranked:
+        record['selected'] = [base.describe()]
+        record['note'] = 'all probes failed, using primary'
+        log_mirror_selection(record)
+        for source in sources[1:]:
+            source.close()
+        return primary
+
+    if mode == MIRROR_MODE_STRIPE and len(ranked) > 1:
+        # 주 소스(또는 캐시 upstream)는 호출한 쪽 소유 - 복사 후 분산 소스를 닫아도 유지
+        selected: CopySource = StripedCopySource([p.source for p in ranked],
+                                                 [p.read_throughput for p in ranked], borrowed=[base])
+        chosen = [p.source for p in ranked]
+    else:
+        selected = ranked[0].source
+        chosen = [selected]
+
+    record['selected'] = [s.describe() for s in chosen]
+    log_mirror_selection(record)
+    print(f"[미러 선택] {mode}: {', '.join(record['selected'])}")
+
+    for source in sources[1:]:
+        if source not in chosen:
+            source.close()
+
+    if cache:
+        if selected is base:
+            return cache
+        # 주 캐시 소스는 호출한 쪽 소유 - 같은 캐시 폴더에 선택한 소스를 upstream으로 둔 새 소스 반환
+        return CacheCopySource(cache.root, selected)
+    return selected
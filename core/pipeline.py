@@ -0,0 +1,325 @@
+"""다단계 스케줄 파이프라인 모듈
+
+스케줄의 stages에 단계와 의존 관계(after)를 적으면 작은 DAG로 실행합니다.
+의존 단계가 모두 끝나는 즉시 다음 단계를 시작하고, 의존 관계가 없는 단계는 동시에 실행합니다.
+단계마다 자원(ResourceExecutor)을 따로 확보하므로 대기 단계 동안에는 브라우저/디스크를
+다른 스케줄이 쓸 수 있습니다.
+
+단계 형식 (schedule['stages']):
+    {"id": "upload", "option": "서버업로드"}
+    {"id": "wait", "wait_minutes": 30, "after": ["upload"]}
+    {"id": "patch_qa1", "option": "서버패치", "after": ["wait"], "awsurl": "https://..."}
+    {"id": "notify", "slack": "QA 서버 패치 완료", "after": ["patch_qa1", "patch_qa2"]}
+
+option 단계의 나머지 키(awsurl, branch, dest_path 등)는 해당 단계에서만 스케줄 값을 덮어씁니다.
+한 단계가 실패하면 그 단계에 의존하는 단계만 건너뛰고, 독립된 단계는 계속 실행합니다.
+"""
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .resource_executor import Resource, ResourceExecutor
+
+
+# 단계 유형
+STAGE_OPTION = 'option'  # execute_option 한 번 실행
+STAGE_WAIT = 'wait'      # wait_minutes분 대기 (자원 사용 안 함)
+STAGE_SLACK = 'slack'    # 스케줄 슬랙 설정으로 메시지 전송
+
+# 단계 상태
+STAGE_PENDING = 'pending'
+STAGE_RUNNING = 'running'
+STAGE_DONE = 'done'
+STAGE_FAILED = 'failed'
+STAGE_SKIPPED = 'skipped'
+
+# 대기 단계 진행 로그 간격 (초)
+WAIT_LOG_INTERVAL = 60
+
+# 서버업로드및패치 기본 파이프라인 (업로드 → patch_delay분 대기 → 패치)
+UPLOAD_AND_PATCH_OPTION = '서버업로드및패치'
+
+# 빌드명이 필요한 옵션 (Prefix면 파이프라인 시작 시 한 번 최신 빌드를 찾아 모든 단계가 같은 빌드 사용)
+BUILD_STAGE_OPTIONS = frozenset({'클라복사', '서버복사', '전체복사', '서버패치', '서버업로드'})
+
+# AWS URL이 필요한 옵션 (단계나 스케줄에 awsurl이 없으면 실행 전에 거부)
+AWSURL_STAGE_OPTIONS = frozenset({'서버패치', '서버최신강제패치', '서버삭제'})
+
+# 단계 키 중 스케줄 값을 덮어쓰지 않는 키
+_STAGE_META_KEYS = ('id', 'after', 'option', 'wait_minutes', 'slack')
+
+_run_counter = itertools.count(1)
+
+
+class PipelineError(Exception):
+    """파이프라인 정의 오류 또는 단계 실패"""
+
+
+class Stage:
+    """파이프라인 단계 하나"""
+
+    __slots__ = ('id', 'type', 'option', 'after', 'wait_minutes', 'message', 'overrides')
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.id = str(spec.get('id') or '').strip()
+        if not self.id:
+            raise PipelineError(f"단계 id가 없습니다: {spec}")
+        after = spec.get('after') or []
+        if isinstance(after, str):
+            after = [after]
+        self.after = tuple(after)
+        self.option = spec.get('option', '')
+        self.wait_minutes = 0.0
+        self.message = ''
+        if 'wait_minutes' in spec:
+            self.type = STAGE_WAIT
+            try:
+                self.wait_minutes = max(0.0, float(spec['wait_minutes']))
+            except (TypeError, ValueError):
+                raise PipelineError(f"'{self.id}' 단계 wait_minutes가 숫자가 아닙니다: {spec['wait_minutes']}")
+        elif 'slack' in spec:
+            self.type = STAGE_SLACK
+            self.message = str(spec['slack'])
+        elif self.option == UPLOAD_AND_PATCH_OPTION:
+            # 단계 안에서 다시 파이프라인을 돌리면 브라우저 자원을 쥔 채 기다리게 됨
+            raise PipelineError(f"'{self.id}' 단계: {UPLOAD_AND_PATCH_OPTION}는 서버업로드 / 대기 / 서버패치 단계로 나눠 주세요")
+        elif self.option:
+            self.type = STAGE_OPTION
+        else:
+            raise PipelineError(f"'{self.id}' 단계에 option / wait_minutes / slack 중 하나가 필요합니다")
+        self.overrides = {k: v for k, v in spec.items() if k not in _STAGE_META_KEYS}
+
+    def __repr__(self) -> str:
+        return f"Stage({self.id!r}, {self.type})"
+
+    def label(self) -> str:
+        if self.type == STAGE_WAIT:
+            return f"{self.id} ({self.wait_minutes:g}분 대기)"
+        if self.type == STAGE_OPTION:
+            return f"{self.id} ({self.option})"
+        return f"{self.id} (슬랙)"
+
+
+def parse_stages(specs: Iterable[Dict[str, Any]]) -> List[Stage]:
+    """
+    단계 정의 해석 및 검증 (id 중복, 없는 의존 단계, 순환 의존)
+
+    Returns:
+        의존 순서(위상 정렬)대로 정렬한 단계 목록
+    """
+    stages = [Stage(spec) for spec in specs]
+    if not stages:
+        raise PipelineError("단계가 없습니다")
+    by_id: Dict[str, Stage] = {}
+    for stage in stages:
+        if stage.id in by_id:
+            raise PipelineError(f"단계 id가 중복됩니다: {stage.id}")
+        by_id[stage.id] = stage
+    for stage in stages:
+        for dep in stage.after:
+            if dep not in by_id:
+                raise PipelineError(f"'{stage.id}' 단계의 의존 단계가 없습니다: {dep}")
+
+    # 위상 정렬 (정의 순서 유지)
+    ordered: List[Stage] = []
+    placed = set()
+    remaining = list(stages)
+    while remaining:
+        ready = [s for s in remaining if all(dep in placed for dep in s.after)]
+        if not ready:
+            raise PipelineError(f"단계 의존 관계에 순환이 있습니다: {', '.join(s.id for s in remaining)}")
+        for stage in ready:
+            ordered.append(stage)
+            placed.add(stage.id)
+        remaining = [s for s in remaining if s.id not in placed]
+    return ordered
+
+
+def schedule_stages(schedule: Dict[str, Any]) -> Optional[List[Stage]]:
+    """
+    스케줄의 파이프라인 단계 (단일 옵션 스케줄이면 None)
+
+    stages가 없는 서버업로드및패치는 업로드 → 대기 → 패치 3단계로 실행합니다.
+    업로드 후 대기가 끝나서야 패치가 실패하지 않도록 필요한 입력(awsurl)도 미리 확인합니다.
+
+    Raises:
+        PipelineError: 단계 정의 오류 또는 AWS URL이 없는 패치/삭제 단계
+    """
+    specs = schedule.get('stages')
+    if specs:
+        stages = parse_stages(specs)
+    elif schedule.get('option') == UPLOAD_AND_PATCH_OPTION:
+        stages = parse_stages([
+            {'id': 'upload', 'option': '서버업로드'},
+            {'id': 'wait', 'wait_minutes': schedule.get('patch_delay', 30), 'after': ['upload']},
+            {'id': 'patch', 'option': '서버패치', 'after': ['wait']},
+        ])
+    else:
+        return None
+    for stage in stages:
+        if stage.option in AWSURL_STAGE_OPTIONS and not stage.overrides.get('awsurl', schedule.get('awsurl')):
+            raise PipelineError(f"'{stage.id}' 단계({stage.option})에 AWS URL이 설정되지 않았습니다")
+    return stages
+
+
+class PipelineRun:
+    """파이프라인 1회 실행 (run()을 호출한 스레드에서 완료까지 대기)"""
+
+    def __init__(self, stages: List[Stage], run_stage: Callable[[Stage], str],
+                 executor: ResourceExecutor,
+                 resources_for: Callable[[Stage], List[Resource]] = lambda stage: [],
+                 name: str = 'pipeline', log: Callable[[str], None] = print,
+                 completed: Iterable[str] = (),
+                 on_stage: Optional[Callable[[Stage, str, str], None]] = None):
+        """
+        Args:
+            stages: parse_stages 결과
+            run_stage: option/slack 단계 실행 함수 (결과 메시지 반환, 실패 시 예외)
+            executor: 단계별 자원 확보에 쓸 실행기
+            resources_for: 단계가 사용할 자원
+            name: 로그/작업 ID용 이름 (스케줄 ID)
+            log: 로그 함수
+            completed: 이전 실행에서 이미 끝난 단계 id (중단된 작업 재개 시 건너뜀)
+            on_stage: 단계 상태 변경 콜백 (단계, running/done/failed, 결과 또는 오류 메시지)
+        """
+        self.stages = stages
+        self.run_stage = run_stage
+        self.executor = executor
+        self.resources_for = resources_for
+        self.name = name
+        self.log = log
+        done = set(completed)
+        self.status: Dict[str, str] = {s.id: STAGE_DONE if s.id in done else STAGE_PENDING for s in stages}
+        self.on_stage = on_stage
+        self.results: Dict[str, str] = {}
+        self.errors: Dict[str, str] = {}
+        self.durations: Dict[str, float] = {}
+        self._job_prefix = f"{name}#{next(_run_counter)}"
+        self._cond = threading.Condition()
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """대기 중인 단계 취소, 대기(wait) 단계 중단 (실행 중인 단계는 끝까지 실행)"""
+        self._cancelled.set()
+        with self._cond:
+            for stage in self.stages:
+                if self.executor.cancel(self._job_id(stage)):
+                    self.status[stage.id] = STAGE_SKIPPED
+            self._cond.notify_all()
+
+    def run(self) -> Dict[str, str]:
+        """
+        모든 단계 실행
+
+        Returns:
+            {단계 id: 결과 메시지}
+
+        Raises:
+            PipelineError: 실패하거나 건너뛴 단계가 있으면 (독립된 단계는 끝까지 실행한 뒤)
+        """
+        with self._cond:
+            while True:
+                self._skip_blocked()
+                for stage in self.stages:
+                    if self.status[stage.id] != STAGE_PENDING:
+                        continue
+                    if self._cancelled.is_set():
+                        self.status[stage.id] = STAGE_SKIPPED
+                    elif self._deps_done(stage):
+                        self._submit(stage)
+                if not any(st in (STAGE_PENDING, STAGE_RUNNING) for st in self.status.values()):
+                    break
+                self._cond.wait()
+
+        failed = [sid for sid, st in self.status.items() if st == STAGE_FAILED]
+        skipped = [sid for sid, st in self.status.items() if st == STAGE_SKIPPED]
+        if failed or skipped:
+            parts = [f"{sid}: {self.errors.get(sid, '')}" for sid in failed]
+            if skipped:
+                parts.append(f"건너뜀: {', '.join(skipped)}")
+            raise PipelineError(' / '.join(parts))
+        return dict(self.results)
+
+    def summary(self) -> str:
+        """마지막 단계(다른 단계가 의존하지 않는 단계)들의 결과"""
+        depended = {dep for s in self.stages for dep in s.after}
+        leaves = [s for s in self.stages if s.id not in depended and self.results.get(s.id)]
+        return '\n'.join(self.results[s.id] for s in leaves)
+
+    # 내부
+    def _job_id(self, stage: Stage) -> str:
+        return f"{self._job_prefix}/{stage.id}"
+
+    def _deps_done(self, stage: Stage) -> bool:
+        return all(self.status[dep] == STAGE_DONE for dep in stage.after)
+
+    def _skip_blocked(self) -> None:
+        """실패/건너뛴 단계에 의존하는 단계 건너뛰기 (잠금 안에서 호출, 정렬 순서라 한 번에 전파)"""
+        for stage in self.stages:
+            if self.status[stage.id] == STAGE_PENDING and any(
+                    self.status[dep] in (STAGE_FAILED, STAGE_SKIPPED) for dep in stage.after):
+                self.status[stage.id] = STAGE_SKIPPED
+                self.log(f"[파이프라인] {self.name}: {stage.label()} 건너뜀 (앞 단계 실패)")
+
+    def _submit(self, stage: Stage) -> None:
+        """단계 실행 요청 (잠금 안에서 호출, 자원을 확보하면 별도 스레드에서 실행)"""
+        self.status[stage.id] = STAGE_RUNNING
+        resources = self.resources_for(stage) if stage.type == STAGE_OPTION else []
+
+        def start():
+            threading.Thread(target=self._execute, args=(stage,), daemon=True,
+                             name=f"stage-{stage.id}").start()
+
+        position = self.executor.submit(self._job_id(stage), resources, start)
+        if position:
+            self.log(f"[파이프라인] {self.name}: {stage.label()} 자원 대기 ({position}번째)")
+
+    def _execute(self, stage: Stage) -> None:
+        started = time.monotonic()
+        self.log(f"[파이프라인] {self.name}: {stage.label()} 시작")
+        self._notify(stage, STAGE_RUNNING, '')
+        try:
+            if stage.type == STAGE_WAIT:
+                result = self._wait(stage)
+            else:
+                result = self.run_stage(stage) or ''
+            status, error = STAGE_DONE, ''
+        except Exception as e:
+            result, status, error = '', STAGE_FAILED, str(e)
+        finally:
+            self.executor.release(self._job_id(stage))
+
+        elapsed = time.monotonic() - started
+        if status == STAGE_DONE:
+            self.log(f"[파이프라인] {self.name}: {stage.label()} 완료 ({elapsed:.1f}초)")
+        else:
+            self.log(f"[파이프라인] {self.name}: {stage.label()} 실패 - {error}")
+        self._notify(stage, status, error or result)
+        with self._cond:
+            self.status[stage.id] = status
+            self.results[stage.id] = result
+            self.durations[stage.id] = elapsed
+            if error:
+                self.errors[stage.id] = error
+            self._cond.notify_all()
+
+    def _notify(self, stage: Stage, status: str, message: str) -> None:
+        """on_stage 호출 (기록 실패가 단계 실행에 영향을 주지 않도록)"""
+        if self.on_stage is None:
+            return
+        try:
+            self.on_stage(stage, status, message)
+        except Exception as e:
+            self.log(f"[파이프라인] {self.name}: 단계 상태 기록 실패 - {e}")
+
+    def _wait(self, stage: Stage) -> str:
+        """대기 단계 (cancel() 시 중단)"""
+        deadline = time.monotonic() + stage.wait_minutes * 60
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return ''
+            self.log(f"[파이프라인] {self.name}: {stage.id} {remaining / 60:.0f}분 남음...")
+            if self._cancelled.wait(min(remaining, WAIT_LOG_INTERVAL)):
+                raise PipelineError("취소됨")
@@ -0,0 +1,271 @@
+"""자원 기반 작업 실행 순서 관리 모듈
+
+옵션마다 사용하는 자원을 선언하고, 자원이 실제로 겹칠 때만 작업을 대기시킵니다.
+- browser: ChromeDriver/Chrome(디버깅 포트) 세션. 해당 옵션은 시작할 때 기존 chromedriver를
+  모두 종료하므로 동시에 하나만 실행
+- nas_read: 빌드 원본(NAS 호스트/HTTP 서버)별 읽기. 같은 원본에서 동시에 읽는 작업 수 제한
+- dest_disk: 대상 드라이브별 쓰기. 복사 엔진이 이미 병렬로 쓰므로 같은 디스크는 하나씩
+
+대기열은 먼저 들어온 순서를 지킵니다. 뒤 작업은 앞에서 기다리는 작업과 겹치는 자원이 없을 때만
+먼저 시작할 수 있어, 자원을 여러 개 쓰는 작업이 계속 뒤로 밀리지 않습니다.
+Qt에 의존하지 않으며, 작업 시작은 호출 측이 넘긴 콜백으로 합니다.
+"""
+import ntpath
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+
+# 자원 종류
+RESOURCE_BROWSER = 'browser'
+RESOURCE_NAS_READ = 'nas_read'
+RESOURCE_DEST_DISK = 'dest_disk'
+
+RESOURCE_LABELS = {
+    RESOURCE_BROWSER: '브라우저',
+    RESOURCE_NAS_READ: 'NAS 읽기',
+    RESOURCE_DEST_DISK: '대상 디스크',
+}
+
+# 자원 종류별 기본 동시 사용 수 (자원 키마다 적용)
+DEFAULT_CAPACITIES = {
+    RESOURCE_BROWSER: 1,
+    RESOURCE_NAS_READ: 2,
+    RESOURCE_DEST_DISK: 1,
+}
+
+# ChromeDriver 사용 옵션 (시작 시 기존 chromedriver/디버깅 포트 Chrome 종료)
+CHROMEDRIVER_OPTIONS = frozenset({'서버패치', '서버업로드', '서버업로드및패치', '서버최신강제패치',
+                                  '서버삭제', '빌드굽기'})
+
+# Chrome을 종료하므로 브라우저 세션을 쓰는 작업과 겹치면 안 되는 옵션
+BROWSER_OPTIONS = CHROMEDRIVER_OPTIONS | {'Chrome프로세스정리'}
+
+# 빌드 원본을 읽어 로컬 대상에 쓰는 옵션
+COPY_OPTIONS = frozenset({'클라복사', '서버복사', '전체복사'})
+
+# 브라우저 자원 키 (디버깅 포트 하나를 공유)
+BROWSER_KEY = 'chrome'
+
+Resource = Tuple[str, str]  # (자원 종류, 자원 키)
+
+
+def source_key(path: str) -> str:
+    """빌드 원본 경로 → 읽기 자원 키 (UNC는 호스트, URL은 서버, 로컬은 드라이브)"""
+    path = (path or '').strip()
+    if '://' in path:
+        return urlparse(path).netloc.lower() or path.lower()
+    normalized = path.replace('/', '\\')
+    if normalized.startswith('\\\\'):
+        return normalized[2:].split('\\', 1)[0].lower()
+    return disk_key(path)
+
+
+def disk_key(path: str) -> str:
+    """대상 경로 → 디스크 자원 키 (드라이브 문자 또는 UNC 공유, 드라이브가 없으면 '/')"""
+    drive = ntpath.splitdrive(path or '')[0] or os.path.splitdrive(os.path.abspath(path or '.'))[0]
+    return drive.upper() or '/'
+
+
+def resources_for_option(option: str, src_folder: str = '', dest_folder: str = '') -> List[Resource]:
+    """옵션이 사용하는 자원 목록 (자원을 쓰지 않는 옵션은 빈 목록)"""
+    resources: List[Resource] = []
+    if option in BROWSER_OPTIONS:
+        resources.append((RESOURCE_BROWSER, BROWSER_KEY))
+    if option in COPY_OPTIONS:
+        resources.append((RESOURCE_NAS_READ, source_key(src_folder)))
+        resources.append((RESOURCE_DEST_DISK, disk_key(dest_folder)))
+    return resources
+
+
+def describe_resources(resources: Iterable[Resource]) -> str:
+    """UI 표시용 자원 이름 ('브라우저, NAS 읽기')"""
+    labels = []
+    for kind, _ in resources:
+        label = RESOURCE_LABELS.get(kind, kind)
+        if label not in labels:
+            labels.append(label)
+    return ', '.join(labels)
+
+
+class _Job:
+    __slots__ = ('job_id', 'resources', 'start')
+
+    def __init__(self, job_id: str, resources: List[Resource], start: Callable[[], None]):
+        self.job_id = job_id
+        self.resources = resources
+        self.start = start
+
+
+class ResourceExecutor:
+    """자원별 동시 실행 수 제한 + 공정한 대기열 (스레드 안전)"""
+
+    def __init__(self, capacities: Optional[Dict[str, int]] = None):
+        self.capacities = dict(DEFAULT_CAPACITIES)
+        if capacities:
+            self.set_capacities(capacities)
+        self._in_use: Dict[Resource, int] = {}
+        self._running: Dict[str, _Job] = {}
+        self._waiting: 'OrderedDict[str, _Job]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def set_capacities(self, capacities: Dict[str, int]) -> None:
+        """자원 종류별 동시 사용 수 변경 (1 미만은 1, 대기 작업은 다음 release 때 반영)"""
+        for kind, value in capacities.items():
+            try:
+                self.capacities[kind] = max(1, int(value))
+            except (TypeError, ValueError):
+                print(f"[ResourceExecutor] 잘못된 동시 실행 수 무시: {kind}={value}")
+
+    # 작업 제출/종료
+    def submit(self, job_id: str, resources: Iterable[Resource], start: Callable[[], None]) -> int:
+        """
+        작업 제출 (자원이 비어 있으면 바로 start 호출)
+
+        Args:
+            job_id: 작업 ID (스케줄 ID)
+            resources: 사용할 자원 목록
+            start: 자원을 확보했을 때 호출할 함수 (잠금 밖에서 호출)
+
+        Returns:
+            0이면 바로 시작, 그 외에는 대기열 순번 (1부터)
+        """
+        job = _Job(job_id, list(dict.fromkeys(resources)), start)
+        with self._lock:
+            if job_id in self._running or job_id in self._waiting:
+                raise ValueError(f"이미 제출된 작업입니다: {job_id}")
+            # 앞에서 기다리는 작업과 겹치면 새치기하지 않음
+            if self._fits(job.resources) and not self._conflicts_with_waiting(job.resources):
+                self._acquire(job)
+                position = 0
+            else:
+                self._waiting[job_id] = job
+                position = len(self._waiting)
+        if position == 0:
+            job.start()
+        return position
+
+    def release(self, job_id: str) -> List[str]:
+        """
+        실행 중인 작업의 자원 반환 후 대기 작업 시작
+
+        대기 작업의 start는 release를 호출한 스레드(다단계 스케줄이면 단계 스레드)에서 호출되므로,
+        UI 객체를 다루는 start는 UI 스레드로 넘겨야 합니다 (QuickBuildApp.schedule_start_requested).
+
+        Returns:
+            새로 시작한 작업 ID 목록
+        """
+        with self._lock:
+            job = self._running.pop(job_id, None)
+            if job is not None:
+                for resource in job.resources:
+                    self._in_use[resource] -= 1
+                    if self._in_use[resource] <= 0:
+                        del self._in_use[resource]
+            started = self._dispatch()
+        for job in started:
+            job.start()
+        return [job.job_id for job in started]
+
+    def cancel(self, job_id: str) -> bool:
+        """대기 중인 작업 취소 (대기 중이 아니면 False)"""
+        with self._lock:
+            if self._waiting.pop(job_id, None) is None:
+                return False
+            # 취소된 작업 때문에 막혀 있던 뒤 작업이 시작될 수 있음
+            started = self._dispatch()
+        for job in started:
+            job.start()
+        return True
+
+    # 조회
+    def is_running(self, job_id: str) -> bool:
+        with self._lock:
+            return job_id in self._running
+
+    def is_waiting(self, job_id: str) -> bool:
+        with self._lock:
+            return job_id in self._waiting
+
+    def position(self, job_id: str) -> Optional[int]:
+        """대기열 순번 (1부터, 실행 중이면 0, 모르는 작업이면 None)"""
+        with self._lock:
+            if job_id in self._running:
+                return 0
+            for i, waiting_id in enumerate(self._waiting, 1):
+                if waiting_id == job_id:
+                    return i
+            return None
+
+    def waiting(self) -> List[Tuple[str, int, List[Resource]]]:
+        """대기 작업 목록 [(작업 ID, 순번, 기다리는 자원), ...]"""
+        with self._lock:
+            return [(job.job_id, i, self._blocking(job))
+                    for i, job in enumerate(self._waiting.values(), 1)]
+
+    def running_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._running)
+
+    def waiting_count(self) -> int:
+        with self._lock:
+            return len(self._waiting)
+
+    # 내부 (잠금 안에서 호출)
+    def _capacity(self, resource: Resource) -> int:
+        return self.capacities.get(resource[0], 1)
+
+    def _fits(self, resources: List[Resource]) -> bool:
+        return all(self._in_use.get(r, 0) < self._capacity(r) for r in resources)
+
+    def _conflicts_with_waiting(self, resources: List[Resource]) -> bool:
+        """대기 중인 작업과 자원이 겹치는지"""
+        wanted = set(resources)
+        for job in self._waiting.values():
+            if wanted.intersection(job.resources):
+                return True
+        return False
+
+    def _blocking(self, job: _Job) -> List[Resource]:
+        """작업이 기다리는 자원 (다 찼거나 앞 작업이 먼저 쓸 자원)"""
+        ahead = set()
+        for waiting_id, other in self._waiting.items():
+            if waiting_id == job.job_id:
+                break
+            ahead.update(other.resources)
+        return [r for r in job.resources
+                if self._in_use.get(r, 0) >= self._capacity(r) or r in ahead]
+
+    def _acquire(self, job: _Job) -> None:
+        for resource in job.resources:
+            self._in_use[resource] = self._in_use.get(resource, 0) + 1
+        self._running[job.job_id] = job
+
+    def _dispatch(self) -> List[_Job]:
+        """대기열 앞에서부터 시작 가능한 작업 꺼내기 (앞 대기 작업과 겹치면 건너뜀)"""
+        started = []
+        blocked = set()  # 앞에서 기다리는 작업이 먼저 쓸 자원
+        for job_id in list(self._waiting):
+            job = self._waiting[job_id]
+            if not blocked.intersection(job.resources) and self._fits(job.resources):
+                del self._waiting[job_id]
+                self._acquire(job)
+                started.append(job)
+            else:
+                blocked.update(job.resources)
+        return started
+
+
+_shared_executor: Optional[ResourceExecutor] = None
+_shared_lock = threading.Lock()
+
+
+def get_resource_executor() -> ResourceExecutor:
+    """프로세스 전역 공유 ResourceExecutor"""
+    global _shared_executor
+    with _shared_lock:
+        if _shared_executor is None:
+            _shared_executor = ResourceExecutor()
+        return _shared_executor
@@ -0,0 +1,404 @@
+"""SQLite 실행 기록 모듈
+
+스케줄 실행마다 스케줄 ID, 옵션, 확정된 빌드명, 단계별 시작/종료 시각, 복사 바이트/파일 수,
+실패 사유, 실행 PC를 로컬 DB(run_history.db)에 남깁니다. 로그 파일을 파싱하지 않고
+소요 시간 / 실패율을 조회할 수 있습니다.
+
+- 기록은 큐에 넣고 백그라운드 스레드가 모아서 한 번에 커밋 (UI/작업 스레드는 DB를 기다리지 않음)
+- 복사 바이트/빌드명은 작업 스레드에 연결된 현재 단계(RunRecorder.stage)로 note_copy / note_build가 기록
+"""
+import contextlib
+import queue
+import socket
+import sqlite3
+import statistics
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# 실행 기록 DB 파일 (settings.json과 같은 위치)
+DEFAULT_HISTORY_PATH = 'run_history.db'
+
+# 기록 보관 기간 (일)
+DEFAULT_HISTORY_KEEP_DAYS = 90
+
+# 쓰기 스레드가 한 번에 커밋할 최대 문장 수
+WRITE_BATCH = 200
+
+# 실행 결과
+RUN_RUNNING = 'running'
+RUN_DONE = 'done'
+RUN_FAILED = 'failed'
+RUN_CANCELLED = 'cancelled'
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    schedule_id TEXT,
+    schedule_name TEXT,
+    option TEXT,
+    build TEXT,
+    host TEXT,
+    status TEXT,
+    queued_at REAL,
+    started_at REAL,
+    ended_at REAL,
+    duration REAL,
+    bytes INTEGER DEFAULT 0,
+    files INTEGER DEFAULT 0,
+    failure_reason TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_schedule ON runs (schedule_id, started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_option ON runs (option, started_at);
+CREATE TABLE IF NOT EXISTS run_stages (
+    run_id TEXT NOT NULL,
+    stage_id TEXT NOT NULL,
+    option TEXT,
+    build TEXT,
+    status TEXT,
+    started_at REAL,
+    ended_at REAL,
+    duration REAL,
+    bytes INTEGER DEFAULT 0,
+    files INTEGER DEFAULT 0,
+    error TEXT,
+    PRIMARY KEY (run_id, stage_id)
+);
+"""
+
+_STOP = object()
+
+
+class RunHistory:
+    """실행 기록 저장소 (기록은 비동기, 조회는 호출 스레드에서 바로)"""
+
+    def __init__(self, db_path: str = DEFAULT_HISTORY_PATH):
+        self.db_path = db_path
+        self.host = socket.gethostname().lower()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+        self._queue: 'queue.Queue' = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True, name='run-history-writer')
+        self._writer.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """남은 기록을 쓰고 종료"""
+        self._queue.put(_STOP)
+        self._writer.join(timeout)
+        with self._lock:
+            self._conn.close()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """지금까지 넣은 기록이 DB에 쓰일 때까지 대기"""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def submit(self, sql: str, params: tuple) -> None:
+        """기록 문장 추가 (쓰기 스레드가 모아서 커밋)"""
+        self._queue.put((sql, params))
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch, events, stop = [], [], False
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    events.append(item)
+                else:
+                    batch.append(item)
+                if len(batch) >= WRITE_BATCH:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                with self._lock:
+                    try:
+                        for sql, params in batch:
+                            self._conn.execute(sql, params)
+                        self._conn.commit()
+                    except sqlite3.Error as e:
+                        self._conn.rollback()
+                        print(f"[RunHistory] 기록 실패 ({len(batch)}건): {e}")
+            for event in events:
+                event.set()
+            if stop:
+                return
+
+    def purge(self, keep_days: float = DEFAULT_HISTORY_KEEP_DAYS) -> None:
+        """보관 기간이 지난 기록 삭제 (쓰기 스레드에서 처리)"""
+        cutoff = time.time() - keep_days * 86400
+        self.submit('DELETE FROM run_stages WHERE run_id IN (SELECT run_id FROM runs WHERE started_at < ?)',
+                    (cutoff,))
+        self.submit('DELETE FROM runs WHERE started_at < ?', (cutoff,))
+
+    def mark_interrupted(self, run_id: str, reason: str, ended_at: Optional[float] = None,
+                         status: str = RUN_FAILED) -> None:
+        """
+        앱 종료로 끝나지 않은 실행을 마감 (실행 중인 단계는 실패로)
+
+        Args:
+            run_id: 실행 ID (JobStore 작업 ID)
+            reason: 실패 사유
+            ended_at: 마지막으로 확인된 시각 (None이면 지금)
+            status: 실행 결과 (모든 단계가 끝난 뒤 종료됐으면 RUN_DONE)
+        """
+        ended = ended_at or time.time()
+        self.submit('UPDATE run_stages SET status = ?, ended_at = ?, duration = ? - started_at, '
+                    'error = COALESCE(error, ?) WHERE run_id = ? AND status = ?',
+                    (RUN_FAILED, ended, ended, reason, run_id, RUN_RUNNING))
+        self.submit('UPDATE runs SET status = ?, started_at = COALESCE(started_at, queued_at), ended_at = ?, '
+                    'duration = ? - COALESCE(started_at, queued_at), failure_reason = ? '
+                    'WHERE run_id = ? AND status = ?',
+                    (status, ended, ended, reason or None, run_id, RUN_RUNNING))
+
+    # 조회
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(r) for r in self._conn.execute(sql, params)]
+
+    @staticmethod
+    def _where(schedule_id: Optional[str], option: Optional[str], since: Optional[float],
+               prefix: str = '') -> Tuple[str, tuple]:
+        clauses, params = [f"{prefix}status != ?"], [RUN_RUNNING]
+        if schedule_id:
+            clauses.append(f"{prefix}schedule_id = ?")
+            params.append(schedule_id)
+        if option:
+            clauses.append(f"{prefix}option = ?")
+            params.append(option)
+        if since:
+            clauses.append(f"{prefix}started_at >= ?")
+            params.append(since)
+        return ' AND '.join(clauses), tuple(params)
+
+    def recent_runs(self, schedule_id: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """최근 실행 (최신순, 실행 중 포함)"""
+        if schedule_id:
+            return self._query('SELECT * FROM runs WHERE schedule_id = ? ORDER BY queued_at DESC LIMIT ?',
+                               (schedule_id, limit))
+        return self._query('SELECT * FROM runs ORDER BY queued_at DESC LIMIT ?', (limit,))
+
+    def stages_of(self, run_id: str) -> List[Dict[str, Any]]:
+        """실행 하나의 단계 기록 (시작순)"""
+        return self._query('SELECT * FROM run_stages WHERE run_id = ? ORDER BY started_at', (run_id,))
+
+    def duration_stats(self, schedule_id: Optional[str] = None, option: Optional[str] = None,
+                       since: Optional[float] = None) -> Dict[str, float]:
+        """성공한 실행의 소요 시간 통계 (초) {'count', 'avg', 'min', 'max', 'p50', 'p90', 'wait_avg'}"""
+        where, params = self._where(schedule_id, option, since)
+        rows = self._query(f"SELECT duration, started_at - queued_at AS waited FROM runs "
+                           f"WHERE {where} AND status = ? AND duration IS NOT NULL", params + (RUN_DONE,))
+        return _stats([r['duration'] for r in rows], [r['waited'] or 0.0 for r in rows])
+
+    def stage_duration_stats(self, schedule_id: Optional[str] = None, option: Optional[str] = None,
+                             since: Optional[float] = None) -> Dict[str, Dict[str, float]]:
+        """단계별 소요 시간 통계 {단계 id: duration_stats 형식} (성공한 단계만)"""
+        where, params = self._where(schedule_id, option, since, prefix='r.')
+        rows = self._query(f"SELECT s.stage_id, s.duration FROM run_stages s JOIN runs r ON r.run_id = s.run_id "
+                           f"WHERE {where} AND s.status = ? AND s.duration IS NOT NULL", params + (RUN_DONE,))
+        by_stage: Dict[str, List[float]] = {}
+        for row in rows:
+            by_stage.setdefault(row['stage_id'], []).append(row['duration'])
+        return {stage_id: _stats(values) for stage_id, values in by_stage.items()}
+
+    def failure_rate(self, schedule_id: Optional[str] = None, option: Optional[str] = None,
+                     since: Optional[float] = None) -> Dict[str, float]:
+        """{'runs', 'failures', 'cancelled', 'rate'} (rate = 실패 / (성공 + 실패), 취소 제외)"""
+        where, params = self._where(schedule_id, option, since)
+        counts = {r['status']: r['n'] for r in self._query(
+            f"SELECT status, COUNT(*) AS n FROM runs WHERE {where} GROUP BY status", params)}
+        done, failed = counts.get(RUN_DONE, 0), counts.get(RUN_FAILED, 0)
+        return {
+            'runs': sum(counts.values()),
+            'failures': failed,
+            'cancelled': counts.get(RUN_CANCELLED, 0),
+            'rate': failed / (done + failed) if done + failed else 0.0,
+        }
+
+    def failure_reasons(self, schedule_id: Optional[str] = None, since: Optional[float] = None,
+                        limit: int = 10) -> List[Tuple[str, int]]:
+        """자주 발생한 실패 사유 [(사유, 횟수), ...]"""
+        where, params = self._where(schedule_id, None, since)
+        rows = self._query(f"SELECT failure_reason, COUNT(*) AS n FROM runs WHERE {where} AND status = ? "
+                           f"GROUP BY failure_reason ORDER BY n DESC LIMIT ?", params + (RUN_FAILED, limit))
+        return [(r['failure_reason'] or '', r['n']) for r in rows]
+
+    def summary_by_schedule(self, since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """스케줄별 실행 수 / 실패율 / 평균 소요 시간 / 복사량"""
+        where, params = self._where(None, None, since)
+        rows = self._query(
+            f"SELECT schedule_id, MAX(schedule_name) AS name, COUNT(*) AS runs, "
+            f"SUM(status = '{RUN_DONE}') AS done, SUM(status = '{RUN_FAILED}') AS failures, "
+            f"AVG(CASE WHEN status = '{RUN_DONE}' THEN duration END) AS avg_duration, "
+            f"SUM(bytes) AS bytes, SUM(files) AS files, MAX(started_at) AS last_started "
+            f"FROM runs WHERE {where} GROUP BY schedule_id ORDER BY last_started DESC", params)
+        for row in rows:
+            finished = (row['done'] or 0) + (row['failures'] or 0)
+            row['failure_rate'] = (row['failures'] or 0) / finished if finished else 0.0
+        return rows
+
+
+def _stats(values: List[float], waits: Optional[List[float]] = None) -> Dict[str, float]:
+    if not values:
+        return {'count': 0}
+    ordered = sorted(values)
+    stats = {
+        'count': len(ordered),
+        'avg': statistics.fmean(ordered),
+        'min': ordered[0],
+        'max': ordered[-1],
+        'p50': statistics.median(ordered),
+        'p90': ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))],
+    }
+    if waits:
+        stats['wait_avg'] = statistics.fmean(waits)
+    return stats
+
+
+class RunRecorder:
+    """스케줄 실행 1회 기록 (queued → start → 단계 → finish, 여러 단계 스레드에서 호출 가능)"""
+
+    def __init__(self, history: RunHistory, schedule: Dict[str, Any], build: str = '',
+                 run_id: str = ''):
+        self.history = history
+        self.run_id = run_id or uuid.uuid4().hex
+        self.schedule_id = schedule.get('id', '')
+        self.option = schedule.get('option', '')
+        self.build = build
+        self.bytes = 0
+        self.files = 0
+        self.started_at: Optional[float] = None
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        history.submit(
+            'INSERT OR REPLACE INTO runs (run_id, schedule_id, schedule_name, option, build, host, status, '
+            'queued_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (self.run_id, self.schedule_id, schedule.get('name', ''), self.option, build or None,
+             history.host, RUN_RUNNING, time.time()))
+
+    def start(self) -> None:
+        """자원을 확보해 실행 시작"""
+        self.started_at = time.time()
+        self.history.submit('UPDATE runs SET started_at = ? WHERE run_id = ?', (self.started_at, self.run_id))
+
+    def stage_started(self, stage_id: str, option: str = '') -> None:
+        now = time.time()
+        with self._lock:
+            self._stages[stage_id] = {'option': option, 'build': '', 'started_at': now,
+                                      'bytes': 0, 'files': 0}
+        # 실행 중에 앱이 종료돼도 어느 단계에서 멈췄는지 남도록 시작할 때도 기록
+        self.history.submit(
+            'INSERT OR REPLACE INTO run_stages (run_id, stage_id, option, build, status, started_at) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (self.run_id, stage_id, option or None, self.build or None, RUN_RUNNING, now))
+
+    def stage_finished(self, stage_id: str, status: str, error: str = '') -> None:
+        now = time.time()
+        with self._lock:
+            stage = self._stages.pop(stage_id, None) or {'option': '', 'build': '', 'started_at': now,
+                                                         'bytes': 0, 'files': 0}
+        self.history.submit(
+            'INSERT OR REPLACE INTO run_stages (run_id, stage_id, option, build, status, started_at, ended_at, '
+            'duration, bytes, files, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (self.run_id, stage_id, stage['option'] or None, stage['build'] or self.build or None, status,
+             stage['started_at'], now, now - stage['started_at'], stage['bytes'], stage['files'], error or None))
+
+    def add_copy(self, stage_id: str, bytes_copied: int, files: int) -> None:
+        with self._lock:
+            self.bytes += bytes_copied
+            self.files += files
+            stage = self._stages.get(stage_id)
+            if stage is not None:
+                stage['bytes'] += bytes_copied
+                stage['files'] += files
+
+    def set_build(self, build: str, stage_id: str = '') -> None:
+        """확정된 빌드명 (Prefix → 전체 빌드명)"""
+        with self._lock:
+            if not self.build:
+                self.build = build
+            stage = self._stages.get(stage_id)
+            if stage is not None:
+                stage['build'] = build
+
+    def finish(self, status: str, failure_reason: str = '') -> None:
+        now = time.time()
+        with self._lock:
+            open_stages = list(self._stages)
+        for stage_id in open_stages:
+            self.stage_finished(stage_id, status, failure_reason)
+        started = self.started_at or now
+        self.history.submit(
+            'UPDATE runs SET status = ?, build = ?, started_at = ?, ended_at = ?, duration = ?, bytes = ?, '
+            'files = ?, failure_reason = ? WHERE run_id = ?',
+            (status, self.build or None, started, now, now - started, self.bytes, self.files,
+             failure_reason or None, self.run_id))
+
+    @contextlib.contextmanager
+    def stage(self, stage_id: str) -> Iterator[None]:
+        """현재 스레드를 이 실행의 단계에 연결 (note_copy / note_build 기록 대상)"""
+        previous = getattr(_current, 'stage', None)
+        _current.stage = (self, stage_id)
+        try:
+            yield
+        finally:
+            _current.stage = previous
+
+
+_current = threading.local()
+
+
+def note_copy(bytes_copied: int, files: int) -> None:
+    """현재 스레드에서 실행 중인 단계의 복사량 기록 (기록 중이 아니면 무시)"""
+    current = getattr(_current, 'stage', None)
+    if current is not None:
+        recorder, stage_id = current
+        recorder.add_copy(stage_id, bytes_copied, files)
+
+
+def note_build(build: str) -> None:
+    """현재 스레드에서 실행 중인 단계의 확정된 빌드명 기록 (기록 중이 아니면 무시)"""
+    current = getattr(_current, 'stage', None)
+    if current is not None and build:
+        recorder, stage_id = current
+        recorder.set_build(build, stage_id)
+
+
+_shared_history: Optional[RunHistory] = None
+_shared_lock = threading.Lock()
+
+
+def get_run_history(db_path: str = DEFAULT_HISTORY_PATH) -> RunHistory:
+    """프로세스 전역 공유 RunHistory"""
+    global _shared_history
+    with _shared_lock:
+        if _shared_history is None:
+            _shared_history = RunHistory(db_path)
+        return _shared_history
+
+
+def open_run_history(config_mgr) -> Optional[RunHistory]:
+    """settings.json history_enabled(기본 true)면 공유 RunHistory (DB를 열 수 없으면 None)"""
+    if not config_mgr.get_setting('history_enabled', True):
+        return None
+    try:
+        history = get_run_history()
+    except (OSError, sqlite3.Error) as e:
+        print(f"[RunHistory] 실행 기록 DB를 열 수 없어 기록하지 않습니다: {e}")
+        return None
+    history.purge(config_mgr.get_setting('history_keep_days', DEFAULT_HISTORY_KEEP_DAYS))
+    return history
@@ -0,0 +1,259 @@
+"""다음 실행 시각 우선순위 큐 모듈
+
+스케줄마다 다음 실행 시각을 계산해 힙에 넣고, 가장 이른 시각까지만 기다립니다.
+매초 전체 스케줄을 훑는 대신 힙 맨 앞만 확인하며, 스케줄이 바뀐 경우에만 힙을 다시 만듭니다.
+Qt에 의존하지 않으므로 타이머는 호출 측(QuickBuildApp)이 next_delay()로 맞춥니다.
+
+이벤트 루프가 막히거나(모달 창, 느린 Slack 호출) 절전/최대 절전에서 깨어나면
+마지막 확인 시각 이후 지나간 실행 시각을 모두 찾아 스케줄별 누락 정책(misfire_policy)을 적용합니다.
+- run_once: 지나간 실행을 한 번으로 합쳐 실행 (기본)
+- run_all: 지나간 실행 시각마다 실행 (최대 MAX_CATCHUP_RUNS회, 앞 실행이 끝난 뒤 하나씩 - CatchupQueue)
+- skip: misfire_grace_minutes분보다 늦었으면 건너뜀
+"""
+import collections
+import heapq
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from .build_watcher import REPEAT_TYPE_NEW_BUILD
+from .cron import REPEAT_TYPE_CRON, CronError, compile_cron
+
+
+# 실행할 스케줄이 없어도 이 시간(초)마다 한 번은 깨어나 schedule.json 변경 확인
+SCHEDULE_MAX_SLEEP = 10.0
+
+# 누락 실행 정책 (스케줄의 misfire_policy 값)
+MISFIRE_RUN_ONCE = 'run_once'
+MISFIRE_RUN_ALL = 'run_all'
+MISFIRE_SKIP = 'skip'
+MISFIRE_POLICIES = (MISFIRE_RUN_ONCE, MISFIRE_RUN_ALL, MISFIRE_SKIP)
+
+# skip 정책 기본 허용 지연 (분, 스케줄의 misfire_grace_minutes 값)
+DEFAULT_MISFIRE_GRACE_MINUTES = 5
+
+# run_all 정책에서 한 번에 따라잡을 최대 실행 수 (오래 잠들어 있던 경우 대비, 최근 것 우선)
+MAX_CATCHUP_RUNS = 10
+
+# 이 시간(초) 이내로 늦은 실행은 정시 실행으로 간주
+ON_TIME_TOLERANCE = 1.0
+
+
+def parse_time_of_day(time_str: str) -> Optional[Tuple[int, int, int]]:
+    """'HH:MM' 또는 'HH:MM:SS' → (시, 분, 초), 형식이 틀리면 None"""
+    try:
+        parts = [int(p) for p in (time_str or '').split(':')]
+    except ValueError:
+        return None
+    if len(parts) == 2:
+        parts.append(0)
+    if len(parts) != 3:
+        return None
+    hour, minute, second = parts
+    if not (0 <= hour < 24 and 0 <= minute < 60 and 0 <= second < 60):
+        return None
+    return hour, minute, second
+
+
+def next_fire_time(schedule: Dict[str, Any], after: datetime) -> Optional[datetime]:
+    """
+    after 이후(after 제외) 첫 실행 시각
+
+    - once/daily: 매일 time에 실행
+    - weekly: repeat_days 요일의 time에 실행
+    - cron: cron 표현식 (초 단위 가능)
+    - new_build, 비활성화, 시간/표현식 형식 오류: None (시간으로 실행하지 않음)
+    """
+    if not schedule.get('enabled', True):
+        return None
+    repeat_type = schedule.get('repeat_type', 'once')
+    if repeat_type == REPEAT_TYPE_NEW_BUILD:
+        return None
+    if repeat_type == REPEAT_TYPE_CRON:
+        try:
+            return compile_cron(schedule.get('cron', '')).next_after(after)
+        except CronError as e:
+            print(f"[ScheduleQueue] {schedule.get('name', '')}: {e}")
+            return None
+    parsed = parse_time_of_day(schedule.get('time', ''))
+    if parsed is None:
+        return None
+    hour, minute, second = parsed
+
+    candidate = after.replace(hour=hour, minute=minute, second=second, microsecond=0)
+    if candidate <= after:
+        candidate += timedelta(days=1)
+
+    if repeat_type in ('once', 'daily'):
+        return candidate
+    if repeat_type == 'weekly':
+        days = set(schedule.get('repeat_days', []))
+        for _ in range(7):
+            if candidate.weekday() in days:
+                return candidate
+            candidate += timedelta(days=1)
+        return None
+    return None
+
+
+class ScheduleQueue:
+    """다음 실행 시각 힙 (UI 스레드 전용)"""
+
+    def __init__(self, evaluated_at: Optional[datetime] = None):
+        """
+        Args:
+            evaluated_at: 이 시각까지는 확인한 것으로 간주 (기본: 현재 분의 시작 직전 - 시작한 분의 스케줄도 실행)
+        """
+        if evaluated_at is None:
+            evaluated_at = datetime.now().replace(second=0, microsecond=0) - timedelta(microseconds=1)
+        self.evaluated_at = evaluated_at
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._schedules: Dict[str, Dict[str, Any]] = {}
+        self._seq = 0
+        self.skipped: List[Tuple[datetime, Dict[str, Any]]] = []  # 마지막 pop_due에서 skip 정책으로 건너뛴 실행
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def rebuild(self, schedules: List[Dict[str, Any]]) -> None:
+        """스케줄 변경 시 힙 다시 만들기 (마지막 확인 시각 이후 실행 시각 기준)"""
+        self._schedules = {}
+        entries = []
+        for schedule in schedules:
+            sid = schedule.get('id')
+            if not sid or sid in self._schedules:
+                continue
+            fire_at = next_fire_time(schedule, self.evaluated_at)
+            if fire_at is None:
+                continue
+            self._schedules[sid] = schedule
+            self._seq += 1
+            entries.append((fire_at, self._seq, sid))
+        heapq.heapify(entries)
+        self._heap = entries
+
+    def peek(self) -> Optional[datetime]:
+        """가장 이른 실행 시각"""
+        return self._heap[0][0] if self._heap else None
+
+    def next_delay(self, now: Optional[datetime] = None) -> Optional[float]:
+        """가장 이른 실행 시각까지 남은 초 (없으면 None)"""
+        fire_at = self.peek()
+        if fire_at is None:
+            return None
+        now = now or datetime.now()
+        return max(0.0, (fire_at - now).total_seconds())
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[Tuple[datetime, Dict[str, Any]]]:
+        """
+        마지막 확인 시각 이후 now까지 실행 시각이 된 스케줄 꺼내기 (누락 정책 적용)
+
+        다음 실행 시각은 now 이후로 다시 넣고, 정책으로 건너뛴 실행은 self.skipped에 기록합니다.
+
+        Returns:
+            [(실행 예정 시각, 스케줄), ...] 시각 순
+        """
+        now = now or datetime.now()
+        due = []
+        self.skipped = []
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, _, sid = heapq.heappop(self._heap)
+            schedule = self._schedules[sid]
+
+            # 지나간 실행 시각 모두 수집 (run_all 상한만큼만 보관)
+            missed = [fire_at]
+            skipped_count = 0
+            next_at = next_fire_time(schedule, fire_at)
+            while next_at is not None and next_at <= now:
+                missed.append(next_at)
+                if len(missed) > MAX_CATCHUP_RUNS:
+                    missed.pop(0)
+                    skipped_count += 1
+                next_at = next_fire_time(schedule, next_at)
+
+            runs = self._apply_misfire_policy(schedule, missed, now)
+            due.extend((run_at, schedule) for run_at in runs)
+            if not runs:
+                self.skipped.extend((at, schedule) for at in missed)
+            if skipped_count:
+                print(f"[ScheduleQueue] {schedule.get('name', sid)}: 오래된 누락 실행 {skipped_count}회 생략")
+
+            if next_at is not None:
+                self._seq += 1
+                heapq.heappush(self._heap, (next_at, self._seq, sid))
+        self.evaluated_at = max(self.evaluated_at, now)
+        due.sort(key=lambda item: item[0])
+        return due
+
+    @staticmethod
+    def _apply_misfire_policy(schedule: Dict[str, Any], missed: List[datetime],
+                              now: datetime) -> List[datetime]:
+        """지나간 실행 시각 중 실제로 실행할 시각 (run_once는 가장 최근 시각 한 번으로 합침)"""
+        latest = missed[-1]
+        if len(missed) == 1 and (now - latest).total_seconds() <= ON_TIME_TOLERANCE:
+            return [latest]  # 정시 실행
+
+        policy = schedule.get('misfire_policy') or MISFIRE_RUN_ONCE
+        if policy == MISFIRE_RUN_ALL:
+            return list(missed)
+        if policy == MISFIRE_SKIP:
+            grace = schedule.get('misfire_grace_minutes', DEFAULT_MISFIRE_GRACE_MINUTES)
+            if (now - latest).total_seconds() > grace * 60:
+                return []
+            return [latest]
+        return [latest]
+
+
+def is_run_all(schedule: Dict[str, Any]) -> bool:
+    """지나간 실행 시각마다 실행하는(run_all) 스케줄인지 여부"""
+    return schedule.get('misfire_policy') == MISFIRE_RUN_ALL
+
+
+class CatchupQueue:
+    """
+    run_all 정책으로 밀린 실행 보관 (스레드 안전)
+
+    같은 스케줄은 동시에 한 번만 실행되므로, pop_due가 한꺼번에 돌려준 실행 중 두 번째부터는
+    여기 넣어 두고 앞 실행이 끝날 때마다 하나씩 꺼내 실행합니다 (실행 시각 순).
+    """
+
+    def __init__(self):
+        self._runs: Dict[str, Deque[Tuple[datetime, Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(runs) for runs in self._runs.values())
+
+    def add(self, fire_at: datetime, schedule: Dict[str, Any]) -> None:
+        with self._lock:
+            self._runs.setdefault(schedule.get('id', ''), collections.deque()).append((fire_at, schedule))
+
+    def has(self, schedule_id: str) -> bool:
+        with self._lock:
+            return bool(self._runs.get(schedule_id))
+
+    def pop(self, schedule_id: str) -> Optional[Tuple[datetime, Dict[str, Any]]]:
+        """다음 밀린 실행 (없으면 None)"""
+        with self._lock:
+            runs = self._runs.get(schedule_id)
+            if not runs:
+                return None
+            entry = runs.popleft()
+            if not runs:
+                del self._runs[schedule_id]
+            return entry
+
+    def schedule_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._runs)
+
+    def retain(self, schedules: Iterable[Dict[str, Any]]) -> None:
+        """삭제되었거나 run_all이 아니게 된 스케줄의 밀린 실행 버리기 (스케줄 내용은 최신으로 교체)"""
+        current = {s.get('id', ''): s for s in schedules if s.get('enabled', True) and is_run_all(s)}
+        with self._lock:
+            for sid in list(self._runs):
+                if sid not in current:
+                    del self._runs[sid]
+                else:
+                    self._runs[sid] = collections.deque((at, current[sid]) for at, _ in self._runs[sid])
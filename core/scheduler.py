@@ -1,22 +1,116 @@
-"""스케줄 관리 모듈"""
+"""스케줄 관리 모듈
+
+스케줄은 메모리에 id 기준으로 보관하고, schedule.json의 mtime/크기가 바뀐 경우에만 다시 읽습니다.
+변경은 메모리와 파일에 바로 함께 반영합니다 (write-through).
+
+변경 내용은 schedule.json 전체를 다시 쓰지 않고 저널(schedule.json.journal)에 한 줄씩 추가합니다.
+- 저널 항목: put(스케줄 전체), patch(바뀐 항목만), delete(id)
+- 읽을 때: 스냅샷(schedule.json) + 저널 재생 (쓰다 끊긴 마지막 줄은 무시)
+- 저널이 길어지거나 오래되면 스냅샷으로 합침 (임시 파일 → os.replace 후 저널 삭제)
+"""
+import copy
 import json
 import os
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import uuid
 
 
+JOURNAL_SUFFIX = '.journal'
+
+# 저널 항목이 이 개수를 넘거나 첫 항목 후 이 시간(초)이 지나면 스냅샷으로 합침
+JOURNAL_COMPACT_ENTRIES = 200
+JOURNAL_COMPACT_SECONDS = 300.0
+
+
 class ScheduleManager:
     """예약 스케줄 관리 (daily/weekly 반복 지원)"""
     
     def __init__(self, schedule_path: str = 'schedule.json'):
         self.schedule_path = schedule_path
+        self.journal_path = schedule_path + JOURNAL_SUFFIX
+        self._journal_entries = 0
+        self._journal_started: Optional[float] = None
+        self._schedules: List[Dict[str, Any]] = []
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._signature: Optional[tuple] = None  # 마지막으로 읽은 스냅샷/저널 (mtime_ns, 크기)
+        self._loaded = False
+        self._lock = threading.RLock()
+        self.read_count = 0  # 실제 파일 읽기 횟수 (확인용)
+        self._version = 0  # 스케줄이 바뀔 때마다 증가 (실행 큐 재구성 판단용)
     
-    def load_schedules(self) -> List[Dict[str, str]]:
-        """스케줄 목록 로드 (dict 또는 list 포맷 모두 지원)"""
-        if not os.path.exists(self.schedule_path):
-            return []
-        
+    @staticmethod
+    def _stat(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+    
+    def _file_signature(self) -> tuple:
+        return self._stat(self.schedule_path), self._stat(self.journal_path)
+    
+    def _ensure_loaded(self) -> None:
+        """파일(스냅샷/저널)이 바뀐 경우에만 다시 읽기"""
+        signature = self._file_signature()
+        if self._loaded and signature == self._signature:
+            return
+        schedules = self._read_file() if signature[0] is not None else []
+        if signature[1] is not None:
+            schedules = self._replay_journal(schedules)
+        self._set_schedules(schedules)
+        self._signature = signature
+        self._loaded = True
+    
+    def _replay_journal(self, schedules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """스냅샷에 저널 항목 적용"""
+        by_id = {s.get('id'): s for s in schedules if s.get('id')}
+        entries = 0
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # 쓰는 도중 끊긴 줄 (마지막 줄)
+                        print(f"스케줄 저널: 손상된 항목 무시 ({len(line)} bytes)")
+                        continue
+                    entries += 1
+                    op, sid = entry.get('op'), entry.get('id')
+                    if op == 'put':
+                        schedule = entry.get('schedule') or {}
+                        sid = schedule.get('id')
+                        if sid in by_id:
+                            by_id[sid].clear()
+                            by_id[sid].update(schedule)
+                        elif sid:
+                            schedules.append(schedule)
+                            by_id[sid] = schedule
+                    elif op == 'patch' and sid in by_id:
+                        by_id[sid].update(entry.get('changes') or {})
+                    elif op == 'delete' and sid in by_id:
+                        schedules.remove(by_id.pop(sid))
+        except OSError as e:
+            print(f"스케줄 저널 읽기 오류: {e}")
+        self._journal_entries = entries
+        if entries and self._journal_started is None:
+            self._journal_started = time.time()
+        return schedules
+    
+    def _set_schedules(self, schedules: List[Dict[str, Any]]) -> None:
+        self._version += 1
+        self._schedules = schedules
+        self._by_id = {}
+        for schedule in schedules:
+            sid = schedule.get('id')
+            if sid and sid not in self._by_id:
+                self._by_id[sid] = schedule
+    
+    def _read_file(self) -> List[Dict[str, Any]]:
+        """schedule.json 파싱 (dict 또는 list 포맷 모두 지원)"""
+        self.read_count += 1
         try:
             with open(self.schedule_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -33,20 +127,95 @@ class ScheduleManager:
             
             # list 포맷 (신버전)
             if isinstance(data, list):
-                return [s for s in data if isinstance(s, dict) and s.get('time')]
+                return [s for s in data if isinstance(s, dict) and (s.get('time') or s.get('cron'))]
             
             return []
         except Exception as e:
             print(f"스케줄 로드 오류: {e}")
             return []
     
+    def get_version(self) -> int:
+        """스케줄 변경 번호 (파일이 바뀌었으면 다시 읽은 뒤 반환)"""
+        with self._lock:
+            self._ensure_loaded()
+            return self._version
+    
+    def load_schedules(self) -> List[Dict[str, str]]:
+        """스케줄 목록 (메모리 사본, 파일이 바뀐 경우에만 다시 읽음)"""
+        with self._lock:
+            self._ensure_loaded()
+            return copy.deepcopy(self._schedules)
+    
     def save_schedules(self, schedules: List[Dict[str, str]]) -> None:
-        """스케줄 목록 저장 (list 포맷)"""
+        """스케줄 목록 저장 (메모리와 비교해 바뀐 스케줄만 저널에 기록)"""
+        with self._lock:
+            self._ensure_loaded()
+            new_schedules = copy.deepcopy(schedules)
+            ids = [s.get('id') for s in new_schedules]
+            old_ids = [s.get('id') for s in self._schedules]
+            kept = [sid for sid in ids if sid in self._by_id]
+            
+            # id 없는 스케줄(구버전)이 있거나 순서가 바뀌면(새 스케줄은 끝에만 추가 가능) 스냅샷 전체 저장
+            if (not all(ids) or len(set(ids)) != len(ids) or not all(old_ids)
+                    or kept != [sid for sid in old_ids if sid in set(ids)] or ids[:len(kept)] != kept):
+                self._set_schedules(new_schedules)
+                self.compact()
+                return
+            
+            entries = [{'op': 'delete', 'id': sid} for sid in old_ids if sid not in set(ids)]
+            entries += [{'op': 'put', 'schedule': s} for s in new_schedules
+                        if self._by_id.get(s['id']) != s]
+            self._set_schedules(new_schedules)
+            self._append(entries)
+    
+    def _append(self, entries: List[Dict[str, Any]]) -> None:
+        """저널에 변경 항목 추가 (fsync까지), 필요하면 스냅샷으로 합침"""
+        if not entries:
+            return
+        self._version += 1
         try:
-            with open(self.schedule_path, 'w', encoding='utf-8') as f:
-                json.dump(schedules, f, ensure_ascii=False, indent=2)
+            data = ''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in entries).encode('utf-8')
+            with open(self.journal_path, 'ab+') as f:
+                # 이전에 쓰다 끊긴 줄이 있으면 줄을 바꿔서 추가
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        data = b'\n' + data
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
         except Exception as e:
             print(f"스케줄 저장 오류: {e}")
+            self.compact()
+            return
+        self._journal_entries += len(entries)
+        if self._journal_started is None:
+            self._journal_started = time.time()
+        self._signature = self._file_signature()
+        
+        if (self._journal_entries >= JOURNAL_COMPACT_ENTRIES
+                or time.time() - self._journal_started >= JOURNAL_COMPACT_SECONDS):
+            self.compact()
+    
+    def compact(self) -> None:
+        """메모리의 스케줄을 스냅샷으로 저장하고 저널 삭제 (임시 파일에 쓴 뒤 교체)"""
+        with self._lock:
+            self._version += 1
+            temp_path = f"{self.schedule_path}.tmp"
+            try:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._schedules, f, ensure_ascii=False, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.schedule_path)
+                # 교체 후 저널 삭제 전에 끊겨도 저널 재생은 같은 결과 (put/patch/delete 모두 멱등)
+                if os.path.exists(self.journal_path):
+                    os.remove(self.journal_path)
+                self._journal_entries = 0
+                self._journal_started = None
+            except Exception as e:
+                print(f"스케줄 저장 오류: {e}")
+            self._signature = self._file_signature()
     
     def add_schedule(self, time: str, option: str, buildname: str, 
                     awsurl: str = '', branch: str = '', 
@@ -69,7 +238,6 @@ class ScheduleManager:
         Returns:
             생성된 스케줄 ID
         """
-        schedules = self.load_schedules()
         schedule_id = str(uuid.uuid4())
         
         new_schedule = {
@@ -86,19 +254,24 @@ class ScheduleManager:
             'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        schedules.append(new_schedule)
-        self.save_schedules(schedules)
+        with self._lock:
+            self._ensure_loaded()
+            self._schedules.append(new_schedule)
+            self._by_id[schedule_id] = new_schedule
+            self._append([{'op': 'put', 'schedule': new_schedule}])
         return schedule_id
     
     def update_schedule(self, schedule_id: str, updates: Dict[str, Any]) -> bool:
         """스케줄 업데이트"""
-        schedules = self.load_schedules()
-        for schedule in schedules:
-            if schedule.get('id') == schedule_id:
-                schedule.update(updates)
-                self.save_schedules(schedules)
-                return True
-        return False
+        with self._lock:
+            self._ensure_loaded()
+            schedule = self._by_id.get(schedule_id)
+            if schedule is None:
+                return False
+            changes = copy.deepcopy(updates)
+            schedule.update(changes)
+            self._append([{'op': 'patch', 'id': schedule_id, 'changes': changes}])
+            return True
     
     def delete_schedule(self, schedule_id: str, force: bool = False) -> bool:
         """
@@ -144,13 +317,14 @@ class ScheduleManager:
     
     def toggle_schedule(self, schedule_id: str) -> Optional[bool]:
         """스케줄 활성화/비활성화 토글"""
-        schedules = self.load_schedules()
-        for schedule in schedules:
-            if schedule.get('id') == schedule_id:
-                schedule['enabled'] = not schedule.get('enabled', True)
-                self.save_schedules(schedules)
-                return schedule['enabled']
-        return None
+        with self._lock:
+            self._ensure_loaded()
+            schedule = self._by_id.get(schedule_id)
+            if schedule is None:
+                return None
+            schedule['enabled'] = not schedule.get('enabled', True)
+            self._append([{'op': 'patch', 'id': schedule_id, 'changes': {'enabled': schedule['enabled']}}])
+            return schedule['enabled']
     
     def copy_schedule(self, schedule_id: str) -> Optional[str]:
         """
@@ -172,64 +346,20 @@ class ScheduleManager:
         new_schedule['name'] = f"{schedule.get('name', 'Unknown')} (복사본)"
         new_schedule['created_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        schedules = self.load_schedules()
-        schedules.append(new_schedule)
-        self.save_schedules(schedules)
+        with self._lock:
+            self._ensure_loaded()
+            self._schedules.append(new_schedule)
+            self._by_id[new_schedule['id']] = new_schedule
+            self._append([{'op': 'put', 'schedule': new_schedule}])
         
         return new_schedule['id']
     
-    def get_due_schedules(self, current_time: str, current_date: datetime = None) -> List[Dict[str, str]]:
-        """
-        현재 시각에 실행해야 할 스케줄 조회
-        
-        Args:
-            current_time: 현재 시간 (HH:MM)
-            current_date: 현재 날짜 (기본값: 현재 시각)
-        
-        Returns:
-            실행해야 할 스케줄 목록 (활성화된 것만)
-        """
-        if current_date is None:
-            current_date = datetime.now()
-        
-        schedules = self.load_schedules()
-        due_schedules = []
-        
-        for schedule in schedules:
-            # 비활성화된 스케줄은 건너뜀
-            if not schedule.get('enabled', True):
-                continue
-            
-            # 시간이 일치하지 않으면 건너뜀
-            if schedule.get('time') != current_time:
-                continue
-            
-            repeat_type = schedule.get('repeat_type', 'once')
-            
-            # 일회성
-            if repeat_type == 'once':
-                due_schedules.append(schedule)
-            
-            # 매일 반복
-            elif repeat_type == 'daily':
-                due_schedules.append(schedule)
-            
-            # 주간 반복 (특정 요일만)
-            elif repeat_type == 'weekly':
-                current_weekday = current_date.weekday()  # 0=월, 6=일
-                repeat_days = schedule.get('repeat_days', [])
-                if current_weekday in repeat_days:
-                    due_schedules.append(schedule)
-        
-        return due_schedules
-    
     def get_schedule_by_id(self, schedule_id: str) -> Optional[Dict[str, Any]]:
-        """ID로 스케줄 조회"""
-        schedules = self.load_schedules()
-        for schedule in schedules:
-            if schedule.get('id') == schedule_id:
-                return schedule
-        return None
+        """ID로 스케줄 조회 (메모리 색인, 파일이 바뀐 경우에만 다시 읽음)"""
+        with self._lock:
+            self._ensure_loaded()
+            schedule = self._by_id.get(schedule_id)
+            return copy.deepcopy(schedule) if schedule is not None else None
     
     def remove_schedule(self, index: int) -> None:
         """스케줄 삭제 (인덱스 기준)"""
@@ -0,0 +1,231 @@
+"""로컬 빌드 스테이징/원자적 게시 모듈
+
+복사는 대상 폴더 아래 숨김 폴더(.staging)에서 진행하고, 완료되면 rename 한 번으로
+dest_folder/<빌드명> 위치에 게시합니다. 런처, BAT 생성, 오래된 빌드 정리 등
+dest_folder를 읽는 쪽은 반쯤 복사된 트리를 볼 수 없습니다.
+
+같은 빌드 폴더가 이미 있으면 기존 폴더를 스테이징 영역으로 옮긴 뒤 새 폴더를 옮겨 교체하고,
+옮겨 둔 기존 폴더는 백그라운드에서 삭제합니다. 두 rename 사이 아주 짧은 순간에는
+최종 경로에 폴더가 없습니다 (Windows는 비어 있지 않은 폴더를 덮어쓰는 rename이 없음).
+"""
+import os
+import shutil
+import stat
+import threading
+import time
+from typing import List
+
+
+# dest_folder 아래 스테이징 폴더명 (점으로 시작 → 빌드 목록에서 제외)
+STAGING_DIR_NAME = '.staging'
+
+# 크래시 등으로 남은 스테이징 폴더 정리 기준 (초)
+STALE_STAGING_SECONDS = 24 * 60 * 60
+
+# 교체되어 삭제 대기 중인 기존 폴더 표식 (.staging/<폴더명>.old.<suffix>)
+RETIRED_MARKER = '.old.'
+
+_counter_lock = threading.Lock()
+_counter = [0]
+
+# 이 프로세스에서 백그라운드 삭제 중인 기존 폴더 경로
+_retiring_lock = threading.Lock()
+_retiring = set()
+
+
+def is_staging_entry(name: str) -> bool:
+    """dest_folder 목록에서 제외할 스테이징/숨김 항목인지 여부"""
+    return name.startswith('.')
+
+
+def _hide_on_windows(path: str) -> None:
+    """Windows 탐색기에서도 숨김 처리 (다른 OS는 점 접두사로 충분)"""
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        FILE_ATTRIBUTE_HIDDEN = 0x02
+        ctypes.windll.kernel32.SetFileAttributesW(path, FILE_ATTRIBUTE_HIDDEN)
+    except Exception:
+        pass
+
+
+def _remove_readonly(func, path, exc_info):
+    """읽기 전용 파일 삭제용 rmtree 오류 핸들러"""
+    try:
+        os.chmod(path, stat.S_IWRITE)
+        func(path)
+    except Exception as e:
+        print(f"[staging] 삭제 실패: {path} - {e}")
+
+
+def _delete_retired(path: str) -> None:
+    try:
+        shutil.rmtree(path, onerror=_remove_readonly)
+    except OSError as e:
+        print(f"[staging] 기존 폴더 삭제 실패: {path} - {e}")
+    finally:
+        with _retiring_lock:
+            _retiring.discard(path)
+
+
+def _delete_retired_later(path: str) -> None:
+    """교체된 기존 폴더를 백그라운드 스레드에서 삭제 (이미 삭제 중이면 무시)"""
+    with _retiring_lock:
+        if path in _retiring:
+            return
+        _retiring.add(path)
+    threading.Thread(target=_delete_retired, args=(path,), name='staging-retire', daemon=True).start()
+
+
+def _unique_suffix() -> str:
+    with _counter_lock:
+        _counter[0] += 1
+        return f"{os.getpid()}_{threading.get_ident()}_{_counter[0]}"
+
+
+class StagedBuild:
+    """
+    스테이징 폴더에 복사 후 원자적으로 게시
+
+    사용 예:
+        staged = StagedBuild(dest_folder, full_buildname, 'WindowsClient')
+        try:
+            engine.copy(source, rel_path, staged.path)
+            staged.publish()
+        except Exception:
+            staged.discard()
+            raise
+    """
+
+    def __init__(self, dest_folder: str, build_name: str, target_name: str = ''):
+        """
+        Args:
+            dest_folder: 로컬 저장 경로 (예: C:/mybuild)
+            build_name: 빌드 전체명
+            target_name: 하위 폴더 (예: WindowsClient, '' 이면 빌드 전체)
+        """
+        self.dest_folder = dest_folder
+        self.build_name = build_name
+        self.target_name = target_name
+        self.skipped_files: List[str] = []
+
+        self.staging_root = os.path.join(dest_folder, STAGING_DIR_NAME)
+        if not os.path.isdir(self.staging_root):
+            os.makedirs(self.staging_root, exist_ok=True)
+            _hide_on_windows(self.staging_root)
+        self.purge_stale(self.staging_root)
+
+        self.staging_build = os.path.join(self.staging_root, f"{build_name}.{_unique_suffix()}")
+        os.makedirs(self.staging_build)
+
+    @property
+    def path(self) -> str:
+        """복사 대상 경로 (스테이징)"""
+        if self.target_name:
+            return os.path.join(self.staging_build, self.target_name)
+        return self.staging_build
+
+    @property
+    def final_path(self) -> str:
+        """게시 후 경로"""
+        if self.target_name:
+            return os.path.join(self.dest_folder, self.build_name, self.target_name)
+        return os.path.join(self.dest_folder, self.build_name)
+
+    def publish(self) -> str:
+        """
+        스테이징 트리를 최종 위치로 게시 (rename 기반, 기존 폴더 삭제는 백그라운드에서 진행)
+
+        Returns:
+            게시된 경로
+        """
+        final_build = os.path.join(self.dest_folder, self.build_name)
+
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+
+        if self.target_name and not os.path.exists(final_build):
+            # 빌드 폴더가 아직 없으면 빌드 폴더째 게시
+            try:
+                os.rename(self.staging_build, final_build)
+                print(f"[staging] 게시 완료: {final_build}")
+                return self.final_path
+            except OSError:
+                # 같은 빌드의 다른 복사(클라/서버)가 먼저 게시한 경우
+                pass
+
+        self._replace(self.path, self.final_path)
+        self.discard()
+        print(f"[staging] 게시 완료: {self.final_path}")
+        return self.final_path
+
+    def _replace(self, staged: str, final: str) -> None:
+        """
+        기존 폴더를 스테이징 영역으로 치운 뒤 rename으로 교체
+
+        두 rename 사이에는 final이 잠시 없습니다. 이 순간 dest_folder를 읽는 쪽은 폴더가 없는
+        것으로 보며, 두 번째 rename이 실패하면 기존 폴더를 되돌린 뒤 오류를 다시 발생시킵니다.
+        """
+        if not os.path.exists(final):
+            os.rename(staged, final)
+            return
+
+        retired = os.path.join(self.staging_root, f"{os.path.basename(final)}{RETIRED_MARKER}{_unique_suffix()}")
+        try:
+            os.rename(final, retired)
+        except OSError as e:
+            # 실행 중인 파일 등으로 기존 폴더를 옮길 수 없으면 파일 단위로 덮어쓰기
+            print(f"[staging] 기존 폴더 교체 불가, 파일 단위 반영: {final} ({e})")
+            self._merge(staged, final)
+            return
+
+        try:
+            os.rename(staged, final)
+        except OSError:
+            os.rename(retired, final)
+            raise
+        # 큰 빌드도 게시가 삭제 시간만큼 늘어지지 않도록 백그라운드 삭제 (남으면 purge_stale이 정리)
+        _delete_retired_later(retired)
+
+    def _merge(self, staged: str, final: str) -> None:
+        """스테이징 파일을 기존 폴더로 개별 이동 (사용 중인 파일은 건너뜀)"""
+        for root, dirs, files in os.walk(staged):
+            rel = os.path.relpath(root, staged)
+            target_dir = final if rel == '.' else os.path.join(final, rel)
+            os.makedirs(target_dir, exist_ok=True)
+            for name in files:
+                target = os.path.join(target_dir, name)
+                try:
+                    if os.path.exists(target):
+                        os.chmod(target, stat.S_IWRITE)
+                    os.replace(os.path.join(root, name), target)
+                except OSError:
+                    print(f"[경고] {name}: 게시 실패 (파일 사용 중)")
+                    self.skipped_files.append(name)
+
+    def discard(self) -> None:
+        """스테이징 폴더 삭제"""
+        if os.path.exists(self.staging_build):
+            shutil.rmtree(self.staging_build, onerror=_remove_readonly)
+
+    @staticmethod
+    def purge_stale(staging_root: str, max_age: float = STALE_STAGING_SECONDS) -> None:
+        """중단된 복사로 남은 오래된 스테이징 폴더와 삭제되지 못한 기존 폴더 정리"""
+        now = time.time()
+        try:
+            with os.scandir(staging_root) as it:
+                entries = [e for e in it if e.is_dir()]
+        except OSError:
+            return
+        for entry in entries:
+            if RETIRED_MARKER in entry.name:
+                # 교체 후 삭제 중 종료된 기존 폴더 - 나이와 무관하게 백그라운드 삭제
+                _delete_retired_later(entry.path)
+                continue
+            try:
+                if now - entry.stat().st_mtime > max_age:
+                    print(f"[staging] 오래된 스테이징 폴더 정리: {entry.name}")
+                    shutil.rmtree(entry.path, onerror=_remove_readonly)
+            except OSError:
+                pass
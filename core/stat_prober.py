@@ -0,0 +1,96 @@
+"""병렬 stat 조회 모듈
+
+NAS(SMB) 루트의 stat/isfile 호출은 한 번마다 네트워크 왕복이 생기므로
+수백 개 폴더를 순서대로 확인하면 콜드 캐시에서 수 초가 걸립니다.
+scandir DirEntry로 얻을 수 있는 정보는 그대로 쓰고, 남은 호출만 작은 스레드 풀로 나눠 보냅니다.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+# 동시 stat 호출 수 (SMB 서버 부하를 고려해 작게 유지)
+DEFAULT_PROBE_WORKERS = 8
+
+# 이 개수 이하는 스레드 풀 없이 바로 처리
+SERIAL_THRESHOLD = 2
+
+# Windows는 scandir 결과에 stat 정보가 포함되어 DirEntry.stat()이 추가 호출 없이 끝남
+DIRENTRY_HAS_STAT = os.name == 'nt'
+
+
+class StatProber:
+    """stat 계열 호출 병렬 처리 (공유 스레드 풀, 스레드 안전)"""
+
+    def __init__(self, max_workers: int = DEFAULT_PROBE_WORKERS):
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='stat-probe')
+            return self._executor
+
+    def map(self, probe: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """
+        items 각각에 probe 적용 (입력 순서대로 결과 반환)
+
+        probe에서 OSError가 나면 해당 결과는 None
+        """
+        items = list(items)
+
+        def safe(item):
+            try:
+                return probe(item)
+            except OSError:
+                return None
+
+        if len(items) <= SERIAL_THRESHOLD or self.max_workers == 1:
+            return [safe(item) for item in items]
+        return list(self._pool().map(safe, items))
+
+    def mtimes(self, paths: Iterable[str]) -> List[Optional[float]]:
+        """경로별 수정 시간 (없으면 None)"""
+        return self.map(lambda p: os.stat(p).st_mtime, paths)
+
+    def isfiles(self, paths: Iterable[str]) -> List[bool]:
+        """경로별 파일 존재 여부"""
+        return self.map(os.path.isfile, paths)
+
+    def entry_mtimes(self, entries: List[os.DirEntry]) -> List[Optional[float]]:
+        """scandir DirEntry 수정 시간 (Windows는 DirEntry 정보 사용, 그 외는 병렬 stat)"""
+        if DIRENTRY_HAS_STAT:
+            result = []
+            for entry in entries:
+                try:
+                    result.append(entry.stat().st_mtime)
+                except OSError:
+                    result.append(None)
+            return result
+        return self.map(lambda e: e.stat().st_mtime, entries)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+_shared_prober: Optional[StatProber] = None
+_shared_lock = threading.Lock()
+
+
+def get_stat_prober() -> StatProber:
+    """프로세스 전역 공유 StatProber"""
+    global _shared_prober
+    with _shared_lock:
+        if _shared_prober is None:
+            _shared_prober = StatProber()
+        return _shared_prober
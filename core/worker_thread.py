@@ -5,56 +5,8 @@ import traceback
 import sys
 import io
 import contextlib
-import re
 
-
-def simplify_error_message(error_msg: str, max_length: int = 200) -> str:
-    """
-    에러 메시지를 간결하게 만듭니다.
-    
-    Args:
-        error_msg: 원본 에러 메시지
-        max_length: 최대 메시지 길이
-    
-    Returns:
-        간결한 에러 메시지
-    """
-    # Selenium NoSuchElementException 패턴 감지
-    if "no such element" in error_msg.lower() or "Unable to locate element" in error_msg:
-        # XPath 또는 selector 정보 추출
-        selector_match = re.search(r'"selector":"([^"]+)"', error_msg)
-        method_match = re.search(r'"method":"([^"]+)"', error_msg)
-        
-        if selector_match and method_match:
-            method = method_match.group(1)
-            selector = selector_match.group(1)
-            # selector가 너무 길면 축약
-            if len(selector) > 80:
-                selector = selector[:77] + "..."
-            return f"요소를 찾을 수 없음 ({method}: {selector})"
-        else:
-            return "요소를 찾을 수 없음"
-    
-    # Stacktrace 제거
-    if "Stacktrace:" in error_msg:
-        error_msg = error_msg.split("Stacktrace:")[0].strip()
-    
-    # "For documentation on this error" 이후 내용 제거
-    if "For documentation on this error" in error_msg:
-        error_msg = error_msg.split("For documentation on this error")[0].strip()
-    
-    # Session info 제거
-    if "(Session info:" in error_msg:
-        error_msg = re.sub(r'\(Session info:[^)]+\)', '', error_msg).strip()
-    
-    # 연속된 공백/줄바꿈 정리
-    error_msg = re.sub(r'\s+', ' ', error_msg).strip()
-    
-    # 최대 길이로 자르기
-    if len(error_msg) > max_length:
-        error_msg = error_msg[:max_length] + "..."
-    
-    return error_msg
+from .error_messages import simplify_error_message
 
 
 class WorkerThread(QThread):
@@ -1,7 +1,6 @@
 """QuickBuild - 스케줄 중심 UI (v2)"""
 import sys
 import os
-import shutil
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QScrollArea, QLabel, QMessageBox, QTextEdit,
                              QMenuBar, QAction, QSplitter, QFrame, QProgressDialog, QLineEdit, QComboBox, QDialog)
@@ -10,16 +9,25 @@ from PyQt5.QtGui import QIcon
 from datetime import datetime
 import subprocess
 import zipfile
-import time
-import re
 
 # Core 모듈 import
 from core import ConfigManager, ScheduleManager, BuildOperations, ScheduleWorkerThread
 from core.aws_manager import AWSManager
-from core.worker_thread import simplify_error_message
+from core.build_catalog import BuildCatalogScanner, get_build_catalog
+from core.build_index import DEFAULT_TTL, get_build_index
+from core.build_readiness import DEFAULT_MARKERS, DEFAULT_PROBE_INTERVAL, get_readiness_checker
+from core.build_watcher import DEFAULT_MAX_INTERVAL, DEFAULT_MIN_INTERVAL, NewBuildWatcher
+from core.coordination import create_coordinator, run_key
+from core.job_runner import JobRunner
+from core.job_store import open_job_store
+from core.run_history import open_run_history
+from core.pipeline import PipelineError
+from core.resource_executor import (RESOURCE_DEST_DISK, RESOURCE_NAS_READ, describe_resources,
+                                    get_resource_executor)
+from core.schedule_queue import SCHEDULE_MAX_SLEEP, CatchupQueue, ScheduleQueue, is_run_all
 
 # UI 모듈 import
-from ui import ScheduleDialog, ScheduleItemWidget, SettingsDialog
+from ui import ScheduleDialog, ScheduleItemWidget, SettingsDialog, BuildBrowserDialog
 # 피드백 다이얼로그 - Slack 직접 전송 방식 (암호화된 토큰 사용)
 try:
     from ui.feedback_dialog_slack import FeedbackDialogSlack as FeedbackDialog
@@ -27,9 +35,7 @@ except ImportError:
     FeedbackDialog = None  # 피드백 기능 비활성화
 
 # 기존 모듈 import
-from makelog import log_execution
 from exporter import export_upload_result
-from slack import send_schedule_notification
 
 # 업데이트 모듈 import
 try:
@@ -58,6 +64,15 @@ class QuickBuildApp(QMainWindow):
     # 업데이트 시그널
     update_check_result = pyqtSignal(bool, object, str)  # has_update, info, error_msg
     
+    # 새 빌드 감지 시그널 (감시 스레드 → UI 스레드)
+    new_build_detected = pyqtSignal(str, str)  # root, build_name
+    
+    # 자원을 확보한 스케줄 시작 시그널 (다단계 스케줄의 단계 스레드가 자원을 반환하며 시작시킨 경우 UI 스레드로 전달)
+    schedule_start_requested = pyqtSignal(object, object)  # schedule, task_func
+    
+    # 분산 실행 임대 상실 시그널 (임대 연장 스레드 → UI 스레드)
+    lease_lost = pyqtSignal(str, str)  # key, schedule_id
+    
     def __init__(self):
         super().__init__()
         
@@ -71,14 +86,45 @@ class QuickBuildApp(QMainWindow):
         self.schedule_mgr = ScheduleManager(self.schedule_file)
         self.build_ops = BuildOperations()
         
+        # 빌드 목록 공유 캐시 유지 시간 (find_latest_build / 빌드 목록 새로고침 공용)
+        get_build_index().ttl = self.config_mgr.get_setting('build_index_ttl', DEFAULT_TTL)
+        
         # 실행 중인 워커 스레드 관리
         self.running_workers = {}  # {schedule_id: worker_thread}
         
+        # 자원별 동시 실행 제한 (브라우저 세션 / NAS 읽기 / 대상 디스크가 겹칠 때만 대기)
+        self.resource_executor = get_resource_executor()
+        self.resource_executor.set_capacities({
+            RESOURCE_NAS_READ: self.config_mgr.get_setting('resource_nas_read_slots', 2),
+            RESOURCE_DEST_DISK: self.config_mgr.get_setting('resource_disk_slots', 1),
+        })
+        
+        # 스케줄 작업 실행 (execute_option / 다단계 파이프라인, 헤드리스 데몬과 공용)
+        # 작업 상태는 job_queue.db (비정상 종료 후 재시작 시 중단된 단계부터 재개),
+        # 단계별 소요 시간 / 복사량 / 실패 사유는 run_history.db에 기록 (백그라운드 쓰기)
+        self.job_runner = JobRunner(self.config_mgr, self.build_ops, self.resource_executor, log=self.log,
+                                    job_store=open_job_store(self.config_mgr),
+                                    history=open_run_history(self.config_mgr))
+        
+        # 여러 PC 분산 실행 (공유 저장소 임대를 잡은 PC만 실행, 사용 안 하면 None)
+        # (실행 중 임대를 잃으면 다단계 스케줄의 남은 단계 취소)
+        self.lease_lost.connect(self.on_lease_lost)
+        self.coordinator = create_coordinator(self.config_mgr,
+                                              on_lost=lambda key, sid: self.lease_lost.emit(key, sid))
+        
         # 스케줄 위젯 매핑 (상태 업데이트용)
         self.schedule_widgets = {}  # {schedule_id: ScheduleItemWidget}
         
-        # 마지막 실행 시간 (중복 방지)
-        self.last_check_time = None
+        # 자원 실행기의 시작 콜백은 자원을 반환한 스레드에서 호출됨
+        # (AutoConnection: UI 스레드면 바로, 단계 스레드면 UI 스레드 이벤트로 워커 생성)
+        self.schedule_start_requested.connect(self.start_schedule_worker)
+        
+        # 다음 실행 시각 큐 (스케줄이 바뀐 경우에만 다시 만듦)
+        self.schedule_queue = ScheduleQueue()
+        self.schedule_queue_version = None
+        
+        # run_all 정책으로 밀린 실행 (앞 실행이 끝나면 하나씩 실행)
+        self.catchup_runs = CatchupQueue()
         
         # 자동 업데이트 관리자
         self.auto_updater = AutoUpdater() if AutoUpdater else None
@@ -100,14 +146,39 @@ class QuickBuildApp(QMainWindow):
         # UI 초기화
         self.init_ui()
         
-        # 타이머 시작 (스케줄 체크)
+        # 빌드 카탈로그 백그라운드 스캐너 (find_latest_build/빌드 브라우저용)
+        self.catalog_scanner = None
+        self.start_catalog_scanner()
+        
+        # 빌드 준비 완료 판정 (마커 파일 / 매니페스트 / 크기 안정)
+        readiness = get_readiness_checker()
+        readiness.enabled = self.config_mgr.get_setting('readiness_enabled', True)
+        readiness.markers = tuple(self.config_mgr.get_setting('readiness_markers', list(DEFAULT_MARKERS)))
+        readiness.probe_interval = self.config_mgr.get_setting('readiness_probe_interval', DEFAULT_PROBE_INTERVAL)
+        
+        # 새 빌드 감지 트리거 (repeat_type 'new_build' 스케줄용, 준비 완료된 빌드만)
+        self.new_build_detected.connect(self.on_new_build_detected)
+        self.build_watcher = NewBuildWatcher(
+            on_new_build=lambda root, name: self.new_build_detected.emit(root, name),
+            ready_check=lambda root, name: readiness.is_ready(root, name, wait=False),
+            min_interval=self.config_mgr.get_setting('build_watch_min_interval', DEFAULT_MIN_INTERVAL),
+            max_interval=self.config_mgr.get_setting('build_watch_max_interval', DEFAULT_MAX_INTERVAL))
+        self.build_watcher.set_watches(self.build_watch_targets())
+        self.build_watcher.start()
+        
+        # 스케줄 타이머 (가장 이른 실행 시각에 맞춘 단발 타이머)
         self.check_timer = QTimer(self)
+        self.check_timer.setSingleShot(True)
+        self.check_timer.setTimerType(Qt.PreciseTimer)
         self.check_timer.timeout.connect(self.check_schedules)
-        self.check_timer.start(1000)  # 1초마다 체크
+        self.check_schedules()
         
         # 로그
         self.log("QuickBuild 시작")
         
+        # 이전 실행에서 끝나지 않은 작업 재개/실패 처리
+        self.resume_interrupted_jobs()
+        
         # 앱 시작 500ms 후 업데이트 체크 (백그라운드) - 먼저 실행
         if self.auto_updater:
             QTimer.singleShot(500, self.check_for_updates_on_startup)
@@ -186,6 +257,11 @@ class QuickBuildApp(QMainWindow):
         update_action.triggered.connect(self.check_update)
         menu.addAction(update_action)
         
+        # 빌드 브라우저 (로컬 카탈로그)
+        build_browser_action = QAction("빌드 브라우저", self)
+        build_browser_action.triggered.connect(self.show_build_browser)
+        menu.addAction(build_browser_action)
+        
         # 버그 및 피드백 메뉴
         feedback_action = QAction("버그 및 피드백", self)
         feedback_action.triggered.connect(self.show_feedback_dialog)
@@ -468,6 +544,15 @@ class QuickBuildApp(QMainWindow):
         
         # 스케줄 로드 (중복 id 제거 - 2회 이상 실행 시 로그 중복 방지)
         raw_schedules = self.schedule_mgr.load_schedules()
+        
+        # 스케줄 소스 경로가 바뀌었으면 카탈로그 스캔 / 새 빌드 감지 대상 갱신
+        if getattr(self, 'catalog_scanner', None):
+            self.catalog_scanner.set_roots(self.catalog_roots())
+        if getattr(self, 'build_watcher', None):
+            self.build_watcher.set_watches(self.build_watch_targets(raw_schedules))
+        # 스케줄이 바뀌었을 수 있으므로 실행 큐 확인/타이머 재설정
+        if getattr(self, 'check_timer', None):
+            self.check_timer.start(0)
         seen_ids = set()
         schedules = []
         for s in raw_schedules:
@@ -506,6 +591,8 @@ class QuickBuildApp(QMainWindow):
                 # 현재 실행 중인 스케줄이면 상태 표시
                 if schedule_id in self.running_workers:
                     item_widget.set_running_status(True, "실행 중...")
+                elif self.resource_executor.is_waiting(schedule_id):
+                    item_widget.set_queued_status(self.resource_executor.position(schedule_id) or 1)
                 
                 self.schedule_layout.addWidget(item_widget)
         
@@ -622,6 +709,10 @@ class QuickBuildApp(QMainWindow):
                 'option': schedule_data['option'],
                 'src_path': schedule_data['src_path'],
                 'dest_path': schedule_data['dest_path'],
+                'source_type': schedule_data['source_type'],
+                'cache_path': schedule_data['cache_path'],
+                'src_paths': schedule_data['src_paths'],
+                'mirror_mode': schedule_data['mirror_mode'],
                 'buildname': schedule_data['buildname'],
                 'awsurl': schedule_data['awsurl'],
                 'branch': schedule_data['branch'],
@@ -630,6 +721,9 @@ class QuickBuildApp(QMainWindow):
                 'enabled': schedule_data['enabled'],
                 'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             }
+            # 나머지 항목(build_mode, prefix 등)도 저장 (새 빌드 감지 트리거는 prefix 필요)
+            for key, value in schedule_data.items():
+                new_schedule.setdefault(key, value)
             
             schedules.append(new_schedule)
             self.schedule_mgr.save_schedules(schedules)
@@ -735,7 +829,18 @@ class QuickBuildApp(QMainWindow):
         self.execute_schedule(schedule)
     
     def stop_schedule(self, schedule_id: str):
-        """스케줄 중지"""
+        """스케줄 중지 (자원 대기 중이면 대기 취소)"""
+        if self.resource_executor.cancel(schedule_id):
+            schedule = self.schedule_mgr.get_schedule_by_id(schedule_id)
+            self.log(f"[대기 취소] {schedule.get('name', 'Unknown') if schedule else schedule_id}")
+            if schedule_id in self.schedule_widgets:
+                self.schedule_widgets[schedule_id].set_running_status(False, "대기 취소됨")
+            self.job_runner.job_finished(schedule_id, False, "대기 취소됨", cancelled=True)
+            self.finish_coordinated(schedule_id)
+            self.update_queue_status()
+            self.update_status_summary()
+            return
+        
         if schedule_id not in self.running_workers:
             QMessageBox.warning(self, "경고", "실행 중인 스케줄이 아닙니다.")
             return
@@ -755,6 +860,9 @@ class QuickBuildApp(QMainWindow):
         if reply == QMessageBox.Yes:
             self.log(f"[중지 요청] {schedule_name}")
             
+            # 다단계 스케줄이면 남은 단계 취소 (실행 중인 단계는 끝나면 자원 반환)
+            self.job_runner.cancel_pipeline(schedule_id)
+            
             # 워커 스레드 중지 (강제 종료)
             if worker.isRunning():
                 worker.terminate()  # 스레드 강제 종료
@@ -768,81 +876,169 @@ class QuickBuildApp(QMainWindow):
             if schedule_id in self.schedule_widgets:
                 self.schedule_widgets[schedule_id].set_running_status(False, "중지됨")
             
+            # 자원 반환 (기다리던 작업 시작)
+            self.resource_executor.release(schedule_id)
+            self.job_runner.job_finished(schedule_id, False, "중지됨", cancelled=True)
+            self.finish_coordinated(schedule_id)
+            self.update_queue_status()
+            
             # 상태 요약 업데이트
             self.update_status_summary()
             
             self.log(f"❌ 중지됨: {schedule_name}")
     
     def check_schedules(self):
-        """스케줄 체크 (1초마다 호출)"""
-        now = datetime.now()
-        current_time_str = now.strftime("%H:%M")
+        """스케줄 체크 (실행 시각이 된 스케줄 실행 후 다음 실행 시각에 타이머 재설정)"""
+        # 스케줄이 바뀌었으면 (편집/외부 수정) 큐 다시 만들기
+        version = self.schedule_mgr.get_version()
+        if version != self.schedule_queue_version:
+            schedules = self.schedule_mgr.load_schedules()
+            self.schedule_queue.rebuild(schedules)
+            self.catchup_runs.retain(schedules)
+            self.schedule_queue_version = version
         
-        # 같은 분에는 한 번만 체크
-        if self.last_check_time == current_time_str:
+        # 마지막 확인 이후 지나간 실행 시각까지 모두 확인 (이벤트 루프 지연/절전 복귀 시 누락 정책 적용)
+        now = datetime.now()
+        due = self.schedule_queue.pop_due(now)
+        for fire_at, schedule in self.schedule_queue.skipped:
+            self.log(f"[누락 건너뜀] {schedule.get('name', 'Unknown')} - {fire_at.strftime('%m-%d %H:%M:%S')}")
+        for fire_at, schedule in due:
+            if is_run_all(schedule) and self.defer_catchup(fire_at, schedule):
+                continue
+            late = (now - fire_at).total_seconds()
+            if late > 60:
+                self.log(f"[지연 실행] {schedule.get('name', 'Unknown')} - {fire_at.strftime('%m-%d %H:%M:%S')} "
+                         f"({int(late // 60)}분 늦음)")
+            else:
+                self.log(f"[자동 실행] {schedule.get('name', 'Unknown')} - {fire_at.strftime('%H:%M:%S')}")
+            self.execute_coordinated(schedule, run_key(schedule.get('id', ''), fire_at=fire_at))
+        
+        # 다른 PC에 양보했던 실행 중 담당 PC가 잡지 않았거나 실행 중 끊긴 것 넘겨받기
+        if self.coordinator:
+            self.coordinator.poll()
+        self.run_catchups()
+        
+        # 가장 이른 실행 시각까지 대기 (외부에서 schedule.json이 바뀌는 경우를 위해 최대 대기 시간 제한)
+        delay = self.schedule_queue.next_delay()
+        if delay is None or delay > SCHEDULE_MAX_SLEEP:
+            delay = SCHEDULE_MAX_SLEEP
+        self.check_timer.start(max(1, int(delay * 1000) + 1))
+    
+    def build_watch_targets(self, schedules: list = None) -> dict:
+        """새 빌드 감지 대상 {소스 루트: [Prefix, ...]} (활성화된 'new_build' 스케줄 기준)"""
+        if schedules is None:
+            schedules = self.schedule_mgr.load_schedules()
+        return self.job_runner.build_watch_targets(schedules)
+    
+    def on_new_build_detected(self, root: str, build_name: str):
+        """새 빌드 감지 → 해당 Prefix의 'new_build' 스케줄 실행"""
+        for schedule in self.job_runner.new_build_schedules(self.schedule_mgr.load_schedules(), root, build_name):
+            self.log(f"[새 빌드 감지] {schedule.get('name', 'Unknown')} - {build_name}")
+            self.execute_coordinated(schedule, run_key(schedule.get('id', ''), build_name=build_name),
+                                     build_name)
+    
+    def is_schedule_busy(self, schedule_id: str) -> bool:
+        """실행 중 / 자원 대기 중이거나 다른 PC가 실행하는지 확인 중인 스케줄"""
+        return (schedule_id in self.running_workers or self.resource_executor.is_waiting(schedule_id)
+                or self.resource_executor.is_running(schedule_id)
+                or (self.coordinator is not None and self.coordinator.has_pending(schedule_id)))
+    
+    def defer_catchup(self, fire_at: datetime, schedule: dict) -> bool:
+        """run_all 스케줄이 아직 실행 중이면 밀린 실행으로 보관 (보관했으면 True)"""
+        schedule_id = schedule.get('id', '')
+        if not self.is_schedule_busy(schedule_id) and not self.catchup_runs.has(schedule_id):
+            return False
+        self.catchup_runs.add(fire_at, schedule)
+        self.log(f"[누락 실행 대기] {schedule.get('name', 'Unknown')} - {fire_at.strftime('%m-%d %H:%M:%S')} "
+                 f"(앞 실행이 끝나면 실행)")
+        return True
+    
+    def run_catchups(self):
+        """앞 실행이 끝난 스케줄의 다음 밀린 실행 시작"""
+        for schedule_id in self.catchup_runs.schedule_ids():
+            if self.is_schedule_busy(schedule_id):
+                continue
+            entry = self.catchup_runs.pop(schedule_id)
+            if entry is None:
+                continue
+            fire_at, schedule = entry
+            self.log(f"[누락 실행] {schedule.get('name', 'Unknown')} - {fire_at.strftime('%m-%d %H:%M:%S')}")
+            self.execute_coordinated(schedule, run_key(schedule_id, fire_at=fire_at), catchup=True)
+    
+    def execute_coordinated(self, schedule: dict, key: str, detected_build: str = '', catchup: bool = False):
+        """자동 실행 (분산 실행을 쓰면 임대를 잡은 경우에만 실행, 수동 실행은 임대 없이 바로 실행)"""
+        if not self.coordinator:
+            self.execute_schedule(schedule, detected_build, catchup=catchup)
             return
+        if not self.coordinator.submit(key, schedule.get('id', ''),
+                                       lambda: self.execute_schedule(schedule, detected_build, catchup=catchup)):
+            self.log(f"[분산 실행] {schedule.get('name', 'Unknown')} - 다른 PC가 실행하거나 담당 PC를 기다립니다")
+    
+    def resume_interrupted_jobs(self):
+        """비정상 종료/업데이트 재시작으로 중단된 작업 처리 (완료된 단계가 있는 다단계 작업은 이어서 실행)"""
+        for schedule, resume in self.job_runner.recover_jobs():
+            self.execute_schedule(schedule, resume=resume)
+    
+    def execute_schedule(self, schedule: dict, detected_build: str = '', resume: dict = None,
+                         catchup: bool = False) -> bool:
+        """
+        스케줄 실행 (QThread)
         
-        self.last_check_time = current_time_str
-        
-        # 실행할 스케줄 조회
-        due_schedules = self.schedule_mgr.get_due_schedules(current_time_str, now)
+        Args:
+            schedule: 스케줄
+            detected_build: 새 빌드 감지 트리거로 실행된 경우 감지된 빌드명 (최신 빌드 탐색 생략)
+            resume: 중단된 작업 재개 정보 (JobRunner.recover_jobs)
+            catchup: run_all 정책으로 밀린 실행 (중복 실행 방지 생략)
         
-        for schedule in due_schedules:
-            self.log(f"[자동 실행] {schedule.get('name', 'Unknown')} - {current_time_str}")
-            self.execute_schedule(schedule)
-    
-    def execute_schedule(self, schedule: dict):
-        """스케줄 실행 (QThread)"""
+        Returns:
+            실행을 시작했거나 자원 대기열에 넣었으면 True
+        """
         schedule_id = schedule.get('id', '')
         
         # 이미 실행 중이면 스킵
         if schedule_id in self.running_workers:
             self.log(f"[실행 중] {schedule.get('name', 'Unknown')} - 이미 실행 중입니다.")
-            return
+            return False
+        if self.resource_executor.is_waiting(schedule_id):
+            self.log(f"[대기 중] {schedule.get('name', 'Unknown')} - 이미 실행 대기 중입니다.")
+            return False
+        if self.resource_executor.is_running(schedule_id):
+            # 자원은 확보했고 UI 스레드에서 워커 시작을 기다리는 중
+            self.log(f"[실행 중] {schedule.get('name', 'Unknown')} - 시작 중입니다.")
+            return False
         
         # 중복 실행 방지: 동일 스케줄이 1.5초 이내 연속 실행 요청 시 스킵 (로그 중복 방지)
         now = datetime.now()
         if not hasattr(self, '_schedule_last_run'):
             self._schedule_last_run = {}
         last = self._schedule_last_run.get(schedule_id)
-        if last and (now - last).total_seconds() < 1.5:
+        if not catchup and last and (now - last).total_seconds() < 1.5:
             self.log(f"[실행 스킵] {schedule.get('name', 'Unknown')} - 중복 실행 방지")
-            return
+            return False
         self._schedule_last_run[schedule_id] = now
         
-        # 작업 함수 생성
+        # 실행할 함수 결정 (다단계 스케줄은 단계마다 자원을 확보하므로 스케줄 단위 자원 없음)
+        try:
+            task_func, resources = self.job_runner.prepare_run(schedule, detected_build, resume)
+        except PipelineError as e:
+            self.log(f"[실행 오류] {schedule.get('name', 'Unknown')} - 단계 정의 오류: {e}")
+            return False
+        self.job_runner.begin_job(schedule, detected_build, resume)
+        
+        # 사용할 자원이 모두 비어 있으면 바로 시작, 겹치면 대기열에 넣고 자원이 반환될 때 시작
+        position = self.resource_executor.submit(
+            schedule_id, resources, lambda: self.schedule_start_requested.emit(schedule, task_func))
+        if position:
+            self.log(f"[실행 대기] {schedule.get('name', 'Unknown')} - {position}번째 "
+                     f"(사용 중인 자원: {describe_resources(resources)})")
+            self.update_queue_status()
+            self.update_status_summary()
+        return True
+    
+    def start_schedule_worker(self, schedule: dict, task_func):
+        """자원을 확보한 스케줄의 워커 스레드 시작 (UI 스레드 전용 - schedule_start_requested로 호출)"""
+        schedule_id = schedule.get('id', '')
         option = schedule.get('option', '')
-        buildname = schedule.get('buildname', '')
-        awsurl = schedule.get('awsurl', '')
-        branch = schedule.get('branch', '')
-        src_path = schedule.get('src_path', '')
-        dest_path = schedule.get('dest_path', '')
-        max_local_copies = schedule.get('max_local_copies', 0)
-        patch_delay = schedule.get('patch_delay', 30)
-        build_prefix = schedule.get('build_prefix', '')
-        teamcity_url = schedule.get('teamcity_url', '')
-        teamcity_branch = schedule.get('teamcity_branch', '')
-
-        # 빌드 모드 확인: 'latest' 또는 'fixed'
-        build_mode = schedule.get('build_mode', 'latest')
-        prefix = schedule.get('prefix', '')
-        
-        # 최신 모드일 경우 prefix로 최신 빌드 찾기
-        if build_mode == 'latest' and prefix:
-            try:
-                # 경로 확인
-                settings = self.config_mgr.load_settings()
-                check_src = src_path or settings.get('input_box1', r'\\pubg-pds\PBB\Builds')
-                
-                # prefix 기준 최신 빌드 찾기
-                buildname = self.find_latest_build(check_src, prefix)
-                self.log(f"[최신 빌드 탐색] Prefix '{prefix}' → {buildname}")
-            except Exception as e:
-                self.log(f"[오류] 최신 빌드 탐색 실패: {e}")
-                return
-        
-        # 실행할 함수 결정
-        task_func = lambda: self.execute_option(option, buildname, awsurl, branch, src_path, dest_path, max_local_copies, patch_delay, schedule, build_prefix, teamcity_url, teamcity_branch)
         
         # 워커 스레드 생성 (Debug 모드이면 stdout 캡처)
         worker = ScheduleWorkerThread(schedule, task_func, capture_stdout=self.debug_mode)
@@ -853,6 +1049,7 @@ class QuickBuildApp(QMainWindow):
         
         # 스레드 시작
         self.running_workers[schedule_id] = worker
+        self.job_runner.job_started(schedule_id)
         worker.start()
     
         # UI 상태 업데이트
@@ -861,607 +1058,12 @@ class QuickBuildApp(QMainWindow):
         
         # 상태 요약 업데이트
         self.update_status_summary()
-        
-        # 슬랙 알림 전송 (시작)
-        # self.send_slack_notification_if_enabled(schedule, '시작', 
-        #                                        f"옵션: {option}\n빌드: {buildname}")
     
-    def find_latest_build(self, src_folder: str, buildname: str) -> str:
-        """
-        빌드명으로 최신 빌드 폴더 찾기
-        
-        Args:
-            src_folder: 빌드 소스 경로
-            buildname: 빌드명 (짧은 이름, 예: game_SEL, game_progression)
-        
-        Returns:
-            전체 빌드 폴더명 (예: CompileBuild_DEV_game_SEL_271167_r306671)
-        """
-        if not os.path.isdir(src_folder):
-            raise Exception(f'Source folder does not exist: {src_folder}')
-        
-        # src_folder에서 buildname이 포함된 폴더 찾기
-        matching_folders = []
-        try:
-            for folder in os.listdir(src_folder):
-                folder_path = os.path.join(src_folder, folder)
-                if os.path.isdir(folder_path) and buildname in folder:
-                    matching_folders.append(folder)
-        except Exception as e:
-            raise Exception(f'Failed to list folders in {src_folder}: {e}')
-        
-        if not matching_folders:
-            raise Exception(f'No build folders found matching: {buildname}')
-        
-        # 최신 폴더 찾기 (리비전 r 값 기준)
-        def extract_revision_from_name(name: str) -> int:
-            m = re.search(r'(?:^|_)r(\d+)(?:$|_)', name)
-            if m:
-                return int(m.group(1))
-            m2 = re.search(r'r(\d+)', name)
-            return int(m2.group(1)) if m2 else -1
-
-        matching_folders.sort(
-            key=lambda x: (
-                extract_revision_from_name(x),
-                os.path.getmtime(os.path.join(src_folder, x))
-            ),
-            reverse=True
-        )
-        latest_folder = matching_folders[0]
-
-        print(f"[find_latest_build] Found {len(matching_folders)} matching folders, latest: {latest_folder}")
-        return latest_folder
-    
-    def force_remove_readonly(self, func, path, exc_info):
-        """
-        읽기 전용 파일 강제 삭제를 위한 오류 핸들러
-        
-        Args:
-            func: 실패한 함수
-            path: 파일/폴더 경로
-            exc_info: 예외 정보
-        """
-        import stat
-        
-        # 읽기 전용 속성 제거
-        try:
-            os.chmod(path, stat.S_IWRITE)
-            func(path)
-        except Exception as e:
-            print(f"[force_remove_readonly] 강제 삭제 실패: {path} - {e}")
-    
-    def cleanup_old_builds(self, dest_folder: str, max_copies: int):
-        """
-        로컬 경로에서 오래된 빌드 폴더 정리 (강제 삭제 포함)
-        
-        Args:
-            dest_folder: 로컬 저장 경로 (예: C:/mybuild)
-            max_copies: 최대 보관 개수 (0이면 정리 안 함)
-        """
-        if max_copies <= 0:
-            return
-        
-        if not os.path.isdir(dest_folder):
-            return
-        
-        try:
-            # dest_folder 내의 모든 폴더 목록 가져오기
-            folders = []
-            for item in os.listdir(dest_folder):
-                item_path = os.path.join(dest_folder, item)
-                if os.path.isdir(item_path):
-                    # 폴더의 수정 시간 가져오기
-                    mtime = os.path.getmtime(item_path)
-                    folders.append((item, item_path, mtime))
-            
-            # 수정 시간 기준 정렬 (오래된 것부터)
-            folders.sort(key=lambda x: x[2])
-            
-            # 현재 개수가 max_copies 이상이면 오래된 것부터 삭제
-            if len(folders) >= max_copies:
-                # 삭제할 개수 계산 (새로 추가될 1개를 위해 공간 확보)
-                to_delete_count = len(folders) - max_copies + 1
-                
-                for i in range(to_delete_count):
-                    folder_name, folder_path, _ = folders[i]
-                    print(f"[cleanup_old_builds] 오래된 빌드 삭제: {folder_name}")
-                    
-                    try:
-                        # 1차 시도: 일반 삭제
-                        shutil.rmtree(folder_path)
-                        print(f"[cleanup_old_builds] 삭제 완료: {folder_name}")
-                    except PermissionError as e:
-                        # 2차 시도: 읽기 전용 속성 제거 후 강제 삭제
-                        print(f"[cleanup_old_builds] 권한 오류 발생, 강제 삭제 시도: {folder_name}")
-                        try:
-                            shutil.rmtree(folder_path, onerror=self.force_remove_readonly)
-                            print(f"[cleanup_old_builds] 강제 삭제 완료: {folder_name}")
-                        except Exception as e2:
-                            print(f"[cleanup_old_builds] 강제 삭제 실패: {folder_name} - {e2}")
-                            # 3차 시도: Windows attrib 명령어 사용
-                            try:
-                                print(f"[cleanup_old_builds] attrib 명령어로 재시도: {folder_name}")
-                                # 읽기 전용 속성 제거 (재귀적으로)
-                                os.system(f'attrib -R "{folder_path}\\*.*" /S /D')
-                                time.sleep(0.5)
-                                shutil.rmtree(folder_path)
-                                print(f"[cleanup_old_builds] attrib 명령어로 삭제 완료: {folder_name}")
-                            except Exception as e3:
-                                print(f"[cleanup_old_builds] 최종 삭제 실패: {folder_name} - {e3}")
-                                print(f"[cleanup_old_builds] 수동 삭제 필요: {folder_path}")
-                    except Exception as e:
-                        print(f"[cleanup_old_builds] 삭제 실패: {folder_name} - {e}")
-        
-        except Exception as e:
-            print(f"[cleanup_old_builds] 오류: {e}")
-    
-    def copy_folder_direct(self, src_folder: str, dest_folder: str, target_folder: str, target_name: str) -> str:
-        """
-        폴더 복사 (스레드 안전 버전)
-        
-        Args:
-            src_folder: 빌드 소스 경로 (예: \\\\pubg-pds\\PBB\\Builds)
-            dest_folder: 로컬 저장 경로 (예: C:/mybuild)
-            target_folder: 빌드 전체명 (예: game_SEL_232323)
-            target_name: 복사할 폴더명 (예: WindowsClient, WindowsServer, '' for all)
-        """
-        folder_to_copy = os.path.join(src_folder, target_folder, target_name) if target_name else os.path.join(src_folder, target_folder)
-        
-        print(f"[copy_folder_direct] src: {folder_to_copy}")
-        print(f"[copy_folder_direct] dest: {os.path.join(dest_folder, target_folder, target_name)}")
-        
-        if not os.path.isdir(src_folder):
-            raise Exception(f'Source path is not valid: {src_folder}')
-        if not os.path.isdir(dest_folder):
-            raise Exception(f'Destination path is not valid: {dest_folder}')
-        if not os.path.isdir(folder_to_copy):
-            raise Exception(f'Folder to copy does not exist: {folder_to_copy}')
-        
-        # 목적지 디렉토리 생성
-        main_path = os.path.join(dest_folder, target_folder)
-        if not os.path.exists(main_path):
-            os.makedirs(main_path)
-        
-        dest_path = os.path.join(dest_folder, target_folder, target_name) if target_name else main_path
-        
-        # 파일 복사 (재시도 로직 포함)
-        file_count = 0
-        failed_files = []
-        
-        dir_count = 0
-        for root, dirs, files in os.walk(folder_to_copy):
-            # 디렉터리(빈 폴더 포함) 생성
-            rel_path = os.path.relpath(root, folder_to_copy)
-            current_dest_dir = os.path.join(dest_path, rel_path) if rel_path != '.' else dest_path
-            if not os.path.exists(current_dest_dir):
-                os.makedirs(current_dest_dir)
-                dir_count += 1
-
-            for d in dirs:
-                sub_dir = os.path.join(current_dest_dir, d)
-                if not os.path.exists(sub_dir):
-                    os.makedirs(sub_dir)
-                    dir_count += 1
-
-            # 파일 복사
-            for file in files:
-                src_file = os.path.join(root, file)
-                dest_dir = current_dest_dir
-                
-                # 파일 복사 시도 (최대 1번: 파일 사용중 등은 스킵)
-                max_retries = 1
-                success = False
-                
-                for attempt in range(max_retries):
-                    try:
-                        # 목적지 파일이 이미 존재하고 읽기 전용이면 속성 제거
-                        dest_file = os.path.join(dest_dir, os.path.basename(src_file))
-                        if os.path.exists(dest_file):
-                            try:
-                                os.chmod(dest_file, 0o777)
-                            except:
-                                pass
-                        
-                        # 파일 복사
-                        shutil.copy2(src_file, dest_dir)
-                        file_count += 1
-                        success = True
-                        break
-                    except PermissionError as e:
-                        if attempt < max_retries - 1:
-                            retry_delay = (attempt + 1) * 0.5
-                            print(f"[재시도 {attempt + 1}/{max_retries}] {file}: 파일 사용 중, {retry_delay}초 대기...")
-                            time.sleep(retry_delay)
-                        else:
-                            print(f"[경고] {file}: 복사 실패 (파일 사용 중)")
-                            failed_files.append(f"{file}")
-                    except Exception as e:
-                        print(f"[오류] {file}: {type(e).__name__}: {e}")
-                        failed_files.append(f"{file}")
-                        break
-        
-        # 결과 메시지 생성
-        result = f"{file_count} files copied, {dir_count} dirs created"
-        if failed_files:
-            result += f" ⚠️ {len(failed_files)} files skipped (in use)"
-            if len(failed_files) <= 5:
-                result += f": {', '.join(failed_files)}"
-        
-        return result
-    
-    def execute_option(self, option: str, buildname: str, awsurl: str, branch: str,
-                      src_path: str = '', dest_path: str = '', max_local_copies: int = 0,
-                      patch_delay: int = 30, schedule: dict = None, build_prefix: str = '',
-                      teamcity_url: str = '', teamcity_branch: str = '') -> str:
-        """
-        실행 옵션 처리 (실제 작업)
-        이 함수는 QThread 내에서 실행됩니다.
-
-        Args:
-            buildname: 빌드명 (Prefix 또는 전체 빌드명)
-                - 짧은 이름(예: game_SEL): find_latest_build로 최신 빌드 찾음
-                - 전체 빌드명(예: CompileBuild_DEV_game_SEL_...): 그대로 사용
-            max_local_copies: 로컬 경로에 저장할 최대 빌드 개수 (0이면 제한 없음)
-            patch_delay: 서버업로드및패치 시 업로드 후 패치까지 대기 시간 (분)
-        """
-        log_execution()  # 실행 로그
-        
-        try:
-            # 경로 정보: 스케줄에 지정된 경로 우선, 없으면 settings에서 가져오기
-            if not src_path or not dest_path:
-                settings = self.config_mgr.load_settings()
-                src_folder = src_path or settings.get('input_box1', r'\\pubg-pds\PBB\Builds')
-                dest_folder = dest_path or settings.get('input_box2', 'C:/mybuild')
-            else:
-                src_folder = src_path
-                dest_folder = dest_path
-            
-            print(f"[execute_option] option: {option}, buildname: {buildname}")
-            print(f"[execute_option] src_folder: {src_folder}, dest_folder: {dest_folder}")
-            
-            # ChromeDriver 사용 옵션: 기존 세션 재사용 문제 방지 위해 맨앞에 강제 종료
-            CHROMEDRIVER_OPTIONS = {'서버패치', '서버업로드', '서버업로드및패치', '서버최신강제패치', '서버삭제', '빌드굽기'}
-            if option in CHROMEDRIVER_OPTIONS:
-                print(f"[execute_option] ChromeDriver 강제 종료 (기존 세션 재사용 방지)")
-                AWSManager.kill_all_chromedrivers()
-                AWSManager.kill_chrome_on_debug_port(port=AWSManager.CHROME_DEBUGGING_PORT)
-                time.sleep(2)
-            
-            # buildname이 실제 폴더인지 확인 (전체 빌드명인지 Prefix인지 판단)
-            def is_full_buildname(name: str) -> bool:
-                """전체 빌드명인지 확인 (실제 폴더 존재 여부로 판단)"""
-                if not name:
-                    return False
-                full_path = os.path.join(src_folder, name)
-                return os.path.isdir(full_path)
-            
-            # 전체 빌드명 결정
-            def get_full_buildname(name: str) -> str:
-                """buildname이 Prefix면 최신 빌드 찾기, 전체 빌드명이면 그대로 사용"""
-                if is_full_buildname(name):
-                    print(f"[get_full_buildname] 전체 빌드명 사용: {name}")
-                    return name
-                else:
-                    print(f"[get_full_buildname] Prefix로 최신 빌드 탐색: {name}")
-                    return self.find_latest_build(src_folder, name)
-            
-            if option == "테스트(로그)":
-                # 테스트 로그만 출력
-                test_log = f"""
-[테스트 로그 출력]
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-실행 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-실행 옵션: {option}
-빌드명: {buildname}
-AWS URL: {awsurl}
-Branch: {branch}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-                print(test_log)
-                return ""
-            
-            elif option == "클라복사":
-                full_buildname = get_full_buildname(buildname)
-                print(f"[execute_option] 클라복사 - full_buildname: {full_buildname}")
-                
-                # 오래된 빌드 정리 (max_local_copies가 설정되어 있으면)
-                if max_local_copies > 0:
-                    print(f"[execute_option] 최대 경로 개수 제한: {max_local_copies}개")
-                    self.cleanup_old_builds(dest_folder, max_local_copies)
-                
-                # 실제 클라이언트 복사 로직
-                result = self.copy_folder_direct(src_folder, dest_folder, full_buildname, 'WindowsClient')
-                return f"클라복사 완료: {full_buildname} ({result})"
-            
-            elif option == "서버복사":
-                full_buildname = get_full_buildname(buildname)
-                print(f"[execute_option] 서버복사 - full_buildname: {full_buildname}")
-                
-                # 오래된 빌드 정리 (max_local_copies가 설정되어 있으면)
-                if max_local_copies > 0:
-                    print(f"[execute_option] 최대 경로 개수 제한: {max_local_copies}개")
-                    self.cleanup_old_builds(dest_folder, max_local_copies)
-                
-                # 실제 서버 복사 로직
-                result = self.copy_folder_direct(src_folder, dest_folder, full_buildname, 'WindowsServer')
-                return f"서버복사 완료: {full_buildname} ({result})"
-            
-            elif option == "전체복사":
-                full_buildname = get_full_buildname(buildname)
-                print(f"[execute_option] 전체복사 - full_buildname: {full_buildname}")
-                
-                # 오래된 빌드 정리 (max_local_copies가 설정되어 있으면)
-                if max_local_copies > 0:
-                    print(f"[execute_option] 최대 경로 개수 제한: {max_local_copies}개")
-                    self.cleanup_old_builds(dest_folder, max_local_copies)
-                
-                # 실제 전체 복사 로직
-                result = self.copy_folder_direct(src_folder, dest_folder, full_buildname, '')
-                return f"전체복사 완료: {full_buildname} ({result})"
-            
-            elif option == "서버패치":
-                # AWS 패치 실행
-                if not awsurl:
-                    raise Exception("AWS URL이 설정되지 않았습니다.")
-                
-                # buildname이 이미 full_buildname이면 그대로 사용 (폴더 검색 없이)
-                # 그렇지 않으면 get_full_buildname으로 폴더 검색
-                if buildname and ('CompileBuild' in buildname or 'Compilebuild' in buildname):
-                    # 이미 전체 빌드 이름임 (예: CompileBuild_DEV_game_SEL_25000_r300001)
-                    full_buildname = buildname
-                    print(f"[서버패치] 지정된 full_buildname 사용: {full_buildname}")
-                else:
-                    # 폴더에서 검색
-                    full_buildname = get_full_buildname(buildname)
-                    print(f"[서버패치] 검색된 full_buildname: {full_buildname}")
-                
-                # 리비전/타입 추출
-                revision = self.build_ops.extract_revision_number(full_buildname)
-                buildType = full_buildname.split('_')[1] if '_' in full_buildname else 'DEV'
-                
-                print(f"[서버패치] revision: {revision}, buildType: {buildType}, branch: {branch}")
-                print(f"[서버패치] AWS URL: {awsurl}")
-                
-                # Chrome 프로세스 종료 후 재시작 (디버깅 포트 재활용 안정화)
-                # print("[서버패치] Chrome 프로세스 종료 중...")
-                # os.system('taskkill /F /IM chrome.exe /T 2>nul')
-                # os.system('taskkill /F /IM chromedriver.exe /T 2>nul')
-                # time.sleep(3)
-                
-                print("[서버패치] AWS Manager 실행 중...")
-                AWSManager.update_server_container(
-                    driver=None,
-                    revision=revision,
-                    aws_link=awsurl,
-                    branch=branch,
-                    build_type=buildType,
-                    is_debug=False,
-                    full_build_name=full_buildname
-                )
-                print("[서버패치] AWS Manager 완료")
-                return (
-                    f"• AWS: {awsurl}\n"
-                    f"• 빌드: `{full_buildname}`"
-                )
-
-            elif option == "서버최신강제패치":
-                # AWS 최신 TAG 자동 선택 패치
-                if not awsurl:
-                    raise Exception("AWS URL이 설정되지 않았습니다.")
-                if not build_prefix:
-                    raise Exception("Build Prefix가 설정되지 않았습니다. (예: DailyQLOC;game_dev_AMS)")
-
-                print(f"[서버최신강제패치] AWS URL: {awsurl}")
-                print(f"[서버최신강제패치] Branch: {branch}")
-                print(f"[서버최신강제패치] Build Prefix: {build_prefix}")
-
-                print("[서버최신강제패치] AWS Manager 실행 중...")
-                selected_tag = AWSManager.update_latest_server_container(
-                    driver=None,
-                    aws_link=awsurl,
-                    branch=branch,
-                    build_prefix=build_prefix,
-                    is_debug=False
-                )
-                print("[서버최신강제패치] AWS Manager 완료")
-                return (
-                    f"• AWS: {awsurl}\n"
-                    f"• Build: `{selected_tag}`\n"
-                    f"• Prefix: `{build_prefix}`"
-                )
-
-            elif option == "서버삭제":
-                # AWS 서버 컨테이너 삭제
-                if not awsurl:
-                    raise Exception("AWS URL이 설정되지 않았습니다.")
-                
-                print(f"[서버삭제] AWS URL: {awsurl}")
-                
-                print("[서버삭제] AWS Manager 실행 중...")
-                AWSManager.delete_server_container(
-                    driver=None,
-                    aws_link=awsurl
-                )
-                print("[서버삭제] AWS Manager 완료")
-                return f"서버삭제 완료: {awsurl}"
-            
-            elif option == "서버업로드":
-                # if not awsurl:
-                #     raise Exception("AWS URL이 설정되지 않았습니다.")
-                
-                # Chrome 프로세스 종료 후 재시작 (디버깅 포트 재활용 안정화)
-                # print("[서버패치] Chrome 프로세스 종료 중...")
-                # os.system('taskkill /F /IM chrome.exe /T 2>nul')
-                # os.system('taskkill /F /IM chromedriver.exe /T 2>nul')
-                # time.sleep(3)
-                
-                
-                full_buildname = get_full_buildname(buildname)
-                
-                # 빌드 경로 확인 (NAS 경로)
-                build_path = os.path.join(src_folder, full_buildname)
-                if not os.path.isdir(build_path):
-                    raise Exception(f"빌드 폴더가 없습니다: {build_path}")
-                
-                # 리비전/타입 추출
-                revision = self.build_ops.extract_revision_number(full_buildname)
-                buildType = full_buildname.split('_')[1] if '_' in full_buildname else 'DEV'
-                
-                # Teamcity 로그인 정보 가져오기
-                teamcity_id, teamcity_pw = self.config_mgr.get_teamcity_credentials()
-                
-                # TeamCity를 통한 서버 배포 실행
-                tc_url = teamcity_url or 'https://pbbseoul6-w.bluehole.net/buildConfiguration/BlackBudget_Deployment_DeployBuild?mode=branches#all-projects'
-                AWSManager.upload_server_build(
-                    driver=None,
-                    revision=revision,
-                    zip_path="",  # TeamCity 방식에서는 사용하지 않음
-                    aws_link=awsurl,
-                    branch=branch,
-                    build_type=buildType,
-                    full_build_name=full_buildname,
-                    teamcity_id=teamcity_id,
-                    teamcity_pw=teamcity_pw,
-                    teamcity_url=teamcity_url
-                )
-                # 서버업로드 완료 슬랙 알림
-                if schedule:
-                    upload_body = (
-                        f"• TeamCity: {tc_url}\n"
-                        f"• 빌드: `{full_buildname}`"
-                    )
-                    if awsurl:
-                        upload_body += f"\n• AWS: {awsurl}"
-                    self.send_slack_notification_if_enabled(
-                        schedule, '업로드완료', upload_body
-                    )
-                return f"서버업로드 완료: {full_buildname}"
-            
-            elif option == "서버업로드및패치":
-                if not awsurl:
-                    raise Exception("AWS URL이 설정되지 않았습니다.")
-                
-                full_buildname = get_full_buildname(buildname)
-                
-                # 빌드 경로 확인 (NAS 경로)
-                build_path = os.path.join(src_folder, full_buildname)
-                if not os.path.isdir(build_path):
-                    raise Exception(f"빌드 폴더가 없습니다: {build_path}")
-                
-                # 리비전/타입 추출
-                revision = self.build_ops.extract_revision_number(full_buildname)
-                buildType = full_buildname.split('_')[1] if '_' in full_buildname else 'DEV'
-                
-                # Teamcity 로그인 정보 가져오기
-                teamcity_id, teamcity_pw = self.config_mgr.get_teamcity_credentials()
-                
-                # TeamCity를 통한 서버 배포 실행
-                tc_url = teamcity_url or 'https://pbbseoul6-w.bluehole.net/buildConfiguration/BlackBudget_Deployment_DeployBuild?mode=branches#all-projects'
-                AWSManager.upload_server_build(
-                    driver=None,
-                    revision=revision,
-                    zip_path="",  # TeamCity 방식에서는 사용하지 않음
-                    aws_link=awsurl,
-                    branch=branch,
-                    build_type=buildType,
-                    full_build_name=full_buildname,
-                    teamcity_id=teamcity_id,
-                    teamcity_pw=teamcity_pw,
-                    teamcity_url=teamcity_url
-                )
-
-                # 1차 슬랙 알림: 업로드(배포 요청) 완료 — TeamCity·AWS URL 통일 표기
-                if schedule:
-                    self.send_slack_notification_if_enabled(
-                        schedule, '업로드완료',
-                        f"• AWS (패치 예정): {awsurl}\n"
-                        f"• 빌드: `{full_buildname}`\n"
-                        f"• TeamCity: {tc_url}\n"
-                        f"• 패치 대기: {patch_delay}분",
-                    )
-
-                # 패치 대기시간 (업로드 완료 후 AWS 반영까지 대기)
-                if patch_delay > 0:
-                    print(f"[서버업로드및패치] 패치 대기시간: {patch_delay}분")
-                    for remaining in range(patch_delay, 0, -1):
-                        print(f"[서버업로드및패치] 패치까지 {remaining}분 남음...")
-                        time.sleep(60)  # 1분마다 로그 출력
-                    print("[서버업로드및패치] 대기 완료, 패치 시작")
-
-                # 패치
-                AWSManager.update_server_container(
-                    driver=None,
-                    revision=revision,
-                    aws_link=awsurl,
-                    branch=branch,
-                    build_type=buildType,
-                    is_debug=False,
-                    full_build_name=full_buildname
-                )
-                return (
-                    f"• AWS: {awsurl}\n"
-                    f"• 빌드: `{full_buildname}`"
-                )
-            
-            elif option == "빌드굽기":
-                # Teamcity 로그인 정보 가져오기
-                teamcity_id, teamcity_pw = self.config_mgr.get_teamcity_credentials()
-                
-                # Teamcity URL (미지정 시 기본값 사용)
-                url_link = teamcity_url or 'https://pbbseoul6-w.bluehole.net/buildConfiguration/BlackBudget_CompileBuild?mode=builds#all-projects'
-                # Teamcity Branch (팀시티 설정에서 지정, 미지정 시 branch 또는 game)
-                tc_branch = teamcity_branch or branch or 'game'
-                
-                # TeamCity 빌드 실행
-                AWSManager.run_teamcity_build(
-                    driver=None,
-                    url_link=url_link,
-                    branch=tc_branch,
-                    teamcity_id=teamcity_id,
-                    teamcity_pw=teamcity_pw
-                )
-                return f"빌드굽기 완료: {tc_branch}"
-            
-            elif option == "Chrome프로세스정리":
-                # Chrome 및 ChromeDriver 프로세스 정리
-                print("[Chrome프로세스정리] 시작")
-                
-                # ChromeDriver 프로세스 종료
-                chromedriver_killed = AWSManager.kill_all_chromedrivers()
-                print(f"[Chrome프로세스정리] ChromeDriver 프로세스 {chromedriver_killed}개 종료")
-                
-                # Chrome 프로세스 종료
-                chrome_result = os.system('taskkill /F /IM chrome.exe /T 2>nul')
-                chrome_killed = "성공" if chrome_result == 0 else "없음"
-                print(f"[Chrome프로세스정리] Chrome 프로세스 종료: {chrome_killed}")
-                
-                # ChromeTEMP 캐시 정리 (선택적)
-                try:
-                    cache_dir = AWSManager.CHROME_USER_DATA_DIR
-                    if os.path.exists(cache_dir):
-                        import shutil
-                        shutil.rmtree(cache_dir)
-                        print(f"[Chrome프로세스정리] 캐시 디렉터리 삭제: {cache_dir}")
-                        cache_cleaned = "✅ 캐시 정리 완료"
-                    else:
-                        cache_cleaned = "캐시 없음"
-                except Exception as e:
-                    cache_cleaned = f"⚠️ 캐시 정리 실패: {e}"
-                    print(f"[Chrome프로세스정리] {cache_cleaned}")
-                
-                # 결과 요약
-                summary = f"ChromeDriver: {chromedriver_killed}개 종료, Chrome: {chrome_killed}, {cache_cleaned}"
-                print(f"[Chrome프로세스정리] 완료 - {summary}")
-                return f"Chrome프로세스정리 완료 - {summary}"
-            
-            else:
-                return f"{option} 실행 완료 (미구현)"
-        
-        except Exception as e:
-            # 에러 메시지를 간결하게 만들어서 재발생
-            simplified_msg = simplify_error_message(str(e))
-            raise Exception(f"{option} 실행 오류: {simplified_msg}")
+    def update_queue_status(self):
+        """자원 대기 중인 스케줄의 대기 순번 표시"""
+        for schedule_id, position, blocking in self.resource_executor.waiting():
+            if schedule_id in self.schedule_widgets:
+                self.schedule_widgets[schedule_id].set_queued_status(position, describe_resources(blocking))
     
     def on_schedule_finished(self, schedule: dict, success: bool, message: str):
         """스케줄 실행 완료"""
@@ -1473,6 +1075,12 @@ Branch: {branch}
             worker = self.running_workers.pop(schedule_id)
             worker.finished.connect(worker.deleteLater)  # 스레드 종료 후 삭제
         
+        # 자원 반환 (기다리던 스케줄 시작, 남은 대기 순번 갱신)
+        self.resource_executor.release(schedule_id)
+        self.job_runner.job_finished(schedule_id, success, message)
+        self.finish_coordinated(schedule_id)
+        self.update_queue_status()
+        
         # UI 상태 업데이트
         if schedule_id in self.schedule_widgets:
             if success:
@@ -1496,6 +1104,26 @@ Branch: {branch}
         # 슬랙 알림 전송 (완료/실패)
         status = '완료' if success else '실패'
         self.send_slack_notification_if_enabled(schedule, status, message)
+        
+        # run_all 정책으로 밀린 다음 실행
+        self.run_catchups()
+    
+    def on_lease_lost(self, key: str, schedule_id: str):
+        """실행 중 분산 실행 임대를 잃음 → 다단계 스케줄이면 남은 단계 취소 (실행 중인 단계는 끝까지 실행)"""
+        schedule = self.schedule_mgr.get_schedule_by_id(schedule_id)
+        name = schedule.get('name', 'Unknown') if schedule else schedule_id
+        self.log(f"[분산 실행] {name} - 다른 PC가 넘겨받아 남은 단계를 취소합니다 (실행 중인 단계는 끝까지 실행)")
+        self.job_runner.cancel_pipeline(schedule_id)
+    
+    def finish_coordinated(self, schedule_id: str):
+        """분산 실행 임대 종료 (끝난 실행을 다른 PC가 다시 실행하지 않도록 기록)"""
+        if self.coordinator:
+            self.coordinator.finish(schedule_id)
+    
+    def flush_run_history(self):
+        """종료 전 쓰기 대기 중인 실행 기록 저장"""
+        if self.job_runner.history is not None:
+            self.job_runner.history.flush(2.0)
     
     def hide_status_message(self, schedule_id: str):
         """상태 메시지 숨기기"""
@@ -1505,68 +1133,15 @@ Branch: {branch}
                 widget.status_label.setVisible(False)
     
     def send_slack_notification_if_enabled(self, schedule: dict, status: str, details: str = None):
-        """
-        스케줄에 슬랙 알림이 활성화되어 있으면 알림 전송
-        
-        Args:
-            schedule: 스케줄 정보
-            status: 상태 (시작, 완료, 실패)
-            details: 추가 상세 정보
-        """
-        try:
-            # 슬랙 알림이 활성화되어 있는지 확인
-            slack_enabled = schedule.get('slack_enabled', False)
-            bot_token = schedule.get('bot_token', '').strip()
-            channel_id = schedule.get('channel_id', '').strip()
-            
-            if not slack_enabled or not bot_token or not channel_id:
-                return
-            
-            # 스케줄 이름
-            schedule_name = schedule.get('name', 'Unknown')
-            
-            # 알림 타입 및 추가 정보
-            notification_type = schedule.get('notification_type', 'standalone')
-            thread_keyword = schedule.get('thread_keyword', '').strip()
-            first_message = schedule.get('first_message', '').strip()
-            
-            # 테스트(로그) 옵션 처리
-            option = schedule.get('option', '')
-            if option == '테스트(로그)':
-                # first_message가 있으면 그것만 전송, 없으면 알림 안 보냄
-                if first_message:
-                    details = None  # 상태값(완료/실패) 제거
-                else:
-                    return  # 알림 전송 안 함
-            
-            # 알림 전송
-            if notification_type in ('thread', 'thread_broadcast') and thread_keyword:
-                mode_label = "스레드 댓글(채널에도 전송)" if notification_type == 'thread_broadcast' else "스레드 댓글"
-                self.log(f"[슬랙 알림] {mode_label} 모드: '{thread_keyword}' 검색 중...")
-
-            send_schedule_notification(
-                webhook_url='',  # 더 이상 사용 안 함 (호환성용)
-                schedule_name=schedule_name,
-                status=status,
-                details=details,
-                notification_type=notification_type,
-                bot_token=bot_token,
-                channel_id=channel_id,
-                thread_keyword=thread_keyword if notification_type in ('thread', 'thread_broadcast') else None,
-                first_message=first_message if first_message else None,
-                schedule_option=schedule.get('option') or None,
-                plain_message_only=(option == '테스트(로그)'),
-            )
-            
-        except Exception as e:
-            # 슬랙 알림 실패는 로그만 남기고 계속 진행
-            self.log(f"[슬랙 알림 오류] {e}")
+        """스케줄에 슬랙 알림이 활성화되어 있으면 알림 전송 (JobRunner 위임)"""
+        self.job_runner.send_slack_notification_if_enabled(schedule, status, details)
     
     def update_status_summary(self):
         """상태 요약 업데이트"""
         running_count = len(self.running_workers)
+        waiting_count = self.resource_executor.waiting_count()
         
-        if running_count == 0:
+        if running_count == 0 and waiting_count == 0:
             self.status_summary_label.setText("실행 중: 0개")
             self.status_summary_label.setStyleSheet("""
                 background-color: #E3F2FD;
@@ -1586,6 +1161,8 @@ Branch: {branch}
                     running_names.append(f"{name} ({option})")
             
             summary_text = f"🔄 실행 중: {running_count}개"
+            if waiting_count:
+                summary_text += f" · ⏳ 대기: {waiting_count}개"
             # if running_names:
             #     summary_text += f"\n{', '.join(running_names[:3])}"  # 최대 3개만 표시
             #     if len(running_names) > 3:
@@ -1832,6 +1409,36 @@ Branch: {branch}
             self.debug_mode = dialog.get_debug_mode()
             self.log("설정이 저장되었습니다")
     
+    def catalog_roots(self) -> list:
+        """카탈로그 스캔 대상 루트 (기본 소스 경로 + 스케줄의 경로 소스)"""
+        settings = self.config_mgr.load_settings()
+        roots = [settings.get('input_box1', r'\\pubg-pds\PBB\Builds')]
+        for schedule in self.schedule_mgr.load_schedules():
+            if schedule.get('source_type', 'path') == 'path' and schedule.get('src_path'):
+                roots.append(schedule['src_path'])
+        return roots
+    
+    def start_catalog_scanner(self):
+        """빌드 카탈로그 스캐너 시작 (settings.json catalog_enabled=false면 사용 안 함)"""
+        if not self.config_mgr.get_setting('catalog_enabled', True):
+            return
+        try:
+            catalog = get_build_catalog()
+            self.catalog_scanner = BuildCatalogScanner(
+                catalog, self.catalog_roots(),
+                interval=self.config_mgr.get_setting('catalog_scan_interval', 30))
+            self.catalog_scanner.start()
+        except Exception as e:
+            self.catalog_scanner = None
+            print(f"[BuildCatalog] 스캐너 시작 실패: {e}")
+    
+    def show_build_browser(self):
+        """빌드 브라우저 다이얼로그 표시"""
+        settings = self.config_mgr.load_settings()
+        root = settings.get('input_box1', r'\\pubg-pds\PBB\Builds')
+        dialog = BuildBrowserDialog(get_build_catalog(), root, self.catalog_scanner, self)
+        dialog.exec_()
+    
     def show_feedback_dialog(self):
         """버그 및 피드백 다이얼로그 표시"""
         if FeedbackDialog is None:
@@ -2010,6 +1617,7 @@ if __name__ == '__main__':
     app = QApplication(sys.argv)
     main_window = QuickBuildApp()
     main_window.show()
+    app.aboutToQuit.connect(main_window.flush_run_history)
     
     # 앱 시작 시 자동 업데이트 확인은 __init__에서 QTimer로 처리됨
     
@@ -0,0 +1,106 @@
+"""분산 실행 임대 테스트"""
+import threading
+import time
+
+import pytest
+
+from core.coordination import (LEASE_DONE, DirectoryLeaseStore, Lease, ScheduleCoordinator,
+                               SQLiteLeaseStore)
+
+
+@pytest.fixture(params=['directory', 'sqlite'])
+def store(request, tmp_path):
+    if request.param == 'directory':
+        yield DirectoryLeaseStore(str(tmp_path / 'locks'), settle=0.05)
+        return
+    store = SQLiteLeaseStore(str(tmp_path / 'locks.db'))
+    yield store
+    store.close()
+
+
+def expire(store, key):
+    """현재 임대를 만료된 것으로 바꿈 (담당 PC가 죽어 연장하지 못한 상황)"""
+    lease = store.get(key)
+    if isinstance(store, DirectoryLeaseStore):
+        store._write(store._path(key), Lease(key, lease.holder, time.time() - 1, lease.state))
+    else:
+        store._transaction(lambda conn: conn.execute(
+            'UPDATE leases SET expires_at = ? WHERE key = ?', (time.time() - 1, key)))
+
+
+def test_acquire_renew_complete(store):
+    assert store.try_acquire('run-1', 'pc-a', 60)
+    assert not store.try_acquire('run-1', 'pc-b', 60)
+    assert store.renew('run-1', 'pc-a', 60)
+    assert not store.renew('run-1', 'pc-b', 60)
+
+    store.complete('run-1', 'pc-a', 60)
+    assert store.get('run-1').state == LEASE_DONE
+    assert not store.try_acquire('run-1', 'pc-b', 60)
+
+
+def test_expired_lease_taken_over(store):
+    assert store.try_acquire('run-1', 'pc-a', 60)
+    expire(store, 'run-1')
+
+    assert store.try_acquire('run-1', 'pc-b', 60)
+    assert store.get('run-1').holder == 'pc-b'
+    assert not store.renew('run-1', 'pc-a', 60)
+
+
+def test_concurrent_takeover_single_winner(tmp_path):
+    # 여러 PC가 동시에 만료된 임대를 넘겨받으려 해도 한 PC만 성공 (임대 파일이 없어지는 순간이 없음)
+    store = DirectoryLeaseStore(str(tmp_path / 'locks'), settle=0.1)
+    for attempt in range(5):
+        key = f'run-{attempt}'
+        assert store.try_acquire(key, 'pc-dead', 60)
+        expire(store, key)
+
+        barrier = threading.Barrier(6)
+        won = []
+
+        def claim(holder):
+            barrier.wait()
+            if store.try_acquire(key, holder, 60):
+                won.append(holder)
+
+        threads = [threading.Thread(target=claim, args=(f'pc-{i}',)) for i in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(won) == 1
+        assert store.get(key).holder == won[0]
+    assert not [name for name in (tmp_path / 'locks' / 'leases').iterdir() if not name.name.endswith('.json')]
+
+
+def test_lost_lease_notifies(store):
+    lost = []
+    coordinator = ScheduleCoordinator(store, host_id='pc-a', claim_grace=0,
+                                      log=lambda message: None, on_lost=lambda key, sid: lost.append((key, sid)))
+    assert coordinator.submit('run-1', 'sched-1', lambda: True)
+    assert coordinator.held_keys() == ['run-1']
+
+    # 공유 저장소 접근이 끊긴 사이 다른 PC가 넘겨받음
+    expire(store, 'run-1')
+    assert store.try_acquire('run-1', 'pc-b', 60)
+    coordinator._beat()
+
+    assert lost == [('run-1', 'sched-1')]
+    assert coordinator.held_keys() == []
+    # 이 PC의 실행이 끝나도 넘겨받은 PC의 임대는 건드리지 않음
+    coordinator.finish('sched-1')
+    assert store.get('run-1').holder == 'pc-b'
+    assert store.get('run-1').state != LEASE_DONE
+
+
+def test_not_started_run_completes_only_its_key(store):
+    coordinator = ScheduleCoordinator(store, host_id='pc-a', claim_grace=0, log=lambda message: None)
+    assert coordinator.submit('run-1', 'sched-1', lambda: True)
+    # 같은 스케줄의 다른 실행이 시작되지 못함 (예: 실행 중)
+    assert not coordinator.submit('run-2', 'sched-1', lambda: False)
+
+    assert coordinator.held_keys() == ['run-1']
+    assert store.get('run-1').state != LEASE_DONE
+    assert store.get('run-2').state == LEASE_DONE
@@ -0,0 +1,346 @@
+"""복사 소스 백엔드 테스트 (로컬 http.server로 HTTP 아티팩트 서버 흉내)"""
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core import copy_sources
+from core.copy_engine import copy_build
+from core.copy_sources import CacheCopySource, HttpCopySource, PathCopySource
+from core.staging import STAGING_DIR_NAME
+
+
+BUILD = 'CompileBuild_DEV_game_SEL_271167_r306671'
+
+# 빌드 트리 (상대 경로 → 내용)
+FILES = {
+    'WindowsClient/game.exe': bytes(range(256)) * 1200,  # 300KB - 분할 다운로드 대상
+    'WindowsClient/data/config.ini': b'[game]\nmode=dev\n',
+    'WindowsServer/server.exe': b'server' * 1000,
+}
+DIRS = ['WindowsClient', 'WindowsClient/data', 'WindowsClient/empty', 'WindowsServer']
+
+
+class ArtifactServer:
+    """index.json / manifest.json / Range 요청을 지원하는 테스트용 아티팩트 서버
+
+    faults[경로] 에 'error'(503) 또는 'truncate'(절반만 보내고 연결 끊기)를 넣으면
+    해당 경로 GET 요청에 순서대로 적용합니다.
+    """
+
+    def __init__(self):
+        self.requests = []  # (method, 경로, Range 헤더)
+        self.faults = {}
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_HEAD(self):
+                self._respond(head=True)
+
+            def do_GET(self):
+                self._respond(head=False)
+
+            def _respond(self, head):
+                path = self.path.split('?', 1)[0].lstrip('/')
+                range_header = self.headers.get('Range')
+                with server.lock:
+                    server.requests.append((self.command, path, range_header))
+                    fault = None
+                    if not head and server.faults.get(path):
+                        fault = server.faults[path].pop(0)
+
+                body = server.content(path)
+                if body is None:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                if fault == 'error':
+                    self.send_response(503)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                status = 200
+                match = re.match(r'bytes=(\d+)-(\d*)$', range_header or '')
+                if match:
+                    start = int(match.group(1))
+                    end = int(match.group(2)) if match.group(2) else len(body) - 1
+                    total = len(body)
+                    body = body[start:end + 1]
+                    status = 206
+                self.send_response(status)
+                self.send_header('Accept-Ranges', 'bytes')
+                self.send_header('Content-Length', str(len(body)))
+                if status == 206:
+                    self.send_header('Content-Range', f'bytes {start}-{end}/{total}')
+                self.end_headers()
+                if head:
+                    return
+                if fault == 'truncate':
+                    self.wfile.write(body[:len(body) // 2])
+                    self.wfile.flush()
+                    self.close_connection = True
+                    return
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self.httpd.server_address[1]}/builds'
+        self.thread = threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    def content(self, path):
+        if path == 'builds/index.json':
+            return json.dumps({'builds': [BUILD]}).encode()
+        if path == f'builds/{BUILD}/manifest.json':
+            return json.dumps({
+                'dirs': DIRS,
+                'files': [{'path': p, 'size': len(data)} for p, data in FILES.items()],
+            }).encode()
+        prefix = f'builds/{BUILD}/'
+        if path.startswith(prefix):
+            return FILES.get(path[len(prefix):])
+        return None
+
+    def gets(self, rel_file):
+        path = f'builds/{BUILD}/{rel_file}'
+        return [r for r in self.requests if r[0] == 'GET' and r[1] == path]
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    srv = ArtifactServer()
+    yield srv
+    srv.close()
+
+
+@pytest.fixture
+def http_source(server, monkeypatch):
+    # 이어받기 위치를 확인할 수 있도록 쓰기 단위를 작게
+    monkeypatch.setattr(copy_sources, 'HTTP_READ_SIZE', 1024)
+    source = HttpCopySource(server.url, chunk_size=64 * 1024, range_workers=3, retry_delay=0)
+    yield source
+    source.close()
+
+
+@pytest.fixture
+def path_root(tmp_path):
+    root = tmp_path / 'share'
+    for rel, data in FILES.items():
+        path = root / BUILD / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    (root / BUILD / 'WindowsClient' / 'empty').mkdir()
+    return root
+
+
+def read_tree(folder):
+    tree = {}
+    for dirpath, _, filenames in os.walk(folder):
+        for name in filenames:
+            full = os.path.join(dirpath, name)
+            tree[os.path.relpath(full, folder).replace(os.sep, '/')] = open(full, 'rb').read()
+    return tree
+
+
+def test_http_listing(http_source):
+    assert http_source.is_available()
+    assert http_source.list_builds() == [BUILD]
+    assert http_source.exists(BUILD)
+    assert http_source.exists(f'{BUILD}/WindowsClient')
+    assert not http_source.exists(f'{BUILD}/MacClient')
+    assert not http_source.exists('NoSuchBuild')
+
+    dirs, files = http_source.list_tree(f'{BUILD}/WindowsClient')
+    assert dirs == ['data', 'empty']
+    assert sorted(files) == [('data/config.ini', 16), ('game.exe', 300 * 1024)]
+
+
+def test_http_ranged_download_reassembles(server, http_source, tmp_path):
+    dest = tmp_path / 'game.exe'
+    copied = http_source.copy_file(f'{BUILD}/WindowsClient/game.exe', str(dest))
+
+    assert copied == len(FILES['WindowsClient/game.exe'])
+    assert dest.read_bytes() == FILES['WindowsClient/game.exe']
+    ranges = sorted(r[2] for r in server.gets('WindowsClient/game.exe'))
+    # 300KB / 64KB → Range 5개
+    assert len(ranges) == 5
+    assert 'bytes=0-65535' in ranges
+    assert 'bytes=262144-307199' in ranges
+
+
+def test_http_small_file_single_get(server, http_source, tmp_path):
+    dest = tmp_path / 'config.ini'
+    http_source.copy_file(f'{BUILD}/WindowsClient/data/config.ini', str(dest))
+
+    assert dest.read_bytes() == FILES['WindowsClient/data/config.ini']
+    assert [r[2] for r in server.gets('WindowsClient/data/config.ini')] == [None]
+
+
+def test_http_retries_server_error(server, http_source, tmp_path):
+    server.faults[f'builds/{BUILD}/WindowsServer/server.exe'] = ['error', 'error']
+    dest = tmp_path / 'server.exe'
+
+    http_source.copy_file(f'{BUILD}/WindowsServer/server.exe', str(dest))
+
+    assert dest.read_bytes() == FILES['WindowsServer/server.exe']
+    assert len(server.gets('WindowsServer/server.exe')) == 3
+
+
+def test_http_gives_up_after_retries(server, http_source, tmp_path):
+    server.faults[f'builds/{BUILD}/WindowsServer/server.exe'] = ['error'] * 10
+
+    with pytest.raises(Exception):
+        http_source.copy_file(f'{BUILD}/WindowsServer/server.exe', str(tmp_path / 'server.exe'))
+    assert len(server.gets('WindowsServer/server.exe')) == http_source.retries + 1
+
+
+def test_http_whole_download_resumes(server, http_source, tmp_path):
+    server.faults[f'builds/{BUILD}/WindowsServer/server.exe'] = ['truncate']
+    dest = tmp_path / 'server.exe'
+
+    copied = http_source.copy_file(f'{BUILD}/WindowsServer/server.exe', str(dest))
+
+    assert copied == 6000
+    assert dest.read_bytes() == FILES['WindowsServer/server.exe']
+    # 절반(3000바이트)에서 끊김 → 다 받은 쓰기 단위(1024 * 2) 다음부터 이어받기
+    assert [r[2] for r in server.gets('WindowsServer/server.exe')] == [None, 'bytes=2048-']
+
+
+def test_http_range_resumes(server, http_source, tmp_path):
+    server.faults[f'builds/{BUILD}/WindowsClient/game.exe'] = [None, 'truncate']
+    dest = tmp_path / 'game.exe'
+
+    http_source.copy_file(f'{BUILD}/WindowsClient/game.exe', str(dest))
+
+    assert dest.read_bytes() == FILES['WindowsClient/game.exe']
+    ranges = [r[2] for r in server.gets('WindowsClient/game.exe')]
+    # 두 번째로 도착한 Range가 절반에서 끊긴 뒤 남은 구간만 다시 요청
+    assert len(ranges) == 6
+    first, broken = ranges[1].split('=')[1].split('-')
+    resumed = f"bytes={int(first) + 32768}-{broken}"
+    assert ranges.count(resumed) == 1
+
+
+def test_path_source(path_root, tmp_path):
+    source = PathCopySource(str(path_root))
+
+    assert source.is_available()
+    assert source.list_builds() == [BUILD]
+    assert source.exists(f'{BUILD}/WindowsClient')
+    assert not source.exists(f'{BUILD}/MacClient')
+    dirs, files = source.list_tree(f'{BUILD}/WindowsClient')
+    assert sorted(dirs) == ['data', 'empty']
+    assert sorted(files) == [('data/config.ini', 16), ('game.exe', 300 * 1024)]
+
+    dest = tmp_path / 'config.ini'
+    assert source.copy_file(f'{BUILD}/WindowsClient/data/config.ini', str(dest)) == 16
+    assert dest.read_bytes() == FILES['WindowsClient/data/config.ini']
+
+
+def test_cache_source_fetches_once(server, http_source, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    cache_dir.mkdir()
+    source = CacheCopySource(str(cache_dir), http_source)
+    rel = f'{BUILD}/WindowsServer/server.exe'
+
+    source.list_tree(f'{BUILD}/WindowsServer')
+    source.copy_file(rel, str(tmp_path / 'first.exe'))
+    source.copy_file(rel, str(tmp_path / 'second.exe'))
+
+    assert (tmp_path / 'first.exe').read_bytes() == FILES['WindowsServer/server.exe']
+    assert (tmp_path / 'second.exe').read_bytes() == FILES['WindowsServer/server.exe']
+    assert (cache_dir / BUILD / 'WindowsServer' / 'server.exe').is_file()
+    # 두 번째 복사는 캐시에서 처리
+    assert len(server.gets('WindowsServer/server.exe')) == 1
+    assert source.list_builds() == [BUILD]
+
+
+def test_cache_source_refetches_wrong_size(server, http_source, tmp_path):
+    cache_file = tmp_path / 'cache' / BUILD / 'WindowsServer' / 'server.exe'
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_bytes(b'stale')
+    source = CacheCopySource(str(tmp_path / 'cache'), http_source)
+
+    source.list_tree(f'{BUILD}/WindowsServer')
+    source.copy_file(f'{BUILD}/WindowsServer/server.exe', str(tmp_path / 'out.exe'))
+
+    assert cache_file.read_bytes() == FILES['WindowsServer/server.exe']
+    assert len(server.gets('WindowsServer/server.exe')) == 1
+
+
+def test_cache_source_without_upstream(path_root):
+    source = CacheCopySource(str(path_root))
+
+    assert source.is_available()
+    assert source.list_builds() == [BUILD]
+    assert source.exists(f'{BUILD}/WindowsServer')
+
+
+@pytest.mark.parametrize('kind', ['path', 'http', 'cache'])
+def test_copy_build_end_to_end(kind, server, http_source, path_root, tmp_path):
+    if kind == 'path':
+        source = PathCopySource(str(path_root))
+    elif kind == 'http':
+        source = http_source
+    else:
+        (tmp_path / 'cache').mkdir()
+        source = CacheCopySource(str(tmp_path / 'cache'), http_source)
+    dest = tmp_path / 'mybuild'
+    dest.mkdir()
+
+    progress = []
+    result = copy_build(source, str(dest), BUILD, 'WindowsClient', max_workers=2,
+                        progress_callback=lambda *args: progress.append(args))
+
+    published = dest / BUILD / 'WindowsClient'
+    assert result.published
+    assert not result.failed_files
+    assert result.file_count == 2
+    assert result.bytes_copied == 300 * 1024 + 16
+    assert read_tree(published) == {
+        'game.exe': FILES['WindowsClient/game.exe'],
+        'data/config.ini': FILES['WindowsClient/data/config.ini'],
+    }
+    assert (published / 'empty').is_dir()
+    # 파일 복사 시작 알림 (소요 시간 기준) 후 파일마다
+    assert progress[0] == (0, 2, 0, 300 * 1024 + 16)
+    assert progress[-1] == (2, 2, 300 * 1024 + 16, 300 * 1024 + 16)
+    # 스테이징 폴더에는 아무것도 남지 않음
+    staging = dest / STAGING_DIR_NAME
+    assert not staging.exists() or os.listdir(staging) == []
+
+
+def test_copy_build_missing_folder(http_source, tmp_path):
+    with pytest.raises(Exception, match='does not exist'):
+        copy_build(http_source, str(tmp_path), BUILD, 'MacClient')
+
+
+def test_copy_build_failed_file_not_published(server, http_source, tmp_path):
+    server.faults[f'builds/{BUILD}/WindowsClient/data/config.ini'] = ['error'] * 10
+    existing = tmp_path / BUILD / 'WindowsClient'
+    existing.mkdir(parents=True)
+    (existing / 'game.exe').write_bytes(b'previous')
+
+    result = copy_build(http_source, str(tmp_path), BUILD, 'WindowsClient')
+
+    assert not result.published
+    assert result.failed_files == ['config.ini']
+    assert 'not published' in result.summary()
+    # 기존 폴더는 그대로, 스테이징 폴더는 정리
+    assert read_tree(existing) == {'game.exe': b'previous'}
+    assert os.listdir(tmp_path / STAGING_DIR_NAME) == []
@@ -0,0 +1,51 @@
+"""크론 표현식 테스트"""
+from datetime import datetime
+
+import pytest
+
+from core.cron import CronError, compile_cron
+
+
+def fires(expr, after, count):
+    cron = compile_cron(expr)
+    result = []
+    for _ in range(count):
+        after = cron.next_after(after)
+        result.append(after)
+    return result
+
+
+def test_every_twenty_minutes_on_weekdays():
+    # 2026-10-16 금요일 17:45 이후 → 다음 주 월요일 10:00
+    assert fires('0 */20 10-17 * * MON-FRI', datetime(2026, 10, 16, 17, 45), 2) == [
+        datetime(2026, 10, 19, 10, 0), datetime(2026, 10, 19, 10, 20)]
+
+
+def test_day_and_weekday_both_restricted_is_or():
+    # 매월 1일 또는 월요일
+    assert fires('0 9 1 * MON', datetime(2026, 10, 1, 10, 0), 3) == [
+        datetime(2026, 10, 5, 9, 0), datetime(2026, 10, 12, 9, 0), datetime(2026, 10, 19, 9, 0)]
+
+
+def test_star_step_day_counts_as_wildcard():
+    # Vixie cron: '*/2'로 시작하는 일 필드는 미지정 → 홀수 일 AND 월요일
+    assert fires('0 9 */2 * MON', datetime(2026, 10, 1, 10, 0), 3) == [
+        datetime(2026, 10, 5, 9, 0), datetime(2026, 10, 19, 9, 0), datetime(2026, 11, 9, 9, 0)]
+
+
+def test_star_step_weekday_counts_as_wildcard():
+    # 15일 AND 짝수 요일(일/화/목/토)
+    assert fires('0 9 15 * */2', datetime(2026, 10, 1), 2) == [
+        datetime(2026, 10, 15, 9, 0), datetime(2026, 11, 15, 9, 0)]
+
+
+def test_range_step_day_is_restriction():
+    # '1-31/2'는 '*'로 시작하지 않으므로 지정된 것 → 홀수 일 OR 월요일
+    assert fires('0 9 1-31/2 * MON', datetime(2026, 10, 1, 10, 0), 3) == [
+        datetime(2026, 10, 3, 9, 0), datetime(2026, 10, 5, 9, 0), datetime(2026, 10, 7, 9, 0)]
+
+
+@pytest.mark.parametrize('expr', ['* * *', '61 * * * *', '*/0 * * * *', '0 9 * * FUNDAY'])
+def test_invalid_expressions(expr):
+    with pytest.raises(CronError):
+        compile_cron(expr)
@@ -0,0 +1,164 @@
+"""run_all 누락 실행이 앞 실행이 끝난 뒤 하나씩 실행되는지 확인 (헤드리스 데몬)"""
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.daemon import DaemonLog, ScheduleDaemon
+from core.schedule_queue import MISFIRE_RUN_ALL, MISFIRE_RUN_ONCE, ScheduleQueue
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+@pytest.fixture(params=['local', 'coordinated'])
+def daemon(request, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    settings = {'job_store_enabled': False, 'history_enabled': False}
+    if request.param == 'coordinated':
+        settings.update(coordination_enabled=True, coordination_store=str(tmp_path / 'locks'),
+                        coordination_claim_grace=0)
+    (tmp_path / 'settings.json').write_text(json.dumps(settings), encoding='utf-8')
+    daemon = ScheduleDaemon(DaemonLog(str(tmp_path / 'log')))
+    yield daemon
+    daemon.stop()
+
+
+class FakeJobs:
+    """prepare_run 대체 - 실행마다 기록하고 release 될 때까지 작업 스레드를 붙잡음"""
+
+    def __init__(self):
+        self.started = []
+        self.active = 0
+        self.max_active = 0
+        self.gates = []
+        self.lock = threading.Lock()
+
+    def prepare_run(self, schedule, detected_build='', resume=None):
+        gate = threading.Event()
+        self.gates.append(gate)
+
+        def task():
+            with self.lock:
+                self.started.append(schedule['id'])
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            gate.wait(5)
+            with self.lock:
+                self.active -= 1
+            return '완료'
+        return task, []
+
+    def release_next(self):
+        for gate in self.gates:
+            if not gate.is_set():
+                gate.set()
+                return
+
+
+def load(daemon, policy, minutes_behind):
+    """매분 실행하는 cron 스케줄을 minutes_behind분 전부터 확인하지 않은 상태로 등록"""
+    schedule = {'id': 'sched-1', 'name': '매분 복사', 'enabled': True, 'repeat_type': 'cron',
+                'cron': '0 * * * * *', 'option': '클라복사', 'misfire_policy': policy}
+    daemon.schedule_mgr.save_schedules([schedule])
+    daemon.queue = ScheduleQueue(evaluated_at=datetime.now() - timedelta(minutes=minutes_behind))
+    daemon.queue.rebuild(daemon.schedule_mgr.load_schedules())
+    daemon.queue_version = daemon.schedule_mgr.get_version()
+
+
+def test_run_all_catchups_run_one_after_another(daemon):
+    jobs = FakeJobs()
+    daemon.runner.prepare_run = jobs.prepare_run
+    load(daemon, MISFIRE_RUN_ALL, minutes_behind=3)
+
+    daemon.check_schedules()
+
+    # 3~4개 실행 시각 중 첫 실행만 시작, 나머지는 밀린 실행으로 보관
+    assert wait_until(lambda: len(jobs.started) == 1)
+    pending = len(daemon.catchup)
+    assert pending >= 2
+
+    for expected in range(2, pending + 2):
+        jobs.release_next()
+        assert wait_until(lambda: len(jobs.started) == expected)
+    jobs.release_next()
+    assert wait_until(lambda: not daemon.running)
+
+    assert len(daemon.catchup) == 0
+    assert jobs.max_active == 1
+    assert [r['success'] for r in daemon.recent] == [True] * (pending + 1)
+    if daemon.coordinator is not None:
+        # 실행 시각마다 임대를 잡고 모두 done으로 끝냄
+        assert daemon.coordinator.held_keys() == []
+        assert daemon.coordinator.pending_keys() == []
+        leases_dir = os.path.join(daemon.config_mgr.get_setting('coordination_store'), 'leases')
+        states = [json.load(open(os.path.join(leases_dir, name), encoding='utf-8')).get('state')
+                  for name in os.listdir(leases_dir)]
+        assert states == ['done'] * (pending + 1)
+
+
+def test_run_all_catchups_survive_duplicate_window(daemon):
+    # 앞 실행이 바로 끝나도 (중복 실행 방지 간격 안) 밀린 실행이 버려지지 않음
+    jobs = FakeJobs()
+    daemon.runner.prepare_run = jobs.prepare_run
+    load(daemon, MISFIRE_RUN_ALL, minutes_behind=2)
+
+    daemon.check_schedules()
+    pending = len(daemon.catchup)
+    for _ in range(pending + 1):
+        jobs.release_next()
+        time.sleep(0.05)
+        jobs.release_next()
+
+    assert wait_until(lambda: len(jobs.started) == pending + 1 and not daemon.running)
+    assert len(daemon.catchup) == 0
+
+
+def test_run_once_merges_missed_runs(daemon):
+    jobs = FakeJobs()
+    daemon.runner.prepare_run = jobs.prepare_run
+    load(daemon, MISFIRE_RUN_ONCE, minutes_behind=3)
+
+    daemon.check_schedules()
+    jobs.release_next()
+
+    assert wait_until(lambda: len(jobs.started) == 1 and not daemon.running)
+    assert len(daemon.catchup) == 0
+
+
+def test_catchups_dropped_when_schedule_removed(daemon):
+    jobs = FakeJobs()
+    daemon.runner.prepare_run = jobs.prepare_run
+    load(daemon, MISFIRE_RUN_ALL, minutes_behind=3)
+    daemon.check_schedules()
+    assert len(daemon.catchup) >= 2
+
+    daemon.schedule_mgr.save_schedules([])
+    daemon.check_schedules()
+    jobs.release_next()
+
+    assert wait_until(lambda: not daemon.running)
+    assert len(daemon.catchup) == 0
+    assert len(jobs.started) == 1
+
+
+def test_schedule_holding_resources_is_busy(daemon):
+    # 작업이 끝나 running에서 빠졌지만 아직 자원을 반환하지 않은 순간 - 다시 제출하지 않음
+    jobs = FakeJobs()
+    daemon.runner.prepare_run = jobs.prepare_run
+    load(daemon, MISFIRE_RUN_ONCE, minutes_behind=0)
+    schedule = daemon.schedule_mgr.load_schedules()[0]
+    daemon.executor.submit('sched-1', [], lambda: None)
+
+    assert daemon.is_busy('sched-1')
+    assert daemon.execute_schedule(schedule) is False
+    assert jobs.started == []
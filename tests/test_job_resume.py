@@ -0,0 +1,111 @@
+"""앱이 중간에 종료된 다단계 작업의 재개 확인 (JobStore 기록 기준)"""
+import pytest
+
+from core.config_manager import ConfigManager
+from core.job_runner import JobRunner
+from core.job_store import JOB_INTERRUPTED, JobStore
+from core.pipeline import STAGE_DONE, STAGE_RUNNING, PipelineError
+from core.run_history import RUN_DONE, RUN_FAILED, RUN_RUNNING, RunHistory
+
+SCHEDULE = {'id': 'sched-1', 'name': '업로드 후 패치', 'enabled': True,
+            'option': '서버업로드및패치', 'awsurl': 'https://example.invalid/build', 'patch_delay': 0}
+
+
+@pytest.fixture
+def restart(tmp_path):
+    """앱 재시작 - 같은 DB를 새 프로세스로 연 것처럼 JobStore/RunHistory/JobRunner 생성"""
+    config_mgr = ConfigManager(str(tmp_path / 'config.json'), str(tmp_path / 'settings.json'))
+    generation = iter(range(1, 100))
+    runners = []
+
+    def start():
+        if runners:
+            # 이전 프로세스가 남긴 실행 기록까지 DB에 쓰인 상태
+            runners[-1].history.flush()
+        store = JobStore(str(tmp_path / 'jobs.db'))
+        # 같은 PID라도 시작 시각이 다르면 이전 프로세스 작업은 종료된 것으로 판단
+        store.pid_started = -next(generation)
+        runner = JobRunner(config_mgr, log=lambda message: None, job_store=store,
+                           history=RunHistory(str(tmp_path / 'run_history.db')))
+        runners.append(runner)
+        return runner
+    yield start
+    for runner in runners:
+        runner.history.close()
+        runner.jobs.close()
+
+
+def run_until_crash(runner, resume, finished_stages):
+    """작업을 시작해 finished_stages까지 완료하고 (종료 기록 없이) 멈춤"""
+    runner.begin_job(SCHEDULE, resume=resume)
+    runner.job_started(SCHEDULE['id'])
+    job_id = runner.active_jobs[SCHEDULE['id']]
+    recorder = runner.active_runs[SCHEDULE['id']]
+    for stage_id in finished_stages:
+        runner.jobs.set_stage(job_id, stage_id, STAGE_RUNNING)
+        recorder.stage_started(stage_id)
+        runner.jobs.set_stage(job_id, stage_id, STAGE_DONE)
+        recorder.stage_finished(stage_id, RUN_DONE)
+    # 다음 단계 실행 중에 종료
+    recorder.stage_started('next')
+    return job_id
+
+
+def test_resumed_job_keeps_completed_stages_after_second_crash(restart):
+    first = restart()
+    first_id = run_until_crash(first, None, ['upload'])
+
+    second = restart()
+    [(schedule, resume)] = second.recover_jobs()
+    assert resume['job_id'] == first_id
+    assert resume['completed'] == ['upload']
+    second_id = run_until_crash(second, resume, ['wait'])
+
+    # 재개한 작업이 다시 중단돼도 첫 작업에서 끝낸 업로드를 다시 하지 않음
+    third = restart()
+    [(schedule, resume)] = third.recover_jobs()
+    assert schedule['id'] == SCHEDULE['id']
+    assert resume['job_id'] == second_id
+    assert resume['completed'] == ['upload', 'wait']
+    assert third.jobs.get(second_id)['state'] == JOB_INTERRUPTED
+
+
+def test_interrupted_runs_closed_in_history(restart):
+    first = restart()
+    resumed_id = run_until_crash(first, None, ['upload'])
+    first.begin_job(dict(SCHEDULE, id='sched-2', option='클라복사'))
+    first.job_started('sched-2')
+    failed_id = first.active_jobs['sched-2']
+
+    second = restart()
+    second.recover_jobs()
+    second.history.flush()
+
+    runs = {run['run_id']: run for run in second.history.recent_runs()}
+    assert runs[resumed_id]['status'] == RUN_FAILED
+    assert '재개' in runs[resumed_id]['failure_reason']
+    assert runs[failed_id]['status'] == RUN_FAILED
+    assert runs[failed_id]['failure_reason'] == second.jobs.get(failed_id)['message']
+    assert all(run['ended_at'] for run in runs.values())
+    # 실행 중이던 단계도 실패로 마감, 끝난 단계는 그대로
+    stages = {stage['stage_id']: stage['status'] for stage in second.history.stages_of(resumed_id)}
+    assert stages == {'upload': RUN_DONE, 'next': RUN_FAILED}
+    assert RUN_RUNNING not in [run['status'] for run in runs.values()]
+
+
+def test_upload_and_patch_without_awsurl_rejected_before_upload(restart):
+    # 업로드하고 대기가 끝난 뒤에야 패치 단계에서 실패하지 않도록 실행 전에 거부
+    runner = restart()
+    with pytest.raises(PipelineError):
+        runner.prepare_run(dict(SCHEDULE, awsurl=''))
+    with pytest.raises(PipelineError):
+        runner.prepare_run({'id': 'sched-2', 'name': '단계 지정', 'stages': [
+            {'id': 'upload', 'option': '서버업로드'},
+            {'id': 'patch', 'option': '서버패치', 'after': ['upload']},
+        ]})
+    # 단계에 awsurl을 지정하면 실행
+    task, resources = runner.prepare_run({'id': 'sched-2', 'name': '단계 지정', 'stages': [
+        {'id': 'upload', 'option': '서버업로드'},
+        {'id': 'patch', 'option': '서버패치', 'after': ['upload'], 'awsurl': 'https://example.invalid/qa'},
+    ]})
+    assert callable(task) and resources == []
@@ -0,0 +1,73 @@
+"""미러 선택 테스트"""
+import pytest
+
+from core import mirror_selector
+from core.copy_engine import copy_build
+from core.copy_sources import CacheCopySource, PathCopySource
+from core.mirror_selector import MIRROR_MODE_FASTEST, MIRROR_MODE_STRIPE, select_mirror_source
+
+
+BUILD = 'CompileBuild_DEV_game_SEL_271167_r306671'
+
+
+@pytest.fixture(autouse=True)
+def no_selection_log(monkeypatch):
+    monkeypatch.setattr(mirror_selector, 'log_mirror_selection', lambda record: None)
+
+
+def make_share(root):
+    folder = root / BUILD / 'WindowsClient'
+    folder.mkdir(parents=True)
+    (folder / 'game.exe').write_bytes(b'x' * 4096)
+    return str(root)
+
+
+@pytest.mark.parametrize('mode', [MIRROR_MODE_FASTEST, MIRROR_MODE_STRIPE])
+def test_cache_primary_is_not_modified(mode, tmp_path):
+    upstream = PathCopySource(make_share(tmp_path / 'primary'))
+    mirror = make_share(tmp_path / 'mirror')
+    cache = CacheCopySource(str(tmp_path / 'cache'), upstream)
+
+    selected = select_mirror_source(cache, [mirror], f'{BUILD}/WindowsClient', mode)
+
+    assert cache.upstream is upstream
+    assert isinstance(selected, CacheCopySource)
+    assert selected.root == cache.root
+    if selected is not cache:
+        assert selected.upstream is not upstream
+
+
+def test_without_mirrors_returns_primary(tmp_path):
+    cache = CacheCopySource(str(tmp_path / 'cache'), PathCopySource(make_share(tmp_path / 'primary')))
+
+    assert select_mirror_source(cache, [], f'{BUILD}/WindowsClient') is cache
+
+
+class ClosablePathSource(PathCopySource):
+    """close 후 사용하면 실패하는 경로 소스 (HTTP 세션처럼)"""
+
+    closed = False
+
+    def copy_file(self, rel_file, dest_file):
+        assert not self.closed, '닫힌 소스 사용'
+        return super().copy_file(rel_file, dest_file)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize('cached', [False, True])
+def test_stripe_copy_keeps_primary_open(cached, tmp_path):
+    upstream = ClosablePathSource(make_share(tmp_path / 'primary'))
+    mirror = make_share(tmp_path / 'mirror')
+    primary = CacheCopySource(str(tmp_path / 'cache'), upstream) if cached else upstream
+
+    for dest in (tmp_path / 'first', tmp_path / 'second'):
+        dest.mkdir()
+        # 호출한 쪽이 주 소스를 다음 복사에 다시 사용
+        result = copy_build(primary, str(dest), BUILD, 'WindowsClient', max_workers=1,
+                            mirror_roots=[mirror], mirror_mode=MIRROR_MODE_STRIPE)
+        assert result.published
+        assert not upstream.closed
+    primary.close()
+    assert upstream.closed
@@ -0,0 +1,79 @@
+"""스테이징/게시 테스트"""
+import os
+import time
+
+import pytest
+
+from core import staging
+from core.staging import RETIRED_MARKER, STAGING_DIR_NAME, StagedBuild
+
+
+BUILD = 'CompileBuild_DEV_game_SEL_271167_r306671'
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def stage(dest, content, target='WindowsClient'):
+    staged = StagedBuild(str(dest), BUILD, target)
+    os.makedirs(staged.path, exist_ok=True)
+    with open(os.path.join(staged.path, 'game.exe'), 'wb') as f:
+        f.write(content)
+    return staged
+
+
+def test_publish_new_build(tmp_path):
+    final = stage(tmp_path, b'new').publish()
+
+    assert final == str(tmp_path / BUILD / 'WindowsClient')
+    assert (tmp_path / BUILD / 'WindowsClient' / 'game.exe').read_bytes() == b'new'
+    assert os.listdir(tmp_path / STAGING_DIR_NAME) == []
+
+
+def test_publish_replaces_and_retires_in_background(tmp_path):
+    stage(tmp_path, b'old').publish()
+    (tmp_path / BUILD / 'WindowsServer').mkdir()
+
+    stage(tmp_path, b'new').publish()
+
+    assert (tmp_path / BUILD / 'WindowsClient' / 'game.exe').read_bytes() == b'new'
+    assert (tmp_path / BUILD / 'WindowsServer').is_dir()
+    assert wait_until(lambda: os.listdir(tmp_path / STAGING_DIR_NAME) == [])
+
+
+def test_publish_restores_existing_when_rename_fails(tmp_path, monkeypatch):
+    stage(tmp_path, b'old').publish()
+    staged = stage(tmp_path, b'new')
+    real_rename = os.rename
+
+    def rename(src, dst):
+        # 기존 폴더를 치운 뒤 새 폴더를 옮기는 rename만 실패
+        if src == staged.path:
+            raise PermissionError('locked')
+        real_rename(src, dst)
+
+    monkeypatch.setattr(staging.os, 'rename', rename)
+    with pytest.raises(PermissionError):
+        staged.publish()
+
+    assert (tmp_path / BUILD / 'WindowsClient' / 'game.exe').read_bytes() == b'old'
+
+
+def test_purge_stale_removes_leftover_retired(tmp_path):
+    root = tmp_path / STAGING_DIR_NAME
+    leftover = root / f'WindowsClient{RETIRED_MARKER}1234_1_1'
+    (leftover / 'data').mkdir(parents=True)
+    (leftover / 'data' / 'file.bin').write_bytes(b'x')
+    fresh = root / f'{BUILD}.1234_1_2'
+    fresh.mkdir()
+
+    StagedBuild.purge_stale(str(root))
+
+    assert wait_until(lambda: not leftover.exists())
+    assert fresh.is_dir()
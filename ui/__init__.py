@@ -4,6 +4,7 @@ from .schedule_item_widget import ScheduleItemWidget
 from .settings_dialog import SettingsDialog
 from .slack_token_dialog import AddSlackItemDialog, SlackTokenManager
 from .deploy_dialog import DeployDialog
+from .build_browser_dialog import BuildBrowserDialog
 
-__all__ = ['ScheduleDialog', 'ScheduleItemWidget', 'SettingsDialog', 'AddSlackItemDialog', 'SlackTokenManager', 'DeployDialog']
+__all__ = ['ScheduleDialog', 'ScheduleItemWidget', 'SettingsDialog', 'AddSlackItemDialog', 'SlackTokenManager', 'DeployDialog', 'BuildBrowserDialog']
 
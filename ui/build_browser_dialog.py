@@ -0,0 +1,122 @@
+"""
+빌드 브라우저 다이얼로그 - 로컬 빌드 카탈로그(SQLite) 조회
+"""
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QAbstractItemView, QApplication, QCheckBox)
+from PyQt5.QtCore import Qt, QTimer
+from datetime import datetime
+
+from core.build_catalog import BuildCatalog
+
+
+class BuildBrowserDialog(QDialog):
+    """카탈로그에 저장된 빌드 목록 검색 (SMB 접근 없음)"""
+
+    COLUMNS = ['빌드명', '타입', '브랜치', 'CL', '리비전', '수정 시간', '크기(GB)', '파일 수', 'version.txt']
+
+    def __init__(self, catalog: BuildCatalog, root: str, scanner=None, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.root = root
+        self.scanner = scanner
+
+        # 입력 중 과도한 조회 방지 (디바운스)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self.refresh_table)
+
+        self.init_ui()
+        self.refresh_table()
+
+    def init_ui(self):
+        """UI 초기화"""
+        self.setWindowTitle("빌드 브라우저")
+        self.setMinimumWidth(1000)
+        self.setMinimumHeight(600)
+
+        layout = QVBoxLayout()
+
+        # 검색
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(QLabel("검색:"))
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("빌드명 키워드 (공백으로 여러 개, 모두 포함)")
+        self.search_edit.textChanged.connect(lambda: self.search_timer.start(200))
+        search_layout.addWidget(self.search_edit)
+
+        self.version_only_check = QCheckBox("version.txt 있는 빌드만")
+        self.version_only_check.stateChanged.connect(self.refresh_table)
+        search_layout.addWidget(self.version_only_check)
+
+        self.rescan_button = QPushButton("다시 스캔")
+        self.rescan_button.setEnabled(self.scanner is not None)
+        self.rescan_button.clicked.connect(self.request_rescan)
+        search_layout.addWidget(self.rescan_button)
+        layout.addLayout(search_layout)
+
+        # 목록
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.cellDoubleClicked.connect(self.copy_build_name)
+        layout.addWidget(self.table)
+
+        # 상태
+        bottom_layout = QHBoxLayout()
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #888888;")
+        bottom_layout.addWidget(self.status_label)
+        bottom_layout.addStretch()
+        close_button = QPushButton("닫기")
+        close_button.clicked.connect(self.accept)
+        bottom_layout.addWidget(close_button)
+        layout.addLayout(bottom_layout)
+
+        self.setLayout(layout)
+
+    def refresh_table(self):
+        """카탈로그 조회 후 표 갱신"""
+        keywords = self.search_edit.text().split()
+        rows = self.catalog.query(self.root, keywords, limit=1000,
+                                  require_version=self.version_only_check.isChecked())
+
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(rows))
+        for i, row in enumerate(rows):
+            values = [
+                row['name'],
+                row['build_type'] or '',
+                row['branch'] or '',
+                row['changelist'] or 0,
+                row['revision'] or 0,
+                datetime.fromtimestamp(row['mtime']).strftime('%Y-%m-%d %H:%M') if row['mtime'] else '',
+                round((row['total_bytes'] or 0) / (1024 ** 3), 2),
+                row['file_count'] or 0,
+                '✅' if row['has_version'] else '',
+            ]
+            for col, value in enumerate(values):
+                item = QTableWidgetItem()
+                item.setData(Qt.DisplayRole, value)
+                self.table.setItem(i, col, item)
+        self.table.setSortingEnabled(True)
+
+        last = self.catalog.last_scanned(self.root)
+        last_text = datetime.fromtimestamp(last).strftime('%H:%M:%S') if last else '스캔 기록 없음'
+        self.status_label.setText(f"{len(rows)}개 · {self.root} · 마지막 스캔: {last_text} · 더블클릭하면 빌드명 복사")
+
+    def request_rescan(self):
+        """백그라운드 스캐너에 즉시 스캔 요청"""
+        if self.scanner is not None:
+            self.scanner.scan_now()
+            self.status_label.setText("스캔 요청됨... 잠시 후 새로고침됩니다")
+            QTimer.singleShot(3000, self.refresh_table)
+
+    def copy_build_name(self, row: int, column: int):
+        item = self.table.item(row, 0)
+        if item:
+            QApplication.clipboard().setText(item.text())
+            self.status_label.setText(f"복사됨: {item.text()}")
@@ -3,12 +3,80 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdi
                              QPushButton, QComboBox, QTimeEdit, QCheckBox, QGroupBox,
                              QRadioButton, QButtonGroup, QMessageBox, QFormLayout, QFileDialog,
                              QSpinBox)
-from PyQt5.QtCore import QTime, Qt
+from PyQt5.QtCore import QTime, Qt, QThread, QTimer, pyqtSignal
 from typing import Dict, Any, Optional, List
+import bisect
 import json
 import os
 from datetime import datetime
 from ui.slack_token_dialog import AddSlackItemDialog, SlackTokenManager
+from core.build_catalog import peek_build_catalog
+from core.build_index import get_build_index
+from core.build_name import revision_of
+from core.build_token_index import split_keywords
+from core.build_watcher import REPEAT_TYPE_NEW_BUILD
+from core.cron import REPEAT_TYPE_CRON, CronError, compile_cron
+from core.copy_sources import (SOURCE_TYPE_PATH, SOURCE_TYPE_HTTP, SOURCE_TYPE_CACHE,
+                               create_copy_source)
+from core.mirror_selector import MIRROR_MODE_FASTEST, MIRROR_MODE_STRIPE, parse_mirror_roots
+from core.schedule_queue import (DEFAULT_MISFIRE_GRACE_MINUTES, MISFIRE_RUN_ALL, MISFIRE_RUN_ONCE,
+                                 MISFIRE_SKIP)
+
+
+# 빌드 목록 조회 중 새로고침 버튼에 표시할 스피너 프레임
+SPINNER_FRAMES = ['◐', '◓', '◑', '◒']
+
+# Prefix 입력 후 실시간 검색까지 대기 시간 (ms)
+LIVE_SEARCH_DELAY_MS = 300
+
+
+class BuildListThread(QThread):
+    """빌드 목록 조회 워커 스레드 (찾은 빌드를 묶음 단위로 전달)"""
+    found = pyqtSignal(list)  # Prefix가 포함된 빌드명 묶음
+    done = pyqtSignal(bool, str)  # (success, message)
+    
+    # 실행 중인 스레드 참조 유지 (다이얼로그가 먼저 닫혀도 스레드 객체가 해제되지 않도록)
+    _running = set()
+    
+    def __init__(self, src_path: str, source_type: str, cache_path: str, prefix: str,
+                 force: bool = True):
+        super().__init__()
+        self.src_path = src_path
+        self.source_type = source_type
+        self.cache_path = cache_path
+        self.prefix = prefix
+        self.keywords = split_keywords(prefix) or [prefix]
+        self.force = force
+    
+    def start(self):
+        BuildListThread._running.add(self)
+        self.finished.connect(lambda: BuildListThread._running.discard(self))
+        super().start()
+    
+    def run(self):
+        try:
+            if self.source_type == SOURCE_TYPE_PATH and not os.path.isdir(self.src_path):
+                self.done.emit(False, f"소스 경로가 존재하지 않습니다: {self.src_path}")
+                return
+            
+            # 최근 스캔된 카탈로그가 있으면 DB 조회, 없으면 공유 목록 캐시
+            catalog = peek_build_catalog()
+            if self.source_type == SOURCE_TYPE_PATH and catalog is not None and catalog.is_fresh(self.src_path):
+                self.found.emit([row['name'] for row in catalog.query(self.src_path, self.keywords)])
+            else:
+                def on_names(names):
+                    matching = [name for name in names if all(k in name for k in self.keywords)]
+                    if matching:
+                        self.found.emit(matching)
+                
+                source = create_copy_source(self.source_type, self.src_path, self.cache_path)
+                try:
+                    get_build_index().get_builds(self.src_path, source, force=self.force, on_names=on_names)
+                finally:
+                    source.close()
+            self.done.emit(True, "")
+        except Exception as e:
+            self.done.emit(False, f"빌드 목록 새로고침 오류: {e}")
 
 
 class ScheduleDialog(QDialog):
@@ -35,6 +103,17 @@ class ScheduleDialog(QDialog):
         self.is_edit_mode = schedule is not None
         self.parent_window = parent  # 부모 윈도우 참조 저장 (find_latest_build 사용)
         
+        # 빌드 목록 백그라운드 조회 상태
+        self.list_thread: Optional[BuildListThread] = None
+        self.list_keys: List[tuple] = []  # 드롭다운 항목 정렬 키 (최신순)
+        self.list_select_latest = False
+        self.spinner_index = 0
+        self.spinner_timer = QTimer(self)
+        self.spinner_timer.timeout.connect(self.advance_spinner)
+        self.live_search_timer = QTimer(self)
+        self.live_search_timer.setSingleShot(True)
+        self.live_search_timer.timeout.connect(self.live_search_builds)
+        
         self.setWindowTitle("스케줄 편집" if self.is_edit_mode else "스케줄 생성")
         self.setModal(True)
         self.setMinimumWidth(550)
@@ -135,6 +214,35 @@ class ScheduleDialog(QDialog):
         self.repeat_group.addButton(self.weekly_radio, 2)
         layout.addWidget(self.weekly_radio)
         
+        self.new_build_radio = QRadioButton("새 빌드 감지 (Prefix와 일치하는 새 빌드가 올라오면 실행)")
+        self.new_build_radio.setToolTip("실행 시간 대신 소스 경로에 새 빌드가 준비되면 바로 실행합니다.\n"
+                                        "빌드 설정의 Prefix가 필요합니다.")
+        self.repeat_group.addButton(self.new_build_radio, 3)
+        layout.addWidget(self.new_build_radio)
+        self.new_build_radio.toggled.connect(self.on_time_mode_changed)
+        
+        # 크론 표현식 (초 단위, 구간/간격 반복)
+        cron_layout = QHBoxLayout()
+        self.cron_radio = QRadioButton("크론 표현식:")
+        self.repeat_group.addButton(self.cron_radio, 4)
+        cron_layout.addWidget(self.cron_radio)
+        self.cron_edit = QLineEdit()
+        self.cron_edit.setPlaceholderText("예: 0 */20 10-17 * * MON-FRI")
+        self.cron_edit.setToolTip(
+            "[초] 분 시 일 월 요일 (초는 생략 가능)\n"
+            "예: 0 */20 10-17 * * MON-FRI → 평일 10:00~17:40 20분마다\n"
+            "예: 15 30 * * * * → 매시 30분 15초\n"
+            "예: 0 9 * * 1 → 매주 월요일 09:00"
+        )
+        self.cron_edit.setEnabled(False)
+        self.cron_edit.textChanged.connect(self.update_cron_preview)
+        cron_layout.addWidget(self.cron_edit)
+        layout.addLayout(cron_layout)
+        self.cron_preview_label = QLabel("")
+        self.cron_preview_label.setStyleSheet("color: #888888;")
+        layout.addWidget(self.cron_preview_label)
+        self.cron_radio.toggled.connect(self.on_time_mode_changed)
+        
         # 요일 선택 (주간 반복용)
         weekday_layout = QHBoxLayout()
         weekday_layout.addWidget(QLabel("반복 요일:"))
@@ -158,6 +266,27 @@ class ScheduleDialog(QDialog):
         self.weekly_radio.toggled.connect(self.on_weekly_toggled)
         #
         
+        # 실행 시각을 놓쳤을 때 (PC 절전, 앱 응답 없음 등)
+        misfire_layout = QHBoxLayout()
+        misfire_layout.addWidget(QLabel("놓친 실행:"))
+        self.misfire_policy_combo = QComboBox()
+        self.misfire_policy_combo.addItem("한 번만 실행", MISFIRE_RUN_ONCE)
+        self.misfire_policy_combo.addItem("놓친 횟수만큼 모두 실행", MISFIRE_RUN_ALL)
+        self.misfire_policy_combo.addItem("지정 시간보다 늦으면 건너뜀", MISFIRE_SKIP)
+        self.misfire_policy_combo.setToolTip("PC 절전/앱 응답 없음 등으로 실행 시각을 놓쳤을 때의 처리")
+        misfire_layout.addWidget(self.misfire_policy_combo)
+        self.misfire_grace_spinbox = QSpinBox()
+        self.misfire_grace_spinbox.setRange(0, 1440)
+        self.misfire_grace_spinbox.setValue(DEFAULT_MISFIRE_GRACE_MINUTES)
+        self.misfire_grace_spinbox.setSuffix("분")
+        self.misfire_grace_spinbox.setEnabled(False)
+        misfire_layout.addWidget(self.misfire_grace_spinbox)
+        misfire_layout.addStretch()
+        self.misfire_policy_combo.currentIndexChanged.connect(
+            lambda: self.misfire_grace_spinbox.setEnabled(self.misfire_policy_combo.currentData() == MISFIRE_SKIP))
+        layout.addLayout(misfire_layout)
+        self.new_build_radio.toggled.connect(lambda checked: self.misfire_policy_combo.setEnabled(not checked))
+        
         group.setLayout(layout)
         return group
     
@@ -179,6 +308,50 @@ class ScheduleDialog(QDialog):
         src_layout.addWidget(src_browse_btn)
         layout.addRow("소스 경로:", src_layout)
         
+        # 소스 유형 (복사 소스 백엔드)
+        self.source_type_combo = QComboBox()
+        self.source_type_combo.addItem("경로 (SMB/로컬)", SOURCE_TYPE_PATH)
+        self.source_type_combo.addItem("HTTP 아티팩트", SOURCE_TYPE_HTTP)
+        self.source_type_combo.addItem("로컬 캐시", SOURCE_TYPE_CACHE)
+        self.source_type_combo.setToolTip(
+            "경로: 소스 경로의 폴더에서 직접 복사\n"
+            "HTTP 아티팩트: 소스 경로에 아티팩트 URL 입력 (병렬 Range 다운로드)\n"
+            "로컬 캐시: 캐시 폴더 우선 사용, 없는 파일만 소스 경로에서 받아옴"
+        )
+        self.source_type_combo.currentIndexChanged.connect(self.on_source_type_changed)
+        layout.addRow("소스 유형:", self.source_type_combo)
+        
+        # 로컬 캐시 경로 (로컬 캐시 유형 전용)
+        cache_layout = QHBoxLayout()
+        self.cache_path_edit = QLineEdit()
+        self.cache_path_edit.setPlaceholderText("C:/buildcache")
+        self.cache_path_edit.setEnabled(False)
+        cache_layout.addWidget(self.cache_path_edit)
+        
+        self.cache_browse_btn = QPushButton("...")
+        self.cache_browse_btn.setFixedWidth(30)
+        self.cache_browse_btn.setEnabled(False)
+        self.cache_browse_btn.clicked.connect(self.browse_cache_path)
+        cache_layout.addWidget(self.cache_browse_btn)
+        layout.addRow("캐시 경로:", cache_layout)
+        
+        # 미러 경로 (여러 소스 중 측정 후 선택)
+        mirror_layout = QHBoxLayout()
+        self.mirror_paths_edit = QLineEdit()
+        self.mirror_paths_edit.setPlaceholderText(r"예: \\mirror-nas\PBB\Builds;\\teammate-pc\Builds")
+        self.mirror_paths_edit.setToolTip(
+            "소스 경로 외에 같은 빌드를 받을 수 있는 경로/URL\n"
+            "세미콜론(;)으로 구분하여 여러 개 입력\n"
+            "복사 전 각 경로의 조회 지연과 읽기 속도를 측정합니다."
+        )
+        mirror_layout.addWidget(self.mirror_paths_edit)
+        
+        self.mirror_mode_combo = QComboBox()
+        self.mirror_mode_combo.addItem("가장 빠른 미러", MIRROR_MODE_FASTEST)
+        self.mirror_mode_combo.addItem("여러 미러 분산", MIRROR_MODE_STRIPE)
+        mirror_layout.addWidget(self.mirror_mode_combo)
+        layout.addRow("미러 경로:", mirror_layout)
+        
         # 로컬 저장 경로
         dest_layout = QHBoxLayout()
         self.dest_path_edit = QLineEdit()
@@ -228,7 +401,8 @@ class ScheduleDialog(QDialog):
         
         # Prefix (빌드명 필터) - 항상 활성화
         self.prefix_edit = QLineEdit()
-        self.prefix_edit.setPlaceholderText("예: game_SEL, game_progression")
+        self.prefix_edit.setPlaceholderText("예: game_SEL, game_progression (;로 구분하면 모두 포함)")
+        self.prefix_edit.textChanged.connect(lambda: self.live_search_timer.start(LIVE_SEARCH_DELAY_MS))
         layout.addRow("Prefix:", self.prefix_edit)
 
         # 빌드명 드롭다운 + 새로고침 (우측에 배치)
@@ -246,6 +420,11 @@ class ScheduleDialog(QDialog):
         
         layout.addRow("빌드명:", buildname_layout)
         
+        # 빌드 목록 조회 상태 (완료/오류 메시지 박스 대신 표시)
+        self.build_list_status = QLabel("")
+        self.build_list_status.setStyleSheet("color: #888888;")
+        layout.addRow("", self.build_list_status)
+        
         group.setLayout(layout)
         return group
     
@@ -256,6 +435,18 @@ class ScheduleDialog(QDialog):
         if path:
             self.src_path_edit.setText(path)
     
+    def browse_cache_path(self):
+        """로컬 캐시 경로 찾아보기"""
+        path = QFileDialog.getExistingDirectory(self, "캐시 경로 선택", self.cache_path_edit.text())
+        if path:
+            self.cache_path_edit.setText(path)
+    
+    def on_source_type_changed(self):
+        """소스 유형 변경 시 캐시 경로 활성화/비활성화"""
+        is_cache = self.source_type_combo.currentData() == SOURCE_TYPE_CACHE
+        self.cache_path_edit.setEnabled(is_cache)
+        self.cache_browse_btn.setEnabled(is_cache)
+    
     def browse_dest_path(self):
         """로컬 경로 찾아보기"""
         current_path = self.dest_path_edit.text() or self.default_dest_path
@@ -693,6 +884,30 @@ class ScheduleDialog(QDialog):
         
         return layout
     
+    def on_time_mode_changed(self):
+        """새 빌드 감지/크론은 실행 시간 입력 대신 각자의 조건으로 실행"""
+        self.time_edit.setEnabled(not (self.new_build_radio.isChecked() or self.cron_radio.isChecked()))
+        self.cron_edit.setEnabled(self.cron_radio.isChecked())
+        self.update_cron_preview()
+    
+    def update_cron_preview(self):
+        """크론 표현식 다음 실행 시각 미리보기"""
+        expr = self.cron_edit.text().strip()
+        if not self.cron_radio.isChecked() or not expr:
+            self.cron_preview_label.setText("")
+            return
+        try:
+            times = compile_cron(expr).next_times(datetime.now(), 3)
+        except CronError as e:
+            self.cron_preview_label.setStyleSheet("color: #e74c3c;")
+            self.cron_preview_label.setText(str(e))
+            return
+        self.cron_preview_label.setStyleSheet("color: #888888;")
+        if times:
+            self.cron_preview_label.setText("다음 실행: " + ", ".join(t.strftime('%m-%d %H:%M:%S') for t in times))
+        else:
+            self.cron_preview_label.setText("실행 시각이 없습니다.")
+    
     def on_weekly_toggled(self, checked: bool):
         """주간 반복 토글 시 요일 체크박스 활성화/비활성화"""
         for checkbox in self.weekday_checkboxes:
@@ -823,6 +1038,9 @@ class ScheduleDialog(QDialog):
         
         # 필드 활성화/비활성화 (값은 유지)
         self.src_path_edit.setEnabled(requirements.get('src_path', True))
+        self.source_type_combo.setEnabled(requirements.get('src_path', True))
+        self.mirror_paths_edit.setEnabled(requirements.get('src_path', True))
+        self.mirror_mode_combo.setEnabled(requirements.get('src_path', True))
         self.dest_path_edit.setEnabled(requirements.get('dest_path', True))
         self.awsurl_edit.setEnabled(requirements.get('awsurl', True))
         self.branch_edit.setEnabled(requirements.get('branch', True))
@@ -846,7 +1064,7 @@ class ScheduleDialog(QDialog):
             self.buildname_combo.setEnabled(True)
     
     def refresh_build_list(self):
-        """Prefix 기준으로 빌드명 드롭다운 새로고침"""
+        """Prefix 기준으로 빌드명 드롭다운 새로고침 (백그라운드 조회, 최신 빌드 선택)"""
         prefix = self.prefix_edit.text().strip()
         if not prefix:
             QMessageBox.warning(self, "입력 오류", "Prefix를 입력하세요.")
@@ -857,44 +1075,113 @@ class ScheduleDialog(QDialog):
             QMessageBox.warning(self, "입력 오류", "소스 경로를 입력하세요.")
             return
         
-        import os
-        import re
-        
-        if not os.path.isdir(src_path):
-            QMessageBox.warning(self, "경로 오류", f"소스 경로가 존재하지 않습니다:\n{src_path}")
+        # 새로고침 버튼이므로 캐시 무시하고 강제 재조회
+        self.start_build_listing(src_path, prefix, force=True, select_latest=True)
+    
+    def live_search_builds(self):
+        """Prefix 입력 시 실시간 검색 (카탈로그/목록 캐시 우선, 없으면 백그라운드 조회)"""
+        prefix = self.prefix_edit.text().strip()
+        src_path = self.src_path_edit.text().strip()
+        if not prefix or not src_path or not self.buildname_combo.isEnabled():
             return
         
-        try:
-            # Prefix 포함된 폴더 찾기
-            matching_folders = []
-            for folder in os.listdir(src_path):
-                folder_path = os.path.join(src_path, folder)
-                if os.path.isdir(folder_path) and prefix in folder:
-                    matching_folders.append(folder)
-            
-            if not matching_folders:
-                QMessageBox.information(self, "결과 없음", f"'{prefix}' Prefix를 포함한 빌드가 없습니다.")
+        source_type = self.source_type_combo.currentData()
+        names = None
+        catalog = peek_build_catalog()
+        if source_type == SOURCE_TYPE_PATH and catalog is not None and catalog.is_fresh(src_path):
+            names = [row['name'] for row in catalog.query(src_path, split_keywords(prefix))]
+        else:
+            try:
+                source = create_copy_source(source_type, src_path, self.cache_path_edit.text().strip())
+            except ValueError:
                 return
-            
-            # 리비전 기준 정렬 (최신순)
-            def extract_revision(name: str) -> int:
-                m = re.search(r'(?:^|_)r(\d+)(?:$|_)', name)
-                if m:
-                    return int(m.group(1))
-                m2 = re.search(r'r(\d+)', name)
-                return int(m2.group(1)) if m2 else -1
-            
-            matching_folders.sort(key=extract_revision, reverse=True)
-            
-            # 빌드명 드롭다운 업데이트
-            self.buildname_combo.clear()
-            self.buildname_combo.addItems(matching_folders)
-            
-            QMessageBox.information(self, "새로고침 완료", 
-                                   f"{len(matching_folders)}개의 빌드를 찾았습니다.\n최신: {matching_folders[0]}")
+            try:
+                # 목록 캐시의 토큰 역색인으로 검색 (디스크/네트워크 접근 없음)
+                names = get_build_index().search(src_path, split_keywords(prefix), source, cached_only=True)
+            finally:
+                source.close()
+        
+        if names is None:
+            # 캐시가 없으면 한 번 조회 (TTL 안의 캐시는 재사용)
+            self.start_build_listing(src_path, prefix, force=False, select_latest=False)
+            return
         
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"빌드 목록 새로고침 오류:\n{e}")
+        self.stop_build_listing()
+        self.reset_build_items()
+        self.add_build_items(names)
+        self.show_build_list_result(prefix)
+    
+    def start_build_listing(self, src_path: str, prefix: str, force: bool, select_latest: bool):
+        """빌드 목록 백그라운드 조회 시작 (진행 중인 조회 결과는 버림)"""
+        self.stop_build_listing()
+        self.reset_build_items()
+        self.list_select_latest = select_latest
+        
+        thread = BuildListThread(src_path, self.source_type_combo.currentData(),
+                                 self.cache_path_edit.text().strip(), prefix, force)
+        thread.found.connect(lambda names, t=thread: self.on_builds_found(t, names))
+        thread.done.connect(lambda ok, msg, t=thread: self.on_build_listing_finished(t, ok, msg))
+        self.list_thread = thread
+        
+        self.build_list_status.setStyleSheet("color: #888888;")
+        self.build_list_status.setText(f"'{prefix}' 검색 중...")
+        self.spinner_timer.start(120)
+        thread.start()
+    
+    def stop_build_listing(self):
+        """진행 중인 조회 결과 무시 (조회 자체는 백그라운드에서 끝까지 진행)"""
+        self.list_thread = None
+        self.spinner_timer.stop()
+        self.refresh_builds_btn.setText("🔄")
+    
+    def advance_spinner(self):
+        self.spinner_index = (self.spinner_index + 1) % len(SPINNER_FRAMES)
+        self.refresh_builds_btn.setText(SPINNER_FRAMES[self.spinner_index])
+    
+    def reset_build_items(self):
+        """드롭다운 항목 비우기 (입력 중인 빌드명은 유지)"""
+        current = self.buildname_combo.currentText()
+        self.buildname_combo.clear()
+        self.list_keys = []
+        self.buildname_combo.setEditText(current)
+    
+    def add_build_items(self, names: List[str]):
+        """리비전 최신순 위치에 빌드명 삽입"""
+        current = self.buildname_combo.currentText()
+        for name in names:
+            key = (-revision_of(name), name)
+            pos = bisect.bisect_left(self.list_keys, key)
+            if pos < len(self.list_keys) and self.list_keys[pos] == key:
+                continue
+            self.list_keys.insert(pos, key)
+            self.buildname_combo.insertItem(pos, name)
+        self.buildname_combo.setEditText(current)
+    
+    def on_builds_found(self, thread: BuildListThread, names: List[str]):
+        if thread is not self.list_thread:
+            return
+        self.add_build_items(names)
+        self.build_list_status.setText(f"'{thread.prefix}' 검색 중... {len(self.list_keys)}개")
+    
+    def on_build_listing_finished(self, thread: BuildListThread, success: bool, message: str):
+        if thread is not self.list_thread:
+            return
+        self.stop_build_listing()
+        if not success:
+            self.build_list_status.setStyleSheet("color: #e74c3c;")
+            self.build_list_status.setText(message)
+            return
+        if self.list_select_latest and self.list_keys:
+            self.buildname_combo.setCurrentIndex(0)
+        self.show_build_list_result(thread.prefix)
+    
+    def show_build_list_result(self, prefix: str):
+        self.build_list_status.setStyleSheet("color: #888888;")
+        if not self.list_keys:
+            self.build_list_status.setText(f"'{prefix}' Prefix를 포함한 빌드가 없습니다.")
+        else:
+            self.build_list_status.setText(
+                f"{len(self.list_keys)}개의 빌드 · 최신: {self.buildname_combo.itemText(0)}")
     
     def load_schedule_data(self):
         """스케줄 데이터 로드 (편집 모드)"""
@@ -922,6 +1209,11 @@ class ScheduleDialog(QDialog):
             self.once_radio.setChecked(True)
         elif repeat_type == 'daily':
             self.daily_radio.setChecked(True)
+        elif repeat_type == REPEAT_TYPE_NEW_BUILD:
+            self.new_build_radio.setChecked(True)
+        elif repeat_type == REPEAT_TYPE_CRON:
+            self.cron_edit.setText(self.schedule.get('cron', ''))
+            self.cron_radio.setChecked(True)
         elif repeat_type == 'weekly':
             self.weekly_radio.setChecked(True)
             repeat_days = self.schedule.get('repeat_days', [])
@@ -929,6 +1221,12 @@ class ScheduleDialog(QDialog):
                 if 0 <= day < len(self.weekday_checkboxes):
                     self.weekday_checkboxes[day].setChecked(True)
         
+        idx = self.misfire_policy_combo.findData(self.schedule.get('misfire_policy', MISFIRE_RUN_ONCE))
+        if idx >= 0:
+            self.misfire_policy_combo.setCurrentIndex(idx)
+        self.misfire_grace_spinbox.setValue(
+            self.schedule.get('misfire_grace_minutes', DEFAULT_MISFIRE_GRACE_MINUTES))
+        
         # 빌드 설정 (경로 포함)
         src_path = self.schedule.get('src_path', '')
         if src_path:
@@ -938,6 +1236,18 @@ class ScheduleDialog(QDialog):
         if dest_path:
             self.dest_path_edit.setText(dest_path)
         
+        # 소스 유형 / 캐시 경로
+        idx = self.source_type_combo.findData(self.schedule.get('source_type', SOURCE_TYPE_PATH))
+        if idx >= 0:
+            self.source_type_combo.setCurrentIndex(idx)
+        self.cache_path_edit.setText(self.schedule.get('cache_path', ''))
+        
+        # 미러 경로 / 선택 모드
+        self.mirror_paths_edit.setText(';'.join(parse_mirror_roots(self.schedule.get('src_paths', []))))
+        idx = self.mirror_mode_combo.findData(self.schedule.get('mirror_mode', MIRROR_MODE_FASTEST))
+        if idx >= 0:
+            self.mirror_mode_combo.setCurrentIndex(idx)
+        
         # 최대 경로 개수
         max_local_copies = self.schedule.get('max_local_copies', 0)
         if max_local_copies > 0:
@@ -1051,6 +1361,20 @@ class ScheduleDialog(QDialog):
                 QMessageBox.warning(self, "입력 오류", "주간 반복은 최소 하나의 요일을 선택해야 합니다.")
                 return
         
+        # 크론 표현식 검사
+        if self.cron_radio.isChecked():
+            try:
+                compile_cron(self.cron_edit.text().strip())
+            except CronError as e:
+                QMessageBox.warning(self, "입력 오류", f"크론 표현식 오류:\n{e}")
+                return
+        
+        # 새 빌드 감지는 Prefix 필요
+        if self.new_build_radio.isChecked():
+            if not (self.prefix_edit.text().strip() or self.buildname_combo.currentText().strip()):
+                QMessageBox.warning(self, "입력 오류", "새 빌드 감지는 Prefix를 입력해야 합니다.")
+                return
+        
         self.accept()
     
     def get_schedule_data(self) -> Dict[str, Any]:
@@ -1062,6 +1386,12 @@ class ScheduleDialog(QDialog):
         elif self.daily_radio.isChecked():
             repeat_type = 'daily'
             repeat_days = []
+        elif self.new_build_radio.isChecked():
+            repeat_type = REPEAT_TYPE_NEW_BUILD
+            repeat_days = []
+        elif self.cron_radio.isChecked():
+            repeat_type = REPEAT_TYPE_CRON
+            repeat_days = []
         else:  # weekly
             repeat_type = 'weekly'
             repeat_days = [i for i, cb in enumerate(self.weekday_checkboxes) if cb.isChecked()]
@@ -1116,6 +1446,10 @@ class ScheduleDialog(QDialog):
             'option': self.option_combo.currentText(),
             'src_path': self.src_path_edit.text().strip(),
             'dest_path': self.dest_path_edit.text().strip(),
+            'source_type': self.source_type_combo.currentData(),
+            'cache_path': self.cache_path_edit.text().strip(),
+            'src_paths': parse_mirror_roots(self.mirror_paths_edit.text()),
+            'mirror_mode': self.mirror_mode_combo.currentData(),
             'max_local_copies': max_local_copies,
             'build_mode': build_mode,
             'prefix': self.prefix_edit.text().strip(),
@@ -1128,6 +1462,9 @@ class ScheduleDialog(QDialog):
             'teamcity_branch': self.teamcity_branch_edit.text().strip(),
             'repeat_type': repeat_type,
             'repeat_days': repeat_days,
+            'cron': self.cron_edit.text().strip(),
+            'misfire_policy': self.misfire_policy_combo.currentData(),
+            'misfire_grace_minutes': self.misfire_grace_spinbox.value(),
             'enabled': self.enabled_checkbox.isChecked(),
             'slack_enabled': slack_enabled,
             'slack_webhook': slack_webhook,  # 호환성
@@ -223,6 +223,10 @@ class ScheduleItemWidget(QFrame):
             repeat_text = '일회성'
         elif repeat_type == 'daily':
             repeat_text = '매일 반복'
+        elif repeat_type == 'new_build':
+            repeat_text = '새 빌드 감지'
+        elif repeat_type == 'cron':
+            repeat_text = f"크론 {self.schedule.get('cron', '')}"
         elif repeat_type == 'weekly':
             days = self.schedule.get('repeat_days', [])
             day_names = ['월', '화', '수', '목', '금', '토', '일']
@@ -386,3 +390,20 @@ class ScheduleItemWidget(QFrame):
             else:
                 self.setStyleSheet("background-color: #f5f5f5; opacity: 0.7;")
 
+    
+    def set_queued_status(self, position: int, waiting_for: str = ''):
+        """
+        자원 대기 상태 설정 (중지 버튼으로 대기 취소 가능)
+        
+        Args:
+            position: 대기열 순번 (1부터)
+            waiting_for: 기다리는 자원 이름 (예: '브라우저')
+        """
+        self.set_running_status(True)
+        message = f"⏳ 대기 중 ({position}번째"
+        if waiting_for:
+            message += f" · {waiting_for}"
+        self.status_label.setText(message + ")")
+        self.status_label.setStyleSheet("color: #607D8B; font-weight: bold; font-size: 9pt;")
+        self.progress_bar.setVisible(False)
+        self.setStyleSheet("background-color: #ECEFF1; border-left: 3px solid #607D8B;")